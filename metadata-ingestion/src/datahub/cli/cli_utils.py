@@ -427,9 +427,10 @@ def ensure_has_system_metadata(
     props["clientVersion"] = datahub_version.__version__
 
 
-def enable_auto_decorators(main_group: click.Group) -> None:
+def enable_auto_decorators(main_group: click.Command) -> None:
     """
     Enable automatic decorators for all click commands.
+    If a single command is passed instead of a group, only that command is wrapped.
     This wraps existing command callback functions to add upgrade and telemetry decorators.
     """
 
@@ -484,6 +485,9 @@ def enable_auto_decorators(main_group: click.Group) -> None:
                     # Wrap individual commands
                     wrap_command_callback(command_obj)
 
-    wrap_group_commands(main_group)
+    if isinstance(main_group, click.Group):
+        wrap_group_commands(main_group)
+    else:
+        wrap_command_callback(main_group)
 
     log.debug("Auto-decorators enabled successfully")
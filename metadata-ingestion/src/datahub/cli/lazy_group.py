@@ -0,0 +1,94 @@
+import importlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import click
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    # The `module:attribute` path of the click command.
+    import_path: str
+
+    # Shown by `--help`, so that listing the commands doesn't import them.
+    # Must match the docstring of the command.
+    help: str
+
+    # For commands that depend on optional extras. If set and the import fails,
+    # a shim command that suggests this is registered instead.
+    missing_dependency_suggestion: Optional[str] = None
+
+    def load(self, name: str) -> click.Command:
+        module_name, attribute = self.import_path.split(":")
+        try:
+            command = getattr(importlib.import_module(module_name), attribute)
+        except ImportError as e:
+            if self.missing_dependency_suggestion is None:
+                raise
+            logger.debug(f"Failed to load datahub {name} command: {e}")
+
+            from datahub.cli.cli_utils import make_shim_command
+
+            return make_shim_command(name, self.missing_dependency_suggestion)
+
+        assert isinstance(command, click.Command), self.import_path
+        return command
+
+
+class LazyGroup(click.Group):
+    """A click group whose subcommands are imported only when they're invoked.
+
+    Commands can also be registered eagerly, as with a regular click group. The
+    `on_command_loaded` callback is called once for every command, lazy or not,
+    the first time it's looked up.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Optional[Dict[str, LazyCommand]] = None,
+        on_command_loaded: Optional[Callable[[click.Command], None]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Dict[str, LazyCommand] = dict(lazy_commands or {})
+        self.on_command_loaded = on_command_loaded
+        self._loaded_commands: Set[str] = set()
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*self.commands, *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(self.lazy_commands[cmd_name].load(cmd_name), cmd_name)
+
+        command = super().get_command(ctx, cmd_name)
+        if command is not None and cmd_name not in self._loaded_commands:
+            self._loaded_commands.add(cmd_name)
+            if self.on_command_loaded is not None:
+                self.on_command_loaded(command)
+        return command
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        # Same as click.Group.format_commands, but uses the registered help of the
+        # lazy commands that haven't been loaded.
+        commands: List[Tuple[str, click.Command]] = []
+        for name in self.list_commands(ctx):
+            command = self.commands.get(name)
+            if command is None:
+                command = click.Command(name, help=self.lazy_commands[name].help)
+            if not command.hidden:
+                commands.append((name, command))
+
+        if commands:
+            limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+            rows = [
+                (name, command.get_short_help_str(limit)) for name, command in commands
+            ]
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
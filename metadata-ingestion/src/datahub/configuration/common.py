@@ -151,6 +151,12 @@ class TransformerSemantics(ConfigEnum):
 class TransformerSemanticsConfigModel(ConfigModel):
     semantics: TransformerSemantics = TransformerSemantics.OVERWRITE
     replace_existing: bool = False
+    prefetch_window_size: int = Field(
+        default=0,
+        ge=0,
+        description="With PATCH semantics, buffer this many records and fetch the server aspects "
+        "they need in batched, concurrent calls instead of one lookup per entity. Disabled when 0.",
+    )
 
 
 class DynamicTypedConfig(ConfigModel):
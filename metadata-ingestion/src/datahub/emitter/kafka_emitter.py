@@ -152,6 +152,20 @@ class DatahubKafkaEmitter(Closeable, Emitter):
             on_delivery=callback,
         )
 
+    def poll(self, timeout: float = 0) -> int:
+        """Serves delivery callbacks of previous writes, waiting up to timeout seconds.
+
+        Returns the number of callbacks that were served.
+        """
+        served = 0
+        for producer in self.producers.values():
+            served += producer.poll(timeout)
+        return served
+
+    def queue_depth(self) -> int:
+        """Number of messages that are queued or waiting for delivery acknowledgement."""
+        return sum(len(producer) for producer in self.producers.values())
+
     def flush(self) -> None:
         for producer in self.producers.values():
             producer.flush()
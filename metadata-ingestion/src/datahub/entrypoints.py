@@ -8,46 +8,116 @@ from typing import ContextManager, Optional
 import click
 
 import datahub._version as datahub_version
-from datahub.cli.check_cli import check
-from datahub.cli.cli_utils import (
-    enable_auto_decorators,
-    fixup_gms_url,
-    generate_access_token,
-    make_shim_command,
-)
-from datahub.cli.config_utils import DATAHUB_CONFIG_PATH, write_gms_config
-from datahub.cli.container_cli import container
-from datahub.cli.delete_cli import delete
-from datahub.cli.docker_cli import docker
 from datahub.cli.env_utils import get_boolean_env_variable
-from datahub.cli.exists_cli import exists
-from datahub.cli.get_cli import get
-from datahub.cli.ingest_cli import ingest
-from datahub.cli.migrate import migrate
-from datahub.cli.put_cli import put
-from datahub.cli.specific.assertions_cli import assertions
-from datahub.cli.specific.datacontract_cli import datacontract
-from datahub.cli.specific.dataproduct_cli import dataproduct
-from datahub.cli.specific.dataset_cli import dataset
-from datahub.cli.specific.forms_cli import forms
-from datahub.cli.specific.group_cli import group
-from datahub.cli.specific.structuredproperties_cli import properties
-from datahub.cli.specific.user_cli import user
-from datahub.cli.state_cli import state
-from datahub.cli.telemetry import telemetry as telemetry_cli
-from datahub.cli.timeline_cli import timeline
-from datahub.configuration.common import should_show_stack_trace
-from datahub.ingestion.graph.client import get_default_graph
-from datahub.ingestion.graph.config import ClientMode
-from datahub.utilities._custom_package_loader import model_version_name
+from datahub.cli.lazy_group import LazyCommand, LazyGroup
 from datahub.utilities.logging_manager import configure_logging
-from datahub.utilities.server_config_util import get_gms_config
 
 logger = logging.getLogger(__name__)
 _logging_configured: Optional[ContextManager] = None
 
 MAX_CONTENT_WIDTH = 120
 
+# Subcommands are only imported when they're invoked, since many of them pull in
+# the generated metadata classes, which take seconds to import.
+_LAZY_COMMANDS = {
+    "check": LazyCommand(
+        "datahub.cli.check_cli:check",
+        "Helper commands for checking various aspects of DataHub.",
+    ),
+    "docker": LazyCommand(
+        "datahub.cli.docker_cli:docker",
+        "Helper commands for setting up and interacting with a local DataHub instance using Docker.",
+    ),
+    "ingest": LazyCommand(
+        "datahub.cli.ingest_cli:ingest", "Ingest metadata into DataHub."
+    ),
+    "delete": LazyCommand(
+        "datahub.cli.delete_cli:delete", "Delete metadata from DataHub."
+    ),
+    "exists": LazyCommand(
+        "datahub.cli.exists_cli:exists",
+        "A group of commands to check existence of entities in DataHub.",
+    ),
+    "get": LazyCommand(
+        "datahub.cli.get_cli:get", "A group of commands to get metadata from DataHub."
+    ),
+    "put": LazyCommand(
+        "datahub.cli.put_cli:put", "A group of commands to put metadata in DataHub."
+    ),
+    "state": LazyCommand(
+        "datahub.cli.state_cli:state",
+        "Managed state stored in DataHub by stateful ingestion.",
+    ),
+    "telemetry": LazyCommand("datahub.cli.telemetry:telemetry", "Toggle telemetry."),
+    "migrate": LazyCommand(
+        "datahub.cli.migrate:migrate",
+        "Helper commands for migrating metadata within DataHub.",
+    ),
+    "timeline": LazyCommand(
+        "datahub.cli.timeline_cli:timeline",
+        "Get timeline for an entity based on certain categories",
+    ),
+    "user": LazyCommand(
+        "datahub.cli.specific.user_cli:user",
+        "A group of commands to interact with the User entity in DataHub.",
+    ),
+    "group": LazyCommand(
+        "datahub.cli.specific.group_cli:group",
+        "A group of commands to interact with the Group entity in DataHub.",
+    ),
+    "dataproduct": LazyCommand(
+        "datahub.cli.specific.dataproduct_cli:dataproduct",
+        "A group of commands to interact with the DataProduct entity in DataHub.",
+    ),
+    "dataset": LazyCommand(
+        "datahub.cli.specific.dataset_cli:dataset",
+        "A group of commands to interact with the Dataset entity in DataHub.",
+    ),
+    "properties": LazyCommand(
+        "datahub.cli.specific.structuredproperties_cli:properties",
+        "A group of commands to interact with structured properties in DataHub.",
+    ),
+    "forms": LazyCommand(
+        "datahub.cli.specific.forms_cli:forms",
+        "A group of commands to interact with forms in DataHub.",
+    ),
+    "datacontract": LazyCommand(
+        "datahub.cli.specific.datacontract_cli:datacontract",
+        "A group of commands to interact with the DataContract entity in DataHub.",
+    ),
+    "assertions": LazyCommand(
+        "datahub.cli.specific.assertions_cli:assertions",
+        "A group of commands to interact with the Assertion entity in DataHub.",
+    ),
+    "container": LazyCommand(
+        "datahub.cli.container_cli:container",
+        "A group of commands to interact with containers in DataHub.",
+    ),
+    "iceberg": LazyCommand(
+        "datahub.cli.iceberg_cli:iceberg",
+        "A group of commands to manage Iceberg warehouses using DataHub as the Iceberg Catalog.",
+        missing_dependency_suggestion="run `pip install 'acryl-datahub[iceberg-catalog]'`",
+    ),
+    "lite": LazyCommand(
+        "datahub.cli.lite_cli:lite",
+        "A group of commands to work with a DataHub Lite instance",
+        missing_dependency_suggestion="run `pip install 'acryl-datahub[datahub-lite]'`",
+    ),
+    "actions": LazyCommand(
+        "datahub_actions.cli.actions:actions",
+        "Execute one or more Actions Pipelines",
+        missing_dependency_suggestion="run `pip install acryl-datahub-actions`",
+    ),
+}
+
+
+def _enable_auto_decorators(command: click.Command) -> None:
+    from datahub.cli.cli_utils import enable_auto_decorators
+
+    # Adding telemetry and upgrade decorators to the command, once it's loaded.
+    enable_auto_decorators(command)
+
+
 if sys.version_info >= (3, 12):
     click.secho(
         "Python versions above 3.11 are not actively tested with yet. Please use Python 3.11 for now.",
@@ -57,6 +127,9 @@ if sys.version_info >= (3, 12):
 
 
 @click.group(
+    cls=LazyGroup,
+    lazy_commands=_LAZY_COMMANDS,
+    on_command_loaded=_enable_auto_decorators,
     context_settings=dict(
         # Avoid truncation of help text.
         # See https://github.com/pallets/click/issues/486.
@@ -114,6 +187,10 @@ def datahub(
 def version(include_server: bool = False) -> None:
     """Print version number and exit."""
 
+    from datahub.ingestion.graph.client import get_default_graph
+    from datahub.ingestion.graph.config import ClientMode
+    from datahub.utilities._custom_package_loader import model_version_name
+
     click.echo(f"DataHub CLI version: {datahub_version.nice_version_name()}")
     click.echo(f"Models: {model_version_name()}")
     click.echo(f"Python version: {sys.version}")
@@ -133,6 +210,9 @@ def version(include_server: bool = False) -> None:
 def init(use_password: bool = False) -> None:
     """Configure which datahub instance to connect to"""
 
+    from datahub.cli.cli_utils import fixup_gms_url, generate_access_token
+    from datahub.cli.config_utils import DATAHUB_CONFIG_PATH, write_gms_config
+
     if os.path.isfile(DATAHUB_CONFIG_PATH):
         click.confirm(f"{DATAHUB_CONFIG_PATH} already exists. Overwrite?", abort=True)
 
@@ -163,63 +243,6 @@ def init(use_password: bool = False) -> None:
     click.echo(f"Written to {DATAHUB_CONFIG_PATH}")
 
 
-datahub.add_command(check)
-datahub.add_command(docker)
-datahub.add_command(ingest)
-datahub.add_command(delete)
-datahub.add_command(exists)
-datahub.add_command(get)
-datahub.add_command(put)
-datahub.add_command(state)
-datahub.add_command(telemetry_cli)
-datahub.add_command(migrate)
-datahub.add_command(timeline)
-datahub.add_command(user)
-datahub.add_command(group)
-datahub.add_command(dataproduct)
-datahub.add_command(dataset)
-datahub.add_command(properties)
-datahub.add_command(forms)
-datahub.add_command(datacontract)
-datahub.add_command(assertions)
-datahub.add_command(container)
-
-try:
-    from datahub.cli.iceberg_cli import iceberg
-
-    datahub.add_command(iceberg)
-except ImportError as e:
-    logger.debug(f"Failed to load datahub iceberg command: {e}")
-    datahub.add_command(
-        make_shim_command(
-            "iceberg", "run `pip install 'acryl-datahub[iceberg-catalog]'`"
-        )
-    )
-
-try:
-    from datahub.cli.lite_cli import lite
-
-    datahub.add_command(lite)
-except ImportError as e:
-    logger.debug(f"Failed to load datahub lite command: {e}")
-    datahub.add_command(
-        make_shim_command("lite", "run `pip install 'acryl-datahub[datahub-lite]'`")
-    )
-
-try:
-    from datahub_actions.cli.actions import actions
-
-    datahub.add_command(actions)
-except ImportError as e:
-    logger.debug(f"Failed to load datahub actions framework: {e}")
-    datahub.add_command(
-        make_shim_command("actions", "run `pip install acryl-datahub-actions`")
-    )
-
-# Adding telemetry and upgrade decorators to all commands
-enable_auto_decorators(datahub)
-
-
 def main(**kwargs):
     # We use threads in a variety of places within our CLI. The multiprocessing
     # "fork" start method is not safe to use with threads.
@@ -239,6 +262,9 @@ def main(**kwargs):
         error.show()
         sys.exit(1)
     except Exception as exc:
+        from datahub.configuration.common import should_show_stack_trace
+        from datahub.utilities.server_config_util import get_gms_config
+
         if not should_show_stack_trace(exc):
             # Don't print the full stack trace for simple config errors.
             logger.debug("Error: %s", exc, exc_info=exc)
@@ -537,6 +537,9 @@ class Pipeline:
                 # before we call process_commits.
                 self.inner_exit_stack.close()
 
+                # Wait for in-flight writes, so that their failures are taken into
+                # account by the commit policies.
+                self.sink.flush()
                 self.process_commits()
                 self.final_status = PipelineStatus.COMPLETED
             except (SystemExit, KeyboardInterrupt) as e:
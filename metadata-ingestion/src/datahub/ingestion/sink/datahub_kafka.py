@@ -1,6 +1,12 @@
+import dataclasses
+import time
 from dataclasses import dataclass
+from enum import auto
 from typing import Optional, Union
 
+import pydantic
+
+from datahub.configuration.common import ConfigEnum
 from datahub.emitter.kafka_emitter import DatahubKafkaEmitter, KafkaEmitterConfig
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import RecordEnvelope, WorkUnit
@@ -10,11 +16,61 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 
+# How long to wait for delivery acknowledgements when the in-flight cap is reached.
+_IN_FLIGHT_POLL_TIMEOUT_SECONDS = 0.1
+
+
+class KafkaSinkMode(ConfigEnum):
+    # Flushes the producers after every workunit, so each workunit waits for a
+    # produce-ack round trip.
+    SYNC = auto()
+
+    # Only flushes at checkpoint boundaries and on close, relying on delivery
+    # callbacks for accounting. The number of unacknowledged messages is bounded
+    # by max_in_flight_messages.
+    PIPELINED = auto()
+
 
 class KafkaSinkConfig(KafkaEmitterConfig):
-    # This extra layer of indirection exists in case we need to add extra
-    # config options to the sink config.
-    pass
+    mode: KafkaSinkMode = KafkaSinkMode.SYNC
+
+    # Only applies in pipelined mode.
+    max_in_flight_messages: pydantic.PositiveInt = 10000
+
+
+@dataclasses.dataclass
+class DatahubKafkaSinkReport(SinkReport):
+    mode: Optional[KafkaSinkMode] = None
+    in_flight_messages: int = 0
+    max_in_flight_messages_seen: int = 0
+    max_queue_depth: int = 0
+    in_flight_cap_waits: int = 0
+
+    produce_latency_ms_avg: Optional[float] = None
+    produce_latency_ms_max: float = 0
+    _produce_latency_ms_total: float = 0
+    _produce_latency_count: int = 0
+
+    def report_sent(self, queue_depth: int) -> None:
+        self.in_flight_messages += 1
+        self.max_in_flight_messages_seen = max(
+            self.max_in_flight_messages_seen, self.in_flight_messages
+        )
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def report_delivered(self, latency_ms: float) -> None:
+        self.in_flight_messages -= 1
+        self._produce_latency_ms_total += latency_ms
+        self._produce_latency_count += 1
+        self.produce_latency_ms_max = max(self.produce_latency_ms_max, latency_ms)
+
+    def compute_stats(self) -> None:
+        super().compute_stats()
+        if self._produce_latency_count:
+            self.produce_latency_ms_avg = round(
+                self._produce_latency_ms_total / self._produce_latency_count, 2
+            )
+        self.produce_latency_ms_max = round(self.produce_latency_ms_max, 2)
 
 
 @dataclass
@@ -22,8 +78,16 @@ class _KafkaCallback:
     reporter: SinkReport
     record_envelope: RecordEnvelope
     write_callback: WriteCallback
+    # Set once the record has been handed to the producer.
+    produce_start: Optional[float] = None
 
     def kafka_callback(self, err: Optional[Exception], msg: str) -> None:
+        if self.produce_start is not None and isinstance(
+            self.reporter, DatahubKafkaSinkReport
+        ):
+            self.reporter.report_delivered(
+                (time.perf_counter() - self.produce_start) * 1000
+            )
         if err is not None:
             self.reporter.report_failure(err)
             self.write_callback.on_failure(
@@ -34,17 +98,28 @@ class _KafkaCallback:
             self.write_callback.on_success(self.record_envelope, {"msg": msg})
 
 
-class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
+class DatahubKafkaSink(Sink[KafkaSinkConfig, DatahubKafkaSinkReport]):
     emitter: DatahubKafkaEmitter
 
     def __post_init__(self):
         self.emitter = DatahubKafkaEmitter(self.config)
+        self.report.mode = self.config.mode
 
     def handle_work_unit_start(self, workunit: WorkUnit) -> None:
         pass
 
     def handle_work_unit_end(self, workunit: WorkUnit) -> None:
-        self.emitter.flush()
+        if self.config.mode == KafkaSinkMode.SYNC:
+            self.emitter.flush()
+        else:
+            self.emitter.poll(0)
+
+    def _wait_for_in_flight_capacity(self) -> None:
+        if self.report.in_flight_messages < self.config.max_in_flight_messages:
+            return
+        self.report.in_flight_cap_waits += 1
+        while self.report.in_flight_messages >= self.config.max_in_flight_messages:
+            self.emitter.poll(_IN_FLIGHT_POLL_TIMEOUT_SECONDS)
 
     def write_record_async(
         self,
@@ -57,15 +132,21 @@ class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
         ],
         write_callback: WriteCallback,
     ) -> None:
-        callback = _KafkaCallback(
-            self.report, record_envelope, write_callback
-        ).kafka_callback
+        kafka_callback = _KafkaCallback(self.report, record_envelope, write_callback)
+        callback = kafka_callback.kafka_callback
         try:
+            if self.config.mode == KafkaSinkMode.PIPELINED:
+                self._wait_for_in_flight_capacity()
             record = record_envelope.record
+            produce_start = time.perf_counter()
             self.emitter.emit(
                 record,
                 callback=callback,
             )
+            # The emitter polls before producing, so the delivery callback of
+            # this record can't have been called yet.
+            kafka_callback.produce_start = produce_start
+            self.report.report_sent(self.emitter.queue_depth())
         except Exception as err:
             # In case we throw an exception while trying to emit the record,
             # catch it and report the failure. This might happen if the schema
@@ -73,5 +154,8 @@ class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
             # fail when serializing the record.
             callback(err, f"Failed to write record: {err}")
 
+    def flush(self) -> None:
+        self.emitter.flush()
+
     def close(self) -> None:
         self.emitter.flush()
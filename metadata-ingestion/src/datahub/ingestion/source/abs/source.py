@@ -48,7 +48,11 @@ from datahub.ingestion.source.data_lake_common.data_lake_utils import (
     ContainerWUCreator,
     add_partition_columns_to_schema,
 )
+from datahub.ingestion.source.data_lake_common.schema_inference_cache import (
+    SchemaInferenceCache,
+)
 from datahub.ingestion.source.schema_inference import avro, csv_tsv, json, parquet
+from datahub.ingestion.source.schema_inference.base import SchemaInferenceBase
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StaleEntityRemovalHandler,
 )
@@ -64,6 +68,7 @@ from datahub.metadata.schema_classes import (
     OperationClass,
     OperationTypeClass,
     OtherSchemaClass,
+    SchemaFieldClass,
     _Aspect,
 )
 from datahub.telemetry import telemetry
@@ -121,6 +126,8 @@ class TableData:
     table_path: str
     size_in_bytes: int
     number_of_files: int
+    # The ETag of the blob at full_path, if known from the listing.
+    etag: Optional[str] = None
 
 
 @platform_name("ABS Data Lake", id="abs")
@@ -139,6 +146,11 @@ class ABSSource(StatefulIngestionSourceBase):
         self.source_config = config
         self.report = DataLakeSourceReport()
         self.profiling_times_taken = []
+        self.schema_inference_cache = SchemaInferenceCache.for_config(
+            config.schema_inference_cache, config.platform
+        )
+        if self.schema_inference_cache:
+            self.report.schema_inference_cache = self.schema_inference_cache.stats
         config_report = {
             config_option: config.dict().get(config_option)
             for config_option in config_options_to_report
@@ -159,7 +171,19 @@ class ABSSource(StatefulIngestionSourceBase):
 
         return cls(config, ctx)
 
-    def get_fields(self, table_data: TableData, path_spec: PathSpec) -> List:
+    def _infer_fields(
+        self, table_data: TableData, inferrer: SchemaInferenceBase
+    ) -> List[SchemaFieldClass]:
+        cache_key = None
+        if self.schema_inference_cache and table_data.etag:
+            cache_key = SchemaInferenceCache.make_key(
+                table_data.full_path, table_data.etag, inferrer
+            )
+            cached_fields = self.schema_inference_cache.get(cache_key)
+            if cached_fields is not None:
+                logger.debug(f"Using the cached schema of {table_data.full_path}")
+                return cached_fields
+
         if self.is_abs_platform():
             if self.source_config.azure_config is None:
                 raise ValueError("Azure config is required for ABS file sources")
@@ -175,6 +199,22 @@ class ABSSource(StatefulIngestionSourceBase):
             # capabilities of smart_open.
             file = smart_open(table_data.full_path, "rb")
 
+        try:
+            fields = inferrer.infer_schema(file)
+        except Exception as e:
+            self.report.report_warning(
+                table_data.full_path,
+                f"could not infer schema for file {table_data.full_path}: {e}",
+            )
+            return []
+        finally:
+            file.close()
+
+        if self.schema_inference_cache and cache_key:
+            self.schema_inference_cache.put(cache_key, fields)
+        return fields
+
+    def get_fields(self, table_data: TableData, path_spec: PathSpec) -> List:
         fields = []
 
         extension = pathlib.Path(table_data.full_path).suffix
@@ -188,37 +228,29 @@ class ABSSource(StatefulIngestionSourceBase):
         if extension == "" and path_spec.default_extension:
             extension = f".{path_spec.default_extension}"
 
-        try:
-            if extension == ".parquet":
-                fields = parquet.ParquetInferrer().infer_schema(file)
-            elif extension == ".csv":
-                fields = csv_tsv.CsvInferrer(
-                    max_rows=self.source_config.max_rows
-                ).infer_schema(file)
-            elif extension == ".tsv":
-                fields = csv_tsv.TsvInferrer(
-                    max_rows=self.source_config.max_rows
-                ).infer_schema(file)
-            elif extension == ".json":
-                fields = json.JsonInferrer().infer_schema(file)
-            elif extension == ".jsonl":
-                fields = json.JsonInferrer(
-                    max_rows=self.source_config.max_rows, format="jsonl"
-                ).infer_schema(file)
-            elif extension == ".avro":
-                fields = avro.AvroInferrer().infer_schema(file)
-            else:
-                self.report.report_warning(
-                    table_data.full_path,
-                    f"file {table_data.full_path} has unsupported extension",
-                )
-            file.close()
-        except Exception as e:
+        inferrer: Optional[SchemaInferenceBase] = None
+        if extension == ".parquet":
+            inferrer = parquet.ParquetInferrer()
+        elif extension == ".csv":
+            inferrer = csv_tsv.CsvInferrer(max_rows=self.source_config.max_rows)
+        elif extension == ".tsv":
+            inferrer = csv_tsv.TsvInferrer(max_rows=self.source_config.max_rows)
+        elif extension == ".json":
+            inferrer = json.JsonInferrer(max_rows=self.source_config.max_rows)
+        elif extension == ".jsonl":
+            inferrer = json.JsonInferrer(
+                max_rows=self.source_config.max_rows, format="jsonl"
+            )
+        elif extension == ".avro":
+            inferrer = avro.AvroInferrer()
+
+        if inferrer:
+            fields = self._infer_fields(table_data, inferrer)
+        else:
             self.report.report_warning(
                 table_data.full_path,
-                f"could not infer schema for file {table_data.full_path}: {e}",
+                f"file {table_data.full_path} has unsupported extension",
             )
-            file.close()
         logger.debug(f"Extracted fields in schema: {fields}")
         fields = sorted(fields, key=lambda f: f.fieldPath)
 
@@ -362,6 +394,7 @@ class ABSSource(StatefulIngestionSourceBase):
         rel_path: str,
         timestamp: datetime,
         size: int,
+        etag: Optional[str] = None,
     ) -> TableData:
         logger.debug(f"Getting table data for path: {path}")
         table_name, table_path = path_spec.extract_table_name_and_path(path)
@@ -375,6 +408,7 @@ class ABSSource(StatefulIngestionSourceBase):
             table_path=table_path,
             number_of_files=1,
             size_in_bytes=size,
+            etag=etag,
         )
         return table_data
 
@@ -428,7 +462,7 @@ class ABSSource(StatefulIngestionSourceBase):
 
     def abs_browser(
         self, path_spec: PathSpec, sample_size: int
-    ) -> Iterable[Tuple[str, str, datetime, int]]:
+    ) -> Iterable[Tuple[str, str, datetime, int, Optional[str]]]:
         if self.source_config.azure_config is None:
             raise ValueError("azure_config not set. Cannot browse Azure Blob Storage")
         abs_blob_service_client = (
@@ -489,6 +523,7 @@ class ABSSource(StatefulIngestionSourceBase):
                                 obj.name,
                                 obj.last_modified,
                                 obj.size,
+                                obj.etag,
                             )
                 except Exception as e:
                     # This odd check if being done because boto does not have a proper exception to catch
@@ -515,7 +550,7 @@ class ABSSource(StatefulIngestionSourceBase):
                 logger.debug(f"Path: {abs_path}")
                 # the following line if using the file_system_client
                 # yield abs_path, obj.last_modified, obj.content_length,
-                yield abs_path, obj.name, obj.last_modified, obj.size
+                yield abs_path, obj.name, obj.last_modified, obj.size, obj.etag
 
     def create_abs_path(self, key: str) -> str:
         if self.source_config.azure_config:
@@ -528,7 +563,7 @@ class ABSSource(StatefulIngestionSourceBase):
 
     def local_browser(
         self, path_spec: PathSpec
-    ) -> Iterable[Tuple[str, str, datetime, int]]:
+    ) -> Iterable[Tuple[str, str, datetime, int, Optional[str]]]:
         prefix = self.get_prefix(path_spec.include)
         if os.path.isfile(prefix):
             logger.debug(f"Scanning single local file: {prefix}")
@@ -538,6 +573,7 @@ class ABSSource(StatefulIngestionSourceBase):
                 file_name,
                 datetime.utcfromtimestamp(os.path.getmtime(prefix)),
                 os.path.getsize(prefix),
+                None,
             )
         else:
             logger.debug(f"Scanning files under local folder: {prefix}")
@@ -554,6 +590,7 @@ class ABSSource(StatefulIngestionSourceBase):
                         file,
                         datetime.utcfromtimestamp(os.path.getmtime(full_path)),
                         os.path.getsize(full_path),
+                        None,
                     )
 
     def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
@@ -573,11 +610,11 @@ class ABSSource(StatefulIngestionSourceBase):
                     else self.local_browser(path_spec)
                 )
                 table_dict: Dict[str, TableData] = {}
-                for file, name, timestamp, size in file_browser:
+                for file, name, timestamp, size, etag in file_browser:
                     if not path_spec.allowed(file):
                         continue
                     table_data = self.extract_table_data(
-                        path_spec, file, name, timestamp, size
+                        path_spec, file, name, timestamp, size, etag
                     )
                     if table_data.table_path not in table_dict:
                         table_dict[table_data.table_path] = table_data
@@ -599,10 +636,19 @@ class ABSSource(StatefulIngestionSourceBase):
                             table_dict[
                                 table_data.table_path
                             ].timestamp = table_data.timestamp
+                            table_dict[
+                                table_data.table_path
+                            ].rel_path = table_data.rel_path
+                            table_dict[table_data.table_path].etag = table_data.etag
 
                 for _, table_data in table_dict.items():
                     yield from self.ingest_table(table_data, path_spec)
 
+    def close(self) -> None:
+        if self.schema_inference_cache:
+            self.schema_inference_cache.close()
+        super().close()
+
     def get_workunit_processors(self) -> List[Optional[MetadataWorkUnitProcessor]]:
         return [
             *super().get_workunit_processors(),
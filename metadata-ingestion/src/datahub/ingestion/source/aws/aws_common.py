@@ -420,12 +420,18 @@ class AwsConnectionConfig(ConfigModel):
         )
 
     def get_s3_client(
-        self, verify_ssl: Optional[Union[bool, str]] = None
+        self,
+        verify_ssl: Optional[Union[bool, str]] = None,
+        max_pool_connections: Optional[int] = None,
     ) -> "S3Client":
+        config = self._aws_config()
+        if max_pool_connections is not None:
+            # For clients that are shared by several threads.
+            config = config.merge(Config(max_pool_connections=max_pool_connections))
         return self.get_session().client(
             "s3",
             endpoint_url=self.aws_endpoint_url,
-            config=self._aws_config(),
+            config=config,
             verify=verify_ssl,
         )
 
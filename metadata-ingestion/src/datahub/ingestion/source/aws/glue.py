@@ -21,6 +21,8 @@ from urllib.parse import urlparse
 
 import botocore.exceptions
 import yaml
+from botocore.config import Config
+from botocore.endpoint import MAX_POOL_CONNECTIONS
 from pydantic import validator
 from pydantic.fields import Field
 
@@ -125,6 +127,7 @@ from datahub.metadata.schema_classes import (
 from datahub.utilities.delta import delta_type_to_hive_type
 from datahub.utilities.hive_schema_to_avro import get_schema_fields_for_hive_column
 from datahub.utilities.lossy_collections import LossyList
+from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutor
 from datahub.utilities.urns.error import InvalidUrnError
 
 logger = logging.getLogger(__name__)
@@ -132,6 +135,9 @@ logger = logging.getLogger(__name__)
 DEFAULT_PLATFORM = "glue"
 VALID_PLATFORMS = [DEFAULT_PLATFORM, "athena"]
 
+# The maximum number of tag values in a Lake Formation tag expression.
+LF_TAG_EXPRESSION_MAX_VALUES = 50
+
 
 class GlueSourceConfig(
     StatefulIngestionConfigBase, DatasetSourceConfigMixin, AwsSourceConfig
@@ -183,7 +189,20 @@ class GlueSourceConfig(
 
     extract_lakeformation_tags: Optional[bool] = Field(
         default=False,
-        description="When True, extracts Lake Formation tags directly assigned to Glue tables/databases. Note: Tags inherited from databases or other parent resources are excluded.",
+        description="When True, extracts Lake Formation tags directly assigned to Glue tables/databases. Note: Tags inherited from databases or other parent resources are excluded. "
+        "The tags of the tables of a catalog are looked up in bulk, with one `SearchTablesByLFTags` search per tag key, "
+        "which requires the `lakeformation:ListLFTags` and `lakeformation:SearchTablesByLFTags` permissions. "
+        "If the search fails, the tags are fetched table by table.",
+    )
+
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of threads used to list the tables of the databases, search their Lake Formation tags "
+        "and download and parse the scripts of the jobs concurrently. Workunits are emitted in the same order as with a single thread. "
+        "The AWS clients are shared by the threads, with a connection pool of at least this size. "
+        "Unless `aws_retry_mode` is set, the `adaptive` retry mode is used when this is greater than 1, "
+        "which slows down all the threads when AWS throttles the requests.",
     )
 
     profiling: GlueProfilingConfig = Field(
@@ -210,6 +229,26 @@ class GlueSourceConfig(
             self.profiling.operation_config
         )
 
+    def _aws_config(self) -> Config:
+        config = super()._aws_config()
+        if self.max_workers == 1:
+            return config
+
+        overrides: Dict[str, Any] = {
+            "max_pool_connections": max(
+                self.max_workers,
+                self.aws_advanced_config.get(
+                    "max_pool_connections", MAX_POOL_CONNECTIONS
+                ),
+            )
+        }
+        if "aws_retry_mode" not in self.__fields_set__:
+            overrides["retries"] = {
+                "max_attempts": self.aws_retry_num,
+                "mode": "adaptive",
+            }
+        return config.merge(Config(**overrides))
+
     @property
     def glue_client(self):
         return self.get_glue_client()
@@ -255,6 +294,8 @@ class GlueSourceReport(StaleEntityRemovalSourceReport):
     num_dataset_to_dataset_edges_in_job: int = 0
     num_dataset_invalid_delta_schema: int = 0
     num_dataset_valid_delta_schema: int = 0
+    num_lf_tag_searches: int = 0
+    num_table_lf_tag_lookups: int = 0
 
     def report_table_scanned(self) -> None:
         self.tables_scanned += 1
@@ -341,8 +382,6 @@ class GlueSource(StatefulIngestionSourceBase):
     source_config: GlueSourceConfig
     report: GlueSourceReport
 
-    lf_tag_cache: Dict[str, Dict[str, List[str]]] = {}
-
     def __init__(self, config: GlueSourceConfig, ctx: PipelineContext):
         super().__init__(config, ctx)
         self.ctx = ctx
@@ -363,6 +402,33 @@ class GlueSource(StatefulIngestionSourceBase):
                 self.ctx.graph
             )
 
+        # catalog id -> (database name, table name) -> LF tags, or None if the
+        # tags of the tables of the catalog couldn't be searched.
+        self._table_lf_tags_by_catalog: Dict[
+            str, Optional[Dict[Tuple[str, str], List[LakeFormationTag]]]
+        ] = {}
+
+    @staticmethod
+    def _parse_lf_tags(
+        lf_tags: List[Dict[str, Any]],
+        excluded_tags: Optional[Set[Tuple[str, str]]] = None,
+    ) -> List[LakeFormationTag]:
+        tags = []
+        for lf_tag in lf_tags:
+            catalog_id = lf_tag.get("CatalogId")
+            tag_key = lf_tag.get("TagKey")
+            for tag_value in lf_tag.get("TagValues", []):
+                if excluded_tags and (tag_key, tag_value) in excluded_tags:
+                    continue
+                tags.append(
+                    LakeFormationTag(
+                        key=tag_key,
+                        value=tag_value,
+                        catalog_id=catalog_id,
+                    )
+                )
+        return tags
+
     def get_database_lf_tags(
         self,
         catalog_id: str,
@@ -385,20 +451,7 @@ class GlueSource(StatefulIngestionSourceBase):
             if response:
                 logger.info(f"LF tags for database {database_name}: {response}")
             # Extract and return the LF tags
-            lf_tags = response.get("LFTagOnDatabase", [])
-
-            tags = []
-            for lf_tag in lf_tags:
-                catalog_id = lf_tag.get("CatalogId")
-                tag_key = lf_tag.get("TagKey")
-                for tag_value in lf_tag.get("TagValues", []):
-                    t = LakeFormationTag(
-                        key=tag_key,
-                        value=tag_value,
-                        catalog_id=catalog_id,
-                    )
-                    tags.append(t)
-            return tags
+            return self._parse_lf_tags(response.get("LFTagOnDatabase", []))
 
         except Exception as e:
             print(
@@ -428,38 +481,106 @@ class GlueSource(StatefulIngestionSourceBase):
             )
 
             # Extract and return the LF tags
-            lf_tags = response.get("LFTagsOnTable", [])
-
-            tags = []
-            for lf_tag in lf_tags:
-                catalog_id = lf_tag.get("CatalogId")
-                tag_key = lf_tag.get("TagKey")
-                for tag_value in lf_tag.get("TagValues", []):
-                    t = LakeFormationTag(
-                        key=tag_key,
-                        value=tag_value,
-                        catalog_id=catalog_id,
-                    )
-                    tags.append(t)
-            return tags
+            return self._parse_lf_tags(response.get("LFTagsOnTable", []))
 
         except Exception:
             return []
 
-    def get_all_lf_tags(self) -> List:
+    def get_all_lf_tags(self, catalog_id: Optional[str] = None) -> List:
+        catalog_args = {"CatalogId": catalog_id} if catalog_id else {}
         # 1. Get all LF-Tags in your account (metadata only)
         response = self.lf_client.list_lf_tags(
-            MaxResults=50  # Adjust as needed
+            MaxResults=50,  # Adjust as needed
+            **catalog_args,
         )
         all_lf_tags = response["LFTags"]
         # Continue pagination if necessary
         while "NextToken" in response:
             response = self.lf_client.list_lf_tags(
-                NextToken=response["NextToken"], MaxResults=50
+                NextToken=response["NextToken"], MaxResults=50, **catalog_args
             )
             all_lf_tags.extend(response["LFTags"])
         return all_lf_tags
 
+    def _search_tables_by_lf_tag(
+        self, catalog_id: str, lf_tag: Dict[str, Any]
+    ) -> Iterable[List[Dict[str, Any]]]:
+        tag_values = lf_tag["TagValues"]
+        paginator = self.lf_client.get_paginator("search_tables_by_lf_tags")
+        for i in range(0, len(tag_values), LF_TAG_EXPRESSION_MAX_VALUES):
+            expression = [
+                {
+                    "TagKey": lf_tag["TagKey"],
+                    "TagValues": tag_values[i : i + LF_TAG_EXPRESSION_MAX_VALUES],
+                }
+            ]
+            for page in paginator.paginate(CatalogId=catalog_id, Expression=expression):
+                yield page["TableList"]
+
+    def search_table_lf_tags(
+        self, catalog_id: str
+    ) -> Dict[Tuple[str, str], List[LakeFormationTag]]:
+        """
+        Get the LF tags of all the tagged tables of a catalog, keyed by database and
+        table name, with one search per LF tag key rather than one call per table.
+
+        The search returns the tags that tables inherit from their database too, so
+        the tags of a table that are also on its database are excluded.
+        """
+        table_lf_tags: Dict[Tuple[str, str], List[LakeFormationTag]] = {}
+        for tagged_tables in ThreadedIteratorExecutor.process(
+            worker_func=self._search_tables_by_lf_tag,
+            args_list=[
+                (catalog_id, lf_tag)
+                for lf_tag in self.get_all_lf_tags(catalog_id)
+                if lf_tag.get("TagValues")
+            ],
+            max_workers=self.source_config.max_workers,
+            ordered=True,
+        ):
+            self.report.num_lf_tag_searches += 1
+            for tagged_table in tagged_tables:
+                table = tagged_table["Table"]
+                key = (table["DatabaseName"], table["Name"])
+                if key in table_lf_tags:
+                    continue
+                database_tags = {
+                    (lf_tag.get("TagKey"), tag_value)
+                    for lf_tag in tagged_table.get("LFTagOnDatabase", [])
+                    for tag_value in lf_tag.get("TagValues", [])
+                }
+                table_lf_tags[key] = self._parse_lf_tags(
+                    tagged_table.get("LFTagsOnTable", []), excluded_tags=database_tags
+                )
+        return table_lf_tags
+
+    def _get_table_lf_tags(self, table: Dict) -> List[LakeFormationTag]:
+        catalog_id = table["CatalogId"]
+        if catalog_id not in self._table_lf_tags_by_catalog:
+            try:
+                self._table_lf_tags_by_catalog[catalog_id] = self.search_table_lf_tags(
+                    catalog_id
+                )
+            except Exception as e:
+                self.report.warning(
+                    title="Failed to search Lake Formation tags",
+                    message="Unable to search the Lake Formation tags of the tables in bulk, "
+                    "falling back to fetching them table by table.",
+                    context=catalog_id,
+                    exc=e,
+                )
+                self._table_lf_tags_by_catalog[catalog_id] = None
+
+        table_lf_tags = self._table_lf_tags_by_catalog[catalog_id]
+        if table_lf_tags is None:
+            self.report.num_table_lf_tag_lookups += 1
+            return self.get_table_lf_tags(
+                catalog_id=catalog_id,
+                database_name=table["DatabaseName"],
+                table_name=table["Name"],
+            )
+        return table_lf_tags.get((table["DatabaseName"], table["Name"]), [])
+
     def get_glue_arn(
         self, account_id: str, database: str, table: Optional[str] = None
     ) -> str:
@@ -874,20 +995,37 @@ class GlueSource(StatefulIngestionSourceBase):
                 table["DatabaseName"] = database["Name"]
             yield table
 
+    def _list_tables_of_database(
+        self, database: Mapping[str, Any]
+    ) -> Iterable[Tuple[Mapping[str, Any], List[Dict], Optional[Exception]]]:
+        tables: List[Dict] = []
+        try:
+            tables.extend(self.get_tables_from_database(database))
+        except Exception as e:
+            yield database, tables, e
+        else:
+            yield database, tables, None
+
     def get_all_databases_and_tables(
         self,
     ) -> Tuple[List[Mapping[str, Any]], List[Dict]]:
-        all_databases = [*self.get_all_databases()]
+        all_databases = []
         all_tables = []
-        for database in all_databases:
-            try:
-                for tables in self.get_tables_from_database(database):
-                    all_tables.append(tables)
-            except Exception as e:
+        # The tables of the databases are listed concurrently, but collected in the
+        # order of the databases.
+        for database, tables, error in ThreadedIteratorExecutor.process(
+            worker_func=self._list_tables_of_database,
+            args_list=((database,) for database in self.get_all_databases()),
+            max_workers=self.source_config.max_workers,
+            ordered=True,
+        ):
+            all_databases.append(database)
+            all_tables.extend(tables)
+            if error is not None:
                 self.report.warning(
                     message="Failed to get tables from database",
                     context=database["Name"],
-                    exc=e,
+                    exc=error,
                 )
         return all_databases, all_tables
 
@@ -1328,24 +1466,34 @@ class GlueSource(StatefulIngestionSourceBase):
             dataset_urn=dataset_urn, db_name=database_name
         )
 
-    def _transform_extraction(self) -> Iterable[MetadataWorkUnit]:
-        dags: Dict[str, Optional[Dict[str, Any]]] = {}
-        flow_names: Dict[str, str] = {}
-        for job in self.get_all_jobs():
-            flow_urn = mce_builder.make_data_flow_urn(
-                self.platform, job["Name"], self.env
-            )
+    def _get_job_dataflow_graph(
+        self, job: Dict[str, Any]
+    ) -> Iterable[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]]:
+        flow_urn = mce_builder.make_data_flow_urn(self.platform, job["Name"], self.env)
 
-            yield self.get_dataflow_wu(flow_urn, job)
+        job_script_location = job.get("Command", {}).get("ScriptLocation")
 
-            job_script_location = job.get("Command", {}).get("ScriptLocation")
+        dag: Optional[Dict[str, Any]] = None
 
-            dag: Optional[Dict[str, Any]] = None
+        if job_script_location is not None:
+            dag = self.get_dataflow_graph(job_script_location, flow_urn)
+        else:
+            self.report.num_job_script_location_missing += 1
 
-            if job_script_location is not None:
-                dag = self.get_dataflow_graph(job_script_location, flow_urn)
-            else:
-                self.report.num_job_script_location_missing += 1
+        yield flow_urn, job, dag
+
+    def _transform_extraction(self) -> Iterable[MetadataWorkUnit]:
+        dags: Dict[str, Optional[Dict[str, Any]]] = {}
+        flow_names: Dict[str, str] = {}
+        # The scripts of the jobs are downloaded and parsed concurrently, but the
+        # jobs are processed in order.
+        for flow_urn, job, dag in ThreadedIteratorExecutor.process(
+            worker_func=self._get_job_dataflow_graph,
+            args_list=[(job,) for job in self.get_all_jobs()],
+            max_workers=self.source_config.max_workers,
+            ordered=True,
+        ):
+            yield self.get_dataflow_wu(flow_urn, job)
 
             dags[flow_urn] = dag
             flow_names[flow_urn] = job["Name"]
@@ -1420,11 +1568,7 @@ class GlueSource(StatefulIngestionSourceBase):
 
         # Add Lake Formation tags if enabled
         if self.source_config.extract_lakeformation_tags:
-            tags = self.get_table_lf_tags(
-                catalog_id=table["CatalogId"],
-                database_name=table["DatabaseName"],
-                table_name=table["Name"],
-            )
+            tags = self._get_table_lf_tags(table)
 
             global_tags = self._get_lake_formation_tags(tags)
             if global_tags:
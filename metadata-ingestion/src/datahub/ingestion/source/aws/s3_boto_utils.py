@@ -1,5 +1,5 @@
 import logging
-from typing import Iterable, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
 from datahub.emitter.mce_builder import make_tag_urn
 from datahub.ingestion.api.common import PipelineContext
@@ -11,6 +11,9 @@ from datahub.ingestion.source.aws.s3_util import (
 )
 from datahub.metadata.schema_classes import GlobalTagsClass, TagAssociationClass
 
+if TYPE_CHECKING:
+    from mypy_boto3_s3 import S3Client
+
 logging.getLogger("py4j").setLevel(logging.ERROR)
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -87,11 +90,15 @@ def list_folders_path(
 
 
 def list_folders(
-    bucket_name: str, prefix: str, aws_config: Optional[AwsConnectionConfig]
+    bucket_name: str,
+    prefix: str,
+    aws_config: Optional[AwsConnectionConfig],
+    s3_client: Optional["S3Client"] = None,
 ) -> Iterable[str]:
-    if aws_config is None:
-        raise ValueError("aws_config not set. Cannot browse s3")
-    s3_client = aws_config.get_s3_client()
+    if s3_client is None:
+        if aws_config is None:
+            raise ValueError("aws_config not set. Cannot browse s3")
+        s3_client = aws_config.get_s3_client()
     paginator = s3_client.get_paginator("list_objects_v2")
     for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix, Delimiter="/"):
         for o in page.get("CommonPrefixes", []):
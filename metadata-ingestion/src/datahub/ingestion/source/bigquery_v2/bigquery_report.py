@@ -15,6 +15,7 @@ from datahub.sql_parsing.sql_parsing_aggregator import SqlAggregatorReport
 from datahub.utilities.lossy_collections import LossyDict, LossyList, LossySet
 from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.stats_collections import TopKDict, int_top_k_dict
+from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutorStats
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -98,6 +99,9 @@ class BigQueryV2Report(
     num_lineage_total_log_entries: TopKDict[str, int] = field(
         default_factory=int_top_k_dict
     )
+    dataset_processing_executor: ThreadedIteratorExecutorStats = field(
+        default_factory=ThreadedIteratorExecutorStats
+    )
     num_lineage_parsed_log_entries: TopKDict[str, int] = field(
         default_factory=int_top_k_dict
     )
@@ -0,0 +1,143 @@
+"""
+An opt-in, on-disk cache of the schemas inferred from the sample files of data lake tables.
+
+Inferring a schema requires downloading (part of) the sample file of every table, even
+though most of them don't change between runs. The object stores give every version of
+an object a distinct ETag, so an inferred schema can be reused as long as the sample
+file has the same ETag, without downloading it again.
+"""
+
+import dataclasses
+import hashlib
+import json
+import pathlib
+import time
+from typing import List, NamedTuple, Optional
+
+from pydantic import Field
+
+from datahub._version import __version__
+from datahub.configuration.common import ConfigModel
+from datahub.ingestion.source.schema_inference.base import SchemaInferenceBase
+from datahub.metadata.schema_classes import SchemaFieldClass
+from datahub.utilities.sqlite_cache import SqliteCache
+
+_DEFAULT_CACHE_DIR = pathlib.Path.home() / ".datahub" / "schema_inference_cache"
+_TABLE_NAME = "inferred_schemas"
+
+
+class SchemaInferenceCacheConfig(ConfigModel):
+    enabled: bool = Field(
+        default=False,
+        description="Whether to cache the schemas inferred from sample files on disk, keyed by the URI and "
+        "ETag of the file, so that unchanged files aren't downloaded and inferred again on the next run.",
+    )
+    path: Optional[pathlib.Path] = Field(
+        default=None,
+        description="SQLite file of the cache. Defaults to a file per platform in `~/.datahub/schema_inference_cache`.",
+    )
+    max_age_days: int = Field(
+        default=30,
+        ge=1,
+        description="Cached schemas that weren't used for this many days are removed, e.g. those of files that "
+        "were overwritten or deleted.",
+    )
+
+
+class SchemaInferenceCacheConfigMixin(ConfigModel):
+    schema_inference_cache: SchemaInferenceCacheConfig = Field(
+        default_factory=SchemaInferenceCacheConfig,
+        description="On-disk cache of the schemas inferred from sample files.",
+    )
+
+
+@dataclasses.dataclass
+class SchemaInferenceCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+    expired: int = 0
+
+
+class SchemaInferenceCacheKey(NamedTuple):
+    uri: str
+    etag: str
+    # Digest of the inferrer and its settings.
+    inferrer: str
+
+
+class SchemaInferenceCache(SqliteCache):
+    """Inferred schema fields stored in a SQLite file, keyed by file version and inferrer settings."""
+
+    def __init__(self, path: pathlib.Path, max_age_days: int):
+        super().__init__(path)
+        self.stats = SchemaInferenceCacheStats()
+
+        # A file has a single version at a time, so only the schema of its latest
+        # version is kept for each inferrer.
+        self._conn.execute(
+            f"""CREATE TABLE IF NOT EXISTS {_TABLE_NAME} (
+                uri TEXT NOT NULL,
+                inferrer TEXT NOT NULL,
+                etag TEXT NOT NULL,
+                accessed_at REAL NOT NULL,
+                fields TEXT NOT NULL,
+                PRIMARY KEY (uri, inferrer)
+            )"""
+        )
+        self.stats.expired = self._delete_unused(
+            _TABLE_NAME, max_age_days * 24 * 60 * 60
+        )
+
+    @classmethod
+    def for_config(
+        cls, config: SchemaInferenceCacheConfig, platform: str
+    ) -> Optional["SchemaInferenceCache"]:
+        """Returns the cache of the config, or None if it isn't enabled."""
+        if not config.enabled:
+            return None
+        return cls.for_path(
+            config.path or _DEFAULT_CACHE_DIR / f"{platform}.sqlite",
+            config.max_age_days,
+        )
+
+    @staticmethod
+    def make_key(
+        uri: str, etag: str, inferrer: SchemaInferenceBase
+    ) -> SchemaInferenceCacheKey:
+        # The inferred schema depends on the inferrer and its settings, e.g. the number of
+        # rows that are read, and on its implementation, which may change across versions.
+        settings = json.dumps(vars(inferrer), sort_keys=True, default=str)
+        return SchemaInferenceCacheKey(
+            uri=uri,
+            etag=etag,
+            inferrer=hashlib.sha256(
+                f"{type(inferrer).__name__}\n{settings}\n{__version__}".encode()
+            ).hexdigest(),
+        )
+
+    def get(self, key: SchemaInferenceCacheKey) -> Optional[List[SchemaFieldClass]]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT fields FROM {_TABLE_NAME} WHERE uri = ? AND inferrer = ? AND etag = ?",
+                (key.uri, key.inferrer, key.etag),
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self._conn.execute(
+                f"UPDATE {_TABLE_NAME} SET accessed_at = ? WHERE uri = ? AND inferrer = ?",
+                (time.time(), key.uri, key.inferrer),
+            )
+            self.stats.hits += 1
+        return [SchemaFieldClass.from_obj(field) for field in json.loads(row["fields"])]
+
+    def put(self, key: SchemaInferenceCacheKey, fields: List[SchemaFieldClass]) -> None:
+        serialized_fields = json.dumps([field.to_obj() for field in fields])
+        with self._lock:
+            # Replaces the schema of the previous version of the file, if any.
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {_TABLE_NAME} VALUES (?, ?, ?, ?, ?)",
+                (key.uri, key.inferrer, key.etag, time.time(), serialized_fields),
+            )
+            self.stats.stored += 1
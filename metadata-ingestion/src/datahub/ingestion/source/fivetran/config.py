@@ -31,6 +31,7 @@ from datahub.ingestion.source.state.stateful_ingestion_base import (
 )
 from datahub.utilities.lossy_collections import LossyList
 from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutorStats
 
 logger = logging.getLogger(__name__)
 
@@ -141,6 +142,9 @@ class FivetranSourceReport(StaleEntityRemovalSourceReport):
     metadata_extraction_perf: MetadataExtractionPerfReport = dataclasses.field(
         default_factory=MetadataExtractionPerfReport
     )
+    processing_executor: ThreadedIteratorExecutorStats = dataclasses.field(
+        default_factory=ThreadedIteratorExecutorStats
+    )
 
     def report_connectors_scanned(self, count: int = 1) -> None:
         self.connectors_scanned += count
@@ -231,3 +235,10 @@ class FivetranSourceConfig(StatefulIngestionConfigBase, DatasetSourceConfigMixin
         7,
         description="The number of days to look back when extracting connectors' sync history.",
     )
+
+    connector_batch_size: int = pydantic.Field(
+        default=100,
+        ge=1,
+        description="The number of connectors whose lineage and sync history are fetched with a single set of "
+        "queries. The connectors of a batch are emitted while the next batch is fetched.",
+    )
@@ -323,11 +323,12 @@ class FivetranSource(StatefulIngestionSourceBase):
         Datahub Ingestion framework invoke this method
         """
         logger.info("Fivetran plugin execution is started")
-        connectors = self.audit_log.get_allowed_connectors_list(
+        connectors = self.audit_log.get_allowed_connectors_stream(
             self.config.connector_patterns,
             self.config.destination_patterns,
             self.report,
             self.config.history_sync_lookback_period,
+            self.config.connector_batch_size,
         )
         for connector in connectors:
             logger.info(f"Processing connector id: {connector.connector_id}")
@@ -1,8 +1,8 @@
 import functools
 import json
 import logging
-from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from collections import defaultdict, deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import sqlglot
 from sqlalchemy import create_engine
@@ -20,9 +20,14 @@ from datahub.ingestion.source.fivetran.data_classes import (
     TableLineage,
 )
 from datahub.ingestion.source.fivetran.fivetran_query import FivetranLogQuery
+from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutor
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Stands in for the connector ids while a query is transpiled, so that the query of
+# every batch of connectors can be built from a single transpiled query.
+_CONNECTOR_IDS_PLACEHOLDER = "__datahub_connector_ids__"
+
 
 class FivetranLogAPI:
     def __init__(self, fivetran_log_config: FivetranLogConfig) -> None:
@@ -82,15 +87,31 @@ class FivetranLogAPI:
             fivetran_log_database,
         )
 
-    def _query(self, query: str) -> List[Dict]:
+    @functools.lru_cache(maxsize=None)
+    def _transpile(self, query: str) -> str:
         # Automatically transpile snowflake query syntax to the target dialect.
         if self.fivetran_log_config.destination_platform != "snowflake":
             query = sqlglot.parse_one(query, dialect="snowflake").sql(
                 dialect=self.fivetran_log_config.destination_platform, pretty=True
             )
+        return query
+
+    def _execute(self, query: str) -> Iterator[Dict]:
         logger.info(f"Executing query: {query}")
-        resp = self.engine.execute(query)
-        return [row for row in resp]
+        # Rows are fetched from the cursor as they are consumed.
+        yield from self.engine.execute(query)
+
+    def _query(self, query: str) -> Iterator[Dict]:
+        return self._execute(self._transpile(query))
+
+    def _query_connectors(
+        self, get_query: Callable[[List[str]], str], connector_ids: List[str]
+    ) -> Iterator[Dict]:
+        query = self._transpile(get_query([_CONNECTOR_IDS_PLACEHOLDER]))
+        formatted_connector_ids = ", ".join(f"'{id}'" for id in connector_ids)
+        return self._execute(
+            query.replace(f"'{_CONNECTOR_IDS_PLACEHOLDER}'", formatted_connector_ids)
+        )
 
     def _get_column_lineage_metadata(
         self, connector_ids: List[str]
@@ -99,10 +120,8 @@ class FivetranLogAPI:
         Returns dict of column lineage metadata with key as (<SOURCE_TABLE_ID>, <DESTINATION_TABLE_ID>)
         """
         all_column_lineage = defaultdict(list)
-        column_lineage_result = self._query(
-            self.fivetran_log_query.get_column_lineage_query(
-                connector_ids=connector_ids
-            )
+        column_lineage_result = self._query_connectors(
+            self.fivetran_log_query.get_column_lineage_query, connector_ids
         )
         for column_lineage in column_lineage_result:
             key = (
@@ -117,8 +136,8 @@ class FivetranLogAPI:
         Returns dict of table lineage metadata with key as 'CONNECTOR_ID'
         """
         connectors_table_lineage_metadata = defaultdict(list)
-        table_lineage_result = self._query(
-            self.fivetran_log_query.get_table_lineage_query(connector_ids=connector_ids)
+        table_lineage_result = self._query_connectors(
+            self.fivetran_log_query.get_table_lineage_query, connector_ids
         )
         for table_lineage in table_lineage_result:
             connectors_table_lineage_metadata[
@@ -169,12 +188,15 @@ class FivetranLogAPI:
     ) -> Dict[str, Dict[str, Dict[str, Tuple[float, Optional[str]]]]]:
         sync_logs: Dict[str, Dict[str, Dict[str, Tuple[float, Optional[str]]]]] = {}
 
-        query = self.fivetran_log_query.get_sync_logs_query(
-            syncs_interval=syncs_interval,
-            connector_ids=connector_ids,
+        sync_logs_result = self._query_connectors(
+            functools.partial(
+                self.fivetran_log_query.get_sync_logs_query,
+                syncs_interval,
+            ),
+            connector_ids,
         )
 
-        for row in self._query(query):
+        for row in sync_logs_result:
             connector_id = row[Constant.CONNECTOR_ID]
             sync_id = row[Constant.SYNC_ID]
 
@@ -222,8 +244,6 @@ class FivetranLogAPI:
     @functools.lru_cache()
     def _get_users(self) -> Dict[str, str]:
         users = self._query(self.fivetran_log_query.get_users_query())
-        if not users:
-            return {}
         return {user[Constant.USER_ID]: user[Constant.EMAIL] for user in users}
 
     def get_user_email(self, user_id: str) -> Optional[str]:
@@ -251,12 +271,26 @@ class FivetranLogAPI:
         for connector in connectors:
             connector.jobs = self._get_jobs_list(sync_logs.get(connector.connector_id))
 
-    def get_allowed_connectors_list(
+    def _fill_connectors_batch(
+        self,
+        connectors: List[Connector],
+        report: FivetranSourceReport,
+        syncs_interval: int,
+    ) -> Iterable[Connector]:
+        logger.info(
+            f"Fetching lineage and job run history of {len(connectors)} connectors"
+        )
+        with report.metadata_extraction_perf.connectors_lineage_extraction_sec:
+            self._fill_connectors_lineage(connectors)
+        with report.metadata_extraction_perf.connectors_jobs_extraction_sec:
+            self._fill_connectors_jobs(connectors, syncs_interval)
+        yield from connectors
+
+    def _get_allowed_connectors(
         self,
         connector_patterns: AllowDenyPattern,
         destination_patterns: AllowDenyPattern,
         report: FivetranSourceReport,
-        syncs_interval: int,
     ) -> List[Connector]:
         connectors: List[Connector] = []
         with report.metadata_extraction_perf.connectors_metadata_extraction_sec:
@@ -290,18 +324,53 @@ class FivetranLogAPI:
                         jobs=[],  # filled later
                     )
                 )
+        return connectors
 
+    def get_allowed_connectors_stream(
+        self,
+        connector_patterns: AllowDenyPattern,
+        destination_patterns: AllowDenyPattern,
+        report: FivetranSourceReport,
+        syncs_interval: int,
+        batch_size: int,
+    ) -> Iterable[Connector]:
+        """
+        Yields the allowed connectors, with their lineage and jobs, one batch of connectors at a time.
+        """
+        connectors = deque(
+            self._get_allowed_connectors(
+                connector_patterns, destination_patterns, report
+            )
+        )
         if not connectors:
             # Some of our queries don't work well when there's no connectors, since
             # we push down connector id filters.
             logger.info("No allowed connectors found")
-            return []
+            return
         logger.info(f"Found {len(connectors)} allowed connectors")
 
-        with report.metadata_extraction_perf.connectors_lineage_extraction_sec:
-            logger.info("Fetching connector lineage")
-            self._fill_connectors_lineage(connectors)
-        with report.metadata_extraction_perf.connectors_jobs_extraction_sec:
-            logger.info("Fetching connector job run history")
-            self._fill_connectors_jobs(connectors, syncs_interval)
-        return connectors
+        def batches() -> Iterator[Tuple[List[Connector]]]:
+            # The connectors are removed from the queue as the batches are submitted,
+            # so that each batch is released once its connectors are processed.
+            while connectors:
+                yield (
+                    [
+                        connectors.popleft()
+                        for _ in range(min(batch_size, len(connectors)))
+                    ],
+                )
+
+        # The lineage and jobs of the next batch are fetched in the background, while
+        # the connectors of the previous batch are processed.
+        yield from ThreadedIteratorExecutor.process(
+            worker_func=functools.partial(
+                self._fill_connectors_batch,
+                report=report,
+                syncs_interval=syncs_interval,
+            ),
+            args_list=batches(),
+            max_workers=1,
+            max_backpressure=batch_size,
+            ordered=True,
+            stats=report.processing_executor,
+        )
@@ -23,6 +23,9 @@ from datahub.ingestion.source.data_lake_common.object_store import (
     create_object_store_adapter,
 )
 from datahub.ingestion.source.data_lake_common.path_spec import PathSpec, is_gcs_uri
+from datahub.ingestion.source.data_lake_common.schema_inference_cache import (
+    SchemaInferenceCacheConfigMixin,
+)
 from datahub.ingestion.source.s3.config import DataLakeSourceConfig
 from datahub.ingestion.source.s3.report import DataLakeSourceReport
 from datahub.ingestion.source.s3.source import S3Source
@@ -44,7 +47,10 @@ class HMACKey(ConfigModel):
 
 
 class GCSSourceConfig(
-    StatefulIngestionConfigBase, DatasetSourceConfigMixin, PathSpecsConfigMixin
+    StatefulIngestionConfigBase,
+    DatasetSourceConfigMixin,
+    PathSpecsConfigMixin,
+    SchemaInferenceCacheConfigMixin,
 ):
     credential: HMACKey = Field(
         description="Google cloud storage [HMAC keys](https://cloud.google.com/storage/docs/authentication/hmackeys)",
@@ -52,7 +58,7 @@ class GCSSourceConfig(
 
     max_rows: int = Field(
         default=100,
-        description="Maximum number of rows to use when inferring schemas for TSV and CSV files.",
+        description="Maximum number of rows to use when inferring schemas for TSV, CSV and JSON files.",
     )
 
     number_of_files_to_sample: int = Field(
@@ -100,6 +106,9 @@ class GCSSource(StatefulIngestionSourceBase):
         self.report = GCSSourceReport()
         self.platform: str = PLATFORM_GCS
         self.s3_source = self.create_equivalent_s3_source(ctx)
+        self.report.schema_inference_cache = (
+            self.s3_source.report.schema_inference_cache
+        )
 
     @classmethod
     def create(cls, config_dict, ctx):
@@ -120,6 +129,7 @@ class GCSSource(StatefulIngestionSourceBase):
             env=self.config.env,
             max_rows=self.config.max_rows,
             number_of_files_to_sample=self.config.number_of_files_to_sample,
+            schema_inference_cache=self.config.schema_inference_cache,
             platform=PLATFORM_GCS,  # Ensure GCS platform is used for correct container subtypes
         )
         return s3_config
@@ -186,3 +196,7 @@ class GCSSource(StatefulIngestionSourceBase):
 
     def get_report(self):
         return self.report
+
+    def close(self) -> None:
+        self.s3_source.close()
+        super().close()
@@ -83,6 +83,9 @@ from datahub.ingestion.source.iceberg.iceberg_common import (
     IcebergSourceReport,
 )
 from datahub.ingestion.source.iceberg.iceberg_profiler import IcebergProfiler
+from datahub.ingestion.source.iceberg.iceberg_profiling_state import (
+    IcebergProfilingStateHandler,
+)
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StaleEntityRemovalHandler,
 )
@@ -154,6 +157,13 @@ class IcebergSource(StatefulIngestionSourceBase):
         self.report: IcebergSourceReport = IcebergSourceReport()
         self.config: IcebergSourceConfig = config
         self.ctx: PipelineContext = ctx
+        self.profiler = IcebergProfiler(
+            self.report,
+            self.config.profiling,
+            IcebergProfilingStateHandler(self)
+            if self.config.profiling.use_snapshot_cache
+            else None,
+        )
 
     @classmethod
     def create(cls, config_dict: Dict, ctx: PipelineContext) -> "IcebergSource":
@@ -419,6 +429,7 @@ class IcebergSource(StatefulIngestionSourceBase):
                 )
             ],
             max_workers=self.config.processing_threads,
+            stats=self.report.table_processing_executor,
         ):
             yield wu
 
@@ -451,8 +462,7 @@ class IcebergSource(StatefulIngestionSourceBase):
         )
 
         if self.config.is_profiling_enabled():
-            profiler = IcebergProfiler(self.report, self.config.profiling)
-            yield from profiler.profile_table(dataset_name, table)
+            yield from self.profiler.profile_table(dataset_name, table)
 
     def _create_browse_paths_aspect(
         self,
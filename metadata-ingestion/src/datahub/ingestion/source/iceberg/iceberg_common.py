@@ -26,6 +26,7 @@ from datahub.ingestion.source_config.operation_config import (
 )
 from datahub.utilities.lossy_collections import LossyList
 from datahub.utilities.stats_collections import TopKDict, int_top_k_dict
+from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutorStats
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +69,16 @@ class IcebergProfilingConfig(ConfigModel):
         default_factory=OperationConfig,
         description="Experimental feature. To specify operation configs.",
     )
+    manifest_processing_threads: int = Field(
+        default=4,
+        description="How many threads will be reading the manifest files of a single table.",
+    )
+    use_snapshot_cache: bool = Field(
+        default=False,
+        description="Whether to store table profiles in the stateful ingestion state, keyed by the table's snapshot. "
+        "Tables whose snapshot hasn't changed since the last run are not profiled again, and for tables that were only "
+        "appended to, only the newly added manifests are read. Requires stateful ingestion to be enabled.",
+    )
     # Stats we cannot compute without looking at data
     # include_field_mean_value: bool = True
     # include_field_median_value: bool = True
@@ -261,6 +272,12 @@ class IcebergSourceReport(StaleEntityRemovalSourceReport):
     tables_listed_per_namespace: TopKDict[str, int] = field(
         default_factory=int_top_k_dict
     )
+    table_processing_executor: ThreadedIteratorExecutorStats = field(
+        default_factory=ThreadedIteratorExecutorStats
+    )
+    manifests_profiled: int = 0
+    profiles_from_snapshot_cache: int = 0
+    profiles_incrementally_updated: int = 0
 
     def report_listed_tables_for_namespace(
         self, namespace: str, no_tables: int
@@ -1,9 +1,14 @@
 import logging
-from typing import Any, Callable, Dict, Iterable, Optional, cast
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import reduce
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, cast
 
-from pyiceberg.conversions import from_bytes
-from pyiceberg.schema import Schema
+from pyiceberg.conversions import from_bytes, to_bytes
+from pyiceberg.manifest import ManifestFile
+from pyiceberg.schema import Schema, index_by_id
 from pyiceberg.table import Table
+from pyiceberg.table.snapshots import Operation, Snapshot
 from pyiceberg.types import (
     DateType,
     DecimalType,
@@ -12,6 +17,7 @@ from pyiceberg.types import (
     IcebergType,
     IntegerType,
     LongType,
+    PrimitiveType,
     TimestampType,
     TimestamptzType,
     TimeType,
@@ -28,6 +34,10 @@ from datahub.ingestion.source.iceberg.iceberg_common import (
     IcebergProfilingConfig,
     IcebergSourceReport,
 )
+from datahub.ingestion.source.iceberg.iceberg_profiling_state import (
+    IcebergProfilingStateHandler,
+    IcebergTableProfileState,
+)
 from datahub.metadata.schema_classes import (
     DatasetFieldProfileClass,
     DatasetProfileClass,
@@ -38,50 +48,265 @@ from datahub.utilities.perf_timer import PerfTimer
 LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class ManifestProfile:
+    """Stats aggregated from the data files of one or more manifests.
+
+    Profiles of disjoint sets of data files can be merged in any order, which allows
+    the manifests to be read concurrently, and cached profiles to be updated with the
+    manifests added since.
+    """
+
+    null_counts: Dict[int, int] = field(default_factory=dict)
+    min_bounds: Dict[int, Any] = field(default_factory=dict)
+    max_bounds: Dict[int, Any] = field(default_factory=dict)
+
+    def merge(self, other: "ManifestProfile") -> "ManifestProfile":
+        for field_id, count in other.null_counts.items():
+            self.null_counts[field_id] = self.null_counts.get(field_id, 0) + count
+        _merge_bounds(min, self.min_bounds, other.min_bounds)
+        _merge_bounds(max, self.max_bounds, other.max_bounds)
+        return self
+
+
+def _merge_bounds(
+    aggregator: Callable, aggregated_values: Dict[int, Any], values: Dict[int, Any]
+) -> None:
+    for field_id, value in values.items():
+        agg_value = aggregated_values.get(field_id)
+        aggregated_values[field_id] = (
+            aggregator(agg_value, value) if agg_value is not None else value
+        )
+
+
 class IcebergProfiler:
     def __init__(
         self,
         report: IcebergSourceReport,
         config: IcebergProfilingConfig,
+        state_handler: Optional[IcebergProfilingStateHandler] = None,
     ) -> None:
         self.report: IcebergSourceReport = report
         self.config: IcebergProfilingConfig = config
+        self.state_handler = state_handler
         self.platform: str = "iceberg"
 
-    def _aggregate_counts(
-        self,
-        aggregated_count: Dict[int, int],
-        manifest_counts: Dict[int, int],
-    ) -> Dict[int, int]:
-        return {
-            k: aggregated_count.get(k, 0) + manifest_counts.get(k, 0)
-            for k in set(aggregated_count) | set(manifest_counts)
-        }
-
     def _aggregate_bounds(
         self,
-        schema: Schema,
+        numeric_types: Dict[int, PrimitiveType],
         aggregator: Callable,
         aggregated_values: Dict[int, Any],
         manifest_values: Dict[int, bytes],
     ) -> None:
         for field_id, value_encoded in manifest_values.items():  # type: int, Any
-            try:
-                field = schema.find_field(field_id)
-            except ValueError:
-                # Bounds in manifests can reference historical field IDs that are not part of the current schema.
-                # We simply not profile those since we only care about the current snapshot.
-                continue
-            if IcebergProfiler._is_numeric_type(field.field_type):
-                value_decoded = from_bytes(field.field_type, value_encoded)
+            field_type = numeric_types.get(field_id)
+            # Bounds in manifests can reference historical field IDs that are not part of the current schema.
+            # We simply not profile those since we only care about the current snapshot.
+            if field_type is not None:
+                value_decoded = from_bytes(field_type, value_encoded)
                 if value_decoded is not None:
                     agg_value = aggregated_values.get(field_id)
                     aggregated_values[field_id] = (
                         aggregator(agg_value, value_decoded)
-                        if agg_value
+                        if agg_value is not None
                         else value_decoded
                     )
 
+    def _profile_manifest(
+        self,
+        table: Table,
+        numeric_types: Dict[int, PrimitiveType],
+        manifest: ManifestFile,
+        added_in_snapshots: Optional[Set[int]] = None,
+    ) -> ManifestProfile:
+        """Aggregates the stats of the live data files of a manifest.
+
+        If `added_in_snapshots` is set, only the data files added by those snapshots
+        are included.
+        """
+        profile = ManifestProfile()
+        for manifest_entry in manifest.fetch_manifest_entry(table.io):
+            if (
+                added_in_snapshots is not None
+                and manifest_entry.snapshot_id not in added_in_snapshots
+            ):
+                continue
+            data_file = manifest_entry.data_file
+            if self.config.include_field_null_count:
+                for field_id, count in data_file.null_value_counts.items():
+                    profile.null_counts[field_id] = (
+                        profile.null_counts.get(field_id, 0) + count
+                    )
+            if self.config.include_field_min_value:
+                self._aggregate_bounds(
+                    numeric_types, min, profile.min_bounds, data_file.lower_bounds
+                )
+            if self.config.include_field_max_value:
+                self._aggregate_bounds(
+                    numeric_types, max, profile.max_bounds, data_file.upper_bounds
+                )
+        return profile
+
+    def _profile_manifests(
+        self,
+        table: Table,
+        numeric_types: Dict[int, PrimitiveType],
+        manifests: List[ManifestFile],
+        added_in_snapshots: Optional[Set[int]] = None,
+    ) -> ManifestProfile:
+        if len(manifests) <= 1 or self.config.manifest_processing_threads <= 1:
+            profiles = [
+                self._profile_manifest(
+                    table, numeric_types, manifest, added_in_snapshots
+                )
+                for manifest in manifests
+            ]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self.config.manifest_processing_threads,
+                thread_name_prefix="iceberg_manifest",
+            ) as executor:
+                profiles = list(
+                    executor.map(
+                        lambda manifest: self._profile_manifest(
+                            table, numeric_types, manifest, added_in_snapshots
+                        ),
+                        manifests,
+                    )
+                )
+        self.report.manifests_profiled += len(manifests)
+        return reduce(ManifestProfile.merge, profiles, ManifestProfile())
+
+    @staticmethod
+    def _snapshots_appended_since(
+        table: Table, snapshot: Snapshot, since_snapshot_id: int
+    ) -> Optional[Set[int]]:
+        """Returns the ids of the snapshots after `since_snapshot_id` up to `snapshot`,
+        or None if any of them isn't an append, or the history isn't available."""
+        snapshot_ids: Set[int] = set()
+        current: Optional[Snapshot] = snapshot
+        while current is not None and current.snapshot_id != since_snapshot_id:
+            if current.summary is None or current.summary.operation != Operation.APPEND:
+                return None
+            snapshot_ids.add(current.snapshot_id)
+            current = (
+                table.snapshot_by_id(current.parent_snapshot_id)
+                if current.parent_snapshot_id is not None
+                else None
+            )
+        return snapshot_ids if current is not None else None
+
+    def _get_manifest_profile(
+        self,
+        dataset_name: str,
+        table: Table,
+        schema: Schema,
+        snapshot: Snapshot,
+    ) -> ManifestProfile:
+        numeric_types = {
+            field_id: cast(PrimitiveType, nested_field.field_type)
+            for field_id, nested_field in index_by_id(schema).items()
+            if IcebergProfiler._is_numeric_type(nested_field.field_type)
+        }
+
+        cached = self._get_cached_table_state(dataset_name, schema)
+        if cached is not None and cached.snapshot_id == snapshot.snapshot_id:
+            assert self.state_handler is not None
+            self.state_handler.set_table_state(dataset_name, cached)
+            self.report.profiles_from_snapshot_cache += 1
+            return self._decode_table_state(cached, numeric_types)
+
+        appended_snapshots = (
+            self._snapshots_appended_since(table, snapshot, cached.snapshot_id)
+            if cached is not None
+            else None
+        )
+        if cached is not None and appended_snapshots is not None:
+            # Manifests of an append-only history are never removed, so only the ones
+            # written since can contain data files we haven't seen. These may also be
+            # merged manifests, which repeat older data files as existing entries.
+            profile = self._decode_table_state(cached, numeric_types).merge(
+                self._profile_manifests(
+                    table,
+                    numeric_types,
+                    [
+                        manifest
+                        for manifest in snapshot.manifests(table.io)
+                        if manifest.added_snapshot_id in appended_snapshots
+                    ],
+                    appended_snapshots,
+                )
+            )
+            self.report.profiles_incrementally_updated += 1
+        else:
+            profile = self._profile_manifests(
+                table, numeric_types, snapshot.manifests(table.io)
+            )
+
+        if self.state_handler is not None and self.config.use_snapshot_cache:
+            self.state_handler.set_table_state(
+                dataset_name,
+                self._encode_table_state(snapshot, schema, profile, numeric_types),
+            )
+        return profile
+
+    def _get_cached_table_state(
+        self, dataset_name: str, schema: Schema
+    ) -> Optional[IcebergTableProfileState]:
+        if self.state_handler is None or not self.config.use_snapshot_cache:
+            return None
+        cached = self.state_handler.get_last_table_state(dataset_name)
+        if (
+            cached is None
+            or cached.schema_id != schema.schema_id
+            or cached.include_field_null_count != self.config.include_field_null_count
+            or cached.include_field_min_value != self.config.include_field_min_value
+            or cached.include_field_max_value != self.config.include_field_max_value
+        ):
+            return None
+        return cached
+
+    def _encode_table_state(
+        self,
+        snapshot: Snapshot,
+        schema: Schema,
+        profile: ManifestProfile,
+        numeric_types: Dict[int, PrimitiveType],
+    ) -> IcebergTableProfileState:
+        return IcebergTableProfileState(
+            snapshot_id=snapshot.snapshot_id,
+            schema_id=schema.schema_id,
+            include_field_null_count=self.config.include_field_null_count,
+            include_field_min_value=self.config.include_field_min_value,
+            include_field_max_value=self.config.include_field_max_value,
+            null_counts=profile.null_counts,
+            min_bounds={
+                field_id: to_bytes(numeric_types[field_id], value).hex()
+                for field_id, value in profile.min_bounds.items()
+            },
+            max_bounds={
+                field_id: to_bytes(numeric_types[field_id], value).hex()
+                for field_id, value in profile.max_bounds.items()
+            },
+        )
+
+    @staticmethod
+    def _decode_table_state(
+        table_state: IcebergTableProfileState,
+        numeric_types: Dict[int, PrimitiveType],
+    ) -> ManifestProfile:
+        return ManifestProfile(
+            null_counts=dict(table_state.null_counts),
+            min_bounds={
+                field_id: from_bytes(numeric_types[field_id], bytes.fromhex(value))
+                for field_id, value in table_state.min_bounds.items()
+            },
+            max_bounds={
+                field_id: from_bytes(numeric_types[field_id], bytes.fromhex(value))
+                for field_id, value in table_state.max_bounds.items()
+            },
+        )
+
     def profile_table(
         self,
         dataset_name: str,
@@ -89,7 +314,9 @@ class IcebergProfiler:
     ) -> Iterable[_Aspect]:
         """This method will profile the supplied Iceberg table by looking at the table's manifest.
 
-        The overall profile of the table is aggregated from the individual manifest files.
+        The overall profile of the table is aggregated from the individual manifest files, which are
+        read concurrently. If the snapshot cache is enabled, the aggregated stats are reused for
+        unchanged snapshots, and only updated with the newly added manifests for appends.
         We can extract the following from those manifests:
           - "field minimum values"
           - "field maximum values"
@@ -137,33 +364,12 @@ class IcebergProfiler:
             )
             dataset_profile.fieldProfiles = []
 
-            total_count = 0
-            null_counts: Dict[int, int] = {}
-            min_bounds: Dict[int, Any] = {}
-            max_bounds: Dict[int, Any] = {}
+            schema = table.schema()
+            profile = ManifestProfile()
             try:
-                for manifest in current_snapshot.manifests(table.io):
-                    for manifest_entry in manifest.fetch_manifest_entry(table.io):
-                        data_file = manifest_entry.data_file
-                        if self.config.include_field_null_count:
-                            null_counts = self._aggregate_counts(
-                                null_counts, data_file.null_value_counts
-                            )
-                        if self.config.include_field_min_value:
-                            self._aggregate_bounds(
-                                table.schema(),
-                                min,
-                                min_bounds,
-                                data_file.lower_bounds,
-                            )
-                        if self.config.include_field_max_value:
-                            self._aggregate_bounds(
-                                table.schema(),
-                                max,
-                                max_bounds,
-                                data_file.upper_bounds,
-                            )
-                        total_count += data_file.record_count
+                profile = self._get_manifest_profile(
+                    dataset_name, table, schema, current_snapshot
+                )
             except Exception as e:
                 self.report.warning(
                     title="Error when profiling a table",
@@ -173,8 +379,11 @@ class IcebergProfiler:
                 )
             if row_count:
                 # Iterating through fieldPaths introduces unwanted stats for list element fields...
-                for field_path, field_id in table.schema()._name_to_id.items():
-                    field = table.schema().find_field(field_id)
+                null_counts = profile.null_counts
+                min_bounds = profile.min_bounds
+                max_bounds = profile.max_bounds
+                for field_path, field_id in schema._name_to_id.items():
+                    field = schema.find_field(field_id)
                     column_profile = DatasetFieldProfileClass(fieldPath=field_path)
                     if self.config.include_field_null_count:
                         column_profile.nullCount = cast(
@@ -0,0 +1,103 @@
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, cast
+
+from pydantic import Field
+
+from datahub.configuration.common import ConfigModel
+from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import JobId
+from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
+from datahub.ingestion.source.state.use_case_handler import (
+    StatefulIngestionUsecaseHandlerBase,
+)
+
+if TYPE_CHECKING:
+    from datahub.ingestion.source.iceberg.iceberg import IcebergSource
+
+
+class IcebergTableProfileState(ConfigModel):
+    """The aggregated manifest stats of a table, as of a snapshot."""
+
+    snapshot_id: int
+    schema_id: int
+
+    # The profiling config the stats were computed with.
+    include_field_null_count: bool
+    include_field_min_value: bool
+    include_field_max_value: bool
+
+    # Keyed by field id. Bounds are hex encoded Iceberg single-value serializations.
+    null_counts: Dict[int, int] = Field(default_factory=dict)
+    min_bounds: Dict[int, str] = Field(default_factory=dict)
+    max_bounds: Dict[int, str] = Field(default_factory=dict)
+
+
+class IcebergProfilingCheckpointState(CheckpointStateBase):
+    # Maps dataset name -> profile state
+    tables: Dict[str, IcebergTableProfileState] = Field(default_factory=dict)
+
+
+class IcebergProfilingStateHandler(
+    StatefulIngestionUsecaseHandlerBase[IcebergProfilingCheckpointState]
+):
+    """Stores the profiles of the tables in the stateful ingestion state, so that
+    tables whose snapshot didn't change don't have to be profiled again."""
+
+    def __init__(self, source: "IcebergSource"):
+        self.state_provider = source.state_provider
+        self.config = source.config.stateful_ingestion
+        self.run_id = source.ctx.run_id
+        self.pipeline_name = source.ctx.pipeline_name
+        self.state_provider.register_stateful_ingestion_usecase_handler(self)
+
+        # Tables are profiled by multiple threads.
+        self._lock = threading.Lock()
+        self._last_state: Optional[IcebergProfilingCheckpointState] = None
+
+    def is_checkpointing_enabled(self) -> bool:
+        return self.state_provider.is_stateful_ingestion_configured()
+
+    @property
+    def job_id(self) -> JobId:
+        return JobId("iceberg_profiling")
+
+    def create_checkpoint(
+        self,
+    ) -> Optional[Checkpoint[IcebergProfilingCheckpointState]]:
+        if not self.is_checkpointing_enabled() or (
+            self.config and self.config.ignore_new_state
+        ):
+            return None
+
+        assert self.pipeline_name is not None
+        return Checkpoint(
+            job_name=self.job_id,
+            pipeline_name=self.pipeline_name,
+            run_id=self.run_id,
+            state=IcebergProfilingCheckpointState(),
+        )
+
+    def get_last_table_state(
+        self, dataset_name: str
+    ) -> Optional[IcebergTableProfileState]:
+        if not self.is_checkpointing_enabled():
+            return None
+        with self._lock:
+            if self._last_state is None:
+                last_checkpoint = self.state_provider.get_last_checkpoint(
+                    self.job_id, IcebergProfilingCheckpointState
+                )
+                self._last_state = (
+                    last_checkpoint.state
+                    if last_checkpoint and last_checkpoint.state
+                    else IcebergProfilingCheckpointState()
+                )
+            return self._last_state.tables.get(dataset_name)
+
+    def set_table_state(
+        self, dataset_name: str, table_state: IcebergTableProfileState
+    ) -> None:
+        with self._lock:
+            cur_checkpoint = self.state_provider.get_current_checkpoint(self.job_id)
+            if cur_checkpoint:
+                cur_state = cast(IcebergProfilingCheckpointState, cur_checkpoint.state)
+                cur_state.tables[dataset_name] = table_state
@@ -4,12 +4,12 @@ import re
 import urllib
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generator, Iterable, List, Optional
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
 
 import click
 import requests
 from pydantic.fields import Field
-from requests.adapters import HTTPAdapter, Retry
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter, Retry
 
 from datahub.configuration.common import AllowDenyPattern
 from datahub.configuration.source_common import DatasetSourceConfigMixin
@@ -53,6 +53,7 @@ from datahub.metadata.schema_classes import (
     StatusClass,
 )
 from datahub.utilities.lossy_collections import LossyList
+from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -125,6 +126,13 @@ class AzureADConfig(StatefulIngestionConfigBase, DatasetSourceConfigMixin):
         default=True,
         description="This option is useful only when `ingest_users` is set to False and `ingest_group_membership` to True. As effect, only the users which belongs to the selected groups will be ingested.",
     )
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of groups whose members are fetched from Microsoft Graph concurrently. "
+        "The concurrent requests share the Graph API throttling limits, requests that are throttled are "
+        "retried after the delay requested by Graph.",
+    )
     users_pattern: AllowDenyPattern = Field(
         default=AllowDenyPattern.allow_all(),
         description="regex patterns for users to filter in ingestion.",
@@ -265,7 +273,11 @@ class AzureADSource(StatefulIngestionSourceBase):
         retries = Retry(
             total=5, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504]
         )
-        adapter = HTTPAdapter(max_retries=retries)
+        # Keep a connection per worker fetching group members.
+        adapter = HTTPAdapter(
+            max_retries=retries,
+            pool_maxsize=max(self.config.max_workers, DEFAULT_POOLSIZE),
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         self.session = session
@@ -354,16 +366,29 @@ class AzureADSource(StatefulIngestionSourceBase):
             and len(self.selected_azure_ad_groups) > 0
         ):
             # 2) the groups' membership
+            mapped_azure_ad_groups = []
             for azure_ad_group in self.selected_azure_ad_groups:
-                # Azure supports nested groups, but not DataHub.  We need to explode the nested groups into a flat list.
                 datahub_corp_group_urn = self._map_azure_ad_group_to_urn(azure_ad_group)
                 if not datahub_corp_group_urn:
                     error_str = f"Failed to extract DataHub Group Name from Azure AD Group named {azure_ad_group.get('displayName')}. Skipping..."
                     self.report.report_failure("azure_ad_group_mapping", error_str)
                     continue
-                self._add_group_members_to_group_membership(
+                mapped_azure_ad_groups.append((datahub_corp_group_urn, azure_ad_group))
+
+            # The members of the groups are fetched concurrently, but added in the
+            # order of the groups, so that the memberships don't depend on timing.
+            for (
+                datahub_corp_group_urn,
+                azure_ad_user,
+            ) in ThreadedIteratorExecutor.process(
+                worker_func=self._get_azure_ad_group_users,
+                args_list=mapped_azure_ad_groups,
+                max_workers=self.config.max_workers,
+                ordered=True,
+            ):
+                self._add_user_to_group_membership(
                     datahub_corp_group_urn,
-                    azure_ad_group,
+                    azure_ad_user,
                     datahub_corp_user_urn_to_group_membership,
                 )
 
@@ -392,13 +417,10 @@ class AzureADSource(StatefulIngestionSourceBase):
                     datahub_corp_user_urn_to_group_membership,
                 )
 
-    def _add_group_members_to_group_membership(
-        self,
-        parent_corp_group_urn: str,
-        azure_ad_group: dict,
-        user_urn_to_group_membership: Dict[str, GroupMembershipClass],
-    ) -> None:
-        # Extract and map members for each group
+    def _get_azure_ad_group_users(
+        self, parent_corp_group_urn: str, azure_ad_group: dict
+    ) -> Iterable[Tuple[str, dict]]:
+        # Extract members for each group
         for azure_ad_group_members in self._get_azure_ad_group_members(azure_ad_group):
             # if group doesn't have any members, continue
             if not azure_ad_group_members:
@@ -406,17 +428,12 @@ class AzureADSource(StatefulIngestionSourceBase):
             for azure_ad_member in azure_ad_group_members:
                 odata_type = azure_ad_member.get("@odata.type")
                 if odata_type == "#microsoft.graph.user":
-                    self._add_user_to_group_membership(
-                        parent_corp_group_urn,
-                        azure_ad_member,
-                        user_urn_to_group_membership,
-                    )
+                    yield parent_corp_group_urn, azure_ad_member
                 elif odata_type == "#microsoft.graph.group":
-                    # Since DataHub does not support nested group, we add the members to the parent group and not the nested one.
-                    self._add_group_members_to_group_membership(
-                        parent_corp_group_urn,
-                        azure_ad_member,
-                        user_urn_to_group_membership,
+                    # Azure supports nested groups, but not DataHub. We need to explode the nested groups
+                    # into a flat list, so we add the members to the parent group and not the nested one.
+                    yield from self._get_azure_ad_group_users(
+                        parent_corp_group_urn, azure_ad_member
                     )
                 else:
                     # Unless told otherwise, we only care about users and groups.  Silently skip other object types.
@@ -5,7 +5,7 @@ import urllib
 from collections import defaultdict
 from dataclasses import dataclass, field
 from time import sleep
-from typing import Dict, Iterable, List, Optional, Set, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import nest_asyncio
 from okta.client import Client as OktaClient
@@ -124,6 +124,15 @@ class OktaConfig(StatefulIngestionConfigBase):
         description="Number of seconds to wait between calls to Okta's REST APIs. (Okta rate limits). Defaults to 10ms.",
     )
 
+    # Optional: Fetch the members of several groups at once.
+    max_concurrent_group_requests: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of groups whose members are fetched from Okta concurrently. "
+        "The concurrent requests share Okta's rate limits, requests that are rate limited are retried "
+        "after the limit resets.",
+    )
+
     # Optional: Filter and search expression for ingesting a subset of users. Only one can be specified at a time.
     okta_users_filter: Optional[str] = Field(
         default=None,
@@ -346,7 +355,7 @@ class OktaSource(StatefulIngestionSourceBase):
             defaultdict(lambda: GroupMembershipClass(groups=[]))
         )
         if self.config.ingest_group_membership and okta_groups is not None:
-            # Fetch membership for each group.
+            mapped_okta_groups: List[Tuple[Group, str]] = []
             for okta_group in okta_groups:
                 datahub_corp_group_urn = self._map_okta_group_profile_to_urn(
                     okta_group.profile
@@ -356,9 +365,16 @@ class OktaSource(StatefulIngestionSourceBase):
                     logger.error(error_str)
                     self.report.report_failure("okta_group_mapping", error_str)
                     continue
+                mapped_okta_groups.append((okta_group, datahub_corp_group_urn))
 
+            # Fetch membership for each group.
+            okta_groups_users = self._get_okta_groups_users(
+                [okta_group for okta_group, _ in mapped_okta_groups], event_loop
+            )
+            for (_, datahub_corp_group_urn), okta_group_users in zip(
+                mapped_okta_groups, okta_groups_users
+            ):
                 # Extract and map users for each group.
-                okta_group_users = self._get_okta_group_users(okta_group, event_loop)
                 for okta_user in okta_group_users:
                     datahub_corp_user_urn = self._map_okta_user_profile_to_urn(
                         okta_user.profile
@@ -476,18 +492,32 @@ class OktaSource(StatefulIngestionSourceBase):
             else:
                 break
 
+    # Retrieves the Okta User Objects of several Okta Groups concurrently, in the order of the groups.
+    # The groups are fetched in chunks, so that only the users of a chunk of groups are held at once.
+    def _get_okta_groups_users(
+        self, groups: List[Group], event_loop: asyncio.AbstractEventLoop
+    ) -> Iterable[List[User]]:
+        async def get_groups_users(chunk: List[Group]) -> List[List[User]]:
+            return await asyncio.gather(
+                *(self._get_okta_group_users(group) for group in chunk)
+            )
+
+        chunk_size = self.config.max_concurrent_group_requests
+        for i in range(0, len(groups), chunk_size):
+            yield from event_loop.run_until_complete(
+                get_groups_users(groups[i : i + chunk_size])
+            )
+
     # Retrieves Okta User Objects in a particular Okta Group in batches.
-    def _get_okta_group_users(
-        self, group: Group, event_loop: asyncio.AbstractEventLoop
-    ) -> Iterable[User]:
+    async def _get_okta_group_users(self, group: Group) -> List[User]:
         logger.debug(f"Extracting users from Okta group named {group.profile.name}")
 
-        # Note that this is not taking full advantage of Python AsyncIO; we are blocking on calls.
+        group_users: List[User] = []
         query_parameters = {"limit": self.config.page_size}
         users = resp = err = None
         try:
-            users, resp, err = event_loop.run_until_complete(
-                self.okta_client.list_group_users(group.id, query_parameters)
+            users, resp, err = await self.okta_client.list_group_users(
+                group.id, query_parameters
             )
         except OktaAPIException as api_err:
             self.report.report_failure(
@@ -501,11 +531,11 @@ class OktaSource(StatefulIngestionSourceBase):
                     f"Failed to fetch Users of Group {group.profile.name} from Okta API: {err}",
                 )
             if users:
-                yield from users
+                group_users.extend(users)
             if resp and resp.has_next():
-                sleep(self.config.delay_seconds)
+                await asyncio.sleep(self.config.delay_seconds)
                 try:
-                    users, err = event_loop.run_until_complete(resp.next())
+                    users, err = await resp.next()
                 except OktaAPIException as api_err:
                     self.report.report_failure(
                         "okta_group_users",
@@ -513,6 +543,7 @@ class OktaSource(StatefulIngestionSourceBase):
                     )
             else:
                 break
+        return group_users
 
     # Retrieves all Okta User Objects in batches.
     def _get_okta_users(self, event_loop: asyncio.AbstractEventLoop) -> Iterable[User]:
@@ -27,6 +27,11 @@ from requests.adapters import HTTPAdapter
 
 from datahub.configuration import ConfigModel
 from datahub.configuration.common import ConfigurationError
+from datahub.utilities.http_response_cache import (
+    HttpResponseCache,
+    HttpResponseCacheConfigMixin,
+    mount_http_response_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +44,7 @@ class TransportOptionsConfig(ConfigModel):
         return TransportOptions(timeout=self.timeout, headers=self.headers)
 
 
-class LookerAPIConfig(ConfigModel):
+class LookerAPIConfig(HttpResponseCacheConfigMixin):
     client_id: str = Field(description="Looker API client id.")
     client_secret: str = Field(description="Looker API client secret.")
     base_url: str = Field(
@@ -82,6 +87,7 @@ class LookerAPI:
         os.environ["LOOKERSDK_BASE_URL"] = config.base_url
 
         self.client = looker_sdk.init40()
+        self.http_response_cache: Optional[HttpResponseCache] = None
 
         # Somewhat hacky mechanism for enabling retries on the Looker SDK.
         # Unfortunately, it doesn't expose a cleaner way to do this.
@@ -93,6 +99,9 @@ class LookerAPI:
             )
             self.client.transport.session.mount("http://", adapter)
             self.client.transport.session.mount("https://", adapter)
+            self.http_response_cache = mount_http_response_cache(
+                self.client.transport.session, config.http_response_cache, "looker"
+            )
         elif self.config.max_retries > 0:
             logger.warning("Unable to configure retries on the Looker SDK transport.")
 
@@ -254,6 +263,9 @@ class LookerAPI:
             "client_stats": self.client_stats,
             "folder_cache": self.folder_ancestors.cache_info(),
             "user_cache": self.get_user.cache_info(),
+            "http_response_cache": (
+                self.http_response_cache.stats if self.http_response_cache else None
+            ),
         }
 
     def all_dashboards(self, fields: Union[str, List[str]]) -> Sequence[DashboardBase]:
@@ -55,13 +55,23 @@ from datahub.metadata.schema_classes import (
 )
 from datahub.sql_parsing.sqlglot_lineage import create_lineage_sql_parsed_result
 from datahub.utilities import config_clean
+from datahub.utilities.spilling_cache import (
+    SpillingCache,
+    SpillingCacheConfigMixin,
+    SpillingCacheStats,
+    memoized_method,
+)
 
 logger = logging.getLogger(__name__)
 
 DATASOURCE_URN_RECURSION_LIMIT = 5
 
 
-class MetabaseConfig(DatasetLineageProviderConfigBase, StatefulIngestionConfigBase):
+class MetabaseConfig(
+    DatasetLineageProviderConfigBase,
+    StatefulIngestionConfigBase,
+    SpillingCacheConfigMixin,
+):
     # See the Metabase /api/session endpoint for details
     # https://www.metabase.com/docs/latest/api-documentation.html#post-apisession
     connect_uri: str = Field(default="localhost:3000", description="Metabase host URL.")
@@ -121,7 +131,7 @@ class MetabaseConfig(DatasetLineageProviderConfigBase, StatefulIngestionConfigBa
 
 @dataclass
 class MetabaseReport(StaleEntityRemovalSourceReport):
-    pass
+    request_cache: Optional[SpillingCacheStats] = None
 
 
 @platform_name("Metabase")
@@ -184,6 +194,8 @@ class MetabaseSource(StatefulIngestionSourceBase):
         super().__init__(config, ctx)
         self.config = config
         self.report = MetabaseReport()
+        self.request_cache = SpillingCache[object].for_config(self.config)
+        self.report.request_cache = self.request_cache.stats
         self.setup_session()
         self.source_config: MetabaseConfig = config
 
@@ -248,6 +260,7 @@ class MetabaseSource(StatefulIngestionSourceBase):
                     title="Unable to Log User Out",
                     message=f"Unable to logout for user {self.config.username}",
                 )
+        self.request_cache.close()
         super().close()
 
     def emit_dashboard_mces(self) -> Iterable[MetadataWorkUnit]:
@@ -357,7 +370,7 @@ class MetabaseSource(StatefulIngestionSourceBase):
 
         return dashboard_snapshot
 
-    @lru_cache(maxsize=None)
+    @memoized_method("request_cache")
     def _get_ownership(self, creator_id: int) -> Optional[OwnershipClass]:
         user_info_url = f"{self.config.connect_uri}/api/user/{creator_id}"
         try:
@@ -673,7 +686,7 @@ class MetabaseSource(StatefulIngestionSourceBase):
         query_patched = re.sub(r"\{\{.+?\}\}", r"1", query_patched)
         return query_patched
 
-    @lru_cache(maxsize=None)
+    @memoized_method("request_cache")
     def get_source_table_from_id(
         self, table_id: Union[int, str]
     ) -> Tuple[Optional[str], Optional[str]]:
@@ -726,7 +739,7 @@ class MetabaseSource(StatefulIngestionSourceBase):
 
         return platform_instance
 
-    @lru_cache(maxsize=None)
+    @memoized_method("request_cache")
     def get_datasource_from_id(
         self, datasource_id: Union[int, str]
     ) -> Tuple[str, Optional[str], Optional[str], Optional[str]]:
@@ -1,13 +1,26 @@
+import contextlib
 import dataclasses
 import logging
 import os
 import re
+import threading
 import time
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from functools import lru_cache
 from json import JSONDecodeError
-from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import dateutil.parser as dp
 import psutil
@@ -18,7 +31,7 @@ import tenacity
 import yaml
 from liquid import Template, Undefined
 from pydantic import Field, validator
-from requests.adapters import HTTPAdapter, Retry
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter, Retry
 from requests.exceptions import ConnectionError
 from requests.models import HTTPBasicAuth, HTTPError
 from tenacity import retry_if_exception_type, stop_after_attempt, wait_exponential
@@ -115,8 +128,28 @@ from datahub.sql_parsing.sqlglot_lineage import (
     infer_output_schema,
 )
 from datahub.utilities import config_clean
+from datahub.utilities.http_response_cache import (
+    HttpResponseCacheConfigMixin,
+    HttpResponseCacheStats,
+    mount_http_response_cache,
+)
 from datahub.utilities.lossy_collections import LossyList
 from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.ratelimiter import (
+    RateLimitConfigMixin,
+    RateLimiterStats,
+    mount_rate_limiter,
+)
+from datahub.utilities.spilling_cache import (
+    SpillingCache,
+    SpillingCacheConfigMixin,
+    SpillingCacheStats,
+    memoized_method,
+)
+from datahub.utilities.threaded_iterator_executor import (
+    ThreadedIteratorExecutor,
+    ThreadedIteratorExecutorStats,
+)
 
 logger: logging.Logger = logging.getLogger(__name__)
 # Default API limit for items returned per API call
@@ -149,6 +182,9 @@ class ModeAPIConfig(ConfigModel):
 class ModeConfig(
     StatefulIngestionConfigBase,
     DatasetLineageProviderConfigBase,
+    HttpResponseCacheConfigMixin,
+    RateLimitConfigMixin,
+    SpillingCacheConfigMixin,
 ):
     # See https://mode.com/developer/api-reference/authentication/
     # for authentication
@@ -200,6 +236,13 @@ class ModeConfig(
         default=True, description="Tag measures and dimensions in the schema"
     )
 
+    max_threads: int = Field(
+        default=1,
+        ge=1,
+        description="Number of reports whose queries, charts and owners are fetched from the Mode API concurrently. "
+        "The output is the same as with a single thread. Consider setting `rate_limit` when increasing it.",
+    )
+
     items_per_page: int = Field(
         default=DEFAULT_API_ITEMS_PER_PAGE,
         description="Number of items per page for paginated API requests.",
@@ -259,10 +302,36 @@ class ModeSourceReport(StaleEntityRemovalSourceReport):
     dataset_get_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
     query_get_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
     chart_get_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
+    rate_limit: Optional[RateLimiterStats] = None
+    request_cache: Optional[SpillingCacheStats] = None
+    http_response_cache: Optional[HttpResponseCacheStats] = None
+    processing_executor: ThreadedIteratorExecutorStats = dataclasses.field(
+        default_factory=ThreadedIteratorExecutorStats
+    )
+
+    _timers_lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+    _running_timers: Dict[int, int] = dataclasses.field(
+        default_factory=lambda: defaultdict(int)
+    )
 
     def report_dropped_space(self, ent_name: str) -> None:
         self.filtered_spaces.append(ent_name)
 
+    @contextlib.contextmanager
+    def timed(self, timer: PerfTimer) -> Iterator[None]:
+        """Times API calls that may run concurrently: the timer runs while at least one of them is in progress."""
+        with self._timers_lock:
+            self._running_timers[id(timer)] += 1
+            if self._running_timers[id(timer)] == 1:
+                timer.start()
+        try:
+            yield
+        finally:
+            with self._timers_lock:
+                self._running_timers[id(timer)] -= 1
+                if self._running_timers[id(timer)] == 0:
+                    timer.finish()
+
 
 @platform_name("Mode")
 @config_class(ModeConfig)
@@ -360,14 +429,29 @@ class ModeSource(StatefulIngestionSourceBase):
         self.report = ModeSourceReport()
         self.ctx = ctx
 
+        self.request_cache = SpillingCache[Dict].for_config(self.config)
+        self.report.request_cache = self.request_cache.stats
+
         self.session = requests.Session()
         # Handling retry and backoff
         retries = 3
         backoff_factor = 10
         retry = Retry(total=retries, backoff_factor=backoff_factor)
-        adapter = HTTPAdapter(max_retries=retry)
+        # Keep a connection per thread fetching reports.
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_maxsize=max(self.config.max_threads, DEFAULT_POOLSIZE),
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        self.rate_limiter = mount_rate_limiter(self.session, self.config.rate_limit)
+        if self.rate_limiter is not None:
+            self.report.rate_limit = self.rate_limiter.stats
+        http_response_cache = mount_http_response_cache(
+            self.session, self.config.http_response_cache, "mode"
+        )
+        if http_response_cache is not None:
+            self.report.http_response_cache = http_response_cache.stats
 
         self.session.auth = HTTPBasicAuth(
             self.config.token,
@@ -1512,7 +1596,7 @@ class ModeSource(StatefulIngestionSourceBase):
 
     def _get_queries(self, report_token: str) -> List[dict]:
         try:
-            with self.report.query_get_timer:
+            with self.report.timed(self.report.query_get_timer):
                 # This endpoint does not handle pagination properly
                 queries = self._get_request_json(
                     f"{self.workspace_uri}/reports/{report_token}/queries"
@@ -1558,7 +1642,7 @@ class ModeSource(StatefulIngestionSourceBase):
 
     def _get_charts(self, report_token: str, query_token: str) -> List[dict]:
         try:
-            with self.report.chart_get_timer:
+            with self.report.timed(self.report.chart_get_timer):
                 # This endpoint does not handle pagination properly
                 charts = self._get_request_json(
                     f"{self.workspace_uri}/reports/{report_token}/queries/{query_token}/charts"
@@ -1596,7 +1680,7 @@ class ModeSource(StatefulIngestionSourceBase):
             yield data
             page += 1
 
-    @lru_cache(maxsize=None)
+    @memoized_method("request_cache")
     def _get_request_json(self, url: str) -> Dict:
         r = tenacity.Retrying(
             wait=wait_exponential(
@@ -1627,9 +1711,12 @@ class ModeSource(StatefulIngestionSourceBase):
                 error_response = http_error.response
                 if error_response.status_code == 429:
                     self.report.num_requests_exceeding_rate_limit += 1
-                    # respect Retry-After
+                    # respect Retry-After, unless the rate limiter of the URL already waited for it
                     sleep_time = error_response.headers.get("retry-after")
-                    if sleep_time is not None:
+                    if sleep_time is not None and (
+                        self.rate_limiter is None
+                        or self.rate_limiter.for_url(url) is None
+                    ):
                         time.sleep(float(sleep_time))
                     raise HTTPError429 from None
                 elif error_response.status_code == 504:
@@ -1685,121 +1772,154 @@ class ModeSource(StatefulIngestionSourceBase):
             aspect=BrowsePathsV2Class(path=self._browse_path_space()),
         ).as_workunit()
 
+    def _process_reports_concurrently(
+        self,
+        worker_func: Callable[[str, dict], Iterable[MetadataWorkUnit]],
+        space_token: str,
+        report_pages: Iterable[List[dict]],
+    ) -> Iterable[MetadataWorkUnit]:
+        # The reports are processed concurrently, but their work units are yielded
+        # in the order of the reports, so that the output doesn't depend on timing.
+        yield from ThreadedIteratorExecutor.process(
+            worker_func=worker_func,
+            args_list=(
+                (space_token, report)
+                for report_page in report_pages
+                for report in report_page
+            ),
+            max_workers=self.config.max_threads,
+            ordered=True,
+            stats=self.report.processing_executor,
+        )
+
     def emit_dashboard_mces(self) -> Iterable[MetadataWorkUnit]:
         for space_token, space_name in self.space_tokens.items():
             yield from self.construct_space_container(space_token, space_name)
-            space_container_key = self.gen_space_key(space_token)
+            yield from self._process_reports_concurrently(
+                self._emit_report_dashboard_mces,
+                space_token,
+                self._get_reports(space_token),
+            )
 
-            for report_page in self._get_reports(space_token):
-                for report in report_page:
-                    logger.debug(
-                        f"Report: name: {report.get('name')} token: {report.get('token')}"
-                    )
-                    dashboard_tuple_from_report = self.construct_dashboard(
-                        space_token=space_token, report_info=report
-                    )
+    def _emit_report_dashboard_mces(
+        self, space_token: str, report: dict
+    ) -> Iterable[MetadataWorkUnit]:
+        logger.debug(f"Report: name: {report.get('name')} token: {report.get('token')}")
+        dashboard_tuple_from_report = self.construct_dashboard(
+            space_token=space_token, report_info=report
+        )
 
-                    if dashboard_tuple_from_report is None:
-                        continue
-                    (
-                        dashboard_snapshot_from_report,
-                        browse_mcpw,
-                    ) = dashboard_tuple_from_report
+        if dashboard_tuple_from_report is None:
+            return
+        (
+            dashboard_snapshot_from_report,
+            browse_mcpw,
+        ) = dashboard_tuple_from_report
 
-                    mce = MetadataChangeEvent(
-                        proposedSnapshot=dashboard_snapshot_from_report
-                    )
+        mce = MetadataChangeEvent(proposedSnapshot=dashboard_snapshot_from_report)
 
-                    mcpw = MetadataChangeProposalWrapper(
-                        entityUrn=dashboard_snapshot_from_report.urn,
-                        aspect=SubTypesClass(typeNames=[BIAssetSubTypes.MODE_REPORT]),
-                    )
-                    yield mcpw.as_workunit()
-                    yield from add_dataset_to_container(
-                        container_key=space_container_key,
-                        dataset_urn=dashboard_snapshot_from_report.urn,
-                    )
-                    yield browse_mcpw.as_workunit()
+        mcpw = MetadataChangeProposalWrapper(
+            entityUrn=dashboard_snapshot_from_report.urn,
+            aspect=SubTypesClass(typeNames=[BIAssetSubTypes.MODE_REPORT]),
+        )
+        yield mcpw.as_workunit()
+        yield from add_dataset_to_container(
+            container_key=self.gen_space_key(space_token),
+            dataset_urn=dashboard_snapshot_from_report.urn,
+        )
+        yield browse_mcpw.as_workunit()
 
-                    usage_statistics = DashboardUsageStatisticsClass(
-                        timestampMillis=round(datetime.now().timestamp() * 1000),
-                        viewsCount=report.get("view_count", 0),
-                    )
+        usage_statistics = DashboardUsageStatisticsClass(
+            timestampMillis=round(datetime.now().timestamp() * 1000),
+            viewsCount=report.get("view_count", 0),
+        )
 
-                    yield MetadataChangeProposalWrapper(
-                        entityUrn=dashboard_snapshot_from_report.urn,
-                        aspect=usage_statistics,
-                    ).as_workunit()
+        yield MetadataChangeProposalWrapper(
+            entityUrn=dashboard_snapshot_from_report.urn,
+            aspect=usage_statistics,
+        ).as_workunit()
 
-                    if self.config.ingest_embed_url is True:
-                        yield self.create_embed_aspect_mcp(
-                            entity_urn=dashboard_snapshot_from_report.urn,
-                            embed_url=f"{self.config.connect_uri}/{self.config.workspace}/reports/{report.get('token')}/embed",
-                        ).as_workunit()
+        if self.config.ingest_embed_url is True:
+            yield self.create_embed_aspect_mcp(
+                entity_urn=dashboard_snapshot_from_report.urn,
+                embed_url=f"{self.config.connect_uri}/{self.config.workspace}/reports/{report.get('token')}/embed",
+            ).as_workunit()
 
-                    yield MetadataWorkUnit(
-                        id=dashboard_snapshot_from_report.urn, mce=mce
-                    )
+        yield MetadataWorkUnit(id=dashboard_snapshot_from_report.urn, mce=mce)
 
     def emit_chart_mces(self) -> Iterable[MetadataWorkUnit]:
         # Space/collection -> report -> query -> Chart
         for space_token in self.space_tokens:
-            for report_page in self._get_reports(space_token):
-                for report in report_page:
-                    report_token = report.get("token", "")
-
-                    queries = self._get_queries(report_token)
-                    for query in queries:
-                        query_mcps = self.construct_query_or_dataset(
-                            report_token,
-                            query,
-                            space_token=space_token,
-                            report_info=report,
-                            is_mode_dataset=False,
-                        )
-                        chart_fields: Dict[str, SchemaFieldClass] = {}
-                        for wu in query_mcps:
-                            if isinstance(
-                                wu.metadata, MetadataChangeProposalWrapper
-                            ) and isinstance(wu.metadata.aspect, SchemaMetadataClass):
-                                schema_metadata = wu.metadata.aspect
-                                for field in schema_metadata.fields:
-                                    chart_fields.setdefault(field.fieldPath, field)
-
-                            yield wu
-
-                        charts = self._get_charts(report_token, query.get("token", ""))
-                        # build charts
-                        for i, chart in enumerate(charts):
-                            yield from self.construct_chart_from_api_data(
-                                i,
-                                chart,
-                                chart_fields,
-                                query,
-                                space_token=space_token,
-                                report_info=report,
-                                query_name=query["name"],
-                            )
+            yield from self._process_reports_concurrently(
+                self._emit_report_chart_mces,
+                space_token,
+                self._get_reports(space_token),
+            )
+
+    def _emit_report_chart_mces(
+        self, space_token: str, report: dict
+    ) -> Iterable[MetadataWorkUnit]:
+        report_token = report.get("token", "")
+
+        queries = self._get_queries(report_token)
+        for query in queries:
+            query_mcps = self.construct_query_or_dataset(
+                report_token,
+                query,
+                space_token=space_token,
+                report_info=report,
+                is_mode_dataset=False,
+            )
+            chart_fields: Dict[str, SchemaFieldClass] = {}
+            for wu in query_mcps:
+                if isinstance(
+                    wu.metadata, MetadataChangeProposalWrapper
+                ) and isinstance(wu.metadata.aspect, SchemaMetadataClass):
+                    schema_metadata = wu.metadata.aspect
+                    for field in schema_metadata.fields:
+                        chart_fields.setdefault(field.fieldPath, field)
+
+                yield wu
+
+            charts = self._get_charts(report_token, query.get("token", ""))
+            # build charts
+            for i, chart in enumerate(charts):
+                yield from self.construct_chart_from_api_data(
+                    i,
+                    chart,
+                    chart_fields,
+                    query,
+                    space_token=space_token,
+                    report_info=report,
+                    query_name=query["name"],
+                )
 
     def emit_dataset_mces(self):
         """
         Emits MetadataChangeEvents (MCEs) for datasets within each space.
         """
         for space_token, _ in self.space_tokens.items():
-            for dataset_page in self._get_datasets(space_token):
-                for report in dataset_page:
-                    report_token = report.get("token", "")
-                    queries = self._get_queries(report_token)
-                    for query in queries:
-                        query_mcps = self.construct_query_or_dataset(
-                            report_token,
-                            query,
-                            space_token=space_token,
-                            report_info=report,
-                            is_mode_dataset=True,
-                        )
-                        for wu in query_mcps:
-                            yield wu
+            yield from self._process_reports_concurrently(
+                self._emit_report_dataset_mces,
+                space_token,
+                self._get_datasets(space_token),
+            )
+
+    def _emit_report_dataset_mces(
+        self, space_token: str, report: dict
+    ) -> Iterable[MetadataWorkUnit]:
+        report_token = report.get("token", "")
+        queries = self._get_queries(report_token)
+        for query in queries:
+            query_mcps = self.construct_query_or_dataset(
+                report_token,
+                query,
+                space_token=space_token,
+                report_info=report,
+                is_mode_dataset=True,
+            )
+            for wu in query_mcps:
+                yield wu
 
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "ModeSource":
@@ -1818,12 +1938,16 @@ class ModeSource(StatefulIngestionSourceBase):
         yield from self.emit_dashboard_mces()
         yield from self.emit_dataset_mces()
         yield from self.emit_chart_mces()
-        cache_info = self._get_request_json.cache_info()
-        self.report.get_cache_hits = cache_info.hits
-        self.report.get_cache_misses = cache_info.misses
-        self.report.get_cache_size = cache_info.currsize
+        cache_stats = self.request_cache.stats
+        self.report.get_cache_hits = cache_stats.hits + cache_stats.disk_hits
+        self.report.get_cache_misses = cache_stats.misses
+        self.report.get_cache_size = cache_stats.misses
         memory_used = self._get_process_memory()
         self.report.process_memory_used_mb = round(memory_used["rss"], 2)
 
     def get_report(self) -> SourceReport:
         return self.report
+
+    def close(self) -> None:
+        self.request_cache.close()
+        super().close()
@@ -244,7 +244,7 @@ def construct_schema_pymongo(
 
     documents = collection.aggregate(aggregations, allowDiskUse=True)
 
-    return construct_schema(list(documents), delimiter)
+    return construct_schema(documents, delimiter)
 
 
 @platform_name("MongoDB")
@@ -1,4 +1,5 @@
 import logging
+import pathlib
 from dataclasses import dataclass, field as dataclass_field
 from enum import Enum
 from typing import Dict, List, Literal, Optional, Union
@@ -23,6 +24,10 @@ from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionConfigBase,
 )
 from datahub.utilities.global_warning_util import add_global_warning
+from datahub.utilities.http_response_cache import (
+    HttpResponseCacheConfigMixin,
+    HttpResponseCacheStats,
+)
 from datahub.utilities.lossy_collections import LossyList
 from datahub.utilities.perf_timer import PerfTimer
 
@@ -220,10 +225,19 @@ class PowerBiDashboardSourceReport(StaleEntityRemovalSourceReport):
     m_query_parse_validation_errors: int = 0
     m_query_parse_unexpected_character_errors: int = 0
     m_query_parse_unknown_errors: int = 0
+    m_query_parse_cache_hits: int = 0
+    m_query_parse_pool_timer: PerfTimer = dataclass_field(default_factory=PerfTimer)
+    m_query_parse_pool_expressions: int = 0
     m_query_resolver_errors: int = 0
     m_query_resolver_no_lineage: int = 0
     m_query_resolver_successes: int = 0
 
+    scan_jobs_created: int = 0
+    max_scan_jobs_in_flight: int = 0
+    scan_wait_timer: PerfTimer = dataclass_field(default_factory=PerfTimer)
+
+    http_response_cache: Optional[HttpResponseCacheStats] = None
+
     def report_dashboards_scanned(self, count: int = 1) -> None:
         self.dashboards_scanned += count
 
@@ -289,7 +303,10 @@ class PowerBiProfilingConfig(ConfigModel):
 
 
 class PowerBiDashboardSourceConfig(
-    StatefulIngestionConfigBase, DatasetSourceConfigMixin, IncrementalLineageConfigMixin
+    StatefulIngestionConfigBase,
+    DatasetSourceConfigMixin,
+    IncrementalLineageConfigMixin,
+    HttpResponseCacheConfigMixin,
 ):
     platform_name: str = pydantic.Field(
         default=Constant.PLATFORM_NAME, hidden_from_docs=True
@@ -372,6 +389,13 @@ class PowerBiDashboardSourceConfig(
         le=100,
         description="batch size for sending workspace_ids to PBI, 100 is the limit",
     )
+    max_concurrent_scans: int = pydantic.Field(
+        default=1,
+        gt=0,
+        le=16,
+        description="Number of workspace scan jobs (each of scan_batch_size workspaces) to have in flight at the same "
+        "time. Scan results are processed as soon as each job completes. 16 is the limit of the PowerBI admin API.",
+    )
     workspace_id_as_urn_part: bool = pydantic.Field(
         default=False,
         description="It is recommended to set this to True only if you have legacy workspaces based on Office 365 groups, as those workspaces can have identical names. "
@@ -528,6 +552,21 @@ class PowerBiDashboardSourceConfig(
         "Increase this value if you encounter the 'M-Query Parsing Timeout' message in the connector report.",
     )
 
+    m_query_parse_cache_file: Optional[pathlib.Path] = pydantic.Field(
+        default=None,
+        description="Path of a local file in which the parse trees of the M-query expressions are cached across runs. "
+        "Expressions that are identical to one parsed by a previous run aren't parsed again. "
+        "Within a run, identical expressions are always parsed only once.",
+    )
+
+    m_query_parse_processes: int = pydantic.Field(
+        default=0,
+        ge=0,
+        description="Number of processes used to parse the M-query expressions of a workspace ahead of time. "
+        "Parsing is CPU bound, so this speeds up lineage extraction of workspaces with many tables. "
+        "If 0, expressions are parsed one at a time as the tables are processed.",
+    )
+
     metadata_api_timeout: int = pydantic.Field(
         default=30,
         description="timeout in seconds for Metadata Rest Api.",
@@ -1,13 +1,18 @@
+import concurrent.futures
 import functools
+import hashlib
 import importlib.resources as pkg_resource
 import logging
+import multiprocessing
 import os
-from typing import Dict, List, Optional
+import pathlib
+from typing import Dict, Iterable, List, Optional
 
 import lark
 from lark import Lark, Tree
 
 import datahub.ingestion.source.powerbi.m_query.data_classes
+from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.source.powerbi.config import (
     PowerBiDashboardSourceConfig,
@@ -21,6 +26,10 @@ from datahub.ingestion.source.powerbi.m_query.data_classes import (
     TRACE_POWERBI_MQUERY_PARSER,
 )
 from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import Table
+from datahub.utilities.file_backed_collections import (
+    ConnectionWrapper,
+    FileBackedDict,
+)
 from datahub.utilities.threading_timeout import TimeoutException, threading_timeout
 
 logger = logging.getLogger(__name__)
@@ -29,18 +38,26 @@ _M_QUERY_PARSE_TIMEOUT = int(os.getenv("DATAHUB_POWERBI_M_QUERY_PARSE_TIMEOUT",
 
 
 @functools.lru_cache(maxsize=1)
-def get_lark_parser() -> Lark:
-    # Read lexical grammar as text
-    grammar: str = pkg_resource.read_text(
+def _get_grammar() -> str:
+    return pkg_resource.read_text(
         "datahub.ingestion.source.powerbi", "powerbi-lexical-grammar.rule"
     )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_grammar_hash() -> "hashlib._Hash":
+    return hashlib.sha256(_get_grammar().encode())
+
+
+@functools.lru_cache(maxsize=1)
+def get_lark_parser() -> Lark:
+    # Read lexical grammar as text
+    grammar: str = _get_grammar()
     # Create lark parser for the grammar text
     return Lark(grammar, start="let_expression", regex=True)
 
 
-def _parse_expression(expression: str, parse_timeout: int = 60) -> Tree:
-    lark_parser: Lark = get_lark_parser()
-
+def _normalize_expression(expression: str) -> str:
     # Replace U+00a0 NO-BREAK SPACE with a normal space.
     # Sometimes PowerBI returns expressions with this character and it breaks the parser.
     expression = expression.replace("\u00a0", " ")
@@ -49,6 +66,12 @@ def _parse_expression(expression: str, parse_timeout: int = 60) -> Tree:
     # to distinguish between an empty and null set =null to ="null"
     expression = expression.replace("=null", '="null"')
 
+    return expression
+
+
+def _parse_normalized_expression(expression: str, parse_timeout: int) -> Tree:
+    lark_parser: Lark = get_lark_parser()
+
     logger.debug(f"Parsing expression = {expression}")
     with threading_timeout(parse_timeout):
         parse_tree: Tree = lark_parser.parse(expression)
@@ -59,6 +82,145 @@ def _parse_expression(expression: str, parse_timeout: int = 60) -> Tree:
     return parse_tree
 
 
+def _parse_expression(expression: str, parse_timeout: int = 60) -> Tree:
+    return _parse_normalized_expression(
+        _normalize_expression(expression), parse_timeout
+    )
+
+
+class MQueryParseCache(Closeable):
+    """
+    Parse trees of M-Query expressions, keyed by the hash of the normalized expression and of the grammar.
+
+    Datasets often share identical expressions, which are then parsed only once. If a cache file is given, the
+    parse trees are persisted in it and reused by later runs. Parse failures are only remembered for the current
+    run.
+    """
+
+    def __init__(self, cache_file: Optional[pathlib.Path] = None):
+        self._connection = ConnectionWrapper(cache_file) if cache_file else None
+        self._parse_trees: FileBackedDict[Tree] = FileBackedDict(
+            shared_connection=self._connection,
+            tablename="m_query_parse_trees",
+            should_compress_value=True,
+        )
+        self._parse_errors: Dict[str, BaseException] = {}
+
+    @staticmethod
+    def _key(normalized_expression: str) -> str:
+        digest = _get_grammar_hash().copy()
+        digest.update(normalized_expression.encode())
+        return digest.hexdigest()
+
+    def parse(
+        self,
+        expression: str,
+        parse_timeout: int,
+        reporter: PowerBiDashboardSourceReport,
+    ) -> Tree:
+        normalized_expression = _normalize_expression(expression)
+        key = self._key(normalized_expression)
+        parse_tree = self._parse_trees.get(key)
+        if parse_tree is not None:
+            reporter.m_query_parse_cache_hits += 1
+            return parse_tree
+        if key in self._parse_errors:
+            reporter.m_query_parse_cache_hits += 1
+            raise self._parse_errors[key]
+
+        try:
+            parse_tree = _parse_normalized_expression(
+                normalized_expression, parse_timeout
+            )
+        except KeyboardInterrupt:
+            raise
+        except BaseException as e:
+            self._parse_errors[key] = e
+            raise
+        self._parse_trees[key] = parse_tree
+        return parse_tree
+
+    def parse_ahead(
+        self,
+        expressions: Iterable[str],
+        parse_timeout: int,
+        processes: int,
+        reporter: PowerBiDashboardSourceReport,
+    ) -> None:
+        """
+        Parse the expressions that aren't cached yet with a pool of processes, so that the later parse calls are
+        cache hits.
+        """
+        pending: Dict[str, str] = {}
+        for expression in expressions:
+            normalized_expression = _normalize_expression(expression)
+            key = self._key(normalized_expression)
+            if key not in self._parse_trees and key not in self._parse_errors:
+                pending[key] = normalized_expression
+        if not pending:
+            return
+
+        reporter.m_query_parse_pool_expressions += len(pending)
+        with (
+            reporter.m_query_parse_pool_timer,
+            concurrent.futures.ProcessPoolExecutor(
+                max_workers=processes,
+                # Forking would copy the threads and sessions of the source.
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor,
+        ):
+            futures = {
+                executor.submit(
+                    _parse_normalized_expression, normalized_expression, parse_timeout
+                ): key
+                for key, normalized_expression in pending.items()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                try:
+                    self._parse_trees[key] = future.result()
+                except concurrent.futures.process.BrokenProcessPool as e:
+                    # Leave the remaining expressions to be parsed in this process.
+                    logger.warning(f"M-Query parse processes failed: {e}")
+                    break
+                except Exception as e:
+                    self._parse_errors[key] = e
+
+    def close(self) -> None:
+        self._parse_trees.close()
+        if self._connection is not None:
+            self._connection.close()
+
+
+def parse_ahead(
+    tables: Iterable[Table],
+    parse_cache: MQueryParseCache,
+    reporter: PowerBiDashboardSourceReport,
+    config: PowerBiDashboardSourceConfig,
+) -> None:
+    """
+    Parse the M-Query expressions of the tables with a pool of m_query_parse_processes processes, ahead of the
+    get_upstream_tables calls.
+    """
+    if config.m_query_parse_processes == 0:
+        return
+
+    expressions = [
+        table.expression
+        for table in tables
+        if table.expression is not None
+        and validator.validate_parse_tree(
+            table.expression, native_query_enabled=config.native_query_parsing
+        )[0]
+    ]
+    parse_cache.parse_ahead(
+        expressions,
+        parse_timeout=config.m_query_parse_timeout,
+        processes=config.m_query_parse_processes,
+        reporter=reporter,
+    )
+
+
 def get_upstream_tables(
     table: Table,
     reporter: PowerBiDashboardSourceReport,
@@ -66,6 +228,7 @@ def get_upstream_tables(
     ctx: PipelineContext,
     config: PowerBiDashboardSourceConfig,
     parameters: Optional[Dict[str, str]] = None,
+    parse_cache: Optional[MQueryParseCache] = None,
 ) -> List[datahub.ingestion.source.powerbi.m_query.data_classes.Lineage]:
     parameters = parameters or {}
     if table.expression is None:
@@ -95,8 +258,16 @@ def get_upstream_tables(
 
         with reporter.m_query_parse_timer:
             reporter.m_query_parse_attempts += 1
-            parse_tree: Tree = _parse_expression(
-                table.expression, parse_timeout=config.m_query_parse_timeout
+            parse_tree: Tree = (
+                parse_cache.parse(
+                    table.expression,
+                    parse_timeout=config.m_query_parse_timeout,
+                    reporter=reporter,
+                )
+                if parse_cache is not None
+                else _parse_expression(
+                    table.expression, parse_timeout=config.m_query_parse_timeout
+                )
             )
 
     except KeyboardInterrupt:
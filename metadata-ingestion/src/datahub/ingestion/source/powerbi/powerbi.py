@@ -126,11 +126,13 @@ class Mapper:
         config: PowerBiDashboardSourceConfig,
         reporter: PowerBiDashboardSourceReport,
         dataplatform_instance_resolver: AbstractDataPlatformInstanceResolver,
+        parse_cache: Optional[parser.MQueryParseCache] = None,
     ):
         self.__ctx = ctx
         self.__config = config
         self.__reporter = reporter
         self.__dataplatform_instance_resolver = dataplatform_instance_resolver
+        self.__parse_cache = parse_cache
         self.workspace_key: Optional[ContainerKey] = None
 
     @staticmethod
@@ -253,6 +255,7 @@ class Mapper:
             ctx=self.__ctx,
             config=self.__config,
             parameters=parameters,
+            parse_cache=self.__parse_cache,
         )
 
         logger.debug(
@@ -1282,8 +1285,15 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase, TestableSource):
             )  # Exit pipeline as we are not able to connect to PowerBI API Service. This exit will avoid raising
             # unwanted stacktrace on console
 
+        self.parse_cache = parser.MQueryParseCache(
+            self.source_config.m_query_parse_cache_file
+        )
         self.mapper = Mapper(
-            ctx, config, self.reporter, self.dataplatform_instance_resolver
+            ctx,
+            config,
+            self.reporter,
+            self.dataplatform_instance_resolver,
+            self.parse_cache,
         )
 
         # Create and register the stateful ingestion use-case handler.
@@ -1472,9 +1482,28 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase, TestableSource):
                 ),
             )
 
+    def parse_m_queries_ahead(self, workspace: powerbi_data_classes.Workspace) -> None:
+        if self.source_config.extract_lineage is False:
+            return
+
+        parser.parse_ahead(
+            tables=(
+                table
+                for dataset in workspace.datasets.values()
+                if self.source_config.extract_independent_datasets
+                or dataset.id not in workspace.independent_datasets
+                for table in dataset.tables
+            ),
+            parse_cache=self.parse_cache,
+            reporter=self.reporter,
+            config=self.source_config,
+        )
+
     def get_workspace_workunit(
         self, workspace: powerbi_data_classes.Workspace
     ) -> Iterable[MetadataWorkUnit]:
+        self.parse_m_queries_ahead(workspace)
+
         if self.source_config.extract_workspaces_to_containers:
             workspace_workunits = self.mapper.generate_container_for_workspace(
                 workspace
@@ -1559,31 +1588,32 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase, TestableSource):
         batches = more_itertools.chunked(
             allowed_workspaces, self.source_config.scan_batch_size
         )
-        for batch_workspaces in batches:
-            for workspace in self.powerbi_client.fill_workspaces(
-                batch_workspaces, self.reporter
-            ):
-                logger.info(f"Processing workspace id: {workspace.id}")
-
-                if self.source_config.modified_since:
-                    # As modified_workspaces is not idempotent, hence we checkpoint for each powerbi workspace
-                    # Because job_id is used as a dictionary key, we have to set a new job_id
-                    # Refer to https://github.com/datahub-project/datahub/blob/master/metadata-ingestion/src/datahub/ingestion/source/state/stateful_ingestion_base.py#L390
-                    self.stale_entity_removal_handler.set_job_id(workspace.id)
-                    self.state_provider.register_stateful_ingestion_usecase_handler(
-                        self.stale_entity_removal_handler
-                    )
+        for workspace in self.powerbi_client.fill_workspace_batches(batches):
+            logger.info(f"Processing workspace id: {workspace.id}")
 
-                    yield from self._apply_workunit_processors(
-                        [
-                            *super().get_workunit_processors(),
-                            self.stale_entity_removal_handler.workunit_processor,
-                        ],
-                        self.get_workspace_workunit(workspace),
-                    )
-                else:
-                    # Maintain backward compatibility
-                    yield from self.get_workspace_workunit(workspace)
+            if self.source_config.modified_since:
+                # As modified_workspaces is not idempotent, hence we checkpoint for each powerbi workspace
+                # Because job_id is used as a dictionary key, we have to set a new job_id
+                # Refer to https://github.com/datahub-project/datahub/blob/master/metadata-ingestion/src/datahub/ingestion/source/state/stateful_ingestion_base.py#L390
+                self.stale_entity_removal_handler.set_job_id(workspace.id)
+                self.state_provider.register_stateful_ingestion_usecase_handler(
+                    self.stale_entity_removal_handler
+                )
+
+                yield from self._apply_workunit_processors(
+                    [
+                        *super().get_workunit_processors(),
+                        self.stale_entity_removal_handler.workunit_processor,
+                    ],
+                    self.get_workspace_workunit(workspace),
+                )
+            else:
+                # Maintain backward compatibility
+                yield from self.get_workspace_workunit(workspace)
 
     def get_report(self) -> SourceReport:
         return self.reporter
+
+    def close(self) -> None:
+        self.parse_cache.close()
+        super().close()
@@ -1,7 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from time import sleep
 from typing import Any, Dict, Iterator, List, Optional, Union
 
 import msal
@@ -33,6 +32,11 @@ from datahub.ingestion.source.powerbi.rest_api_wrapper.profiling_utils import (
     process_sample_result,
 )
 from datahub.ingestion.source.powerbi.rest_api_wrapper.query import DaxQuery
+from datahub.utilities.http_response_cache import (
+    HttpResponseCache,
+    HttpResponseCacheConfig,
+    mount_http_response_cache,
+)
 
 # Logger instance
 logger = logging.getLogger(__name__)
@@ -83,6 +87,7 @@ class DataResolverBase(ABC):
         client_secret: str,
         tenant_id: str,
         metadata_api_timeout: int,
+        http_response_cache: Optional[HttpResponseCacheConfig] = None,
     ):
         self._access_token: Optional[str] = None
         self._access_token_expiry_time: Optional[datetime] = None
@@ -114,6 +119,15 @@ class DataResolverBase(ABC):
                 )
             ),
         )
+        self.http_response_cache: Optional[HttpResponseCache] = None
+        if http_response_cache is not None:
+            self.http_response_cache = mount_http_response_cache(
+                self._request_session,
+                http_response_cache,
+                "powerbi",
+                # Polled until the scan completes
+                uncached_url_patterns=["/workspaces/scanStatus/"],
+            )
 
     @abstractmethod
     def get_groups_endpoint(self) -> str:
@@ -736,6 +750,9 @@ class AdminAPIResolver(DataResolverBase):
         Constant.GET_WORKSPACE_APP: "{POWERBI_ADMIN_BASE_URL}/apps",
     }
 
+    # How long to wait between checks of the status of a scan job
+    SCAN_POLL_INTERVAL_SECONDS = 3
+
     def create_scan_job(self, workspace_ids: List[str]) -> str:
         """
         Create scan job on PowerBI for the workspace
@@ -772,76 +789,31 @@ class AdminAPIResolver(DataResolverBase):
 
         return scan_id
 
-    @staticmethod
-    def _calculate_max_retry(minimum_sleep: int, timeout: int) -> int:
-        if timeout < minimum_sleep:
-            logger.info(
-                f"Setting timeout to minimum_sleep time {minimum_sleep} seconds"
-            )
-            timeout = minimum_sleep
-
-        return timeout // minimum_sleep
-
-    def _is_scan_result_ready(
-        self,
-        scan_get_endpoint: str,
-        max_retry: int,
-        minimum_sleep_seconds: int,
-        scan_id: str,
-    ) -> bool:
-        logger.debug(f"Hitting URL={scan_get_endpoint}")
-        retry = 1
-        while True:
-            logger.debug(f"retry = {retry}")
-            res = self._request_session.get(
-                scan_get_endpoint,
-                headers=self.get_authorization_header(),
-            )
-
-            logger.debug(f"Request response = {res}")
-
-            res.raise_for_status()
+    def _is_scan_succeeded(self, scan_get_endpoint: str, scan_id: str) -> bool:
+        res = self._request_session.get(
+            scan_get_endpoint,
+            headers=self.get_authorization_header(),
+        )
 
-            if res.json()[Constant.STATUS].upper() == Constant.SUCCEEDED:
-                logger.debug(f"Scan result is available for scan id({scan_id})")
-                return True
+        logger.debug(f"Request response = {res}")
 
-            if retry == max_retry:
-                logger.warning(
-                    "Max retry reached when polling for scan job (lineage) result. Scan job is not "
-                    "available! Try increasing your max retry using config option scan_timeout"
-                )
-                break
-
-            logger.debug(
-                f"Waiting to check for scan job completion for {minimum_sleep_seconds} seconds."
-            )
-            sleep(minimum_sleep_seconds)
-            retry += 1
+        res.raise_for_status()
 
+        if res.json()[Constant.STATUS].upper() == Constant.SUCCEEDED:
+            logger.debug(f"Scan result is available for scan id({scan_id})")
+            return True
         return False
 
-    def wait_for_scan_to_complete(self, scan_id: str, timeout: int) -> Any:
+    def is_scan_complete(self, scan_id: str) -> bool:
         """
-        Poll the PowerBi service for workspace scan to complete
+        Check the status of a workspace scan once, without waiting
         """
-        minimum_sleep_seconds = 3
-        max_retry: int = AdminAPIResolver._calculate_max_retry(
-            minimum_sleep_seconds, timeout
-        )
-        # logger.info(f"Max trial {max_retry}")
-
         scan_get_endpoint = AdminAPIResolver.API_ENDPOINTS[Constant.SCAN_GET]
         scan_get_endpoint = scan_get_endpoint.format(
             POWERBI_ADMIN_BASE_URL=DataResolverBase.ADMIN_BASE_URL, SCAN_ID=scan_id
         )
-
-        return self._is_scan_result_ready(
-            scan_get_endpoint=scan_get_endpoint,
-            max_retry=max_retry,
-            minimum_sleep_seconds=minimum_sleep_seconds,
-            scan_id=scan_id,
-        )
+        logger.debug(f"Hitting URL={scan_get_endpoint}")
+        return self._is_scan_succeeded(scan_get_endpoint, scan_id)
 
     def get_users(self, workspace_id: str, entity: str, entity_id: str) -> List[User]:
         """
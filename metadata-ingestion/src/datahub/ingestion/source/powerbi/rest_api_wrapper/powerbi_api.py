@@ -1,7 +1,9 @@
+import itertools
 import json
 import logging
 import sys
-from typing import Any, Dict, Iterable, List, Optional, cast
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import requests
 
@@ -33,6 +35,11 @@ from datahub.ingestion.source.powerbi.rest_api_wrapper.data_resolver import (
 # Logger instance
 logger = logging.getLogger(__name__)
 
+SCAN_TIMEOUT_ERROR_MESSAGE = (
+    "Workspace detail is not available. Please increase the scan_timeout configuration value to wait "
+    "longer for the scan job to complete."
+)
+
 
 def form_full_table_name(
     config: PowerBiDashboardSourceConfig,
@@ -69,6 +76,7 @@ class PowerBiAPI:
             client_secret=self.__config.client_secret,
             tenant_id=self.__config.tenant_id,
             metadata_api_timeout=self.__config.metadata_api_timeout,
+            http_response_cache=self.__config.http_response_cache,
         )
 
         self.__admin_api_resolver = AdminAPIResolver(
@@ -76,9 +84,15 @@ class PowerBiAPI:
             client_secret=self.__config.client_secret,
             tenant_id=self.__config.tenant_id,
             metadata_api_timeout=self.__config.metadata_api_timeout,
+            http_response_cache=self.__config.http_response_cache,
         )
 
         self.reporter: PowerBiDashboardSourceReport = reporter
+        # Both resolvers share the cache, since they use the same file.
+        if self.__regular_api_resolver.http_response_cache is not None:
+            self.reporter.http_response_cache = (
+                self.__regular_api_resolver.http_response_cache.stats
+            )
 
         # A report or tile in one workspace can be built using a dataset from another workspace.
         # We need to store the dataset ID (which is a UUID) mapped to its dataset instance.
@@ -279,7 +293,7 @@ class PowerBiAPI:
                 dashboard_endorsements={},
                 scan_result={},
                 independent_datasets={},
-                app=None,  # It will be populated in _fill_metadata_from_scan_result method
+                app=None,  # It will be populated in _workspaces_from_scan_result method
             )
             for workspace in groups
         ]
@@ -300,8 +314,7 @@ class PowerBiAPI:
 
         return modified_workspace_ids
 
-    def _get_scan_result(self, workspace_ids: List[str]) -> Any:
-        scan_id: Optional[str] = None
+    def _create_scan_job(self, workspace_ids: List[str]) -> Optional[str]:
         try:
             scan_id = self.__admin_api_resolver.create_scan_job(
                 workspace_ids=workspace_ids
@@ -314,26 +327,63 @@ class PowerBiAPI:
                     "API. "
                 )
             return None
+        self.__reporter.scan_jobs_created += 1
+        return scan_id
 
-        logger.debug("Waiting for scan to complete")
-        if (
-            self.__admin_api_resolver.wait_for_scan_to_complete(
-                scan_id=scan_id, timeout=self.__config.scan_timeout
-            )
-            is False
-        ):
-            raise ValueError(
-                "Workspace detail is not available. Please increase the scan_timeout configuration value to wait "
-                "longer for the scan job to complete."
-            )
-
-        # Scan is complete lets take the result
+    def _fetch_scan_result(self, scan_id: str) -> Any:
         scan_result = self.__admin_api_resolver.get_scan_result(scan_id=scan_id)
-        pretty_json: str = json.dumps(scan_result, indent=1)
-        logger.debug(f"scan result = {pretty_json}")
+        # The scan result of a batch of workspaces can be large, don't serialize it for nothing
+        if logger.isEnabledFor(logging.DEBUG):
+            pretty_json: str = json.dumps(scan_result, indent=1)
+            logger.debug(f"scan result = {pretty_json}")
 
         return scan_result
 
+    def _get_scan_results(
+        self, workspace_batches: Iterable[List[Workspace]]
+    ) -> Iterable[Tuple[List[Workspace], Any]]:
+        """
+        Scan the batches of workspaces with up to max_concurrent_scans scan jobs in flight, and yield the scan
+        result of each batch as soon as its job completes. The result is None if the scan job couldn't be created.
+        """
+        batches = iter(workspace_batches)
+        # scan id -> (workspaces, deadline)
+        in_flight: Dict[str, Tuple[List[Workspace], float]] = {}
+        while True:
+            for workspaces in itertools.islice(
+                batches, self.__config.max_concurrent_scans - len(in_flight)
+            ):
+                scan_id = self._create_scan_job(
+                    [workspace.id for workspace in workspaces]
+                )
+                if scan_id is None:
+                    yield workspaces, None
+                    continue
+                in_flight[scan_id] = (
+                    workspaces,
+                    time.monotonic() + self.__config.scan_timeout,
+                )
+                self.__reporter.max_scan_jobs_in_flight = max(
+                    self.__reporter.max_scan_jobs_in_flight, len(in_flight)
+                )
+
+            if not in_flight:
+                break
+
+            completed = []
+            with self.__reporter.scan_wait_timer:
+                for scan_id, (workspaces, deadline) in list(in_flight.items()):
+                    if self.__admin_api_resolver.is_scan_complete(scan_id):
+                        del in_flight[scan_id]
+                        completed.append((workspaces, self._fetch_scan_result(scan_id)))
+                    elif time.monotonic() > deadline:
+                        raise ValueError(SCAN_TIMEOUT_ERROR_MESSAGE)
+                if not completed:
+                    logger.debug(f"Waiting for {len(in_flight)} scan jobs to complete")
+                    time.sleep(AdminAPIResolver.SCAN_POLL_INTERVAL_SECONDS)
+            # The other scan jobs keep running while the completed ones are processed
+            yield from completed
+
     @staticmethod
     def _parse_endorsement(endorsements: Optional[dict]) -> List[str]:
         if not endorsements:
@@ -530,12 +580,11 @@ class PowerBiAPI:
         app.dashboards = app_dashboards
         workspace.app = app
 
-    def _fill_metadata_from_scan_result(
+    def _workspaces_from_scan_result(
         self,
         workspaces: List[Workspace],
+        scan_result: Any,
     ) -> List[Workspace]:
-        workspace_ids = [workspace.id for workspace in workspaces]
-        scan_result = self._get_scan_result(workspace_ids)
         if not scan_result:
             return workspaces
 
@@ -673,15 +722,18 @@ class PowerBiAPI:
         fill_dashboard_tags()
         self._fill_independent_datasets(workspace=workspace)
 
-    def fill_workspaces(
-        self, workspaces: List[Workspace], reporter: PowerBiDashboardSourceReport
+    def fill_workspace_batches(
+        self, workspace_batches: Iterable[List[Workspace]]
     ) -> Iterable[Workspace]:
-        logger.info(
-            f"Fetching initial metadata for workspaces: {[workspace.format_name_for_logger() for workspace in workspaces]}"
-        )
-
-        workspaces = self._fill_metadata_from_scan_result(workspaces=workspaces)
-        # First try to fill the admin detail as some regular metadata contains lineage to admin metadata
-        for workspace in workspaces:
-            self._fill_regular_metadata_detail(workspace=workspace)
-        return workspaces
+        """
+        Scan the batches of workspaces concurrently and fill the metadata of their workspaces. The workspaces of
+        each batch are yielded as soon as its scan completes.
+        """
+        for workspaces, scan_result in self._get_scan_results(workspace_batches):
+            logger.info(
+                f"Fetching initial metadata for workspaces: {[workspace.format_name_for_logger() for workspace in workspaces]}"
+            )
+            workspaces = self._workspaces_from_scan_result(workspaces, scan_result)
+            for workspace in workspaces:
+                self._fill_regular_metadata_detail(workspace=workspace)
+            yield from workspaces
@@ -24,6 +24,7 @@ from datahub.ingestion.source.superset import (
     SupersetSourceReport,
 )
 from datahub.utilities import config_clean
+from datahub.utilities.http_response_cache import mount_http_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -115,4 +116,9 @@ class PresetSource(SupersetSource):
         test_response = requests_session.get(f"{self.config.connect_uri}/version")
         if not test_response.ok:
             logger.error("Unable to connect to workspace")
+        http_response_cache = mount_http_response_cache(
+            requests_session, self.config.http_response_cache, "preset"
+        )
+        if http_response_cache is not None:
+            self.report.http_response_cache = http_response_cache.stats
         return requests_session
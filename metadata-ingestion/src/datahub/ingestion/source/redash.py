@@ -53,7 +53,10 @@ from datahub.metadata.schema_classes import (
 from datahub.sql_parsing.sqlglot_lineage import create_lineage_sql_parsed_result
 from datahub.utilities.lossy_collections import LossyDict, LossyList, LossySet
 from datahub.utilities.perf_timer import PerfTimer
-from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutor
+from datahub.utilities.threaded_iterator_executor import (
+    ThreadedIteratorExecutor,
+    ThreadedIteratorExecutorStats,
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -307,6 +310,9 @@ class RedashSourceReport(StaleEntityRemovalSourceReport):
     max_page_dashboards: Optional[int] = field(default=None)
     api_page_limit: Optional[float] = field(default=None)
     timing: LossyDict[str, int] = field(default_factory=LossyDict)
+    page_processing_executor: ThreadedIteratorExecutorStats = field(
+        default_factory=ThreadedIteratorExecutorStats
+    )
 
     def report_item_scanned(self) -> None:
         self.items_scanned += 1
@@ -611,6 +617,7 @@ class RedashSource(StatefulIngestionSourceBase):
             self._process_dashboard_response,
             [(page,) for page in range(1, max_page + 1)],
             max_workers=self.config.parallelism,
+            stats=self.report.page_processing_executor,
         )
 
     def _get_chart_type_from_viz_data(self, viz_data: Dict) -> str:
@@ -735,6 +742,7 @@ class RedashSource(StatefulIngestionSourceBase):
             self._process_query_response,
             [(page,) for page in range(1, max_page + 1)],
             max_workers=self.config.parallelism,
+            stats=self.report.page_processing_executor,
         )
 
     def add_config_to_report(self) -> None:
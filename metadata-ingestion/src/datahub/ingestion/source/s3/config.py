@@ -13,6 +13,9 @@ from datahub.configuration.validate_field_rename import pydantic_renamed_field
 from datahub.ingestion.source.aws.aws_common import AwsConnectionConfig
 from datahub.ingestion.source.data_lake_common.config import PathSpecsConfigMixin
 from datahub.ingestion.source.data_lake_common.path_spec import PathSpec
+from datahub.ingestion.source.data_lake_common.schema_inference_cache import (
+    SchemaInferenceCacheConfigMixin,
+)
 from datahub.ingestion.source.s3.datalake_profiler_config import DataLakeProfilerConfig
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StatefulStaleMetadataRemovalConfig,
@@ -28,7 +31,10 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 
 class DataLakeSourceConfig(
-    StatefulIngestionConfigBase, DatasetSourceConfigMixin, PathSpecsConfigMixin
+    StatefulIngestionConfigBase,
+    DatasetSourceConfigMixin,
+    PathSpecsConfigMixin,
+    SchemaInferenceCacheConfigMixin,
 ):
     platform: str = Field(
         default="",
@@ -82,7 +88,7 @@ class DataLakeSourceConfig(
 
     max_rows: int = Field(
         default=100,
-        description="Maximum number of rows to use when inferring schemas for TSV and CSV files.",
+        description="Maximum number of rows to use when inferring schemas for TSV, CSV and JSON files.",
     )
     add_partition_columns_to_schema: bool = Field(
         default=False,
@@ -98,6 +104,15 @@ class DataLakeSourceConfig(
         description="Number of files to list to sample for schema inference. This will be ignored if sample_files is set to False in the pathspec.",
     )
 
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of threads used to list the folders of the tables of a `{table}` path spec, "
+        "and to infer the schemas of the tables from their sample files, concurrently. "
+        "Workunits are emitted in the same order as with a single thread. "
+        "The threads share an S3 client with a connection pool of this size.",
+    )
+
     _rename_path_spec_to_plural = pydantic_renamed_field(
         "path_spec", "path_specs", lambda path_spec: [path_spec]
     )
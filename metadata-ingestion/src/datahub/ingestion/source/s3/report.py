@@ -1,6 +1,10 @@
 import dataclasses
 from dataclasses import field as dataclass_field
+from typing import Optional
 
+from datahub.ingestion.source.data_lake_common.schema_inference_cache import (
+    SchemaInferenceCacheStats,
+)
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StaleEntityRemovalSourceReport,
 )
@@ -12,6 +16,7 @@ class DataLakeSourceReport(StaleEntityRemovalSourceReport):
     files_scanned = 0
     filtered: LossyList[str] = dataclass_field(default_factory=LossyList)
     number_of_files_filtered: int = 0
+    schema_inference_cache: Optional[SchemaInferenceCacheStats] = None
 
     def report_file_scanned(self) -> None:
         self.files_scanned += 1
@@ -4,12 +4,24 @@ import logging
 import os
 import pathlib
 import re
+import threading
 import time
 from datetime import datetime
 from pathlib import PurePath
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import smart_open.compression as so_compression
+from botocore.endpoint import MAX_POOL_CONNECTIONS
 from more_itertools import peekable
 from pyspark.conf import SparkConf
 from pyspark.sql import SparkSession
@@ -50,6 +62,9 @@ from datahub.ingestion.source.data_lake_common.object_store import (
     create_object_store_adapter,
 )
 from datahub.ingestion.source.data_lake_common.path_spec import FolderTraversalMethod
+from datahub.ingestion.source.data_lake_common.schema_inference_cache import (
+    SchemaInferenceCache,
+)
 from datahub.ingestion.source.s3.config import DataLakeSourceConfig, PathSpec
 from datahub.ingestion.source.s3.report import DataLakeSourceReport
 from datahub.ingestion.source.schema_inference import avro, csv_tsv, json, parquet
@@ -72,13 +87,18 @@ from datahub.metadata.schema_classes import (
     OtherSchemaClass,
     PartitionsSummaryClass,
     PartitionSummaryClass,
+    SchemaFieldClass,
     _Aspect,
 )
 from datahub.telemetry import stats, telemetry
 from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutor
 
 if TYPE_CHECKING:
-    from mypy_boto3_s3.service_resource import Bucket
+    from mypy_boto3_s3 import S3Client
+    from mypy_boto3_s3.service_resource import Bucket, S3ServiceResource
+
+T = TypeVar("T")
 
 # hide annoying debug errors from py4j
 logging.getLogger("py4j").setLevel(logging.ERROR)
@@ -152,6 +172,7 @@ class Folder:
     sample_file: str
     partition_id: Optional[List[Tuple[str, str]]] = None
     is_partition: bool = False
+    sample_file_etag: Optional[str] = None
 
     def partition_id_text(self) -> Optional[str]:
         return (
@@ -177,6 +198,7 @@ class BrowsePath:
     size: int
     partitions: List[Folder]
     content_type: Optional[str] = None
+    etag: Optional[str] = None
 
 
 @dataclasses.dataclass
@@ -192,6 +214,8 @@ class TableData:
     max_partition: Optional[Folder] = None
     min_partition: Optional[Folder] = None
     content_type: Optional[str] = None
+    # The ETag of the file at full_path, if known from the listing.
+    etag: Optional[str] = None
 
 
 @platform_name("S3 / Local Files", id="s3")
@@ -222,6 +246,16 @@ class S3Source(StatefulIngestionSourceBase):
         self.source_config = config
         self.report = DataLakeSourceReport()
         self.profiling_times_taken = []
+        # The S3 client is thread-safe and shared by all the threads, while boto3
+        # resources aren't, so each thread gets its own.
+        self._s3_client: Optional["S3Client"] = None
+        self._s3_client_lock = threading.Lock()
+        self._thread_local = threading.local()
+        self.schema_inference_cache = SchemaInferenceCache.for_config(
+            config.schema_inference_cache, config.platform
+        )
+        if self.schema_inference_cache:
+            self.report.schema_inference_cache = self.schema_inference_cache.stats
         self.container_WU_creator = ContainerWUCreator(
             self.source_config.platform,
             self.source_config.platform_instance,
@@ -432,23 +466,102 @@ class S3Source(StatefulIngestionSourceBase):
         # see https://mungingdata.com/pyspark/avoid-dots-periods-column-names/
         return df.toDF(*(c.replace(".", "_") for c in df.columns))
 
-    def get_fields(self, table_data: TableData, path_spec: PathSpec) -> List:
-        if self.is_s3_platform():
-            if self.source_config.aws_config is None:
-                raise ValueError("AWS config is required for S3 file sources")
+    def _should_recreate_aws_clients(self) -> bool:
+        aws_config = self.source_config.aws_config
+        assert aws_config is not None
+        # Assumed role credentials expire, and are refreshed with a new session.
+        return (
+            aws_config.allowed_cred_refresh()
+            and aws_config._should_refresh_credentials()
+        )
+
+    def _get_s3_client(self) -> "S3Client":
+        if self.source_config.aws_config is None:
+            raise ValueError("AWS config is required for S3 file sources")
+
+        with self._s3_client_lock:
+            if self._s3_client is None or self._should_recreate_aws_clients():
+                self._s3_client = self.source_config.aws_config.get_s3_client(
+                    self.source_config.verify_ssl,
+                    max_pool_connections=max(
+                        self.source_config.max_workers, MAX_POOL_CONNECTIONS
+                    ),
+                )
+            return self._s3_client
+
+    def _get_s3_bucket(self, bucket_name: str) -> "Bucket":
+        if self.source_config.aws_config is None:
+            raise ValueError("aws_config not set. Cannot browse s3")
+
+        s3: Optional["S3ServiceResource"] = getattr(
+            self._thread_local, "s3_resource", None
+        )
+        if s3 is None or self._should_recreate_aws_clients():
+            s3 = self._thread_local.s3_resource = (
+                self.source_config.aws_config.get_s3_resource(
+                    self.source_config.verify_ssl
+                )
+            )
+        return s3.Bucket(bucket_name)
+
+    def _process_concurrently(
+        self,
+        worker_func: Callable[..., Iterable[T]],
+        args_list: Iterable[Tuple[Any, ...]],
+    ) -> Iterable[T]:
+        """Runs the jobs in `max_workers` threads, and yields their items in order."""
+        if self.source_config.max_workers == 1:
+            for args in args_list:
+                yield from worker_func(*args)
+        else:
+            yield from ThreadedIteratorExecutor.process(
+                worker_func=worker_func,
+                args_list=args_list,
+                max_workers=self.source_config.max_workers,
+                ordered=True,
+            )
 
-            s3_client = self.source_config.aws_config.get_s3_client(
-                self.source_config.verify_ssl
+    def _infer_fields(
+        self, table_data: TableData, inferrer: SchemaInferenceBase
+    ) -> List[SchemaFieldClass]:
+        cache_key = None
+        if self.schema_inference_cache and table_data.etag:
+            cache_key = SchemaInferenceCache.make_key(
+                table_data.full_path, table_data.etag, inferrer
             )
+            cached_fields = self.schema_inference_cache.get(cache_key)
+            if cached_fields is not None:
+                logger.debug(f"Using the cached schema of {table_data.full_path}")
+                return cached_fields
 
+        if self.is_s3_platform():
             file = smart_open(
-                table_data.full_path, "rb", transport_params={"client": s3_client}
+                table_data.full_path,
+                "rb",
+                transport_params={"client": self._get_s3_client()},
             )
         else:
             # We still use smart_open here to take advantage of the compression
             # capabilities of smart_open.
             file = smart_open(table_data.full_path, "rb")
 
+        try:
+            fields = inferrer.infer_schema(file)
+            logger.debug(f"Extracted fields in schema: {fields}")
+        except Exception as e:
+            self.report.report_warning(
+                table_data.full_path,
+                f"could not infer schema for file {table_data.full_path}: {e}",
+            )
+            return []
+        finally:
+            file.close()
+
+        if self.schema_inference_cache and cache_key:
+            self.schema_inference_cache.put(cache_key, fields)
+        return fields
+
+    def get_fields(self, table_data: TableData, path_spec: PathSpec) -> List:
         extension = pathlib.Path(table_data.full_path).suffix
         from datahub.ingestion.source.data_lake_common.path_spec import (
             SUPPORTED_COMPRESSIONS,
@@ -463,20 +576,12 @@ class S3Source(StatefulIngestionSourceBase):
         fields = []
         inferrer = self._get_inferrer(extension, table_data.content_type)
         if inferrer:
-            try:
-                fields = inferrer.infer_schema(file)
-                logger.debug(f"Extracted fields in schema: {fields}")
-            except Exception as e:
-                self.report.report_warning(
-                    table_data.full_path,
-                    f"could not infer schema for file {table_data.full_path}: {e}",
-                )
+            fields = self._infer_fields(table_data, inferrer)
         else:
             self.report.report_warning(
                 table_data.full_path,
                 f"file {table_data.full_path} has unsupported extension",
             )
-        file.close()
 
         if self.source_config.sort_schema_fields:
             fields = sorted(fields, key=lambda f: f.fieldPath)
@@ -498,7 +603,7 @@ class S3Source(StatefulIngestionSourceBase):
         elif content_type == "text/tab-separated-values":
             return csv_tsv.TsvInferrer(max_rows=self.source_config.max_rows)
         elif content_type == "application/json":
-            return json.JsonInferrer()
+            return json.JsonInferrer(max_rows=self.source_config.max_rows)
         elif content_type == "application/avro":
             return avro.AvroInferrer()
         elif extension == ".parquet":
@@ -512,7 +617,7 @@ class S3Source(StatefulIngestionSourceBase):
                 max_rows=self.source_config.max_rows, format="jsonl"
             )
         elif extension == ".json":
-            return json.JsonInferrer()
+            return json.JsonInferrer(max_rows=self.source_config.max_rows)
         elif extension == ".avro":
             return avro.AvroInferrer()
         else:
@@ -655,8 +760,48 @@ class S3Source(StatefulIngestionSourceBase):
         # The adapter handles all the URL generation with proper region handling
         return self.object_store_adapter.get_external_url(table_data)
 
+    def _get_schema_metadata(
+        self, table_data: TableData, path_spec: PathSpec
+    ) -> Optional[SchemaMetadata]:
+        if table_data.size_in_bytes <= 0:
+            logger.info(
+                f"Skipping schema extraction for empty file {table_data.full_path}"
+            )
+            return None
+
+        try:
+            fields = self.get_fields(table_data, path_spec)
+            return SchemaMetadata(
+                schemaName=table_data.display_name,
+                platform=make_data_platform_urn(self.source_config.platform),
+                version=0,
+                hash="",
+                fields=fields,
+                platformSchema=OtherSchemaClass(rawSchema=""),
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to extract schema from file {table_data.full_path}. The error was:{e}"
+            )
+            return None
+
+    def _infer_table_schema(
+        self, table_data: TableData, path_spec: PathSpec
+    ) -> Iterable[Tuple[TableData, Optional[SchemaMetadata]]]:
+        yield table_data, self._get_schema_metadata(table_data, path_spec)
+
     def ingest_table(
         self, table_data: TableData, path_spec: PathSpec
+    ) -> Iterable[MetadataWorkUnit]:
+        yield from self._ingest_table(
+            table_data, path_spec, self._get_schema_metadata(table_data, path_spec)
+        )
+
+    def _ingest_table(
+        self,
+        table_data: TableData,
+        path_spec: PathSpec,
+        schema_metadata: Optional[SchemaMetadata],
     ) -> Iterable[MetadataWorkUnit]:
         aspects: List[Optional[_Aspect]] = []
 
@@ -727,26 +872,8 @@ class S3Source(StatefulIngestionSourceBase):
             externalUrl=self.get_external_url(table_data),
         )
         aspects.append(dataset_properties)
-        if table_data.size_in_bytes > 0:
-            try:
-                fields = self.get_fields(table_data, path_spec)
-                schema_metadata = SchemaMetadata(
-                    schemaName=table_data.display_name,
-                    platform=data_platform_urn,
-                    version=0,
-                    hash="",
-                    fields=fields,
-                    platformSchema=OtherSchemaClass(rawSchema=""),
-                )
-                aspects.append(schema_metadata)
-            except Exception as e:
-                logger.error(
-                    f"Failed to extract schema from file {table_data.full_path}. The error was:{e}"
-                )
-        else:
-            logger.info(
-                f"Skipping schema extraction for empty file {table_data.full_path}"
-            )
+        if schema_metadata is not None:
+            aspects.append(schema_metadata)
 
         if (
             self.source_config.use_s3_bucket_tags
@@ -834,6 +961,7 @@ class S3Source(StatefulIngestionSourceBase):
                 )
             ),
             content_type=browse_path.content_type,
+            etag=browse_path.etag,
         )
 
     def resolve_templated_folders(self, bucket_name: str, prefix: str) -> Iterable[str]:
@@ -876,6 +1004,7 @@ class S3Source(StatefulIngestionSourceBase):
             bucket_name=bucket_name,
             prefix=folder,
             aws_config=self.source_config.aws_config,
+            s3_client=self._get_s3_client(),
         )
         iterator = peekable(iterator)
         if iterator:
@@ -990,6 +1119,7 @@ class S3Source(StatefulIngestionSourceBase):
                 modification_time=folder_info.max_time,
                 sample_file=max_file_s3_path,
                 size=folder_info.total_size,
+                sample_file_etag=latest_obj.e_tag,
             )
 
     def create_s3_path(self, bucket_name: str, key: str) -> str:
@@ -1115,167 +1245,172 @@ class S3Source(StatefulIngestionSourceBase):
             logger.info(f"Resolved prefixes: {resolved_prefixes}")
 
             # STEP 3: Process each resolved prefix to find table folders
+            table_folders: List[str] = []
             for resolved_prefix in resolved_prefixes:
                 logger.info(f"Processing resolved prefix: {resolved_prefix}")
 
                 # Get all folders that could be tables under this resolved prefix
                 # These are the actual table names (e.g., "users", "events", "logs")
-                table_folders = list(
+                folders = list(
                     list_folders(
-                        bucket_name, resolved_prefix, self.source_config.aws_config
+                        bucket_name,
+                        resolved_prefix,
+                        self.source_config.aws_config,
+                        s3_client=self._get_s3_client(),
                     )
                 )
-                logger.debug(
-                    f"Found table folders under {resolved_prefix}: {table_folders}"
+                logger.debug(f"Found table folders under {resolved_prefix}: {folders}")
+                table_folders.extend(folders)
+
+            # STEP 4: Process each table folder to create a table-level dataset.
+            # Listing the partitions of the tables is independent, so it runs in
+            # `max_workers` threads, and the tables are still yielded in order.
+            yield from self._process_concurrently(
+                self._browse_table_folder,
+                (
+                    (path_spec, bucket_name, table_folder)
+                    for table_folder in table_folders
+                ),
+            )
+
+        except Exception as e:
+            if "NoSuchBucket" in repr(e):
+                self.get_report().report_warning(
+                    "Missing bucket", f"No bucket found {bucket_name}"
                 )
+                return
+            logger.error(f"Error in _process_templated_path: {e}")
+            raise e
 
-                # STEP 4: Process each table folder to create a table-level dataset
-                for table_folder in table_folders:
-                    # Create the full S3 path for this table
-                    table_s3_path = self.create_s3_path(
-                        bucket_name, table_folder.rstrip("/")
-                    )
-                    logger.info(
-                        f"Processing table folder: {table_folder} -> {table_s3_path}"
-                    )
+    def _browse_table_folder(
+        self, path_spec: PathSpec, bucket_name: str, table_folder: str
+    ) -> Iterable[BrowsePath]:
+        """
+        Creates the table-level dataset of a single table folder found by
+        `_process_templated_path`. It may run in a worker thread.
+        """
+        # Create the full S3 path for this table
+        table_s3_path = self.create_s3_path(bucket_name, table_folder.rstrip("/"))
+        logger.info(f"Processing table folder: {table_folder} -> {table_s3_path}")
 
-                    # Extract table name using the ORIGINAL path spec pattern matching (not the modified one)
-                    # This uses the compiled regex pattern to extract the table name from the full path
-                    table_name, table_path = path_spec.extract_table_name_and_path(
-                        table_s3_path
-                    )
+        # Extract table name using the ORIGINAL path spec pattern matching (not the modified one)
+        # This uses the compiled regex pattern to extract the table name from the full path
+        table_name, table_path = path_spec.extract_table_name_and_path(table_s3_path)
 
-                    # Apply table name filtering if configured
-                    if not path_spec.tables_filter_pattern.allowed(table_name):
-                        logger.debug(f"Table '{table_name}' not allowed and skipping")
-                        continue
+        # Apply table name filtering if configured
+        if not path_spec.tables_filter_pattern.allowed(table_name):
+            logger.debug(f"Table '{table_name}' not allowed and skipping")
+            return
 
-                    # STEP 5: Handle partition traversal based on configuration
-                    # Get all partition folders first
-                    all_partition_folders = list(
-                        list_folders(
-                            bucket_name, table_folder, self.source_config.aws_config
-                        )
-                    )
-                    logger.info(
-                        f"Found {len(all_partition_folders)} partition folders under table {table_name} using method {path_spec.traversal_method}"
+        # boto3 resources aren't thread-safe, so each thread browses its own
+        bucket = self._get_s3_bucket(bucket_name)
+
+        # STEP 5: Handle partition traversal based on configuration
+        # Get all partition folders first
+        all_partition_folders = list(
+            list_folders(
+                bucket_name,
+                table_folder,
+                self.source_config.aws_config,
+                s3_client=self._get_s3_client(),
+            )
+        )
+        logger.info(
+            f"Found {len(all_partition_folders)} partition folders under table {table_name} using method {path_spec.traversal_method}"
+        )
+
+        if all_partition_folders:
+            # Apply the same traversal logic as the original code
+            dirs_to_process = []
+
+            if path_spec.traversal_method == FolderTraversalMethod.ALL:
+                # Process ALL partitions (original behavior)
+                dirs_to_process = all_partition_folders
+                logger.debug(f"Processing ALL {len(all_partition_folders)} partitions")
+
+            else:
+                # Use the original get_dir_to_process logic for MIN/MAX
+                protocol = "s3://"  # Default protocol for S3
+
+                if (
+                    path_spec.traversal_method == FolderTraversalMethod.MIN_MAX
+                    or path_spec.traversal_method == FolderTraversalMethod.MAX
+                ):
+                    # Get MAX partition using original logic
+                    dirs_to_process_max = self.get_dir_to_process(
+                        bucket_name=bucket_name,
+                        folder=table_folder + "/",
+                        path_spec=path_spec,
+                        protocol=protocol,
+                        min=False,
                     )
+                    if dirs_to_process_max:
+                        # Convert full S3 paths back to relative paths for processing
+                        dirs_to_process.extend(
+                            [
+                                d.replace(f"{protocol}{bucket_name}/", "")
+                                for d in dirs_to_process_max
+                            ]
+                        )
+                        logger.debug(f"Added MAX partition: {dirs_to_process_max}")
 
-                    if all_partition_folders:
-                        # Apply the same traversal logic as the original code
-                        dirs_to_process = []
-
-                        if path_spec.traversal_method == FolderTraversalMethod.ALL:
-                            # Process ALL partitions (original behavior)
-                            dirs_to_process = all_partition_folders
-                            logger.debug(
-                                f"Processing ALL {len(all_partition_folders)} partitions"
-                            )
-
-                        else:
-                            # Use the original get_dir_to_process logic for MIN/MAX
-                            protocol = "s3://"  # Default protocol for S3
-
-                            if (
-                                path_spec.traversal_method
-                                == FolderTraversalMethod.MIN_MAX
-                                or path_spec.traversal_method
-                                == FolderTraversalMethod.MAX
-                            ):
-                                # Get MAX partition using original logic
-                                dirs_to_process_max = self.get_dir_to_process(
-                                    bucket_name=bucket_name,
-                                    folder=table_folder + "/",
-                                    path_spec=path_spec,
-                                    protocol=protocol,
-                                    min=False,
-                                )
-                                if dirs_to_process_max:
-                                    # Convert full S3 paths back to relative paths for processing
-                                    dirs_to_process.extend(
-                                        [
-                                            d.replace(f"{protocol}{bucket_name}/", "")
-                                            for d in dirs_to_process_max
-                                        ]
-                                    )
-                                    logger.debug(
-                                        f"Added MAX partition: {dirs_to_process_max}"
-                                    )
-
-                            if (
-                                path_spec.traversal_method
-                                == FolderTraversalMethod.MIN_MAX
-                            ):
-                                # Get MIN partition using original logic
-                                dirs_to_process_min = self.get_dir_to_process(
-                                    bucket_name=bucket_name,
-                                    folder=table_folder + "/",
-                                    path_spec=path_spec,
-                                    protocol=protocol,
-                                    min=True,
-                                )
-                                if dirs_to_process_min:
-                                    # Convert full S3 paths back to relative paths for processing
-                                    dirs_to_process.extend(
-                                        [
-                                            d.replace(f"{protocol}{bucket_name}/", "")
-                                            for d in dirs_to_process_min
-                                        ]
-                                    )
-                                    logger.debug(
-                                        f"Added MIN partition: {dirs_to_process_min}"
-                                    )
-
-                        # Process the selected partitions
-                        all_folders = []
-                        for partition_folder in dirs_to_process:
-                            # Ensure we have a clean folder path
-                            clean_folder = partition_folder.rstrip("/")
-
-                            logger.info(f"Scanning files in partition: {clean_folder}")
-                            partition_files = list(
-                                self.get_folder_info(path_spec, bucket, clean_folder)
-                            )
-                            all_folders.extend(partition_files)
-
-                        if all_folders:
-                            # Use the most recent file across all processed partitions
-                            latest_file = max(
-                                all_folders, key=lambda x: x.modification_time
-                            )
-
-                            # Get partition information
-                            partitions = [f for f in all_folders if f.is_partition]
-
-                            # Calculate total size of processed partitions
-                            total_size = sum(f.size for f in all_folders)
-
-                            # Create ONE BrowsePath per table
-                            # The key insight: we need to provide the sample file for schema inference
-                            # but the table path should be extracted correctly by extract_table_name_and_path
-                            yield BrowsePath(
-                                file=latest_file.sample_file,  # Sample file for schema inference
-                                timestamp=latest_file.modification_time,  # Latest timestamp
-                                size=total_size,  # Size of processed partitions
-                                partitions=partitions,  # Partition metadata
-                            )
-                        else:
-                            logger.warning(
-                                f"No files found in processed partitions for table {table_name}"
-                            )
-                    else:
-                        logger.warning(
-                            f"No partition folders found under table {table_name}"
+                if path_spec.traversal_method == FolderTraversalMethod.MIN_MAX:
+                    # Get MIN partition using original logic
+                    dirs_to_process_min = self.get_dir_to_process(
+                        bucket_name=bucket_name,
+                        folder=table_folder + "/",
+                        path_spec=path_spec,
+                        protocol=protocol,
+                        min=True,
+                    )
+                    if dirs_to_process_min:
+                        # Convert full S3 paths back to relative paths for processing
+                        dirs_to_process.extend(
+                            [
+                                d.replace(f"{protocol}{bucket_name}/", "")
+                                for d in dirs_to_process_min
+                            ]
                         )
+                        logger.debug(f"Added MIN partition: {dirs_to_process_min}")
 
-        except Exception as e:
-            if "NoSuchBucket" in repr(e):
-                self.get_report().report_warning(
-                    "Missing bucket", f"No bucket found {bucket_name}"
+            # Process the selected partitions
+            all_folders = []
+            for partition_folder in dirs_to_process:
+                # Ensure we have a clean folder path
+                clean_folder = partition_folder.rstrip("/")
+
+                logger.info(f"Scanning files in partition: {clean_folder}")
+                partition_files = list(
+                    self.get_folder_info(path_spec, bucket, clean_folder)
                 )
-                return
-            logger.error(f"Error in _process_templated_path: {e}")
-            raise e
+                all_folders.extend(partition_files)
+
+            if all_folders:
+                # Use the most recent file across all processed partitions
+                latest_file = max(all_folders, key=lambda x: x.modification_time)
+
+                # Get partition information
+                partitions = [f for f in all_folders if f.is_partition]
+
+                # Calculate total size of processed partitions
+                total_size = sum(f.size for f in all_folders)
+
+                # Create ONE BrowsePath per table
+                # The key insight: we need to provide the sample file for schema inference
+                # but the table path should be extracted correctly by extract_table_name_and_path
+                yield BrowsePath(
+                    file=latest_file.sample_file,  # Sample file for schema inference
+                    timestamp=latest_file.modification_time,  # Latest timestamp
+                    size=total_size,  # Size of processed partitions
+                    partitions=partitions,  # Partition metadata
+                    etag=latest_file.sample_file_etag,
+                )
+            else:
+                logger.warning(
+                    f"No files found in processed partitions for table {table_name}"
+                )
+        else:
+            logger.warning(f"No partition folders found under table {table_name}")
 
     def _process_simple_path(
         self, path_spec: PathSpec, bucket: "Bucket", bucket_name: str
@@ -1333,6 +1468,7 @@ class S3Source(StatefulIngestionSourceBase):
                 size=obj.size,
                 partitions=[],  # No partitions in simple mode
                 content_type=content_type,
+                etag=obj.e_tag,
             )
 
     def local_browser(self, path_spec: PathSpec) -> Iterable[BrowsePath]:
@@ -1409,9 +1545,18 @@ class S3Source(StatefulIngestionSourceBase):
                             table_dict[
                                 table_data.table_path
                             ].timestamp = table_data.timestamp
-
-                for _, table_data in table_dict.items():
-                    yield from self.ingest_table(table_data, path_spec)
+                            table_dict[table_data.table_path].etag = table_data.etag
+
+                # Sampling files to infer their schema is I/O bound, so it runs in
+                # `max_workers` threads, while the workunits are still generated in
+                # table order on this thread.
+                for table_data, schema_metadata in self._process_concurrently(
+                    self._infer_table_schema,
+                    ((table_data, path_spec) for table_data in table_dict.values()),
+                ):
+                    yield from self._ingest_table(
+                        table_data, path_spec, schema_metadata
+                    )
 
             if not self.source_config.is_profiling_enabled():
                 return
@@ -1469,3 +1614,8 @@ class S3Source(StatefulIngestionSourceBase):
 
     def get_report(self):
         return self.report
+
+    def close(self) -> None:
+        if self.schema_inference_cache:
+            self.schema_inference_cache.close()
+        super().close()
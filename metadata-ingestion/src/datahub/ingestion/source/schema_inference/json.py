@@ -1,9 +1,10 @@
 import itertools
 import logging
-from typing import IO, Dict, List, Type, Union
+from typing import IO, Any, Dict, Iterable, List, Type, Union
 
+import ijson
 import jsonlines as jsl
-import ujson
+from more_itertools import peekable
 
 from datahub.ingestion.source.schema_inference.base import SchemaInferenceBase
 from datahub.ingestion.source.schema_inference.object import construct_schema
@@ -39,26 +40,25 @@ class JsonInferrer(SchemaInferenceBase):
         self.format = format
 
     def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
+        datastore: Iterable[Dict[str, Any]]
         if self.format == "jsonl":
             file.seek(0)
             reader = jsl.Reader(file)
-            datastore = [
-                obj
-                for obj in itertools.islice(
-                    reader.iter(type=dict, skip_invalid=True), self.max_rows
-                )
-            ]
+            datastore = itertools.islice(
+                reader.iter(type=dict, skip_invalid=True), self.max_rows
+            )
         else:
             try:
-                datastore = ujson.load(file)
-            except ujson.JSONDecodeError as e:
-                logger.info(f"Got ValueError: {e}. Retry with jsonlines")
+                # Only the first records are read, at most max_rows, since the file
+                # may be a very large array.
+                datastore = list(itertools.islice(self._iter_json(file), self.max_rows))
+            except ijson.JSONError as e:
+                logger.info(f"Got JSONError: {e}. Retry with jsonlines")
                 file.seek(0)
                 reader = jsl.Reader(file)
-                datastore = [obj for obj in reader.iter(type=dict, skip_invalid=True)]
-
-        if not isinstance(datastore, list):
-            datastore = [datastore]
+                datastore = itertools.islice(
+                    reader.iter(type=dict, skip_invalid=True), self.max_rows
+                )
 
         schema = construct_schema(datastore, delimiter=".")
         fields: List[SchemaField] = []
@@ -81,3 +81,11 @@ class JsonInferrer(SchemaInferenceBase):
             fields.append(field)
 
         return fields
+
+    @staticmethod
+    def _iter_json(file: IO[bytes]) -> Iterable[Any]:
+        """Incrementally parses the elements of a JSON array, or the JSON values of the file, e.g. a single object."""
+        events = peekable(ijson.parse(file, use_float=True, multiple_values=True))
+        if events.peek(None) == ("", "start_array", None):
+            return ijson.items(events, "item")
+        return ijson.items(events, "")
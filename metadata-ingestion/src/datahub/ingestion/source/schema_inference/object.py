@@ -1,5 +1,13 @@
 from collections import Counter
-from typing import Any, Counter as CounterType, Dict, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Counter as CounterType,
+    Dict,
+    Iterable,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from typing_extensions import TypedDict
 
@@ -83,90 +91,189 @@ def is_nullable_collection(
     return any(is_field_nullable(doc, field_path) for doc in collection)
 
 
-def construct_schema(
-    collection: Sequence[Dict[str, Any]], delimiter: str
-) -> Dict[Tuple[str, ...], SchemaDescription]:
+class _NonNullablePaths:
+    """The field paths that are non-nullable in a single document, as a tree.
+
+    A path is non-nullable if it's a node of the tree. If `all_below` is set, every
+    path below the node is non-nullable as well, which is the case for lists that
+    don't contain any objects (see `is_field_nullable`).
     """
-    Construct (infer) a schema from a collection of documents.
 
-    For each field (represented as a tuple to handle nested items), reports the following:
-        - `types`: Python types of field values
-        - `count`: Number of times the field was encountered
-        - `type`: type of the field if `types` is just a single value, otherwise `mixed`
-        - `nullable`: if field is ever null/missing
-        - `delimited_name`: name of the field, joined by a given delimiter
+    __slots__ = ("children", "all_below")
 
-    Parameters
-    ----------
-        collection:
-            collection to construct schema over.
-        delimiter:
-            string to concatenate field names by
-    """
+    def __init__(self) -> None:
+        self.children: Dict[str, "_NonNullablePaths"] = {}
+        self.all_below = False
+
+    def intersect(self, other: "_NonNullablePaths") -> "_NonNullablePaths":
+        if self.all_below:
+            return other
+        if other.all_below:
+            return self
+        result = _NonNullablePaths()
+        for key, child in self.children.items():
+            other_child = other.children.get(key)
+            if other_child is not None:
+                result.children[key] = child.intersect(other_child)
+        return result
 
-    schema: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
 
-    def append_to_schema(doc: Dict[str, Any], parent_prefix: Tuple[str, ...]) -> None:
-        """
-        Recursively update the schema with a document, which may/may not contain nested fields.
+# Shared by all scalar values, must not be modified.
+_NO_NON_NULLABLE_PATHS = _NonNullablePaths()
 
-        Parameters
-        ----------
-            doc:
-                document to scan
-            parent_prefix:
-                prefix of fields that the document is under, pass an empty tuple when initializing
-        """
 
+class PartialSchema:
+    """Schema inference state, built in a single pass over a stream of documents.
+
+    Partial schemas built over disjoint sets of documents (e.g. by separate
+    workers or cursors) can be combined with `merge`, and turned into the final
+    schema with `to_schema`. Partial schemas can be pickled.
+    """
+
+    def __init__(self) -> None:
+        self.document_count = 0
+        self.fields: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
+        # Number of documents for which a path is known to be non-nullable.
+        self._non_nullable_counts: CounterType[Tuple[str, ...]] = Counter()
+        # Number of documents for which all paths below a path are non-nullable.
+        self._non_nullable_below_counts: CounterType[Tuple[str, ...]] = Counter()
+
+    def add_documents(self, documents: Iterable[Dict[str, Any]]) -> "PartialSchema":
+        for document in documents:
+            self.add_document(document)
+        return self
+
+    def add_document(self, document: Dict[str, Any]) -> None:
+        self.document_count += 1
+        non_nullable = self._add_object(document, ())
+        self._count_non_nullable(non_nullable, ())
+
+    def _add_object(
+        self, doc: Dict[str, Any], parent_prefix: Tuple[str, ...]
+    ) -> _NonNullablePaths:
+        """Records the fields of an object, and returns its non-nullable paths."""
+
+        non_nullable = _NonNullablePaths()
         for key, value in doc.items():
             new_parent_prefix = parent_prefix + (key,)
+            child = _NO_NON_NULLABLE_PATHS
 
             # if nested value, look at the types within
             if isinstance(value, dict):
-                append_to_schema(value, new_parent_prefix)
+                child = self._add_object(value, new_parent_prefix)
             # if array of values, check what types are within
-            if isinstance(value, list):
-                for item in value:
-                    # if dictionary, add it as a nested object
-                    if isinstance(item, dict):
-                        append_to_schema(item, new_parent_prefix)
+            elif isinstance(value, list):
+                if value:
+                    # paths below a list are non-nullable only if they are in every
+                    # object of the list
+                    child = _NonNullablePaths()
+                    child.all_below = True
+                    for item in value:
+                        if isinstance(item, dict):
+                            child = child.intersect(
+                                self._add_object(item, new_parent_prefix)
+                            )
 
             # don't record None values (counted towards nullable)
             if value is not None:
-                if new_parent_prefix not in schema:
-                    schema[new_parent_prefix] = {
+                non_nullable.children[key] = child
+                description = self.fields.get(new_parent_prefix)
+                if description is None:
+                    self.fields[new_parent_prefix] = {
                         "types": Counter([type(value)]),
                         "count": 1,
                     }
-
                 else:
                     # update the type count
-                    schema[new_parent_prefix]["types"].update({type(value): 1})
-                    schema[new_parent_prefix]["count"] += 1
-
-    for document in collection:
-        append_to_schema(document, ())
-
-    extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
-
-    for field_path in schema:
-        field_types = schema[field_path]["types"]
-        field_type: Union[str, type] = "mixed"
-
-        # if single type detected, mark that as the type to go with
-        if len(field_types.keys()) == 1:
-            field_type = next(iter(field_types))
-        elif set(field_types.keys()) == {int, float}:
-            # If there's only floats and ints, it's not really a mixed type.
-            field_type = float
-        field_extended: SchemaDescription = {
-            "types": schema[field_path]["types"],
-            "count": schema[field_path]["count"],
-            "nullable": is_nullable_collection(collection, field_path),
-            "delimited_name": delimiter.join(field_path),
-            "type": field_type,
-        }
-
-        extended_schema[field_path] = field_extended
-
-    return extended_schema
+                    description["types"][type(value)] += 1
+                    description["count"] += 1
+        return non_nullable
+
+    def _count_non_nullable(
+        self, non_nullable: _NonNullablePaths, prefix: Tuple[str, ...]
+    ) -> None:
+        if non_nullable.all_below:
+            self._non_nullable_below_counts[prefix] += 1
+            return
+        for key, child in non_nullable.children.items():
+            path = prefix + (key,)
+            self._non_nullable_counts[path] += 1
+            self._count_non_nullable(child, path)
+
+    def merge(self, other: "PartialSchema") -> "PartialSchema":
+        """Adds the state of another partial schema to this one."""
+
+        self.document_count += other.document_count
+        for field_path, description in other.fields.items():
+            if field_path not in self.fields:
+                self.fields[field_path] = {
+                    "types": Counter(description["types"]),
+                    "count": description["count"],
+                }
+            else:
+                self.fields[field_path]["types"].update(description["types"])
+                self.fields[field_path]["count"] += description["count"]
+        self._non_nullable_counts.update(other._non_nullable_counts)
+        self._non_nullable_below_counts.update(other._non_nullable_below_counts)
+        return self
+
+    def is_nullable(self, field_path: Tuple[str, ...]) -> bool:
+        """Equivalent to `is_nullable_collection` over the documents seen so far."""
+
+        non_nullable_documents = self._non_nullable_counts[field_path] + sum(
+            self._non_nullable_below_counts[field_path[:i]]
+            for i in range(1, len(field_path))
+        )
+        return non_nullable_documents < self.document_count
+
+    def to_schema(self, delimiter: str) -> Dict[Tuple[str, ...], SchemaDescription]:
+        extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
+
+        for field_path, description in self.fields.items():
+            field_types = description["types"]
+            field_type: Union[str, type] = "mixed"
+
+            # if single type detected, mark that as the type to go with
+            if len(field_types.keys()) == 1:
+                field_type = next(iter(field_types))
+            elif set(field_types.keys()) == {int, float}:
+                # If there's only floats and ints, it's not really a mixed type.
+                field_type = float
+            field_extended: SchemaDescription = {
+                "types": field_types,
+                "count": description["count"],
+                "nullable": self.is_nullable(field_path),
+                "delimited_name": delimiter.join(field_path),
+                "type": field_type,
+            }
+
+            extended_schema[field_path] = field_extended
+
+        return extended_schema
+
+
+def construct_schema(
+    collection: Iterable[Dict[str, Any]], delimiter: str
+) -> Dict[Tuple[str, ...], SchemaDescription]:
+    """
+    Construct (infer) a schema from a collection of documents.
+
+    For each field (represented as a tuple to handle nested items), reports the following:
+        - `types`: Python types of field values
+        - `count`: Number of times the field was encountered
+        - `type`: type of the field if `types` is just a single value, otherwise `mixed`
+        - `nullable`: if field is ever null/missing
+        - `delimited_name`: name of the field, joined by a given delimiter
+
+    The collection is only iterated once, so it can be a stream of documents. Use
+    `PartialSchema` directly to build a schema from several streams.
+
+    Parameters
+    ----------
+        collection:
+            collection to construct schema over.
+        delimiter:
+            string to concatenate field names by
+    """
+
+    return PartialSchema().add_documents(collection).to_schema(delimiter)
@@ -18,6 +18,10 @@ from datahub.ingestion.source.state.stale_entity_removal_handler import (
 from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionConfigBase,
 )
+from datahub.utilities.http_response_cache import (
+    HttpResponseCacheConfigMixin,
+    HttpResponseCacheStats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +134,7 @@ class SigmaSourceReport(StaleEntityRemovalSourceReport):
 
     number_of_files_metadata: Dict[str, int] = field(default_factory=dict)
     empty_workspaces: List[str] = field(default_factory=list)
+    http_response_cache: Optional[HttpResponseCacheStats] = None
 
 
 class PlatformDetail(PlatformInstanceConfigMixin, EnvConfigMixin):
@@ -139,7 +144,10 @@ class PlatformDetail(PlatformInstanceConfigMixin, EnvConfigMixin):
 
 
 class SigmaSourceConfig(
-    StatefulIngestionConfigBase, PlatformInstanceConfigMixin, EnvConfigMixin
+    StatefulIngestionConfigBase,
+    PlatformInstanceConfigMixin,
+    EnvConfigMixin,
+    HttpResponseCacheConfigMixin,
 ):
     api_url: str = pydantic.Field(
         default=Constant.DEFAULT_API_URL, description="Sigma API hosted URL."
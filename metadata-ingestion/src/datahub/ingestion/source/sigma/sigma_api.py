@@ -18,6 +18,7 @@ from datahub.ingestion.source.sigma.data_classes import (
     Workbook,
     Workspace,
 )
+from datahub.utilities.http_response_cache import mount_http_response_cache
 
 # Logger instance
 logger = logging.getLogger(__name__)
@@ -30,6 +31,14 @@ class SigmaAPI:
         self.workspaces: Dict[str, Workspace] = {}
         self.users: Dict[str, str] = {}
         self.session = requests.Session()
+        http_response_cache = mount_http_response_cache(
+            self.session,
+            self.config.http_response_cache,
+            "sigma",
+            uncached_url_patterns=["/auth/token"],
+        )
+        if http_response_cache is not None:
+            self.report.http_response_cache = http_response_cache.stats
         self.refresh_token: Optional[str] = None
         # Test connection by generating access token
         logger.info(f"Trying to connect to {self.config.api_url}")
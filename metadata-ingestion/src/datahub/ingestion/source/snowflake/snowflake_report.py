@@ -14,6 +14,7 @@ from datahub.ingestion.source_report.time_window import BaseTimeWindowReport
 from datahub.sql_parsing.sql_parsing_aggregator import SqlAggregatorReport
 from datahub.utilities.lossy_collections import LossyDict
 from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutorStats
 
 if TYPE_CHECKING:
     from datahub.ingestion.source.snowflake.snowflake_queries import (
@@ -103,6 +104,9 @@ class SnowflakeV2Report(
 
     schemas_scanned: int = 0
     databases_scanned: int = 0
+    schema_processing_executor: ThreadedIteratorExecutorStats = field(
+        default_factory=ThreadedIteratorExecutorStats
+    )
     tags_scanned: int = 0
     streams_scanned: int = 0
     procedures_scanned: int = 0
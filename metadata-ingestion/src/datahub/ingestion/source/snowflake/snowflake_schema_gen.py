@@ -378,6 +378,7 @@ class SnowflakeSchemaGenerator(SnowflakeStructuredReportMixin):
                 (snowflake_schema,) for snowflake_schema in snowflake_db.schemas
             ],
             max_workers=SCHEMA_PARALLELISM,
+            stats=self.report.schema_processing_executor,
         ):
             yield wu
 
@@ -1,4 +1,7 @@
+from typing import Optional
+
 from pydantic.fields import Field
+from sqlalchemy.engine.reflection import Inspector
 
 from datahub.configuration.common import AllowDenyPattern
 from datahub.ingestion.api.common import PipelineContext
@@ -11,6 +14,7 @@ from datahub.ingestion.api.decorators import (
     support_status,
 )
 from datahub.ingestion.source.sql.postgres import PostgresConfig, PostgresSource
+from datahub.ingestion.source.sql.sql_common import SchemaReflector
 
 
 class CockroachDBConfig(PostgresConfig):
@@ -35,6 +39,10 @@ class CockroachDBSource(PostgresSource):
     def get_platform(self):
         return "cockroachdb"
 
+    def make_schema_reflector(self, inspector: Inspector) -> Optional[SchemaReflector]:
+        # CockroachDB's pg_catalog is only partially compatible with Postgres'.
+        return None
+
     @classmethod
     def create(cls, config_dict, ctx):
         config = CockroachDBConfig.parse_obj(config_dict)
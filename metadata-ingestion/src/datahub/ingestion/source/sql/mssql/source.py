@@ -1,15 +1,27 @@
 import logging
 import re
 import urllib.parse
+from collections import defaultdict
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import pydantic
 import sqlalchemy.dialects.mssql
 from pydantic.fields import Field
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects.mssql.base import (
+    MSBinary,
+    MSChar,
+    MSNChar,
+    MSNText,
+    MSNVarchar,
+    MSString,
+    MSText,
+    MSVarBinary,
+)
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.exc import ProgrammingError, ResourceClosedError
+from sqlalchemy.sql import sqltypes
 
 import datahub.metadata.schema_classes as models
 from datahub.configuration.common import AllowDenyPattern
@@ -40,6 +52,7 @@ from datahub.ingestion.source.sql.mssql.job_models import (
     StoredProcedure,
 )
 from datahub.ingestion.source.sql.sql_common import (
+    SchemaReflector,
     SQLAlchemySource,
     SqlWorkUnit,
     register_custom_type,
@@ -71,6 +84,203 @@ DEFAULT_TEMP_TABLES_PATTERNS = [
     r".*\.(GE_TMP_|GE_TEMP_|GX_TEMP_)[0-9A-F]{8}",  # great expectations
 ]
 
+SCHEMA_COLUMNS_QUERY = """
+SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE, CHARACTER_MAXIMUM_LENGTH,
+  NUMERIC_PRECISION, NUMERIC_SCALE, COLUMN_DEFAULT, COLLATION_NAME
+FROM INFORMATION_SCHEMA.COLUMNS
+WHERE TABLE_SCHEMA = :schema
+ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+SCHEMA_PK_CONSTRAINTS_QUERY = """
+SELECT C.TABLE_NAME, C.COLUMN_NAME, C.CONSTRAINT_NAME
+FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS TC
+JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE C
+  ON C.CONSTRAINT_NAME = TC.CONSTRAINT_NAME AND C.TABLE_SCHEMA = TC.TABLE_SCHEMA
+WHERE C.TABLE_SCHEMA = :schema AND TC.CONSTRAINT_TYPE = 'PRIMARY KEY'
+ORDER BY C.TABLE_NAME, C.ORDINAL_POSITION
+"""
+
+# Same as the query of MSDialect.get_foreign_keys, for all the tables of a schema:
+# foreign keys can reference either a unique constraint, or a unique index.
+SCHEMA_FOREIGN_KEYS_QUERY = """
+WITH fk_info AS (
+    SELECT
+        ref_con.constraint_schema,
+        ref_con.constraint_name,
+        key_col.ordinal_position,
+        key_col.table_name,
+        ref_con.unique_constraint_schema,
+        ref_con.unique_constraint_name,
+        ref_con.update_rule,
+        ref_con.delete_rule,
+        key_col.column_name AS constrained_column
+    FROM INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS ref_con
+    INNER JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE key_col
+        ON key_col.table_schema = ref_con.constraint_schema
+        AND key_col.constraint_name = ref_con.constraint_name
+    WHERE key_col.table_schema = :schema
+),
+index_info AS (
+    SELECT
+        sys.schemas.name AS index_schema,
+        sys.indexes.name AS index_name,
+        sys.index_columns.key_ordinal AS ordinal_position,
+        sys.objects.name AS table_name,
+        sys.columns.name AS column_name
+    FROM sys.indexes
+    INNER JOIN sys.objects ON sys.objects.object_id = sys.indexes.object_id
+    INNER JOIN sys.schemas ON sys.schemas.schema_id = sys.objects.schema_id
+    INNER JOIN sys.index_columns
+        ON sys.index_columns.object_id = sys.objects.object_id
+        AND sys.index_columns.index_id = sys.indexes.index_id
+    INNER JOIN sys.columns
+        ON sys.columns.object_id = sys.indexes.object_id
+        AND sys.columns.column_id = sys.index_columns.column_id
+)
+SELECT
+    fk_info.table_name,
+    fk_info.constraint_name,
+    fk_info.ordinal_position,
+    fk_info.constrained_column,
+    key_col.table_schema AS referred_table_schema,
+    key_col.table_name AS referred_table_name,
+    key_col.column_name AS referred_column,
+    fk_info.update_rule,
+    fk_info.delete_rule
+FROM fk_info
+INNER JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE key_col
+    ON key_col.constraint_schema = fk_info.unique_constraint_schema
+    AND key_col.constraint_name = fk_info.unique_constraint_name
+    AND key_col.ordinal_position = fk_info.ordinal_position
+UNION
+SELECT
+    fk_info.table_name,
+    fk_info.constraint_name,
+    fk_info.ordinal_position,
+    fk_info.constrained_column,
+    index_info.index_schema AS referred_table_schema,
+    index_info.table_name AS referred_table_name,
+    index_info.column_name AS referred_column,
+    fk_info.update_rule,
+    fk_info.delete_rule
+FROM fk_info
+INNER JOIN index_info
+    ON index_info.index_schema = fk_info.unique_constraint_schema
+    AND index_info.index_name = fk_info.unique_constraint_name
+    AND index_info.ordinal_position = fk_info.ordinal_position
+ORDER BY 1, 2, 3
+"""
+
+# Types whose length and collation are reflected, as in MSDialect.get_columns
+_STRING_TYPES = (
+    MSString,
+    MSChar,
+    MSNVarchar,
+    MSNChar,
+    MSText,
+    MSNText,
+    MSBinary,
+    MSVarBinary,
+    sqltypes.LargeBinary,
+)
+
+
+class SQLServerSchemaReflector(SchemaReflector):
+    """
+    Reflects a schema with INFORMATION_SCHEMA queries, instead of a few per table.
+
+    The table comments aren't reflected by SQLAlchemy for SQL Server, they're
+    fetched for the whole database by the source instead. The identity and the
+    computed definition of the columns are left out, as they aren't ingested.
+    """
+
+    def _execute(self, query: str, schema: str) -> List[Any]:
+        return self.inspector.bind.execute(text(query), {"schema": schema}).fetchall()
+
+    def get_columns(self, schema: str) -> Dict[str, List[dict]]:
+        ischema_names = self.inspector.dialect.ischema_names
+        columns: Dict[str, List[dict]] = defaultdict(list)
+        for (
+            table,
+            name,
+            data_type,
+            is_nullable,
+            char_length,
+            numeric_precision,
+            numeric_scale,
+            default,
+            collation,
+        ) in self._execute(SCHEMA_COLUMNS_QUERY, schema):
+            column_type = ischema_names.get(data_type)
+            kwargs: Dict[str, Any] = {}
+            if column_type in _STRING_TYPES:
+                kwargs["length"] = None if char_length == -1 else char_length
+                if collation:
+                    kwargs["collation"] = collation
+            if column_type is None:
+                logger.debug(f"Unrecognized type {data_type} of column {name}")
+                column_type = sqltypes.NULLTYPE
+            else:
+                if issubclass(column_type, sqltypes.Numeric):
+                    kwargs["precision"] = numeric_precision
+                    if not issubclass(column_type, sqltypes.Float):
+                        kwargs["scale"] = numeric_scale
+                column_type = column_type(**kwargs)
+
+            columns[table].append(
+                {
+                    "name": name,
+                    "type": column_type,
+                    "nullable": is_nullable == "YES",
+                    "default": default,
+                }
+            )
+        return columns
+
+    def get_pk_constraints(self, schema: str) -> Dict[str, dict]:
+        pk_constraints: Dict[str, dict] = {}
+        for table, column, name in self._execute(SCHEMA_PK_CONSTRAINTS_QUERY, schema):
+            pk_constraint = pk_constraints.setdefault(
+                table, {"constrained_columns": [], "name": name}
+            )
+            pk_constraint["constrained_columns"].append(column)
+        return pk_constraints
+
+    def get_foreign_keys(self, schema: str) -> Dict[str, List[dict]]:
+        foreign_keys: Dict[str, Dict[str, dict]] = defaultdict(dict)
+        for (
+            table,
+            name,
+            _,
+            column,
+            referred_schema,
+            referred_table,
+            referred_column,
+            update_rule,
+            delete_rule,
+        ) in self._execute(SCHEMA_FOREIGN_KEYS_QUERY, schema):
+            if name not in foreign_keys[table]:
+                foreign_keys[table][name] = {
+                    "name": name,
+                    "constrained_columns": [],
+                    "referred_schema": referred_schema,
+                    "referred_table": referred_table,
+                    "referred_columns": [],
+                    "options": {
+                        option: rule
+                        for option, rule in [
+                            ("onupdate", update_rule),
+                            ("ondelete", delete_rule),
+                        ]
+                        if rule != "NO ACTION"
+                    },
+                }
+            foreign_key = foreign_keys[table][name]
+            foreign_key["constrained_columns"].append(column)
+            foreign_key["referred_columns"].append(referred_column)
+        return {table: list(fks.values()) for table, fks in foreign_keys.items()}
+
 
 class SQLServerConfig(BasicSQLAlchemyConfig):
     # defaults
@@ -295,6 +505,9 @@ class SQLServerSource(SQLAlchemySource):
         config = SQLServerConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def make_schema_reflector(self, inspector: Inspector) -> Optional[SchemaReflector]:
+        return SQLServerSchemaReflector(inspector)
+
     # override to get table descriptions
     def get_table_properties(
         self, inspector: Inspector, schema: str, table: str
@@ -1,10 +1,14 @@
 # This import verifies that the dependencies are available.
 
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
 import pymysql  # noqa: F401
 from pydantic.fields import Field
-from sqlalchemy import util
+from sqlalchemy import text, util
 from sqlalchemy.dialects.mysql import BIT, base
 from sqlalchemy.dialects.mysql.enumerated import SET
+from sqlalchemy.dialects.mysql.reflection import ReflectedState
 from sqlalchemy.engine.reflection import Inspector
 
 from datahub.ingestion.api.decorators import (
@@ -16,6 +20,7 @@ from datahub.ingestion.api.decorators import (
     support_status,
 )
 from datahub.ingestion.source.sql.sql_common import (
+    SchemaReflector,
     make_sqlalchemy_type,
     register_custom_type,
 )
@@ -48,6 +53,149 @@ base.ischema_names["polygon"] = POLYGON
 base.ischema_names["decimal128"] = DECIMAL128
 
 
+SCHEMA_COLUMNS_QUERY = """
+SELECT c.TABLE_NAME, c.COLUMN_NAME, c.COLUMN_TYPE, c.IS_NULLABLE, c.EXTRA,
+  c.CHARACTER_SET_NAME, c.COLLATION_NAME, c.COLUMN_COMMENT,
+  t.TABLE_TYPE, t.TABLE_COLLATION
+FROM information_schema.COLUMNS c
+JOIN information_schema.TABLES t
+  ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
+WHERE c.TABLE_SCHEMA = :schema
+ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+"""
+
+SCHEMA_PK_CONSTRAINTS_QUERY = """
+SELECT TABLE_NAME, COLUMN_NAME
+FROM information_schema.KEY_COLUMN_USAGE
+WHERE TABLE_SCHEMA = :schema AND CONSTRAINT_NAME = 'PRIMARY'
+ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+SCHEMA_FOREIGN_KEYS_QUERY = """
+SELECT k.TABLE_NAME, k.CONSTRAINT_NAME, k.COLUMN_NAME,
+  k.REFERENCED_TABLE_SCHEMA, k.REFERENCED_TABLE_NAME, k.REFERENCED_COLUMN_NAME,
+  r.UPDATE_RULE, r.DELETE_RULE
+FROM information_schema.KEY_COLUMN_USAGE k
+JOIN information_schema.REFERENTIAL_CONSTRAINTS r
+  ON r.CONSTRAINT_SCHEMA = k.CONSTRAINT_SCHEMA
+  AND r.TABLE_NAME = k.TABLE_NAME
+  AND r.CONSTRAINT_NAME = k.CONSTRAINT_NAME
+WHERE k.TABLE_SCHEMA = :schema AND k.REFERENCED_TABLE_NAME IS NOT NULL
+ORDER BY k.TABLE_NAME, k.CONSTRAINT_NAME, k.ORDINAL_POSITION
+"""
+
+SCHEMA_TABLE_COMMENTS_QUERY = """
+SELECT TABLE_NAME, TABLE_COMMENT
+FROM information_schema.TABLES
+WHERE TABLE_SCHEMA = :schema AND TABLE_TYPE != 'VIEW'
+"""
+
+
+class MySQLSchemaReflector(SchemaReflector):
+    """
+    Reflects a schema with information_schema queries, instead of a
+    SHOW CREATE TABLE statement per table.
+
+    The column definitions are rebuilt from information_schema and parsed
+    by the dialect, so that the types are the same as with SHOW CREATE TABLE.
+    Their defaults are left out, as they aren't ingested.
+    """
+
+    def _execute(self, query: str, schema: str) -> List[Any]:
+        return self.inspector.bind.execute(text(query), {"schema": schema}).fetchall()
+
+    def get_columns(self, schema: str) -> Dict[str, List[dict]]:
+        dialect = self.inspector.dialect
+        parser = dialect._tabledef_parser  # type: ignore[attr-defined]
+        quote = dialect.identifier_preparer.quote_identifier
+
+        states: Dict[str, ReflectedState] = defaultdict(ReflectedState)
+        for row in self._execute(SCHEMA_COLUMNS_QUERY, schema):
+            (
+                table,
+                name,
+                column_type,
+                is_nullable,
+                extra,
+                charset,
+                collation,
+                comment,
+                table_type,
+                table_collation,
+            ) = row
+            is_view = table_type == "VIEW"
+
+            definition = f"  {quote(name)} {column_type}"
+            # SHOW CREATE TABLE only shows the character set and collation of
+            # the columns that don't use the defaults of the table.
+            if not is_view and collation and collation != table_collation:
+                if not (table_collation or "").startswith(f"{charset}_"):
+                    definition += f" CHARACTER SET {charset}"
+                definition += f" COLLATE {collation}"
+            if is_nullable == "NO":
+                definition += " NOT NULL"
+            if "auto_increment" in (extra or "").lower():
+                definition += " AUTO_INCREMENT"
+            columns = states[table].columns
+            num_columns = len(columns)
+            parser._parse_column(definition, states[table])
+            if len(columns) > num_columns and not is_view:
+                columns[-1]["comment"] = comment or None
+
+        return {
+            table: state.columns for table, state in states.items() if state.columns
+        }
+
+    def get_pk_constraints(self, schema: str) -> Dict[str, dict]:
+        pk_constraints: Dict[str, dict] = {}
+        for table, column in self._execute(SCHEMA_PK_CONSTRAINTS_QUERY, schema):
+            pk_constraint = pk_constraints.setdefault(
+                table, {"constrained_columns": [], "name": None}
+            )
+            pk_constraint["constrained_columns"].append(column)
+        return pk_constraints
+
+    def get_foreign_keys(self, schema: str) -> Dict[str, List[dict]]:
+        foreign_keys: Dict[str, Dict[str, dict]] = defaultdict(dict)
+        for (
+            table,
+            name,
+            column,
+            referred_schema,
+            referred_table,
+            referred_column,
+            update_rule,
+            delete_rule,
+        ) in self._execute(SCHEMA_FOREIGN_KEYS_QUERY, schema):
+            if name not in foreign_keys[table]:
+                foreign_keys[table][name] = {
+                    "name": name,
+                    "constrained_columns": [],
+                    "referred_schema": referred_schema,
+                    "referred_table": referred_table,
+                    "referred_columns": [],
+                    "options": {
+                        option: rule
+                        for option, rule in [
+                            ("onupdate", update_rule),
+                            ("ondelete", delete_rule),
+                        ]
+                        # The default rules, that SHOW CREATE TABLE leaves out
+                        if rule not in ("NO ACTION", "RESTRICT")
+                    },
+                }
+            foreign_key = foreign_keys[table][name]
+            foreign_key["constrained_columns"].append(column)
+            foreign_key["referred_columns"].append(referred_column)
+        return {table: list(fks.values()) for table, fks in foreign_keys.items()}
+
+    def get_table_comments(self, schema: str) -> Dict[str, dict]:
+        return {
+            table: {"text": comment or None}
+            for table, comment in self._execute(SCHEMA_TABLE_COMMENTS_QUERY, schema)
+        }
+
+
 class MySQLConnectionConfig(SQLAlchemyConnectionConfig):
     # defaults
     host_port: str = Field(default="localhost:3306", description="MySQL host URL.")
@@ -85,6 +233,9 @@ class MySQLSource(TwoTierSQLAlchemySource):
         config = MySQLConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def make_schema_reflector(self, inspector: Inspector) -> Optional[SchemaReflector]:
+        return MySQLSchemaReflector(inspector)
+
     def add_profile_metadata(self, inspector: Inspector) -> None:
         if not self.config.is_profiling_enabled():
             return
@@ -1,4 +1,5 @@
 import datetime
+import itertools
 import logging
 import platform
 import re
@@ -28,6 +29,7 @@ from datahub.ingestion.api.decorators import (
     support_status,
 )
 from datahub.ingestion.source.sql.sql_common import (
+    SchemaReflector,
     SQLAlchemySource,
     make_sqlalchemy_type,
 )
@@ -234,22 +236,7 @@ class OracleInspectorObjectWrapper:
             for row in cursor
         ]
 
-    def get_columns(
-        self, table_name: str, schema: Optional[str] = None, dblink: str = ""
-    ) -> List[dict]:
-        denormalized_table_name = self._inspector_instance.dialect.denormalize_name(
-            table_name
-        )
-        assert denormalized_table_name
-
-        schema = self._inspector_instance.dialect.denormalize_name(
-            schema or self.default_schema_name
-        )
-
-        if schema is None:
-            schema = self._inspector_instance.dialect.default_schema_name
-
-        columns = []
+    def _get_columns_query(self, dblink: str = "") -> str:
         if not (
             self._inspector_instance.dialect.server_version_info
             and self._inspector_instance.dialect.server_version_info < (9,)
@@ -275,8 +262,6 @@ class OracleInspectorObjectWrapper:
         else:
             identity_cols = "NULL as default_on_null, NULL as identity_options"
 
-        params = {"table_name": denormalized_table_name}
-
         text = """
             SELECT
                 col.column_name,
@@ -288,93 +273,129 @@ class OracleInspectorObjectWrapper:
                 col.data_default,
                 com.comments,
                 col.virtual_column,
-                %(identity_cols)s
+                %(identity_cols)s,
+                col.table_name
             FROM dba_tab_cols%(dblink)s col
             LEFT JOIN dba_col_comments%(dblink)s com
             ON col.table_name = com.table_name
             AND col.column_name = com.column_name
             AND col.owner = com.owner
-            WHERE col.table_name = CAST(:table_name AS VARCHAR2(128))
-            AND col.hidden_column = 'NO'
+            WHERE col.hidden_column = 'NO'
         """
-        if schema is not None:
-            params["owner"] = schema
-            text += " AND col.owner = :owner "
-        text += " ORDER BY col.column_id"
-        text = text % {
+        return text % {
             "dblink": dblink,
             "char_length_col": char_length_col,
             "identity_cols": identity_cols,
         }
 
+    def _get_column_info(self, row: Any) -> dict:
+        colname = self._inspector_instance.dialect.normalize_name(row[0])
+        orig_colname = row[0]
+        coltype = row[1]
+        length = row[2]
+        precision = row[3]
+        scale = row[4]
+        nullable = row[5] == "Y"
+        default = row[6]
+        comment = row[7]
+        generated = row[8]
+        default_on_nul = row[9]
+        identity_options = row[10]
+
+        if coltype == "NUMBER":
+            if precision is None and scale == 0:
+                coltype = INTEGER()
+            else:
+                coltype = ischema_names.get(coltype)(precision, scale)
+        elif coltype == "FLOAT":
+            # TODO: support "precision" here as "binary_precision"
+            coltype = FLOAT()
+        elif coltype in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
+            coltype = ischema_names.get(coltype)(length)
+        elif "WITH TIME ZONE" in coltype:
+            coltype = TIMESTAMP(timezone=True)
+        else:
+            coltype = re.sub(r"\(\d+\)", "", coltype)
+            try:
+                coltype = ischema_names[coltype]()
+            except KeyError:
+                logger.info(
+                    f"Unrecognized column datatype {coltype} of column {colname}"
+                )
+                coltype = sqltypes.NULLTYPE
+
+        if generated == "YES":
+            computed = dict(sqltext=default)
+            default = None
+        else:
+            computed = None
+
+        if identity_options is not None:
+            identity = self._inspector_instance.dialect._parse_identity_options(  # type: ignore
+                identity_options, default_on_nul
+            )
+            default = None
+        else:
+            identity = None
+
+        cdict = {
+            "name": colname,
+            "type": coltype,
+            "nullable": nullable,
+            "default": default,
+            "autoincrement": "auto",
+            "comment": comment,
+        }
+        if orig_colname.lower() == orig_colname:
+            cdict["quote"] = True
+        if computed is not None:
+            cdict["computed"] = computed
+        if identity is not None:
+            cdict["identity"] = identity
+        return cdict
+
+    def get_columns(
+        self, table_name: str, schema: Optional[str] = None, dblink: str = ""
+    ) -> List[dict]:
+        denormalized_table_name = self._inspector_instance.dialect.denormalize_name(
+            table_name
+        )
+        assert denormalized_table_name
+
+        schema = self._inspector_instance.dialect.denormalize_name(
+            schema or self.default_schema_name
+        )
+
+        if schema is None:
+            schema = self._inspector_instance.dialect.default_schema_name
+
+        params = {"table_name": denormalized_table_name}
+        text = self._get_columns_query(dblink)
+        text += " AND col.table_name = CAST(:table_name AS VARCHAR2(128))"
+        if schema is not None:
+            params["owner"] = schema
+            text += " AND col.owner = :owner "
+        text += " ORDER BY col.column_id"
+
         c = self._inspector_instance.bind.execute(sql.text(text), params)
 
-        for row in c:
-            colname = self._inspector_instance.dialect.normalize_name(row[0])
-            orig_colname = row[0]
-            coltype = row[1]
-            length = row[2]
-            precision = row[3]
-            scale = row[4]
-            nullable = row[5] == "Y"
-            default = row[6]
-            comment = row[7]
-            generated = row[8]
-            default_on_nul = row[9]
-            identity_options = row[10]
-
-            if coltype == "NUMBER":
-                if precision is None and scale == 0:
-                    coltype = INTEGER()
-                else:
-                    coltype = ischema_names.get(coltype)(precision, scale)
-            elif coltype == "FLOAT":
-                # TODO: support "precision" here as "binary_precision"
-                coltype = FLOAT()
-            elif coltype in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
-                coltype = ischema_names.get(coltype)(length)
-            elif "WITH TIME ZONE" in coltype:
-                coltype = TIMESTAMP(timezone=True)
-            else:
-                coltype = re.sub(r"\(\d+\)", "", coltype)
-                try:
-                    coltype = ischema_names[coltype]()
-                except KeyError:
-                    logger.info(
-                        f"Unrecognized column datatype {coltype} of column {colname}"
-                    )
-                    coltype = sqltypes.NULLTYPE
+        return [self._get_column_info(row) for row in c]
 
-            if generated == "YES":
-                computed = dict(sqltext=default)
-                default = None
-            else:
-                computed = None
+    def get_schema_columns(self, schema: str) -> Dict[str, List[dict]]:
+        """The columns of all the tables and views of a schema, by table name."""
+        text = self._get_columns_query()
+        text += " AND col.owner = :owner ORDER BY col.table_name, col.column_id"
 
-            if identity_options is not None:
-                identity = self._inspector_instance.dialect._parse_identity_options(  # type: ignore
-                    identity_options, default_on_nul
-                )
-                default = None
-            else:
-                identity = None
-
-            cdict = {
-                "name": colname,
-                "type": coltype,
-                "nullable": nullable,
-                "default": default,
-                "autoincrement": "auto",
-                "comment": comment,
-            }
-            if orig_colname.lower() == orig_colname:
-                cdict["quote"] = True
-            if computed is not None:
-                cdict["computed"] = computed
-            if identity is not None:
-                cdict["identity"] = identity
-
-            columns.append(cdict)
+        c = self._inspector_instance.bind.execute(
+            sql.text(text),
+            dict(owner=self._inspector_instance.dialect.denormalize_name(schema)),
+        )
+
+        columns: Dict[str, List[dict]] = defaultdict(list)
+        for row in c:
+            columns[self._inspector_instance.dialect.normalize_name(row[11])].append(
+                self._get_column_info(row)
+            )
         return columns
 
     def get_table_comment(self, table_name: str, schema: Optional[str] = None) -> Dict:
@@ -404,10 +425,30 @@ class OracleInspectorObjectWrapper:
 
         return {"text": c.scalar()}
 
+    def get_schema_table_comments(self, schema: str) -> Dict[str, Dict]:
+        """The comments of all the tables and views of a schema, by table name."""
+        c = self._inspector_instance.bind.execute(
+            sql.text(
+                "SELECT table_name, comments FROM dba_tab_comments WHERE owner = :schema_name"
+            ),
+            dict(schema_name=self._inspector_instance.dialect.denormalize_name(schema)),
+        )
+        return {
+            self._inspector_instance.dialect.normalize_name(row[0]): {"text": row[1]}
+            for row in c
+        }
+
     def _get_constraint_data(
-        self, table_name: str, schema: Optional[str] = None, dblink: str = ""
+        self, table_name: Optional[str], schema: Optional[str] = None, dblink: str = ""
     ) -> List[sqlalchemy.engine.Row]:
-        params = {"table_name": table_name}
+        """
+        Returns the constraints of a table, or of all the tables of the schema if table_name is None.
+        """
+        params: Dict[str, str] = {}
+        table_filter = ""
+        if table_name is not None:
+            params["table_name"] = table_name
+            table_filter = "\nAND ac.table_name = :table_name"
 
         text = (
             "SELECT"
@@ -420,15 +461,16 @@ class OracleInspectorObjectWrapper:
             "\nacc.position AS loc_pos,"
             "\nNULL AS rem_pos,"
             "\nac.search_condition,"
-            "\nac.delete_rule"
+            "\nac.delete_rule,"
+            "\nac.table_name AS local_table"
             "\nFROM dba_constraints ac"
             "\nJOIN dba_cons_columns acc"
             "\nON ac.owner = acc.owner"
             "\nAND ac.constraint_name = acc.constraint_name"
             "\nAND ac.table_name = acc.table_name"
-            "\nWHERE ac.table_name = :table_name"
-            "\nAND ac.constraint_type IN ('P', 'U', 'C')"
+            "\nWHERE ac.constraint_type IN ('P', 'U', 'C')"
         )
+        text += table_filter
 
         if schema is not None:
             params["owner"] = schema
@@ -447,7 +489,8 @@ class OracleInspectorObjectWrapper:
             "\nacc.position AS loc_pos,"
             "\nrcc.position AS rem_pos,"
             "\nac.search_condition,"
-            "\nac.delete_rule"
+            "\nac.delete_rule,"
+            "\nac.table_name AS local_table"
             "\nFROM dba_constraints ac"
             "\nJOIN dba_cons_columns acc"
             "\nON ac.owner = acc.owner"
@@ -457,35 +500,51 @@ class OracleInspectorObjectWrapper:
             "\nON ac.r_owner = rcc.owner"
             "\nAND ac.r_constraint_name = rcc.constraint_name"
             "\nAND acc.position = rcc.position"
-            "\nWHERE ac.table_name = :table_name"
-            "\nAND ac.constraint_type = 'R'"
+            "\nWHERE ac.constraint_type = 'R'"
         )
+        text += table_filter
 
         if schema is not None:
             text += "\nAND ac.owner = :owner"
 
-        text += "\nORDER BY constraint_name, loc_pos"
+        if table_name is not None:
+            text += "\nORDER BY constraint_name, loc_pos"
+        else:
+            text += "\nORDER BY local_table, constraint_name, loc_pos"
 
         rp = self._inspector_instance.bind.execute(sql.text(text), params)
         return rp.fetchall()
 
-    def get_pk_constraint(
-        self, table_name: str, schema: Optional[str] = None, dblink: str = ""
-    ) -> Dict:
+    def _get_pk_constraint_info(self, constraint_data: Iterable[Any]) -> Dict:
         pkeys = []
         constraint_name = None
 
+        for row in constraint_data:
+            if row[1] == "P":  # constraint_type is 'P' for primary key
+                if constraint_name is None:
+                    constraint_name = self._inspector_instance.dialect.normalize_name(
+                        row[0]
+                    )
+                col_name = self._inspector_instance.dialect.normalize_name(
+                    row[2]
+                )  # local_column
+                pkeys.append(col_name)
+
+        return {"constrained_columns": pkeys, "name": constraint_name}
+
+    def get_pk_constraint(
+        self, table_name: str, schema: Optional[str] = None, dblink: str = ""
+    ) -> Dict:
         try:
-            for row in self._get_constraint_data(table_name, schema, dblink):
-                if row[1] == "P":  # constraint_type is 'P' for primary key
-                    if constraint_name is None:
-                        constraint_name = (
-                            self._inspector_instance.dialect.normalize_name(row[0])
-                        )
-                    col_name = self._inspector_instance.dialect.normalize_name(
-                        row[2]
-                    )  # local_column
-                    pkeys.append(col_name)
+            return self._get_pk_constraint_info(
+                self._get_constraint_data(
+                    self._inspector_instance.dialect.denormalize_name(table_name),
+                    self._inspector_instance.dialect.denormalize_name(
+                        schema or self.default_schema_name
+                    ),
+                    dblink,
+                )
+            )
         except Exception as e:
             self.report.warning(
                 title="Failed to Process Primary Keys",
@@ -499,7 +558,19 @@ class OracleInspectorObjectWrapper:
             # Return empty constraint if we can't process it
             return {"constrained_columns": [], "name": None}
 
-        return {"constrained_columns": pkeys, "name": constraint_name}
+    def get_schema_pk_constraints(self, schema: str) -> Dict[str, Dict]:
+        """The primary keys of all the tables of a schema, by table name."""
+        return {
+            self._inspector_instance.dialect.normalize_name(
+                table_name
+            ): self._get_pk_constraint_info(rows)
+            for table_name, rows in itertools.groupby(
+                self._get_constraint_data(
+                    None, self._inspector_instance.dialect.denormalize_name(schema)
+                ),
+                key=lambda row: row[10],  # local_table
+            )
+        }
 
     def get_foreign_keys(
         self, table_name: str, schema: Optional[str] = None, dblink: str = ""
@@ -516,11 +587,37 @@ class OracleInspectorObjectWrapper:
         if schema is None:
             schema = self._inspector_instance.dialect.default_schema_name
 
-        requested_schema = schema  # to check later on
-
         constraint_data = self._get_constraint_data(
             denormalized_table_name, schema, dblink
         )
+        return self._get_foreign_keys_info(constraint_data, table_name, schema, dblink)
+
+    def get_schema_foreign_keys(self, schema: str) -> Dict[str, List]:
+        """The foreign keys of all the tables of a schema, by table name."""
+        denormalized_schema = self._inspector_instance.dialect.denormalize_name(schema)
+        assert denormalized_schema
+
+        foreign_keys = {}
+        for denormalized_table_name, rows in itertools.groupby(
+            self._get_constraint_data(None, denormalized_schema),
+            key=lambda row: row[10],  # local_table
+        ):
+            table_name = self._inspector_instance.dialect.normalize_name(
+                denormalized_table_name
+            )
+            foreign_keys[table_name] = self._get_foreign_keys_info(
+                rows, table_name, denormalized_schema
+            )
+        return foreign_keys
+
+    def _get_foreign_keys_info(
+        self,
+        constraint_data: Iterable[Any],
+        table_name: str,
+        schema: str,
+        dblink: str = "",
+    ) -> List:
+        requested_schema = schema  # to check later on
 
         def fkey_rec():
             return {
@@ -626,6 +723,26 @@ class OracleInspectorObjectWrapper:
         return getattr(self._inspector_instance, item)
 
 
+class OracleSchemaReflector(SchemaReflector):
+    """Reflects a schema with queries on the DBA_* views for the whole schema, instead of per table."""
+
+    def __init__(self, inspector: OracleInspectorObjectWrapper):
+        super().__init__(cast(Inspector, inspector))
+        self.wrapper = inspector
+
+    def get_columns(self, schema: str) -> Dict[str, List[dict]]:
+        return self.wrapper.get_schema_columns(schema)
+
+    def get_pk_constraints(self, schema: str) -> Dict[str, dict]:
+        return self.wrapper.get_schema_pk_constraints(schema)
+
+    def get_foreign_keys(self, schema: str) -> Dict[str, List[dict]]:
+        return self.wrapper.get_schema_foreign_keys(schema)
+
+    def get_table_comments(self, schema: str) -> Dict[str, dict]:
+        return self.wrapper.get_schema_table_comments(schema)
+
+
 @platform_name("Oracle")
 @config_class(OracleConfig)
 @support_status(SupportStatus.INCUBATING)
@@ -680,6 +797,12 @@ class OracleSource(SQLAlchemySource):
 
         return db_name
 
+    def make_schema_reflector(self, inspector: Inspector) -> Optional[SchemaReflector]:
+        # The ALL_* views are reflected by the SQLAlchemy dialect, table by table.
+        if isinstance(inspector, OracleInspectorObjectWrapper):
+            return OracleSchemaReflector(inspector)
+        return None
+
     def get_inspectors(self) -> Iterable[Inspector]:
         for inspector in super().get_inspectors():
             event.listen(
@@ -1,4 +1,5 @@
 import logging
+import re
 from collections import defaultdict
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
@@ -14,7 +15,7 @@ import sqlalchemy.dialects.postgresql as custom_types
 from geoalchemy2 import Geometry  # noqa: F401
 from pydantic import BaseModel
 from pydantic.fields import Field
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.engine.reflection import Inspector
 
 from datahub.configuration.common import AllowDenyPattern
@@ -31,6 +32,7 @@ from datahub.ingestion.api.decorators import (
 )
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.sql.sql_common import (
+    SchemaReflector,
     SQLAlchemySource,
     SqlWorkUnit,
     register_custom_type,
@@ -97,6 +99,179 @@ ORDER BY source_schema, source_table;
 """
 
 
+# The relations that SQLAlchemy reflects: tables, views, materialized views,
+# foreign tables and partitioned tables.
+_SCHEMA_RELATIONS = """
+SELECT c.oid, c.relname
+FROM pg_catalog.pg_class c
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = :schema AND c.relkind IN ('r', 'v', 'm', 'f', 'p')
+"""
+
+# Same as the query of PGDialect.get_columns, for all the relations of a schema.
+# The generated and identity columns are left out, since they aren't ingested.
+SCHEMA_COLUMNS_QUERY = f"""
+WITH rel AS ({_SCHEMA_RELATIONS})
+SELECT rel.relname,
+  a.attname,
+  pg_catalog.format_type(a.atttypid, a.atttypmod),
+  (
+    SELECT pg_catalog.pg_get_expr(d.adbin, d.adrelid)
+    FROM pg_catalog.pg_attrdef d
+    WHERE d.adrelid = a.attrelid AND d.adnum = a.attnum
+    AND a.atthasdef
+  ) AS default,
+  a.attnotnull,
+  pgd.description AS comment
+FROM pg_catalog.pg_attribute a
+JOIN rel ON rel.oid = a.attrelid
+LEFT JOIN pg_catalog.pg_description pgd ON (
+    pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
+WHERE a.attnum > 0 AND NOT a.attisdropped
+ORDER BY rel.relname, a.attnum
+"""
+
+SCHEMA_PK_CONSTRAINTS_QUERY = f"""
+WITH rel AS ({_SCHEMA_RELATIONS})
+SELECT rel.relname, r.conname, a.attname
+FROM pg_catalog.pg_constraint r
+JOIN rel ON rel.oid = r.conrelid
+CROSS JOIN LATERAL unnest(r.conkey) WITH ORDINALITY AS k(attnum, ord)
+JOIN pg_catalog.pg_attribute a ON a.attrelid = r.conrelid AND a.attnum = k.attnum
+WHERE r.contype = 'p'
+ORDER BY rel.relname, k.ord
+"""
+
+SCHEMA_FOREIGN_KEYS_QUERY = f"""
+WITH rel AS ({_SCHEMA_RELATIONS})
+SELECT rel.relname,
+  r.conname,
+  pg_catalog.pg_get_constraintdef(r.oid, true) AS condef,
+  n.nspname AS conschema
+FROM pg_catalog.pg_constraint r
+JOIN rel ON rel.oid = r.conrelid
+JOIN pg_catalog.pg_class c ON c.oid = r.confrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE r.contype = 'f'
+ORDER BY rel.relname, r.conname
+"""
+
+SCHEMA_TABLE_COMMENTS_QUERY = f"""
+WITH rel AS ({_SCHEMA_RELATIONS})
+SELECT rel.relname, pgd.description
+FROM rel
+JOIN pg_catalog.pg_description pgd ON (
+    pgd.objoid = rel.oid
+    AND pgd.classoid = 'pg_catalog.pg_class'::regclass
+    AND pgd.objsubid = 0)
+"""
+
+# Parses the output of pg_get_constraintdef, like PGDialect.get_foreign_keys.
+_FOREIGN_KEY_DEFINITION = re.compile(
+    r"FOREIGN KEY \((.*?)\) REFERENCES (?:(.*?)\.)?(.*?)\((.*?)\)"
+    r"[\s]?(?:MATCH (?:FULL|PARTIAL|SIMPLE)+)?"
+    r"[\s]?(?:ON UPDATE (CASCADE|RESTRICT|NO ACTION|SET NULL|SET DEFAULT)+)?"
+    r"[\s]?(?:ON DELETE (CASCADE|RESTRICT|NO ACTION|SET NULL|SET DEFAULT)+)?"
+)
+
+
+class PostgresSchemaReflector(SchemaReflector):
+    """Reflects a schema with one pg_catalog query per kind of metadata, instead of one per table."""
+
+    def _execute(self, query: str, schema: str) -> List[Any]:
+        return self.inspector.bind.execute(text(query), {"schema": schema}).fetchall()
+
+    def get_columns(self, schema: str) -> Dict[str, List[dict]]:
+        dialect = self.inspector.dialect
+        rows = self._execute(SCHEMA_COLUMNS_QUERY, schema)
+
+        # Loaded once per table by PGDialect.get_columns.
+        domains = dialect._load_domains(self.inspector.bind)  # type: ignore[attr-defined]
+        enums = {
+            ((rec["name"],) if rec["visible"] else (rec["schema"], rec["name"])): rec
+            for rec in dialect._load_enums(self.inspector.bind, schema="*")  # type: ignore[attr-defined]
+        }
+
+        columns: Dict[str, List[dict]] = defaultdict(list)
+        for table, name, format_type, default, notnull, comment in rows:
+            column = dialect._get_column_info(  # type: ignore[attr-defined]
+                name,
+                format_type,
+                default,
+                notnull,
+                domains,
+                enums,
+                schema,
+                comment,
+                None,
+                None,
+            )
+            columns[table].append(column)
+        return columns
+
+    def get_pk_constraints(self, schema: str) -> Dict[str, dict]:
+        pk_constraints: Dict[str, dict] = {}
+        for table, name, column in self._execute(SCHEMA_PK_CONSTRAINTS_QUERY, schema):
+            pk_constraint = pk_constraints.setdefault(
+                table, {"constrained_columns": [], "name": name}
+            )
+            pk_constraint["constrained_columns"].append(column)
+        return pk_constraints
+
+    def get_foreign_keys(self, schema: str) -> Dict[str, List[dict]]:
+        unquote = self.inspector.dialect.identifier_preparer._unquote_identifier  # type: ignore[attr-defined]
+        foreign_keys: Dict[str, List[dict]] = defaultdict(list)
+        for table, name, definition, referred_table_schema in self._execute(
+            SCHEMA_FOREIGN_KEYS_QUERY, schema
+        ):
+            match = _FOREIGN_KEY_DEFINITION.search(definition)
+            if match is None:
+                raise ValueError(f"Unable to parse foreign key definition {definition}")
+            (
+                constrained_columns,
+                referred_schema,
+                referred_table,
+                referred_columns,
+                onupdate,
+                ondelete,
+            ) = match.groups()
+
+            # pg_get_constraintdef leaves out the schema if it's in the search path.
+            if referred_schema:
+                referred_schema = unquote(referred_schema)
+            elif referred_table_schema == schema:
+                referred_schema = schema
+
+            foreign_keys[table].append(
+                {
+                    "name": name,
+                    "constrained_columns": [
+                        unquote(c) for c in re.split(r"\s*,\s*", constrained_columns)
+                    ],
+                    "referred_schema": referred_schema,
+                    "referred_table": unquote(referred_table),
+                    "referred_columns": [
+                        unquote(c) for c in re.split(r"\s*,\s", referred_columns)
+                    ],
+                    "options": {
+                        option: value
+                        for option, value in [
+                            ("onupdate", onupdate),
+                            ("ondelete", ondelete),
+                        ]
+                        if value is not None and value != "NO ACTION"
+                    },
+                }
+            )
+        return foreign_keys
+
+    def get_table_comments(self, schema: str) -> Dict[str, dict]:
+        return {
+            table: {"text": comment}
+            for table, comment in self._execute(SCHEMA_TABLE_COMMENTS_QUERY, schema)
+        }
+
+
 class ViewLineageEntry(BaseModel):
     # note that the order matches our query above
     # so pydantic is able to parse the tuple using parse_obj
@@ -285,6 +460,9 @@ class PostgresSource(SQLAlchemySource):
             for item in mcps_from_mce(lineage_mce):
                 yield item.as_workunit()
 
+    def make_schema_reflector(self, inspector: Inspector) -> Optional[SchemaReflector]:
+        return PostgresSchemaReflector(inspector)
+
     def get_identifier(
         self, *, schema: str, entity: str, inspector: Inspector, **kwargs: Any
     ) -> str:
@@ -278,6 +278,83 @@ class ProfileMetadata:
     dataset_name_to_storage_bytes: Dict[str, int] = field(default_factory=dict)
 
 
+class SchemaReflector:
+    """
+    Reflects the tables and views of a whole schema with a few catalog queries,
+    instead of the few queries per table that the SQLAlchemy inspector runs.
+
+    Each method returns a dict keyed by table name, in the normalized form returned
+    by `Inspector.get_table_names`, whose values have the same format as the result
+    of the corresponding `Inspector` method. Sources return an implementation for
+    their dialect from `SQLAlchemySource.make_schema_reflector`; methods that aren't
+    implemented raise NotImplementedError, and fall back to the inspector.
+    """
+
+    def __init__(self, inspector: Inspector):
+        self.inspector = inspector
+
+    def get_columns(self, schema: str) -> Dict[str, List[dict]]:
+        raise NotImplementedError
+
+    def get_pk_constraints(self, schema: str) -> Dict[str, dict]:
+        raise NotImplementedError
+
+    def get_foreign_keys(self, schema: str) -> Dict[str, List[dict]]:
+        raise NotImplementedError
+
+    def get_table_comments(self, schema: str) -> Dict[str, dict]:
+        raise NotImplementedError
+
+
+class _SchemaReflectionCache:
+    """The results of a SchemaReflector for the schema being processed.
+
+    Schemas are processed one at a time, so only the results of the last one are kept.
+    """
+
+    def __init__(
+        self,
+        inspector: Inspector,
+        reflector: Optional[SchemaReflector],
+        report: SQLSourceReport,
+    ):
+        self.inspector = inspector
+        self.reflector = reflector
+        self.report = report
+        self._schema: Optional[str] = None
+        # None if the schema couldn't be reflected in bulk.
+        self._results: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def get(self, schema: str, kind: str) -> Optional[Dict[str, Any]]:
+        if self.reflector is None:
+            return None
+        if schema != self._schema:
+            self._schema = schema
+            self._results = {}
+        if kind not in self._results:
+            self._results[kind] = self._reflect(schema, kind)
+        return self._results[kind]
+
+    def _reflect(self, schema: str, kind: str) -> Optional[Dict[str, Any]]:
+        assert self.reflector is not None
+        try:
+            with self.report.bulk_reflection_timer:
+                result = getattr(self.reflector, f"get_{kind}")(schema)
+        except NotImplementedError:
+            return None
+        except Exception as e:
+            self.report.warning(
+                title="Failed to reflect schema in bulk",
+                message=f"Unable to fetch the {kind.replace('_', ' ')} of the tables in bulk, "
+                "falling back to fetching them table by table.",
+                context=schema,
+                exc=e,
+            )
+            return None
+        self.report.num_bulk_reflections += 1
+        return result
+
+
 @capability(
     SourceCapability.CLASSIFICATION,
     "Optionally enabled via `classification.enabled`",
@@ -375,6 +452,8 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         )
         self.report.sql_aggregator = self.aggregator.report
 
+        self._schema_reflection_cache: Optional[_SchemaReflectionCache] = None
+
     def _add_default_options(self, sql_config: SQLCommonConfig) -> None:
         """Add default SQLAlchemy options. Can be overridden by subclasses to add additional defaults."""
         # Extra default SQLAlchemy option for better connection pooling and threading.
@@ -662,6 +741,34 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
 
         return None
 
+    def make_schema_reflector(self, inspector: Inspector) -> Optional[SchemaReflector]:
+        """
+        Subclasses can override this with a SchemaReflector for their dialect,
+        to fetch the metadata of the tables of a schema in bulk.
+        """
+        return None
+
+    def _get_reflected_table_info(
+        self, inspector: Inspector, schema: str, table: str, kind: str, default: Any
+    ) -> Any:
+        """
+        Returns the `kind` ("columns", "pk_constraints", ...) of a table reflected in bulk,
+        or None if the schema couldn't be reflected in bulk. Tables missing from the bulk
+        results get the default.
+        """
+        if not self.config.bulk_schema_reflection:
+            return None
+
+        cache = self._schema_reflection_cache
+        if cache is None or cache.inspector is not inspector:
+            cache = self._schema_reflection_cache = _SchemaReflectionCache(
+                inspector, self.make_schema_reflector(inspector), self.report
+            )
+        result = cache.get(schema, kind)
+        if result is None:
+            return None
+        return result.get(table, default)
+
     def loop_tables(
         self,
         inspector: Inspector,
@@ -758,7 +865,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         dataset_snapshot.aspects.append(dataset_properties)
 
         extra_tags = self.get_extra_tags(inspector, schema, table)
-        pk_constraints: dict = inspector.get_pk_constraint(table, schema)
+        pk_constraints = self._get_pk_constraint(inspector, schema, table)
         partitions: Optional[List[str]] = self.get_partitions(inspector, schema, table)
         foreign_keys = self._get_foreign_keys(dataset_urn, inspector, schema, table)
         schema_fields = self.get_schema_fields(
@@ -900,10 +1007,14 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         # this method and provide a location.
         location: Optional[str] = None
 
+        table_info: Optional[dict] = self._get_reflected_table_info(
+            inspector, schema, table, "table_comments", default={"text": None}
+        )
         try:
-            # SQLAlchemy stubs are incomplete and missing this method.
-            # PR: https://github.com/dropbox/sqlalchemy-stubs/pull/223.
-            table_info: dict = inspector.get_table_comment(table, schema)  # type: ignore
+            if table_info is None:
+                # SQLAlchemy stubs are incomplete and missing this method.
+                # PR: https://github.com/dropbox/sqlalchemy-stubs/pull/223.
+                table_info = inspector.get_table_comment(table, schema)  # type: ignore
         except NotImplementedError:
             return description, properties, location
         except ProgrammingError as pe:
@@ -912,7 +1023,8 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
                 f"Encountered ProgrammingError. Retrying with quoted schema name for schema {schema} and table {table}",
                 pe,
             )
-            table_info: dict = inspector.get_table_comment(table, f'"{schema}"')  # type: ignore
+            table_info = inspector.get_table_comment(table, f'"{schema}"')  # type: ignore
+        assert table_info is not None
 
         description = table_info.get("text")
         if isinstance(description, LegacyRow):
@@ -945,7 +1057,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
     ) -> List[dict]:
         columns = []
         try:
-            columns = inspector.get_columns(table, schema)
+            columns = self._get_table_columns(inspector, schema, table)
             if len(columns) == 0:
                 self.warn(logger, "missing column information", dataset_name)
         except Exception as e:
@@ -957,13 +1069,41 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
             )
         return columns
 
+    def _get_table_columns(
+        self, inspector: Inspector, schema: str, table: str
+    ) -> List[dict]:
+        columns = self._get_reflected_table_info(
+            inspector, schema, table, "columns", default=None
+        )
+        if columns is None:
+            self.report.num_tables_reflected_individually += 1
+            columns = inspector.get_columns(table, schema)
+        return columns
+
+    def _get_pk_constraint(self, inspector: Inspector, schema: str, table: str) -> dict:
+        pk_constraint = self._get_reflected_table_info(
+            inspector,
+            schema,
+            table,
+            "pk_constraints",
+            default={"constrained_columns": [], "name": None},
+        )
+        if pk_constraint is None:
+            pk_constraint = inspector.get_pk_constraint(table, schema)
+        return pk_constraint
+
     def _get_foreign_keys(
         self, dataset_urn: str, inspector: Inspector, schema: str, table: str
     ) -> List[ForeignKeyConstraintClass]:
+        fk_recs = self._get_reflected_table_info(
+            inspector, schema, table, "foreign_keys", default=[]
+        )
         try:
+            if fk_recs is None:
+                fk_recs = inspector.get_foreign_keys(table, schema)
             foreign_keys = [
                 self.get_foreign_key_metadata(dataset_urn, schema, fk_rec, inspector)
-                for fk_rec in inspector.get_foreign_keys(table, schema)
+                for fk_rec in fk_recs
             ]
         except KeyError:
             # certain databases like MySQL cause issues due to lower-case/upper-case irregularities
@@ -1139,7 +1279,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         )
 
         try:
-            columns = inspector.get_columns(view, schema)
+            columns = self._get_table_columns(inspector, schema, view)
         except KeyError:
             # For certain types of views, we are unable to fetch the list of columns.
             self.report.warning(
@@ -111,6 +111,13 @@ class SQLCommonConfig(
         description="Whether to use a file backed cache for the view definitions.",
     )
 
+    bulk_schema_reflection: bool = Field(
+        default=True,
+        description="If the source supports it, fetch the columns, constraints and comments of all the tables of a schema "
+        "with a few catalog queries, instead of a few queries per table. Tables missing from the results of these queries "
+        "are still reflected one by one.",
+    )
+
     profiling: GEProfilingConfig = GEProfilingConfig()
     # Custom Stateful Ingestion settings
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = None
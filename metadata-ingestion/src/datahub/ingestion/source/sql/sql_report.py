@@ -7,6 +7,7 @@ from datahub.ingestion.source.state.stale_entity_removal_handler import (
 )
 from datahub.sql_parsing.sql_parsing_aggregator import SqlAggregatorReport
 from datahub.utilities.lossy_collections import LossyList
+from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.sqlalchemy_query_combiner import SQLAlchemyQueryCombinerReport
 from datahub.utilities.stats_collections import TopKDict, int_top_k_dict
 
@@ -55,6 +56,10 @@ class SQLSourceReport(
     view_definitions_parsing_failures: LossyList[str] = field(default_factory=LossyList)
     sql_aggregator: Optional[SqlAggregatorReport] = None
 
+    num_bulk_reflections: int = 0
+    num_tables_reflected_individually: int = 0
+    bulk_reflection_timer: PerfTimer = field(default_factory=PerfTimer)
+
     def report_entity_scanned(self, name: str, ent_type: str = "table") -> None:
         """
         Entity could be a view or a table
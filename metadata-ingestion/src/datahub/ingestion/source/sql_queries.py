@@ -1,10 +1,13 @@
+import concurrent.futures
+import itertools
 import json
 import logging
+import multiprocessing
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field as dataclass_field
 from datetime import datetime
 from functools import partial
-from typing import ClassVar, Iterable, List, Optional, Union
+from typing import ClassVar, Dict, Iterable, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field, validator
 
@@ -37,16 +40,23 @@ from datahub.ingestion.graph.client import DataHubGraph
 from datahub.ingestion.source.usage.usage_common import BaseUsageConfig
 from datahub.ingestion.source_report.ingestion_stage import IngestionStageReport
 from datahub.metadata.urns import CorpUserUrn, DatasetUrn
-from datahub.sql_parsing.schema_resolver import SchemaResolver
+from datahub.sql_parsing.schema_resolver import SchemaInfo, SchemaResolver
 from datahub.sql_parsing.sql_parsing_aggregator import (
     KnownQueryLineageInfo,
     ObservedQuery,
     SqlAggregatorReport,
     SqlParsingAggregator,
 )
+from datahub.sql_parsing.sqlglot_lineage import SqlParsingResult, sqlglot_lineage
+from datahub.sql_parsing.sqlglot_utils import get_query_fingerprint
+from datahub.utilities.file_backed_collections import FileBackedDict
+from datahub.utilities.perf_timer import PerfTimer
 
 logger = logging.getLogger(__name__)
 
+# Number of query file lines that are decoded, fingerprinted and parsed as a batch.
+_QUERY_CHUNK_SIZE = 1000
+
 
 class SqlQueriesSourceConfig(PlatformInstanceConfigMixin, EnvConfigMixin):
     query_file: str = Field(description="Path to file to ingest")
@@ -77,6 +87,13 @@ class SqlQueriesSourceConfig(PlatformInstanceConfigMixin, EnvConfigMixin):
         description="The SQL dialect to use when parsing queries. Overrides automatic dialect detection.",
         default=None,
     )
+    parse_processes: int = Field(
+        description="Number of processes that parse queries in parallel, ahead of adding them to the lineage "
+        "and usage aggregation. Each process holds a copy of the schemas used for parsing. "
+        "If 0, queries are parsed in the ingestion process.",
+        default=0,
+        ge=0,
+    )
 
 
 @dataclass
@@ -84,6 +101,9 @@ class SqlQueriesSourceReport(SourceReport, IngestionStageReport):
     num_entries_processed: int = 0
     num_entries_failed: int = 0
     num_queries_aggregator_failures: int = 0
+    num_unique_queries_parsed: int = 0
+    num_queries_deduplicated: int = 0
+    query_parse_wait_timer: PerfTimer = dataclass_field(default_factory=PerfTimer)
 
     sql_aggregator: Optional[SqlAggregatorReport] = None
 
@@ -109,9 +129,13 @@ class SqlQueriesSource(Source):
      used if the query can't be parsed.
     - upstream_tables (optional): string[] - Fallback list of tables the query reads from,
      used if the query can't be parsed.
+
+    The file is streamed. Queries that only differ in their literals share a fingerprint and are parsed once,
+    while each of them still counts towards usage with its own timestamp and user. Parsing can be spread over
+    several processes with `parse_processes`.
     """
 
-    schema_resolver: Optional[SchemaResolver]
+    schema_resolver: SchemaResolver
     aggregator: SqlParsingAggregator
 
     def __init__(self, ctx: PipelineContext, config: SqlQueriesSourceConfig):
@@ -135,7 +159,11 @@ class SqlQueriesSource(Source):
                 env=self.config.env,
             )
         else:
-            self.schema_resolver = None
+            self.schema_resolver = SchemaResolver(
+                platform=self.config.platform,
+                platform_instance=self.config.platform_instance,
+                env=self.config.env,
+            )
 
         self.aggregator = SqlParsingAggregator(
             platform=self.config.platform,
@@ -172,13 +200,25 @@ class SqlQueriesSource(Source):
     ) -> Iterable[Union[MetadataWorkUnit, MetadataChangeProposalWrapper]]:
         logger.info(f"Parsing queries from {os.path.basename(self.config.query_file)}")
 
-        with self.report.new_stage("Collecting queries from file"):
-            queries = list(self._parse_query_file())
-            logger.info(f"Collected {len(queries)} queries for processing")
-
         with self.report.new_stage("Processing queries through SQL parsing aggregator"):
-            for query_entry in queries:
-                self._add_query_to_aggregator(query_entry)
+            with _QueryParser(self.config, self.schema_resolver, self.report) as parser:
+                # The next chunk is being parsed while the current one is aggregated.
+                pending: List[Tuple[QueryEntry, Optional[str]]] = []
+                for chunk in self._read_query_chunks():
+                    fingerprints = parser.submit(chunk)
+                    for query_entry, fingerprint in pending:
+                        self._add_query_to_aggregator(
+                            query_entry, parser.get(query_entry, fingerprint)
+                        )
+                    pending = list(zip(chunk, fingerprints))
+                for query_entry, fingerprint in pending:
+                    self._add_query_to_aggregator(
+                        query_entry, parser.get(query_entry, fingerprint)
+                    )
+            logger.info(
+                f"Processed {self.report.num_entries_processed} queries, "
+                f"of which {self.report.num_unique_queries_parsed} were parsed"
+            )
 
         with self.report.new_stage("Generating metadata work units"):
             logger.info("Generating workunits from SQL parsing aggregator")
@@ -206,7 +246,16 @@ class SqlQueriesSource(Source):
                         exc=e,
                     )
 
-    def _add_query_to_aggregator(self, query_entry: "QueryEntry") -> None:
+    def _read_query_chunks(self) -> Iterable[List["QueryEntry"]]:
+        entries = iter(self._parse_query_file())
+        while chunk := list(itertools.islice(entries, _QUERY_CHUNK_SIZE)):
+            yield chunk
+
+    def _add_query_to_aggregator(
+        self,
+        query_entry: "QueryEntry",
+        parse_result: Optional[SqlParsingResult] = None,
+    ) -> None:
         """Add a query to the SQL parsing aggregator."""
         try:
             # If we have both upstream and downstream tables, use explicit lineage
@@ -253,7 +302,9 @@ class SqlQueriesSource(Source):
                     default_schema=self.config.default_schema,
                     override_dialect=self.config.override_dialect,
                 )
-                self.aggregator.add_observed_query(observed_query)
+                self.aggregator.add_observed_query(
+                    observed_query, parse_result=parse_result
+                )
 
         except Exception as e:
             self.report.num_queries_aggregator_failures += 1
@@ -265,6 +316,148 @@ class SqlQueriesSource(Source):
             )
 
 
+_worker_schema_resolver: Optional[SchemaResolver] = None
+
+
+def _init_parse_worker(
+    platform: str,
+    platform_instance: Optional[str],
+    env: str,
+    schema_infos: Dict[str, SchemaInfo],
+) -> None:
+    global _worker_schema_resolver
+    _worker_schema_resolver = SchemaResolver(
+        platform=platform, platform_instance=platform_instance, env=env
+    )
+    for urn, schema_info in schema_infos.items():
+        _worker_schema_resolver.add_raw_schema_info(urn, schema_info)
+
+
+def _parse_query(
+    query: str,
+    schema_resolver: Optional[SchemaResolver],
+    default_db: Optional[str],
+    default_schema: Optional[str],
+    override_dialect: Optional[str],
+) -> SqlParsingResult:
+    schema_resolver = schema_resolver or _worker_schema_resolver
+    assert schema_resolver is not None
+    return sqlglot_lineage(
+        query,
+        schema_resolver=schema_resolver,
+        default_db=default_db,
+        default_schema=default_schema,
+        override_dialect=override_dialect,
+    )
+
+
+class _QueryParser:
+    """Parses each distinct query once, in a process pool if `parse_processes` is set.
+
+    Queries are deduplicated by their fast fingerprint, which ignores literals and formatting,
+    so queries that only differ in e.g. a date filter are parsed once.
+    """
+
+    def __init__(
+        self,
+        config: SqlQueriesSourceConfig,
+        schema_resolver: SchemaResolver,
+        report: SqlQueriesSourceReport,
+    ):
+        self.config = config
+        self.schema_resolver = schema_resolver
+        self.report = report
+
+        self._results: FileBackedDict[SqlParsingResult] = FileBackedDict()
+        self._pending: Dict[str, "concurrent.futures.Future[SqlParsingResult]"] = {}
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        if config.parse_processes:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=config.parse_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_parse_worker,
+                initargs=(
+                    schema_resolver.platform,
+                    schema_resolver.platform_instance,
+                    schema_resolver.env,
+                    schema_resolver.get_schema_infos(),
+                ),
+            )
+
+    def __enter__(self) -> "_QueryParser":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        if self._executor:
+            self._executor.shutdown(cancel_futures=True)
+        self._results.close()
+
+    def submit(self, query_entries: List["QueryEntry"]) -> List[Optional[str]]:
+        """Fingerprints the queries, and starts parsing the ones that weren't seen yet if parsing in parallel.
+
+        Queries with explicit lineage aren't parsed, and get no fingerprint.
+        """
+        fingerprints: List[Optional[str]] = []
+        for query_entry in query_entries:
+            if query_entry.upstream_tables and query_entry.downstream_tables:
+                fingerprints.append(None)
+                continue
+            fingerprint = get_query_fingerprint(
+                query_entry.query,
+                platform=self.config.override_dialect or self.config.platform,
+                fast=True,
+            )
+            fingerprints.append(fingerprint)
+            if (
+                self._executor
+                and fingerprint not in self._pending
+                and fingerprint not in self._results
+            ):
+                self._pending[fingerprint] = self._executor.submit(
+                    _parse_query,
+                    query_entry.query,
+                    None,
+                    self.config.default_db,
+                    self.config.default_schema,
+                    self.config.override_dialect,
+                )
+        return fingerprints
+
+    def get(
+        self, query_entry: "QueryEntry", fingerprint: Optional[str]
+    ) -> Optional[SqlParsingResult]:
+        if fingerprint is None:
+            return None
+
+        result = self._results.get(fingerprint)
+        if result is not None:
+            self.report.num_queries_deduplicated += 1
+            return result
+
+        future = self._pending.pop(fingerprint, None)
+        try:
+            if future is not None:
+                with self.report.query_parse_wait_timer:
+                    result = future.result()
+            else:
+                result = _parse_query(
+                    query_entry.query,
+                    self.schema_resolver,
+                    self.config.default_db,
+                    self.config.default_schema,
+                    self.config.override_dialect,
+                )
+        except Exception as e:
+            # E.g. a parse result that can't be sent back from the worker. The aggregator
+            # will parse the query itself.
+            logger.debug(f"Failed to parse query ahead of time: {e}", exc_info=e)
+            return None
+
+        self.report.num_unique_queries_parsed += 1
+        self._results[fingerprint] = result
+        return result
+
+
 class QueryEntry(BaseModel):
     query: str
     timestamp: Optional[datetime] = None
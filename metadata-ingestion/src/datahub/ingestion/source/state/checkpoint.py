@@ -5,6 +5,7 @@ import functools
 import json
 import logging
 import pickle
+import zlib
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Callable, Generic, Optional, Type, TypeVar
@@ -22,6 +23,10 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_STATE_SIZE = 2**22  # 4MB
 
+# zlib is considerably faster than bz2 at both compression and decompression,
+# at the cost of a slightly larger payload.
+ZLIB_COMPRESSION_LEVEL = 6
+
 
 class CheckpointStateBase(ConfigModel):
     """
@@ -58,6 +63,10 @@ class CheckpointStateBase(ConfigModel):
             )
         elif self.serde == "base85-bz2-json":
             encoded_bytes = CheckpointStateBase._to_bytes_base85_json(self, compressor)
+        elif self.serde == "base85-zlib-json":
+            encoded_bytes = base64.b85encode(
+                zlib.compress(self._to_compact_json_bytes(), ZLIB_COMPRESSION_LEVEL)
+            )
         else:
             raise ValueError(f"Unknown serde: {self.serde}")
 
@@ -78,6 +87,14 @@ class CheckpointStateBase(ConfigModel):
     ) -> bytes:
         return base64.b85encode(compressor(CheckpointStateBase._to_bytes_utf8(model)))
 
+    def _to_compact_json_bytes(self) -> bytes:
+        """
+        Serializes the state for the base85-zlib-json serde. Since older versions of the
+        CLI can't read that serde anyway, subclasses may override this to use a more compact
+        layout, as long as their validators can parse it back.
+        """
+        return CheckpointStateBase._to_bytes_utf8(self)
+
     def prepare_for_commit(self) -> None:
         """
         Perform any pre-commit steps, such as deduplication, custom-compression across data etc.
@@ -128,6 +145,12 @@ class Checkpoint(Generic[StateType]):
                         functools.partial(bz2.decompress),
                         state_class,
                     )
+                elif checkpoint_aspect.state.serde == "base85-zlib-json":
+                    state_obj = Checkpoint._from_base85_json_bytes(
+                        checkpoint_aspect,
+                        zlib.decompress,
+                        state_class,
+                    )
                 else:
                     raise ValueError(f"Unknown serde: {checkpoint_aspect.state.serde}")
             except Exception as e:
@@ -1,4 +1,5 @@
-from typing import Any, Dict, Iterable, List, Tuple, Type
+import json
+from typing import Any, Dict, Iterable, List, Tuple, Type, Union
 
 import pydantic
 
@@ -59,6 +60,58 @@ def pydantic_state_migrator(mapping: Dict[str, str]) -> classmethod:
     return pydantic.root_validator(pre=True, allow_reuse=True)(_validate_field_rename)
 
 
+def _common_prefix_length(a: str, b: str) -> int:
+    # Binary search over slice comparisons, which run in C, instead of
+    # comparing character by character in Python.
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def encode_sorted_urns(urns: Iterable[str]) -> List[Union[int, str]]:
+    """
+    Front-codes the urns: they're sorted, and each urn is stored as the length of the
+    prefix it shares with the previous urn followed by the remaining suffix. Urns from a
+    single source share long prefixes, so this is much smaller than the plain list.
+    """
+
+    encoded: List[Union[int, str]] = []
+    prev = ""
+    for urn in sorted(urns):
+        shared = _common_prefix_length(prev, urn)
+        encoded.append(shared)
+        encoded.append(urn[shared:])
+        prev = urn
+    return encoded
+
+
+def decode_sorted_urns(encoded: List[Union[int, str]]) -> List[str]:
+    if len(encoded) % 2 != 0:
+        raise ValueError("Front-coded urn list must contain (prefix, suffix) pairs")
+
+    urns: List[str] = []
+    prev = ""
+    for i in range(0, len(encoded), 2):
+        shared, suffix = encoded[i], encoded[i + 1]
+        if not isinstance(shared, int) or not isinstance(suffix, str):
+            raise ValueError(f"Invalid entry in front-coded urn list at index {i}")
+        prev = prev[:shared] + suffix
+        urns.append(prev)
+    return urns
+
+
+def _decode_compact_urns(cls: Type, values: dict) -> dict:
+    if "sorted_urns" in values:
+        values.setdefault("urns", [])
+        values["urns"] += decode_sorted_urns(values.pop("sorted_urns"))
+    return values
+
+
 class GenericCheckpointState(CheckpointStateBase):
     urns: List[str] = pydantic.Field(default_factory=list)
 
@@ -82,6 +135,9 @@ class GenericCheckpointState(CheckpointStateBase):
             # "encoded_assertion_urns": "assertion",  # already handled from SQL
         }
     )
+    _compact_urns = pydantic.root_validator(pre=True, allow_reuse=True)(
+        _decode_compact_urns
+    )
 
     def __init__(self, **data: Any):  # type: ignore
         super().__init__(**data)
@@ -112,7 +168,10 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: an iterable to the set of urns present in this checkpoint state but not in the other_checkpoint.
         """
 
-        diff = set(self.urns) - set(other_checkpoint_state.urns)
+        # Stream the difference using the other state's existing set instead of
+        # materializing sets for both states, which matters for states with millions of urns.
+        other_urns = other_checkpoint_state._urns_set
+        diff = (urn for urn in self.urns if urn not in other_urns)
 
         # To maintain backwards compatibility, we provide this filtering mechanism.
         # TODO: Deprecate the `type` parameter and remove it.
@@ -133,15 +192,28 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: (1-|intersection(self, old_checkpoint_state)| / |old_checkpoint_state|) * 100.0
         """
 
-        old_urns_filtered = filter_ignored_entity_types(old_checkpoint_state.urns)
+        old_count = 0
+        overlap_count = 0
+        for urn in old_checkpoint_state.urns:
+            if _is_ignored_entity_urn(urn):
+                continue
+            old_count += 1
+            if urn in self._urns_set:
+                overlap_count += 1
 
-        return compute_percent_entities_changed(
-            new_entities=self.urns, old_entities=old_urns_filtered
-        )
+        if old_count:
+            return (1 - overlap_count / old_count) * 100.0
+        return 0.0
 
     def urn_count(self) -> int:
         return len(self.urns)
 
+    def _to_compact_json_bytes(self) -> bytes:
+        return json.dumps(
+            {"sorted_urns": encode_sorted_urns(self.urns)},
+            separators=(",", ":"),
+        ).encode("utf-8")
+
 
 def compute_percent_entities_changed(
     new_entities: List[str], old_entities: List[str]
@@ -173,11 +245,11 @@ def filter_ignored_entity_types(urns: List[str]) -> List[str]:
     # setting of `fail_safe_threshold` due to removal of irrelevant urns from new state,
     # here, we would ignore irrelevant urns from percentage entities changed computation
     # This special handling can be removed after few months.
-    return [
-        urn
-        for urn in urns
-        if not any(
-            urn.startswith(f"urn:li:{entityType}")
-            for entityType in STATEFUL_INGESTION_IGNORED_ENTITY_TYPES
-        )
-    ]
+    return [urn for urn in urns if not _is_ignored_entity_urn(urn)]
+
+
+def _is_ignored_entity_urn(urn: str) -> bool:
+    return any(
+        urn.startswith(f"urn:li:{entityType}")
+        for entityType in STATEFUL_INGESTION_IGNORED_ENTITY_TYPES
+    )
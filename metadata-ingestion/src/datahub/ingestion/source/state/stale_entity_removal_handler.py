@@ -46,6 +46,12 @@ class StatefulStaleMetadataRemovalConfig(StatefulIngestionConfig):
         le=100.0,
         ge=0.0,
     )
+    compact_state: bool = pydantic.Field(
+        default=False,
+        description="Stores the state as a sorted, prefix-compressed list of urns using zlib instead of bz2 compression. "
+        "This is much faster to commit and load for sources with millions of entities, but versions of the CLI "
+        "released before this option was added will not be able to read the resulting state.",
+    )
 
 
 @dataclass
@@ -195,6 +201,11 @@ class StaleEntityRemovalHandler(
         return self.checkpointing_enabled
 
     def _get_state_obj(self):
+        if (
+            self.stateful_ingestion_config
+            and self.stateful_ingestion_config.compact_state
+        ):
+            return self.state_type_class(serde="base85-zlib-json")
         return self.state_type_class()
 
     def create_checkpoint(self) -> Optional[Checkpoint]:
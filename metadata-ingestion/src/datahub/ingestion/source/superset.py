@@ -3,7 +3,6 @@ import logging
 import os
 from dataclasses import dataclass, field
 from datetime import datetime
-from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import dateutil.parser as dp
@@ -99,9 +98,23 @@ from datahub.sql_parsing.sqlglot_lineage import (
     create_lineage_sql_parsed_result,
 )
 from datahub.utilities import config_clean
+from datahub.utilities.http_response_cache import (
+    HttpResponseCacheConfigMixin,
+    HttpResponseCacheStats,
+    mount_http_response_cache,
+)
 from datahub.utilities.lossy_collections import LossyList
 from datahub.utilities.registries.domain_registry import DomainRegistry
-from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutor
+from datahub.utilities.spilling_cache import (
+    SpillingCache,
+    SpillingCacheConfigMixin,
+    SpillingCacheStats,
+    memoized_method,
+)
+from datahub.utilities.threaded_iterator_executor import (
+    ThreadedIteratorExecutor,
+    ThreadedIteratorExecutorStats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -139,6 +152,11 @@ FIELD_TYPE_MAPPING = {
 @dataclass
 class SupersetSourceReport(StaleEntityRemovalSourceReport):
     filtered: LossyList[str] = field(default_factory=LossyList)
+    processing_executor: ThreadedIteratorExecutorStats = field(
+        default_factory=ThreadedIteratorExecutorStats
+    )
+    request_cache: Optional[SpillingCacheStats] = None
+    http_response_cache: Optional[HttpResponseCacheStats] = None
 
     def report_dropped(self, name: str) -> None:
         self.filtered.append(name)
@@ -164,7 +182,11 @@ class SupersetDataset(BaseModel):
 
 
 class SupersetConfig(
-    StatefulIngestionConfigBase, EnvConfigMixin, PlatformInstanceConfigMixin
+    StatefulIngestionConfigBase,
+    EnvConfigMixin,
+    PlatformInstanceConfigMixin,
+    HttpResponseCacheConfigMixin,
+    SpillingCacheConfigMixin,
 ):
     # TODO: Add support for missing dataPlatformInstance/containers
     # See the Superset /security/login endpoint for details
@@ -295,6 +317,8 @@ class SupersetSource(StatefulIngestionSourceBase):
         super().__init__(config, ctx)
         self.config = config
         self.report = SupersetSourceReport()
+        self.request_cache = SpillingCache[dict].for_config(self.config)
+        self.report.request_cache = self.request_cache.stats
         if self.config.domain:
             self.domain_registry = DomainRegistry(
                 cached_domains=[domain_id for domain_id in self.config.domain],
@@ -339,6 +363,11 @@ class SupersetSource(StatefulIngestionSourceBase):
             logger.error(
                 f"Failed to log in to Superset with status: {test_response.status_code}"
             )
+        http_response_cache = mount_http_response_cache(
+            requests_session, self.config.http_response_cache, "superset"
+        )
+        if http_response_cache is not None:
+            self.report.http_response_cache = http_response_cache.stats
         return requests_session
 
     def paginate_entity_api_results(self, entity_type, page_size=100):
@@ -384,7 +413,7 @@ class SupersetSource(StatefulIngestionSourceBase):
             if owner.get("id")
         ]
 
-    @lru_cache(maxsize=None)
+    @memoized_method("request_cache")
     def get_dataset_info(self, dataset_id: int) -> dict:
         dataset_response = self.session.get(
             f"{self.config.connect_uri}/api/v1/dataset/{dataset_id}",
@@ -596,6 +625,7 @@ class SupersetSource(StatefulIngestionSourceBase):
             worker_func=self._process_dashboard,
             args_list=dashboard_data_list,
             max_workers=self.config.max_threads,
+            stats=self.report.processing_executor,
         )
 
     def build_input_fields(
@@ -964,6 +994,7 @@ class SupersetSource(StatefulIngestionSourceBase):
             worker_func=self._process_chart,
             args_list=chart_data_list,
             max_workers=self.config.max_threads,
+            stats=self.report.processing_executor,
         )
 
     def gen_schema_fields(self, column_data: List[Dict[str, str]]) -> List[SchemaField]:
@@ -1136,7 +1167,7 @@ class SupersetSource(StatefulIngestionSourceBase):
     def construct_dataset_from_dataset_data(
         self, dataset_data: dict
     ) -> DatasetSnapshot:
-        dataset_response = self.get_dataset_info(dataset_data.get("id"))
+        dataset_response = self.get_dataset_info(dataset_data["id"])
         dataset = SupersetDataset(**dataset_response["result"])
 
         datasource_urn = self.get_datasource_urn_from_id(
@@ -1284,6 +1315,7 @@ class SupersetSource(StatefulIngestionSourceBase):
             worker_func=self._process_dataset,
             args_list=dataset_data_list,
             max_workers=self.config.max_threads,
+            stats=self.report.processing_executor,
         )
 
     def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
@@ -1306,6 +1338,10 @@ class SupersetSource(StatefulIngestionSourceBase):
     def get_report(self) -> StaleEntityRemovalSourceReport:
         return self.report
 
+    def close(self) -> None:
+        self.request_cache.close()
+        super().close()
+
     def _get_domain_wu(self, title: str, entity_urn: str) -> Iterable[MetadataWorkUnit]:
         domain_urn = None
         for domain, pattern in self.config.domain.items():
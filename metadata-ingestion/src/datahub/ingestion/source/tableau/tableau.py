@@ -171,6 +171,12 @@ from datahub.sql_parsing.sqlglot_lineage import (
     create_lineage_sql_parsed_result,
 )
 from datahub.utilities import config_clean
+from datahub.utilities.http_response_cache import (
+    HttpResponseCache,
+    HttpResponseCacheConfigMixin,
+    HttpResponseCacheStats,
+    mount_http_response_cache,
+)
 from datahub.utilities.lossy_collections import LossyList
 from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.stats_collections import TopKDict
@@ -213,7 +219,7 @@ logger: logging.Logger = logging.getLogger(__name__)
 REPLACE_SLASH_CHAR = "|"
 
 
-class TableauConnectionConfig(ConfigModel):
+class TableauConnectionConfig(HttpResponseCacheConfigMixin):
     connect_uri: str = Field(description="Tableau host URL.")
     username: Optional[str] = Field(
         default=None,
@@ -315,6 +321,10 @@ class TableauConnectionConfig(ConfigModel):
             server._session.mount("https://", adapter)
 
             server.auth.sign_in(authentication)
+            # Mounted after signing in, so that signing in is never served from the cache.
+            mount_http_response_cache(
+                server._session, self.http_response_cache, "tableau"
+            )
             return server
         except ServerResponseError as e:
             message = f"Unable to login (invalid/expired credentials or missing permissions): {str(e)}"
@@ -776,6 +786,7 @@ class TableauSourceReport(
     num_datasource_field_skipped_no_name: int = 0
     num_csql_field_skipped_no_name: int = 0
     num_table_field_skipped_no_name: int = 0
+    http_response_cache: Optional[HttpResponseCacheStats] = None
     # timers
     extract_usage_stats_timer: Dict[str, float] = dataclass_field(
         default_factory=TopKDict
@@ -923,6 +934,11 @@ class TableauSource(StatefulIngestionSourceBase, TestableSource):
             logger.info(f"Authenticated to Tableau site: '{site_content_url}'")
             self.server = self.config.make_tableau_client(site_content_url)
             self.report.last_authenticated_at = datetime.now(timezone.utc)
+            if self.config.http_response_cache.enabled:
+                # The instance mounted by make_tableau_client.
+                self.report.http_response_cache = HttpResponseCache.for_config(
+                    self.config.http_response_cache, "tableau"
+                ).stats
             report_user_role(report=self.report, server=self.server)
         # Note that we're not catching ConfigurationError, since we want that to throw.
         except ValueError as e:
@@ -208,7 +208,9 @@ class UnityCatalogSourceConfig(
 
     include_table_lineage: bool = pydantic.Field(
         default=True,
-        description="Option to enable/disable lineage generation.",
+        description="Option to enable/disable lineage generation. If `warehouse_id` is set, "
+        "the lineage of all tables of a catalog is read at once from the `system.access.table_lineage` "
+        "system table, instead of calling the lineage API for each table.",
     )
 
     include_external_lineage: bool = pydantic.Field(
@@ -254,6 +256,27 @@ class UnityCatalogSourceConfig(
         hidden_from_docs=True,
     )
 
+    table_max_workers: int = pydantic.Field(
+        default=10,
+        ge=1,
+        description="Number of worker threads used to fetch the lineage of tables concurrently, "
+        "shared across schemas. Workunits are still emitted in a stable order. Set to 1 to disable.",
+    )
+
+    schema_max_workers: int = pydantic.Field(
+        default=2,
+        ge=1,
+        description="Number of schemas whose tables are listed and whose lineage is fetched "
+        "ahead of the schema that is being ingested. Set to 1 to disable.",
+    )
+
+    max_api_calls_per_second: Optional[int] = pydantic.Field(
+        default=None,
+        ge=1,
+        description="Maximum number of Databricks API calls per second made for table listing "
+        "and lineage, across all worker threads. Unlimited by default.",
+    )
+
     include_usage_statistics: bool = Field(
         default=True,
         description="Generate usage statistics.",
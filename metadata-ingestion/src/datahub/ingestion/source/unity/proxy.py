@@ -2,11 +2,25 @@
 Manage the communication with DataBricks Server and provide equivalent dataclasses for dependent modules
 """
 
+import contextlib
 import dataclasses
 import logging
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Union, cast
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 from unittest.mock import patch
 
 import cachetools
@@ -53,6 +67,7 @@ from datahub.ingestion.source.unity.proxy_types import (
     TableReference,
 )
 from datahub.ingestion.source.unity.report import UnityCatalogReport
+from datahub.utilities.ratelimiter import TokenBucketRateLimiter
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -74,6 +89,34 @@ class TableInfoWithGeneration(TableInfo):
         return table_info
 
 
+_table_info_patch = patch(
+    "databricks.sdk.service.catalog.TableInfo", TableInfoWithGeneration
+)
+_table_info_patch_lock = threading.Lock()
+_table_info_patch_users = 0
+
+
+@contextlib.contextmanager
+def _patch_table_info() -> Iterator[None]:
+    """Parses TableInfo as TableInfoWithGeneration.
+
+    Unlike a plain `patch`, it can be entered by several threads at once: the patch is
+    only removed once the last thread exits.
+    """
+    global _table_info_patch_users
+    with _table_info_patch_lock:
+        if _table_info_patch_users == 0:
+            _table_info_patch.start()
+        _table_info_patch_users += 1
+    try:
+        yield
+    finally:
+        with _table_info_patch_lock:
+            _table_info_patch_users -= 1
+            if _table_info_patch_users == 0:
+                _table_info_patch.stop()
+
+
 @dataclasses.dataclass
 class QueryFilterWithStatementTypes(QueryFilter):
     statement_types: List[QueryStatementType] = dataclasses.field(default_factory=list)
@@ -104,6 +147,7 @@ class UnityCatalogApiProxy(UnityCatalogProxyProfilingMixin):
         warehouse_id: Optional[str],
         report: UnityCatalogReport,
         hive_metastore_proxy: Optional[HiveMetastoreProxy] = None,
+        max_api_calls_per_second: Optional[int] = None,
     ):
         self._workspace_client = WorkspaceClient(
             host=workspace_url,
@@ -114,6 +158,12 @@ class UnityCatalogApiProxy(UnityCatalogProxyProfilingMixin):
         self.warehouse_id = warehouse_id or ""
         self.report = report
         self.hive_metastore_proxy = hive_metastore_proxy
+        # Shared by all threads that list tables and fetch lineage. The threads wait
+        # for their slot concurrently, outside of the limiter's lock.
+        self._rate_limiter: Optional[TokenBucketRateLimiter] = None
+        if max_api_calls_per_second:
+            self._rate_limiter = TokenBucketRateLimiter(max_api_calls_per_second)
+            self.report.rate_limit = self._rate_limiter.stats
         self._sql_connection_params = {
             "server_hostname": self._workspace_client.config.host.replace(
                 "https://", ""
@@ -122,6 +172,9 @@ class UnityCatalogApiProxy(UnityCatalogProxyProfilingMixin):
             "access_token": self._workspace_client.config.token,
         }
 
+    def _rate_limit(self) -> ContextManager:
+        return self._rate_limiter or contextlib.nullcontext()
+
     def check_basic_connectivity(self) -> bool:
         return bool(self._workspace_client.catalogs.list(include_browse=True))
 
@@ -182,7 +235,7 @@ class UnityCatalogApiProxy(UnityCatalogProxyProfilingMixin):
         ):
             yield from self.hive_metastore_proxy.hive_metastore_tables(schema)
             return
-        with patch("databricks.sdk.service.catalog.TableInfo", TableInfoWithGeneration):
+        with _patch_table_info(), self._rate_limit():
             response = self._workspace_client.tables.list(
                 catalog_name=schema.catalog.name,
                 schema_name=schema.name,
@@ -293,7 +346,88 @@ class UnityCatalogApiProxy(UnityCatalogProxyProfilingMixin):
                 method, path, body={**body, "page_token": response["next_page_token"]}
             )
 
-    @cached(cachetools.FIFOCache(maxsize=100))
+    @cached(cachetools.FIFOCache(maxsize=100), lock=threading.Lock())
+    def get_catalog_table_lineage(
+        self, catalog: str, include_entity_lineage: bool
+    ) -> Optional[Dict[Tuple[str, str], dict]]:
+        """Get table lineage for all tables in a catalog, from the lineage system table.
+
+        Returns a dict of (schema name, table name) to a response of the same shape as
+        the table lineage API, or None if the system table can't be queried.
+        """
+        logger.info(f"Fetching table lineage for catalog: {catalog}")
+        query = """
+            SELECT
+                entity_type, entity_id,
+                source_table_catalog, source_table_schema, source_table_name, source_path,
+                target_table_catalog, target_table_schema, target_table_name,
+                max(event_time)
+            FROM system.access.table_lineage
+            WHERE
+                (
+                    target_table_catalog = %s
+                    AND target_table_schema IS NOT NULL
+                    AND target_table_name IS NOT NULL
+                )
+                OR (
+                    source_table_catalog = %s
+                    AND source_table_schema IS NOT NULL
+                    AND source_table_name IS NOT NULL
+                    AND entity_type = 'NOTEBOOK'
+                )
+            GROUP BY
+                entity_type, entity_id,
+                source_table_catalog, source_table_schema, source_table_name, source_path,
+                target_table_catalog, target_table_schema, target_table_name
+            """
+        try:
+            rows = self._execute_sql_query_or_raise(query, (catalog, catalog))
+        except Exception as e:
+            logger.warning(
+                f"Error getting table lineage for catalog {catalog} from system table, "
+                f"falling back to the lineage API: {e}",
+                exc_info=True,
+            )
+            return None
+
+        result_dict: Dict[Tuple[str, str], dict] = {}
+        for row in rows:
+            notebook_infos = []
+            if (
+                include_entity_lineage
+                and row["entity_type"] == "NOTEBOOK"
+                and row["entity_id"]
+            ):
+                notebook_infos.append({"notebook_id": int(row["entity_id"])})
+
+            # make fields look like the response from the table lineage API
+            if row["target_table_catalog"] == catalog and row["target_table_name"]:
+                item: dict = {"notebookInfos": notebook_infos}
+                if row["source_table_name"]:
+                    item["tableInfo"] = {
+                        "catalog_name": row["source_table_catalog"],
+                        "schema_name": row["source_table_schema"],
+                        "name": row["source_table_name"],
+                    }
+                elif row["source_path"]:
+                    item["fileInfo"] = {"path": row["source_path"]}
+                result_dict.setdefault(
+                    (row["target_table_schema"], row["target_table_name"]),
+                    {"upstreams": [], "downstreams": []},
+                )["upstreams"].append(item)
+            if (
+                row["source_table_catalog"] == catalog
+                and row["source_table_name"]
+                and notebook_infos
+            ):
+                result_dict.setdefault(
+                    (row["source_table_schema"], row["source_table_name"]),
+                    {"upstreams": [], "downstreams": []},
+                )["downstreams"].append({"notebookInfos": notebook_infos})
+
+        return result_dict
+
+    @cached(cachetools.FIFOCache(maxsize=100), lock=threading.Lock())
     def get_catalog_column_lineage(self, catalog: str) -> Dict[str, Dict[str, dict]]:
         """Get column lineage for all tables in a catalog."""
         logger.info(f"Fetching column lineage for catalog: {catalog}")
@@ -346,27 +480,29 @@ class UnityCatalogApiProxy(UnityCatalogProxyProfilingMixin):
     ) -> dict:
         """List table lineage by table name."""
         logger.debug(f"Getting table lineage for {table_name}")
-        return self._workspace_client.api_client.do(  # type: ignore
-            method="GET",
-            path="/api/2.0/lineage-tracking/table-lineage",
-            body={
-                "table_name": table_name,
-                "include_entity_lineage": include_entity_lineage,
-            },
-        )
+        with self._rate_limit():
+            return self._workspace_client.api_client.do(  # type: ignore
+                method="GET",
+                path="/api/2.0/lineage-tracking/table-lineage",
+                body={
+                    "table_name": table_name,
+                    "include_entity_lineage": include_entity_lineage,
+                },
+            )
 
     def list_lineages_by_column(self, table_name: str, column_name: str) -> list:
         """List column lineage by table name and column name."""
         logger.debug(f"Getting column lineage for {table_name}.{column_name}")
         try:
-            return (
-                self._workspace_client.api_client.do(  # type: ignore
-                    "GET",
-                    "/api/2.0/lineage-tracking/column-lineage",
-                    body={"table_name": table_name, "column_name": column_name},
-                ).get("upstream_cols")
-                or []
-            )
+            with self._rate_limit():
+                return (
+                    self._workspace_client.api_client.do(  # type: ignore
+                        "GET",
+                        "/api/2.0/lineage-tracking/column-lineage",
+                        body={"table_name": table_name, "column_name": column_name},
+                    ).get("upstream_cols")
+                    or []
+                )
         except Exception as e:
             logger.warning(
                 f"Error getting column lineage on table {table_name}, column {column_name}: {e}",
@@ -380,10 +516,23 @@ class UnityCatalogApiProxy(UnityCatalogProxyProfilingMixin):
             return None
         # Lineage endpoint doesn't exists on 2.1 version
         try:
-            response: dict = self.list_lineages_by_table(
-                table_name=table.ref.qualified_table_name,
-                include_entity_lineage=include_entity_lineage,
+            # use the system table if we have a SQL warehouse, otherwise fall back
+            # and use the API, with a call per table.
+            catalog_lineage = (
+                self.get_catalog_table_lineage(
+                    table.ref.catalog, include_entity_lineage
+                )
+                if self.warehouse_id
+                else None
             )
+            response: dict
+            if catalog_lineage is not None:
+                response = catalog_lineage.get((table.ref.schema, table.ref.table), {})
+            else:
+                response = self.list_lineages_by_table(
+                    table_name=table.ref.qualified_table_name,
+                    include_entity_lineage=include_entity_lineage,
+                )
 
             for item in response.get("upstreams") or []:
                 if "tableInfo" in item:
@@ -597,17 +746,21 @@ class UnityCatalogApiProxy(UnityCatalogProxyProfilingMixin):
     def _execute_sql_query(self, query: str, params: Sequence[Any] = ()) -> List[Row]:
         """Execute SQL query using databricks-sql connector for better performance"""
         try:
-            with (
-                connect(**self._sql_connection_params) as connection,
-                connection.cursor() as cursor,
-            ):
-                cursor.execute(query, list(params))
-                return cursor.fetchall()
-
+            return self._execute_sql_query_or_raise(query, params)
         except Exception as e:
             logger.warning(f"Failed to execute SQL query: {e}")
             return []
 
+    def _execute_sql_query_or_raise(
+        self, query: str, params: Sequence[Any] = ()
+    ) -> List[Row]:
+        with (
+            connect(**self._sql_connection_params) as connection,
+            connection.cursor() as cursor,
+        ):
+            cursor.execute(query, list(params))
+            return cursor.fetchall()
+
     @cached(cachetools.FIFOCache(maxsize=100))
     def get_schema_tags(self, catalog: str) -> Dict[str, List[UnityCatalogTag]]:
         """Optimized version using databricks-sql"""
@@ -6,6 +6,8 @@ from datahub.ingestion.source.sql.sql_report import SQLSourceReport
 from datahub.ingestion.source_report.ingestion_stage import IngestionStageReport
 from datahub.utilities.lossy_collections import LossyDict, LossyList
 from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.ratelimiter import RateLimiterStats
+from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutorStats
 
 
 @dataclass
@@ -29,6 +31,11 @@ class UnityCatalogReport(IngestionStageReport, SQLSourceReport):
 
     hive_metastore_catalog_found: Optional[bool] = None
 
+    schema_processing_executor: ThreadedIteratorExecutorStats = field(
+        default_factory=ThreadedIteratorExecutorStats
+    )
+    # Set if max_api_calls_per_second is.
+    rate_limit: Optional[RateLimiterStats] = None
     num_column_lineage_skipped_column_count: int = 0
     num_external_upstreams_lacking_permissions: int = 0
     num_external_upstreams_unsupported: int = 0
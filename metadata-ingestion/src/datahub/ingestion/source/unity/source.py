@@ -1,6 +1,7 @@
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 from urllib.parse import urljoin
 
@@ -139,6 +140,7 @@ from datahub.sql_parsing.sqlglot_lineage import (
 from datahub.utilities.file_backed_collections import FileBackedDict
 from datahub.utilities.hive_schema_to_avro import get_schema_fields_for_hive_column
 from datahub.utilities.registries.domain_registry import DomainRegistry
+from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutor
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -203,6 +205,7 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
             config.warehouse_id,
             report=self.report,
             hive_metastore_proxy=self.hive_metastore_proxy,
+            max_api_calls_per_second=config.max_api_calls_per_second,
         )
 
         self.external_url_base = urljoin(self.config.workspace_url, "/explore/data")
@@ -484,29 +487,92 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
             yield from self.unity_catalog_api_proxy.catalogs(metastore=metastore)
 
     def process_schemas(self, catalog: Catalog) -> Iterable[MetadataWorkUnit]:
+        schemas: List[Schema] = []
         for schema in self.unity_catalog_api_proxy.schemas(catalog=catalog):
             if not self.config.schema_pattern.allowed(schema.id):
                 self.report.schemas.dropped(schema.id)
                 continue
+            schemas.append(schema)
+
+        is_hive_metastore = catalog.type == CustomCatalogType.HIVE_METASTORE_CATALOG
+        if not is_hive_metastore:
+            self._prefetch_catalog_lineage(catalog)
+
+        # The tables of the next schemas are listed, and their lineage fetched, in worker
+        # threads while the current schema is ingested. Workunits are generated in this
+        # thread, in the order of the schemas and tables.
+        with ThreadPoolExecutor(
+            max_workers=self.config.table_max_workers,
+            thread_name_prefix="unity-table-lineage",
+        ) as lineage_executor:
+            for schema, tables, error in ThreadedIteratorExecutor.process(
+                worker_func=self._fetch_schema_tables,
+                args_list=[(schema, lineage_executor) for schema in schemas],
+                # The hive metastore proxy shares a single connection.
+                max_workers=1 if is_hive_metastore else self.config.schema_max_workers,
+                ordered=True,
+                stats=self.report.schema_processing_executor,
+            ):
+                with self.report.new_stage(f"Ingest schema {schema.id}"):
+                    yield from self.gen_schema_containers(schema)
+                    try:
+                        yield from self.process_tables(schema, tables)
+                        if error:
+                            raise error
+                    except Exception as e:
+                        logger.exception(f"Error parsing schema {schema}")
+                        self.report.report_warning(
+                            message="Missed schema because of parsing issues",
+                            context=str(schema),
+                            title="Error parsing schema",
+                            exc=e,
+                        )
+                        continue
 
-            with self.report.new_stage(f"Ingest schema {schema.id}"):
-                yield from self.gen_schema_containers(schema)
-                try:
-                    yield from self.process_tables(schema)
-                except Exception as e:
-                    logger.exception(f"Error parsing schema {schema}")
-                    self.report.report_warning(
-                        message="Missed schema because of parsing issues",
-                        context=str(schema),
-                        title="Error parsing schema",
-                        exc=e,
-                    )
-                    continue
+                    self.report.schemas.processed(schema.id)
+
+    def _prefetch_catalog_lineage(self, catalog: Catalog) -> None:
+        # Lineage read from system tables is fetched once per catalog, before the
+        # worker threads look it up for each table.
+        if not self.unity_catalog_api_proxy.warehouse_id:
+            return
+        if self.config.include_table_lineage:
+            self.unity_catalog_api_proxy.get_catalog_table_lineage(
+                catalog.name, include_entity_lineage=self.config.include_notebooks
+            )
+        if self.config.include_column_lineage:
+            self.unity_catalog_api_proxy.get_catalog_column_lineage(catalog.name)
 
-                self.report.schemas.processed(schema.id)
+    def _fetch_schema_tables(
+        self, schema: Schema, lineage_executor: ThreadPoolExecutor
+    ) -> Iterable[Tuple[Schema, List[Table], Optional[Exception]]]:
+        """Lists the tables of a schema and fetches their lineage, in a worker thread.
 
-    def process_tables(self, schema: Schema) -> Iterable[MetadataWorkUnit]:
-        for table in self.unity_catalog_api_proxy.tables(schema=schema):
+        An error while listing the tables is returned with the tables listed until then.
+        """
+        tables: List[Table] = []
+        error: Optional[Exception] = None
+        try:
+            for table in self.unity_catalog_api_proxy.tables(schema=schema):
+                tables.append(table)
+        except Exception as e:
+            error = e
+
+        for _ in lineage_executor.map(
+            self._fetch_lineage,
+            [
+                table
+                for table in tables
+                if self.config.table_pattern.allowed(table.ref.qualified_table_name)
+            ],
+        ):
+            pass
+        yield schema, tables, error
+
+    def process_tables(
+        self, schema: Schema, tables: Iterable[Table]
+    ) -> Iterable[MetadataWorkUnit]:
+        for table in tables:
             if not self.config.table_pattern.allowed(table.ref.qualified_table_name):
                 self.report.tables.dropped(table.id, f"table ({table.table_type})")
                 continue
@@ -573,7 +639,13 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
         ownership = self._create_table_ownership_aspect(table)
         data_platform_instance = self._create_data_platform_instance_aspect()
 
-        lineage = self.ingest_lineage(table)
+        if (
+            self.config.include_column_lineage
+            and table.upstreams
+            and len(table.columns) > self.config.column_lineage_column_limit
+        ):
+            self.report.num_column_lineage_skipped_column_count += 1
+        lineage = self._generate_lineage_aspect(dataset_urn, table)
 
         if self.config.include_notebooks:
             for notebook_id in table.downstream_notebooks:
@@ -646,16 +718,14 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
             )
         ]
 
-    def ingest_lineage(self, table: Table) -> Optional[UpstreamLineageClass]:
+    def _fetch_lineage(self, table: Table) -> None:
+        """Fetches the upstreams of a table into it. Called from worker threads."""
         if self.config.include_table_lineage:
             self.unity_catalog_api_proxy.table_lineage(
                 table, include_entity_lineage=self.config.include_notebooks
             )
 
         if self.config.include_column_lineage and table.upstreams:
-            if len(table.columns) > self.config.column_lineage_column_limit:
-                self.report.num_column_lineage_skipped_column_count += 1
-
             column_names = [
                 column.name
                 for column in table.columns[: self.config.column_lineage_column_limit]
@@ -664,8 +734,6 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
                 table, column_names, max_workers=self.config.lineage_max_workers
             )
 
-        return self._generate_lineage_aspect(self.gen_dataset_urn(table.ref), table)
-
     def _generate_lineage_aspect(
         self, dataset_urn: str, table: Table
     ) -> Optional[UpstreamLineageClass]:
@@ -13,6 +13,7 @@ from datahub.emitter.mce_builder import Aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.graph.client import DataHubGraph
+from datahub.ingestion.transformer.base_transformer import ServerAspectPrefetcher
 from datahub.ingestion.transformer.dataset_transformer import OwnershipTransformer
 from datahub.metadata.schema_classes import (
     BrowsePathsV2Class,
@@ -52,6 +53,16 @@ class AddDatasetOwnership(OwnershipTransformer):
             raise ConfigurationError(
                 "With PATCH TransformerSemantics, AddDatasetOwnership requires a datahub_api to connect to. Consider using the datahub-rest sink or provide a datahub_api: configuration on your ingestion recipe"
             )
+        if (
+            self.config.semantics == TransformerSemantics.PATCH
+            or self.config.is_container
+        ):
+            self.enable_server_aspect_prefetch(
+                self.ctx.graph,
+                self.config.prefetch_window_size,
+                prefetch_transformed_aspect=self.config.semantics
+                == TransformerSemantics.PATCH,
+            )
 
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "AddDatasetOwnership":
@@ -60,7 +71,10 @@ class AddDatasetOwnership(OwnershipTransformer):
 
     @staticmethod
     def _merge_with_server_ownership(
-        graph: DataHubGraph, urn: str, mce_ownership: Optional[OwnershipClass]
+        graph: DataHubGraph,
+        urn: str,
+        mce_ownership: Optional[OwnershipClass],
+        prefetcher: Optional[ServerAspectPrefetcher] = None,
     ) -> Optional[OwnershipClass]:
         if not mce_ownership or not mce_ownership.owners:
             # If there are no owners to add, we don't need to patch anything.
@@ -69,7 +83,11 @@ class AddDatasetOwnership(OwnershipTransformer):
         # Merge the transformed ownership with existing server ownership.
         # The transformed ownership takes precedence, which may change the ownership type.
 
-        server_ownership = graph.get_ownership(entity_urn=urn)
+        server_ownership = (
+            prefetcher.get_aspect(urn, OwnershipClass)
+            if prefetcher
+            else graph.get_ownership(entity_urn=urn)
+        )
         if server_ownership:
             owners = {
                 (
@@ -102,13 +120,18 @@ class AddDatasetOwnership(OwnershipTransformer):
         logger.debug("Generating Ownership for containers")
         ownership_container_mapping: Dict[str, List[OwnerClass]] = {}
         for entity_urn, data_ownerships in (
-            (urn, self.config.get_owners_to_add(urn)) for urn in self.entity_map
+            (urn, self.config.get_owners_to_add(urn))
+            for urn in self.prefetch_server_aspects(self.entity_map, BrowsePathsV2Class)
         ):
             if not data_ownerships:
                 continue
 
             assert self.ctx.graph
-            browse_paths = self.ctx.graph.get_aspect(entity_urn, BrowsePathsV2Class)
+            browse_paths = (
+                self.prefetcher.get_aspect(entity_urn, BrowsePathsV2Class)
+                if self.prefetcher
+                else self.ctx.graph.get_aspect(entity_urn, BrowsePathsV2Class)
+            )
             if not browse_paths:
                 continue
 
@@ -165,7 +188,10 @@ class AddDatasetOwnership(OwnershipTransformer):
             return cast(
                 Optional[Aspect],
                 self._merge_with_server_ownership(
-                    self.ctx.graph, entity_urn, out_ownership_aspect
+                    self.ctx.graph,
+                    entity_urn,
+                    out_ownership_aspect,
+                    prefetcher=self.prefetcher,
                 ),
             )
         else:
@@ -201,6 +227,7 @@ class SimpleAddDatasetOwnership(AddDatasetOwnership):
             get_owners_to_add=lambda _: owners,
             default_actor=config.default_actor,
             semantics=config.semantics,
+            prefetch_window_size=config.prefetch_window_size,
             replace_existing=config.replace_existing,
         )
         super().__init__(generic_config, ctx)
@@ -238,6 +265,7 @@ class PatternAddDatasetOwnership(AddDatasetOwnership):
             ],
             default_actor=config.default_actor,
             semantics=config.semantics,
+            prefetch_window_size=config.prefetch_window_size,
             replace_existing=config.replace_existing,
             is_container=config.is_container,
         )
@@ -10,6 +10,7 @@ from datahub.configuration.import_resolver import pydantic_resolve_key
 from datahub.emitter.mce_builder import Aspect
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.graph.client import DataHubGraph
+from datahub.ingestion.transformer.base_transformer import ServerAspectPrefetcher
 from datahub.ingestion.transformer.dataset_transformer import (
     DatasetPropertiesTransformer,
 )
@@ -47,6 +48,10 @@ class AddDatasetProperties(DatasetPropertiesTransformer):
         self.ctx = ctx
         self.config = config
         self.resolver_args = resolver_args
+        if self.config.semantics == TransformerSemantics.PATCH:
+            self.enable_server_aspect_prefetch(
+                ctx.graph, self.config.prefetch_window_size
+            )
 
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "AddDatasetProperties":
@@ -58,11 +63,14 @@ class AddDatasetProperties(DatasetPropertiesTransformer):
         graph: DataHubGraph,
         entity_urn: str,
         dataset_properties_aspect: Optional[DatasetPropertiesClass],
+        prefetcher: Optional[ServerAspectPrefetcher] = None,
     ) -> Optional[DatasetPropertiesClass]:
         assert dataset_properties_aspect
 
         server_dataset_properties_aspect: Optional[DatasetPropertiesClass] = (
-            graph.get_dataset_properties(entity_urn)
+            prefetcher.get_aspect(entity_urn, DatasetPropertiesClass)
+            if prefetcher
+            else graph.get_dataset_properties(entity_urn)
         )
         # No need to take any action if server properties is None or there is not customProperties in server properties
         if (
@@ -108,7 +116,10 @@ class AddDatasetProperties(DatasetPropertiesTransformer):
             assert self.ctx.graph
             patch_dataset_properties_aspect = (
                 AddDatasetProperties._merge_with_server_properties(
-                    self.ctx.graph, entity_urn, out_dataset_properties_aspect
+                    self.ctx.graph,
+                    entity_urn,
+                    out_dataset_properties_aspect,
+                    prefetcher=self.prefetcher,
                 )
             )
             return cast(Optional[Aspect], patch_dataset_properties_aspect)
@@ -136,6 +147,7 @@ class SimpleAddDatasetProperties(AddDatasetProperties):
             add_properties_resolver_class=SimpleAddDatasetPropertiesResolverClass,
             replace_existing=config.replace_existing,
             semantics=config.semantics,
+            prefetch_window_size=config.prefetch_window_size,
         )
         resolver_args = {"properties": config.properties}
         super().__init__(generic_config, ctx, **resolver_args)
@@ -35,6 +35,10 @@ class AddDatasetSchemaTags(DatasetSchemaMetadataTransformer):
         super().__init__()
         self.ctx = ctx
         self.config = config
+        if self.config.semantics == TransformerSemantics.PATCH:
+            self.enable_server_aspect_prefetch(
+                ctx.graph, self.config.prefetch_window_size
+            )
 
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "AddDatasetSchemaTags":
@@ -90,7 +94,9 @@ class AddDatasetSchemaTags(DatasetSchemaMetadataTransformer):
         if self.config.semantics == TransformerSemantics.PATCH:
             assert self.ctx.graph
             server_schema_metadata_aspect: Optional[SchemaMetadataClass] = (
-                self.ctx.graph.get_schema_metadata(entity_urn=entity_urn)
+                self.prefetcher.get_aspect(entity_urn, SchemaMetadataClass)
+                if self.prefetcher
+                else self.ctx.graph.get_schema_metadata(entity_urn=entity_urn)
             )
             if server_schema_metadata_aspect is not None:
                 if not schema_metadata_aspect:
@@ -134,6 +140,7 @@ class PatternAddDatasetSchemaTags(AddDatasetSchemaTags):
                 TagAssociationClass(tag=urn) for urn in tag_pattern.value(path)
             ],
             semantics=config.semantics,
+            prefetch_window_size=config.prefetch_window_size,
             replace_existing=config.replace_existing,
         )
         super().__init__(generic_config, ctx)
@@ -36,6 +36,10 @@ class AddDatasetSchemaTerms(DatasetSchemaMetadataTransformer):
         super().__init__()
         self.ctx = ctx
         self.config = config
+        if self.config.semantics == TransformerSemantics.PATCH:
+            self.enable_server_aspect_prefetch(
+                ctx.graph, self.config.prefetch_window_size
+            )
 
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "AddDatasetSchemaTerms":
@@ -109,7 +113,9 @@ class AddDatasetSchemaTerms(DatasetSchemaMetadataTransformer):
         if self.config.semantics == TransformerSemantics.PATCH:
             assert self.ctx.graph
             server_schema_metadata_aspect: Optional[SchemaMetadataClass] = (
-                self.ctx.graph.get_schema_metadata(entity_urn=entity_urn)
+                self.prefetcher.get_aspect(entity_urn, SchemaMetadataClass)
+                if self.prefetcher
+                else self.ctx.graph.get_schema_metadata(entity_urn=entity_urn)
             )
             if server_schema_metadata_aspect is not None:
                 if not schema_metadata_aspect:
@@ -154,6 +160,7 @@ class PatternAddDatasetSchemaTerms(AddDatasetSchemaTerms):
                 for urn in term_pattern.value(path)
             ],
             semantics=config.semantics,
+            prefetch_window_size=config.prefetch_window_size,
             replace_existing=config.replace_existing,
         )
         super().__init__(generic_config, ctx)
@@ -3,6 +3,7 @@ from typing import Callable, Dict, List, Optional, Union, cast
 
 from datahub.configuration.common import (
     KeyValuePattern,
+    TransformerSemantics,
     TransformerSemanticsConfigModel,
 )
 from datahub.configuration.import_resolver import pydantic_resolve_key
@@ -38,6 +39,10 @@ class AddDatasetTags(DatasetTagsTransformer):
         self.ctx = ctx
         self.config = config
         self.processed_tags = {}
+        if self.config.semantics == TransformerSemantics.PATCH:
+            self.enable_server_aspect_prefetch(
+                ctx.graph, self.config.prefetch_window_size
+            )
 
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "AddDatasetTags":
@@ -61,7 +66,11 @@ class AddDatasetTags(DatasetTagsTransformer):
                 self.processed_tags.setdefault(tag.tag, tag)
 
         return self.get_result_semantics(
-            self.config, self.ctx.graph, entity_urn, out_global_tags_aspect
+            self.config,
+            self.ctx.graph,
+            entity_urn,
+            out_global_tags_aspect,
+            prefetcher=self.prefetcher,
         )
 
     def handle_end_of_stream(
@@ -99,6 +108,7 @@ class SimpleAddDatasetTags(AddDatasetTags):
             get_tags_to_add=lambda _: tags,
             replace_existing=config.replace_existing,
             semantics=config.semantics,
+            prefetch_window_size=config.prefetch_window_size,
         )
         super().__init__(generic_config, ctx)
 
@@ -123,6 +133,7 @@ class PatternAddDatasetTags(AddDatasetTags):
             ],
             replace_existing=config.replace_existing,
             semantics=config.semantics,
+            prefetch_window_size=config.prefetch_window_size,
         )
         super().__init__(generic_config, ctx)
 
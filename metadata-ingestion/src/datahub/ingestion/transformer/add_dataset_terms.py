@@ -11,6 +11,7 @@ from datahub.configuration.import_resolver import pydantic_resolve_key
 from datahub.emitter.mce_builder import Aspect
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.graph.client import DataHubGraph
+from datahub.ingestion.transformer.base_transformer import ServerAspectPrefetcher
 from datahub.ingestion.transformer.dataset_transformer import DatasetTermsTransformer
 from datahub.metadata.schema_classes import (
     AuditStampClass,
@@ -36,6 +37,10 @@ class AddDatasetTerms(DatasetTermsTransformer):
         self.ctx = ctx
         self.config = config
         self.log = logging.getLogger(__name__)
+        if self.config.semantics == TransformerSemantics.PATCH:
+            self.enable_server_aspect_prefetch(
+                ctx.graph, self.config.prefetch_window_size
+            )
 
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "AddDatasetTerms":
@@ -47,6 +52,7 @@ class AddDatasetTerms(DatasetTermsTransformer):
         graph: DataHubGraph,
         urn: str,
         glossary_terms_aspect: Optional[GlossaryTermsClass],
+        prefetcher: Optional[ServerAspectPrefetcher] = None,
     ) -> Optional[GlossaryTermsClass]:
         if not glossary_terms_aspect or not glossary_terms_aspect.terms:
             # nothing to add, no need to consult server
@@ -54,7 +60,11 @@ class AddDatasetTerms(DatasetTermsTransformer):
 
         # Merge the transformed terms with existing server terms.
         # The transformed terms takes precedence, which may change the term context.
-        server_glossary_terms_aspect = graph.get_glossary_terms(entity_urn=urn)
+        server_glossary_terms_aspect = (
+            prefetcher.get_aspect(urn, GlossaryTermsClass)
+            if prefetcher
+            else graph.get_glossary_terms(entity_urn=urn)
+        )
         if server_glossary_terms_aspect is not None:
             glossary_terms_aspect.terms = list(
                 {
@@ -94,7 +104,10 @@ class AddDatasetTerms(DatasetTermsTransformer):
         if self.config.semantics == TransformerSemantics.PATCH:
             assert self.ctx.graph
             patch_glossary_terms = AddDatasetTerms._merge_with_server_glossary_terms(
-                self.ctx.graph, entity_urn, out_glossary_terms
+                self.ctx.graph,
+                entity_urn,
+                out_glossary_terms,
+                prefetcher=self.prefetcher,
             )
             return cast(Optional[Aspect], patch_glossary_terms)
         else:
@@ -115,6 +128,7 @@ class SimpleAddDatasetTerms(AddDatasetTerms):
             get_terms_to_add=lambda _: terms,
             replace_existing=config.replace_existing,
             semantics=config.semantics,
+            prefetch_window_size=config.prefetch_window_size,
         )
         super().__init__(generic_config, ctx)
 
@@ -140,6 +154,7 @@ class PatternAddDatasetTerms(AddDatasetTerms):
             ],
             replace_existing=config.replace_existing,
             semantics=config.semantics,
+            prefetch_window_size=config.prefetch_window_size,
         )
         super().__init__(generic_config, ctx)
 
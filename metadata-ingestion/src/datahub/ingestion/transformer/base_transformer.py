@@ -1,21 +1,44 @@
+import itertools
 import logging
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import datahub.emitter.mce_builder as builder
+from datahub._codegen.aspect import _Aspect
 from datahub.emitter.aspect import ASPECT_MAP
 from datahub.emitter.mce_builder import Aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import ControlRecord, EndOfStream, RecordEnvelope
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.graph.client import DataHubGraph
 from datahub.metadata.schema_classes import (
     MetadataChangeEventClass,
     MetadataChangeProposalClass,
 )
+from datahub.utilities.groupby import groupby_unsorted
 from datahub.utilities.urns.urn import Urn, guess_entity_type
 
 log = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+_PREFETCH_BATCH_SIZE = 100
+_PREFETCH_MAX_WORKERS = 4
+
 
 def _update_work_unit_id(
     envelope: RecordEnvelope, urn: str, aspect_name: str
@@ -27,6 +50,88 @@ def _update_work_unit_id(
     return record_metadata
 
 
+class ServerAspectPrefetcher:
+    """
+    Fetches server aspects for many urns at once using batched, concurrent calls,
+    so that transformers with PATCH semantics don't need one synchronous lookup per urn.
+
+    Only the most recently prefetched window is kept in memory. `get_aspect` falls back
+    to fetching the aspect directly if it wasn't prefetched.
+    """
+
+    def __init__(
+        self,
+        graph: DataHubGraph,
+        window_size: int,
+        batch_size: int = _PREFETCH_BATCH_SIZE,
+        max_workers: int = _PREFETCH_MAX_WORKERS,
+    ):
+        self.graph = graph
+        self.window_size = window_size
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self._aspects: Dict[Tuple[str, str], Optional[_Aspect]] = {}
+
+    def windowed(self, items: Iterable[_T]) -> Iterator[List[_T]]:
+        iterator = iter(items)
+        while True:
+            window = list(itertools.islice(iterator, self.window_size))
+            if not window:
+                return
+            yield window
+
+    def prefetch(self, urns: Iterable[str], aspect_type: Type[Aspect]) -> None:
+        # Records are consumed in order, so by the time the next window is
+        # prefetched, the previous one has been fully processed.
+        self._aspects = {}
+        pending = list(dict.fromkeys(urns))
+        if not pending:
+            return
+
+        batches: List[Tuple[str, List[str]]] = []
+        for entity_type, entity_urns in groupby_unsorted(
+            pending, key=guess_entity_type
+        ):
+            urns_list = list(entity_urns)
+            for i in range(0, len(urns_list), self.batch_size):
+                batches.append((entity_type, urns_list[i : i + self.batch_size]))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(
+                lambda batch: self._fetch_batch(batch[0], batch[1], aspect_type),
+                batches,
+            )
+            for batch_aspects in results:
+                self._aspects.update(batch_aspects)
+
+    def _fetch_batch(
+        self, entity_type: str, urns: List[str], aspect_type: Type[Aspect]
+    ) -> Dict[Tuple[str, str], Optional[_Aspect]]:
+        aspect_name = aspect_type.ASPECT_NAME
+        try:
+            entities = self.graph.get_entities(entity_type, urns, [aspect_name])
+        except Exception as e:
+            # The urns will be fetched individually by get_aspect instead.
+            log.warning(
+                f"Failed to prefetch {aspect_name} for {len(urns)} {entity_type} entities: {e}"
+            )
+            return {}
+
+        fetched: Dict[Tuple[str, str], Optional[_Aspect]] = {}
+        for urn in urns:
+            aspect_and_metadata = entities.get(urn, {}).get(aspect_name)
+            fetched[(urn, aspect_name)] = (
+                aspect_and_metadata[0] if aspect_and_metadata else None
+            )
+        return fetched
+
+    def get_aspect(self, urn: str, aspect_type: Type[Aspect]) -> Optional[Aspect]:
+        key = (urn, aspect_type.ASPECT_NAME)
+        if key in self._aspects:
+            return cast(Optional[Aspect], self._aspects[key])
+        return self.graph.get_aspect(entity_urn=urn, aspect_type=aspect_type)
+
+
 class HandleEndOfStreamTransformer:
     def handle_end_of_stream(
         self,
@@ -72,6 +177,8 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
 
     def __init__(self):
         self.entity_map: Dict[str, Dict[str, Any]] = {}
+        self.prefetcher: Optional[ServerAspectPrefetcher] = None
+        self._prefetch_transformed_aspect = False
         mixedin = False
         for mixin in [LegacyMCETransformer, SingleAspectTransformer]:
             mixedin = mixedin or isinstance(self, mixin)
@@ -80,6 +187,66 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                 f"Class does not implement one of required traits {self.allowed_mixins}"
             )
 
+    def enable_server_aspect_prefetch(
+        self,
+        graph: Optional[DataHubGraph],
+        window_size: int,
+        prefetch_transformed_aspect: bool = True,
+    ) -> None:
+        """
+        Sets up a prefetcher that fetches server aspects for windows of `window_size` urns.
+
+        If `prefetch_transformed_aspect` is set, records are buffered in windows and the server
+        version of the transformer's aspect is prefetched for them, before releasing the records
+        in their original order. This is useful for transformers that merge with the server aspect.
+        """
+        if graph is not None and window_size > 0:
+            self.prefetcher = ServerAspectPrefetcher(graph, window_size)
+            self._prefetch_transformed_aspect = prefetch_transformed_aspect
+
+    def _get_urn_to_prefetch(self, record: Any) -> Optional[str]:
+        # Only prefetch for records that will be transformed as they pass through,
+        # since everything else is transformed (and prefetched) at the end of the stream.
+        if not isinstance(self, SingleAspectTransformer) or not self._should_process(
+            record
+        ):
+            return None
+        if isinstance(record, MetadataChangeEventClass):
+            aspect_type = ASPECT_MAP[self.aspect_name()]
+            if (
+                builder.can_add_aspect(record, aspect_type)
+                and builder.get_aspect_if_available(record, aspect_type) is not None
+            ):
+                return record.proposedSnapshot.urn
+        elif (
+            isinstance(record, MetadataChangeProposalWrapper)
+            and record.aspectName == self.aspect_name()
+            and record.aspect
+        ):
+            return record.entityUrn
+        return None
+
+    def _prefetch_record_windows(
+        self, record_envelopes: Iterable[RecordEnvelope]
+    ) -> Iterable[RecordEnvelope]:
+        assert self.prefetcher is not None and isinstance(self, SingleAspectTransformer)
+        aspect_type = ASPECT_MAP[self.aspect_name()]
+        for window in self.prefetcher.windowed(record_envelopes):
+            urns = (self._get_urn_to_prefetch(envelope.record) for envelope in window)
+            self.prefetcher.prefetch((urn for urn in urns if urn), aspect_type)
+            yield from window
+
+    def prefetch_server_aspects(
+        self, urns: Iterable[str], aspect_type: Type[Aspect]
+    ) -> Iterable[str]:
+        """Passes through the urns, prefetching `aspect_type` for each window of them if prefetching is enabled."""
+        if self.prefetcher is None:
+            yield from urns
+            return
+        for window in self.prefetcher.windowed(urns):
+            self.prefetcher.prefetch(window, aspect_type)
+            yield from window
+
     def _should_process(
         self,
         record: Union[
@@ -227,9 +394,33 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                 metadata=record_metadata,
             )
 
+    def _prefetch_unprocessed_entities(
+        self,
+    ) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        if (
+            self.prefetcher is None
+            or not self._prefetch_transformed_aspect
+            or not isinstance(self, SingleAspectTransformer)
+        ):
+            yield from self.entity_map.items()
+            return
+        aspect_type = ASPECT_MAP[self.aspect_name()]
+        for window in self.prefetcher.windowed(self.entity_map.items()):
+            self.prefetcher.prefetch(
+                (urn for urn, state in window if "seen" in state), aspect_type
+            )
+            yield from window
+
     def transform(
         self, record_envelopes: Iterable[RecordEnvelope]
     ) -> Iterable[RecordEnvelope]:
+        if (
+            self.prefetcher is not None
+            and self._prefetch_transformed_aspect
+            and isinstance(self, SingleAspectTransformer)
+        ):
+            record_envelopes = self._prefetch_record_windows(record_envelopes)
+
         for envelope in record_envelopes:
             if not self._should_process(envelope.record):
                 # early exit
@@ -248,7 +439,7 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                 self, SingleAspectTransformer
             ):
                 # walk through state and call transform for any unprocessed entities
-                for urn, state in self.entity_map.items():
+                for urn, state in self._prefetch_unprocessed_entities():
                     if "seen" in state:
                         # call transform on this entity_urn
                         last_seen_mcp = state["seen"].get("mcp")
@@ -14,6 +14,7 @@ from datahub.emitter.mce_builder import Aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.graph.client import DataHubGraph
+from datahub.ingestion.transformer.base_transformer import ServerAspectPrefetcher
 from datahub.ingestion.transformer.dataset_transformer import DatasetDomainTransformer
 from datahub.metadata.schema_classes import (
     BrowsePathsV2Class,
@@ -64,6 +65,16 @@ class AddDatasetDomain(DatasetDomainTransformer):
         super().__init__()
         self.ctx = ctx
         self.config = config
+        needs_server_domains = (
+            self.config.semantics == TransformerSemantics.PATCH
+            or self.config.on_conflict == TransformerOnConflict.DO_NOTHING
+        )
+        if needs_server_domains or self.config.is_container:
+            self.enable_server_aspect_prefetch(
+                ctx.graph,
+                self.config.prefetch_window_size,
+                prefetch_transformed_aspect=needs_server_domains,
+            )
 
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "AddDatasetDomain":
@@ -91,14 +102,21 @@ class AddDatasetDomain(DatasetDomainTransformer):
 
     @staticmethod
     def _merge_with_server_domains(
-        graph: Optional[DataHubGraph], urn: str, mce_domain: Optional[DomainsClass]
+        graph: Optional[DataHubGraph],
+        urn: str,
+        mce_domain: Optional[DomainsClass],
+        prefetcher: Optional[ServerAspectPrefetcher] = None,
     ) -> Optional[DomainsClass]:
         if not mce_domain or not mce_domain.domains:
             # nothing to add, no need to consult server
             return None
 
         assert graph
-        server_domain = graph.get_domain(entity_urn=urn)
+        server_domain = (
+            prefetcher.get_aspect(urn, DomainsClass)
+            if prefetcher
+            else graph.get_domain(entity_urn=urn)
+        )
         if server_domain:
             # compute patch
             # we only include domain who are not present in the server domain list
@@ -125,13 +143,18 @@ class AddDatasetDomain(DatasetDomainTransformer):
             return domain_mcps
 
         for entity_urn, domain_to_add in (
-            (urn, self.config.get_domains_to_add(urn)) for urn in self.entity_map
+            (urn, self.config.get_domains_to_add(urn))
+            for urn in self.prefetch_server_aspects(self.entity_map, BrowsePathsV2Class)
         ):
             if not domain_to_add or not domain_to_add.domains:
                 continue
 
             assert self.ctx.graph
-            browse_paths = self.ctx.graph.get_aspect(entity_urn, BrowsePathsV2Class)
+            browse_paths = (
+                self.prefetcher.get_aspect(entity_urn, BrowsePathsV2Class)
+                if self.prefetcher
+                else self.ctx.graph.get_aspect(entity_urn, BrowsePathsV2Class)
+            )
             if not browse_paths:
                 continue
 
@@ -180,12 +203,19 @@ class AddDatasetDomain(DatasetDomainTransformer):
         if domain_aspect.domains:
             if self.config.on_conflict == TransformerOnConflict.DO_NOTHING:
                 assert self.ctx.graph
-                server_domain = self.ctx.graph.get_domain(entity_urn)
+                server_domain = (
+                    self.prefetcher.get_aspect(entity_urn, DomainsClass)
+                    if self.prefetcher
+                    else self.ctx.graph.get_domain(entity_urn)
+                )
                 if server_domain and server_domain.domains:
                     return None
             if self.config.semantics == TransformerSemantics.PATCH:
                 final_aspect = AddDatasetDomain._merge_with_server_domains(
-                    self.ctx.graph, entity_urn, domain_aspect
+                    self.ctx.graph,
+                    entity_urn,
+                    domain_aspect,
+                    prefetcher=self.prefetcher,
                 )
         return cast(Optional[Aspect], final_aspect)
 
@@ -229,6 +259,7 @@ class PatternAddDatasetDomain(AddDatasetDomain):
         generic_config = AddDatasetDomainSemanticsConfig(
             get_domains_to_add=resolve_domain,
             semantics=config.semantics,
+            prefetch_window_size=config.prefetch_window_size,
             replace_existing=config.replace_existing,
             is_container=config.is_container,
         )
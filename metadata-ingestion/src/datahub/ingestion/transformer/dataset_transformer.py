@@ -10,6 +10,7 @@ from datahub.emitter.mce_builder import Aspect
 from datahub.ingestion.graph.client import DataHubGraph
 from datahub.ingestion.transformer.base_transformer import (
     BaseTransformer,
+    ServerAspectPrefetcher,
     SingleAspectTransformer,
 )
 from datahub.metadata.schema_classes import GlobalTagsClass
@@ -79,7 +80,10 @@ class DatasetTagsTransformer(DatasetTransformer, metaclass=ABCMeta):
 
     @staticmethod
     def merge_with_server_global_tags(
-        graph: DataHubGraph, urn: str, global_tags_aspect: Optional[GlobalTagsClass]
+        graph: DataHubGraph,
+        urn: str,
+        global_tags_aspect: Optional[GlobalTagsClass],
+        prefetcher: Optional[ServerAspectPrefetcher] = None,
     ) -> Optional[GlobalTagsClass]:
         if not global_tags_aspect or not global_tags_aspect.tags:
             # nothing to add, no need to consult server
@@ -87,7 +91,11 @@ class DatasetTagsTransformer(DatasetTransformer, metaclass=ABCMeta):
 
         # Merge the transformed tags with existing server tags.
         # The transformed tags takes precedence, which may change the tag context.
-        server_global_tags_aspect = graph.get_tags(entity_urn=urn)
+        server_global_tags_aspect = (
+            prefetcher.get_aspect(urn, GlobalTagsClass)
+            if prefetcher
+            else graph.get_tags(entity_urn=urn)
+        )
         if server_global_tags_aspect:
             global_tags_aspect.tags = list(
                 {
@@ -118,13 +126,14 @@ class DatasetTagsTransformer(DatasetTransformer, metaclass=ABCMeta):
         graph: Optional[DataHubGraph],
         urn: str,
         out_global_tags_aspect: Optional[GlobalTagsClass],
+        prefetcher: Optional[ServerAspectPrefetcher] = None,
     ) -> Optional[Aspect]:
         if config.semantics == TransformerSemantics.PATCH:
             assert graph
             return cast(
                 Optional[Aspect],
                 DatasetTagsTransformer.merge_with_server_global_tags(
-                    graph, urn, out_global_tags_aspect
+                    graph, urn, out_global_tags_aspect, prefetcher=prefetcher
                 ),
             )
 
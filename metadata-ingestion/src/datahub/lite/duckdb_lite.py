@@ -1,8 +1,10 @@
 import json
 import logging
 import pathlib
+import re
+import sys
 import time
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import duckdb
 
@@ -38,6 +40,200 @@ from datahub.utilities.urns.urn import Urn
 
 logger = logging.getLogger(__name__)
 
+# Compares each staged aspect against its predecessor (the previous staged write
+# for the same urn / aspect, or the stored v0 row), and assigns version numbers
+# to the writes that actually change the aspect.
+_STAGED_CHANGES_QUERY = """
+CREATE OR REPLACE TEMP TABLE staged_aspect_changes AS
+WITH staged_keys AS (
+    SELECT DISTINCT urn, aspect_name FROM staged_aspect_v2
+),
+existing AS (
+    SELECT
+        a.urn,
+        a.aspect_name,
+        a.metadata::VARCHAR AS metadata,
+        a.system_metadata::VARCHAR AS system_metadata,
+        COALESCE(
+            TRY_CAST(json_extract_string(a.system_metadata, '$.properties.sysVersion') AS BIGINT),
+            m.max_version
+        ) AS version
+    FROM metadata_aspect_v2 a
+    JOIN (
+        SELECT v.urn, v.aspect_name, max(v.version) AS max_version
+        FROM metadata_aspect_v2 v
+        JOIN staged_keys k ON v.urn = k.urn AND v.aspect_name = k.aspect_name
+        GROUP BY v.urn, v.aspect_name
+    ) m ON a.urn = m.urn AND a.aspect_name = m.aspect_name
+    WHERE a.version = 0
+),
+compared AS (
+    SELECT
+        s.seq,
+        s.urn,
+        s.aspect_name,
+        s.metadata,
+        s.system_metadata,
+        s.createdon,
+        e.urn IS NOT NULL AS existed,
+        e.version AS base_version,
+        e.system_metadata AS existing_system_metadata,
+        COALESCE(
+            lag(s.metadata) OVER (PARTITION BY s.urn, s.aspect_name ORDER BY s.seq),
+            e.metadata
+        ) IS DISTINCT FROM s.metadata AS changed
+    FROM staged_aspect_v2 s
+    LEFT JOIN existing e ON s.urn = e.urn AND s.aspect_name = e.aspect_name
+),
+versioned AS (
+    SELECT
+        *,
+        COALESCE(base_version, 0)
+        + sum(changed::INTEGER) OVER (PARTITION BY urn, aspect_name ORDER BY seq)
+            AS new_version
+    FROM compared
+)
+SELECT
+    *,
+    json_merge_patch(
+        system_metadata,
+        json_object('properties', json_object('sysVersion', new_version))
+    )::VARCHAR AS versioned_system_metadata
+FROM versioned
+"""
+
+# Builds the rows of the search index: the tokens of the urns, names, titles,
+# descriptions and field paths of the v0 aspects selected by `{filter}`. Tokens are
+# the runs of Unicode letters and digits, like _tokenize_search_query. A token
+# keeps the highest weight among the places it appears in for an aspect.
+_SEARCH_INDEX_QUERY = """
+INSERT INTO metadata_search_v2
+WITH aspects AS (
+    SELECT urn, aspect_name, metadata
+    FROM metadata_aspect_v2 a
+    WHERE version = 0 {filter}
+),
+texts AS (
+    SELECT DISTINCT urn, 'urn' AS aspect_name, 1.0 AS weight, urn AS text FROM aspects
+    UNION ALL
+    SELECT urn, aspect_name, 4.0, metadata->>'$.name' FROM aspects
+    UNION ALL
+    SELECT urn, aspect_name, 4.0, metadata->>'$.title' FROM aspects
+    UNION ALL
+    SELECT urn, aspect_name, 1.0, metadata->>'$.description' FROM aspects
+    UNION ALL
+    SELECT
+        urn,
+        aspect_name,
+        2.0,
+        -- Drop the [version=2.0].[type=...] annotations of v2 field paths.
+        regexp_replace(
+            unnest(json_extract_string(metadata, '$.fields[*].fieldPath')),
+            '\\[[^\\]]*\\]\\.?',
+            '',
+            'g'
+        )
+    FROM aspects
+),
+tokens AS (
+    SELECT
+        urn,
+        aspect_name,
+        weight,
+        unnest(regexp_split_to_array(lower(text), '[^\\pL\\pN]+')) AS token
+    FROM texts
+    WHERE text IS NOT NULL
+)
+SELECT token, urn, aspect_name, max(weight)
+FROM tokens
+WHERE token <> ''
+GROUP BY token, urn, aspect_name
+"""
+
+# Ranks entities by the best match of each query token, where a prefix match
+# counts for a fifth of an exact match. Every query token has to match somewhere in
+# the entity.
+_SEARCH_QUERY = """
+WITH query_tokens AS (
+    SELECT unnest(?::VARCHAR[]) AS query_token
+),
+matches AS (
+    SELECT
+        s.urn,
+        s.aspect_name,
+        q.query_token,
+        max(s.weight * CASE WHEN s.token = q.query_token THEN 1.0 ELSE 0.2 END)
+            AS score
+    FROM metadata_search_v2 s
+    JOIN query_tokens q ON starts_with(s.token, q.query_token)
+    WHERE ({token_filter}) {aspect_filter}
+    GROUP BY s.urn, s.aspect_name, q.query_token
+),
+entities AS (
+    SELECT urn, sum(score) AS score
+    FROM (
+        SELECT urn, query_token, max(score) AS score
+        FROM matches
+        GROUP BY urn, query_token
+    )
+    GROUP BY urn
+    HAVING count(*) = ?
+    ORDER BY score DESC, urn
+    LIMIT ?
+)
+SELECT m.urn, m.aspect_name, a.metadata
+FROM (
+    SELECT urn, aspect_name, sum(score) AS score
+    FROM matches
+    GROUP BY urn, aspect_name
+) m
+JOIN entities e ON m.urn = e.urn
+LEFT JOIN metadata_aspect_v2 a
+    ON a.urn = m.urn AND a.aspect_name = m.aspect_name AND a.version = 0
+ORDER BY e.score DESC, m.urn, m.score DESC, m.aspect_name
+"""
+
+_SEARCH_RESULTS_LIMIT = 1000
+
+
+def _tokenize_search_query(query: str) -> List[str]:
+    """Splits a query into the distinct runs of Unicode letters and digits, like the index."""
+    return list(dict.fromkeys(t for t in re.split(r"[\W_]+", query.lower()) if t))
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """The smallest string above all the strings starting with `prefix`, if any."""
+    while prefix:
+        next_code_point = ord(prefix[-1]) + 1
+        if next_code_point == 0xD800:
+            # surrogates can't be encoded
+            next_code_point = 0xE000
+        if next_code_point <= sys.maxunicode:
+            return prefix[:-1] + chr(next_code_point)
+        prefix = prefix[:-1]
+    return None
+
+
+_STAGED_LATEST_QUERY = """
+CREATE OR REPLACE TEMP TABLE staged_aspect_latest AS
+SELECT
+    urn,
+    aspect_name,
+    bool_or(existed) AS existed,
+    arg_max(metadata, seq) AS metadata,
+    json_merge_patch(
+        COALESCE(
+            arg_max(versioned_system_metadata, seq) FILTER (WHERE changed),
+            any_value(existing_system_metadata),
+            '{}'
+        ),
+        json_object('lastObserved', arg_max(createdon, seq))
+    )::VARCHAR AS system_metadata,
+    arg_min(createdon, seq) AS createdon
+FROM staged_aspect_changes
+GROUP BY urn, aspect_name
+"""
+
 
 class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
     @classmethod
@@ -54,6 +250,14 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         )
         if not config.read_only:
             self._init_db()
+        self._search_index_available = self._search_index_exists()
+        # Aspects accepted by `write` in bulk load mode, not yet flushed to the db.
+        self._staged_aspects: List[Tuple[int, str, str, str, str, int]] = []
+        # While reindexing, edges are accumulated here as
+        # {(src_id, relnship): {dst_id: dst_label}} and written out in one go.
+        self._edge_buffer: Optional[Dict[Tuple[str, str], Dict[str, Optional[str]]]] = (
+            None
+        )
 
     def _create_unique_index(
         self, index_name: str, table_name: str, columns: list
@@ -66,6 +270,13 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             if "already exists" not in str(e).lower():
                 raise
 
+    def _search_index_exists(self) -> bool:
+        return bool(
+            self.duckdb_client.execute(
+                "SELECT 1 FROM information_schema.tables WHERE table_name = 'metadata_search_v2'"
+            ).fetchone()
+        )
+
     def _init_db(self) -> None:
         self.duckdb_client.execute(
             "CREATE TABLE IF NOT EXISTS metadata_aspect_v2 "
@@ -85,6 +296,22 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             "edge_idx", "metadata_edge_v2", ["src_id", "relnship", "dst_id"]
         )
 
+        needs_search_index = not self._search_index_exists()
+        self.duckdb_client.execute(
+            "CREATE TABLE IF NOT EXISTS metadata_search_v2 "
+            "(token VARCHAR, urn VARCHAR, aspect_name VARCHAR, weight DOUBLE)"
+        )
+        try:
+            self.duckdb_client.execute(
+                "CREATE INDEX search_token_idx ON metadata_search_v2 (token)"
+            )
+        except duckdb.CatalogException as e:
+            if "already exists" not in str(e).lower():
+                raise
+        if needs_search_index:
+            # databases created before the search index existed get indexed once
+            self._rebuild_search_index()
+
     def location(self) -> str:
         return self.config.file
 
@@ -112,6 +339,10 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         if not writeables:
             return
 
+        if self.config.bulk_load:
+            self._stage_aspects(writeables)
+            return
+
         # TODO use `with` for transaction
         self.duckdb_client.begin()
         for writeable in writeables:
@@ -228,12 +459,161 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
                         and writeable.aspectName
                         and writeable.aspect
                     )
+                    self._update_search_index(writeable.entityUrn, writeable.aspectName)
                     self.post_update_hook(
                         writeable.entityUrn, writeable.aspectName, writeable.aspect
                     )
 
         self.duckdb_client.commit()
 
+    def _insert_rows(
+        self, table_name: str, columns: Dict[str, str], rows: List[Tuple]
+    ) -> None:
+        # Much cheaper than executemany, which converts and binds every value of
+        # every row separately: the rows are shipped as a single json parameter
+        # and unpacked by duckdb.
+        if not rows:
+            return
+        column_types = json.dumps(columns)
+        column_list = ", ".join(f"r.{column}" for column in columns)
+        self.duckdb_client.execute(
+            f"INSERT INTO {table_name} SELECT {column_list} "
+            f"FROM (SELECT unnest(from_json(?, '[{column_types}]')) AS r)",
+            [json.dumps([dict(zip(columns, row)) for row in rows])],
+        )
+
+    def _stage_aspects(
+        self, writeables: Iterable[MetadataChangeProposalWrapper]
+    ) -> None:
+        for writeable in writeables:
+            self._stage_aspect(writeable)
+        if len(self._staged_aspects) >= self.config.bulk_load_batch_size:
+            self.flush()
+
+    def _stage_aspect(self, writeable: MetadataChangeProposalWrapper) -> None:
+        try:
+            assert writeable.entityUrn and writeable.aspectName
+            created_on = int(time.time() * 1000.0)
+            if writeable.systemMetadata is None:
+                writeable.systemMetadata = SystemMetadataClass(
+                    lastObserved=created_on, properties={}
+                )
+            elif writeable.systemMetadata.lastObserved:
+                created_on = writeable.systemMetadata.lastObserved
+            else:
+                writeable.systemMetadata.lastObserved = created_on
+
+            writeable_dict = writeable.to_obj(simplified_structure=True)
+            system_metadata = writeable_dict["systemMetadata"]
+            if not system_metadata.get("properties"):
+                system_metadata["properties"] = {}
+            self._staged_aspects.append(
+                (
+                    len(self._staged_aspects),
+                    writeable.entityUrn,
+                    writeable.aspectName,
+                    json.dumps(writeable_dict["aspect"]["json"]),
+                    json.dumps(system_metadata),
+                    created_on,
+                )
+            )
+        except Exception as e:
+            logger.error(f"Failed to write {writeable}", e)
+
+    def flush(self) -> None:
+        """Writes out the aspects staged in bulk load mode.
+
+        Staged aspects are loaded into a temporary table, and change detection and
+        version bumping against the existing rows are done with a handful of
+        set-based statements. Graph edges are not maintained per aspect in this
+        mode, and are rebuilt by `reindex` instead.
+        """
+        if not self._staged_aspects:
+            return
+
+        staged, self._staged_aspects = self._staged_aspects, []
+        logger.debug(f"Flushing {len(staged)} staged aspects")
+        self.duckdb_client.execute(
+            "CREATE OR REPLACE TEMP TABLE staged_aspect_v2 "
+            "(seq BIGINT, urn VARCHAR, aspect_name VARCHAR, metadata VARCHAR, system_metadata VARCHAR, createdon BIGINT)"
+        )
+        self.duckdb_client.begin()
+        try:
+            self._insert_rows(
+                "staged_aspect_v2",
+                {
+                    "seq": "BIGINT",
+                    "urn": "VARCHAR",
+                    "aspect_name": "VARCHAR",
+                    "metadata": "VARCHAR",
+                    "system_metadata": "VARCHAR",
+                    "createdon": "BIGINT",
+                },
+                staged,
+            )
+            self.duckdb_client.execute(_STAGED_CHANGES_QUERY)
+            self.duckdb_client.execute(_STAGED_LATEST_QUERY)
+            self.duckdb_client.execute(
+                "INSERT INTO metadata_aspect_v2 "
+                "SELECT urn, aspect_name, new_version, metadata, versioned_system_metadata, createdon "
+                "FROM staged_aspect_changes WHERE changed"
+            )
+            self.duckdb_client.execute(
+                "INSERT INTO metadata_aspect_v2 "
+                "SELECT urn, aspect_name, 0, metadata, system_metadata, createdon "
+                "FROM staged_aspect_latest WHERE NOT existed"
+            )
+            self.duckdb_client.execute(
+                "UPDATE metadata_aspect_v2 SET metadata = l.metadata, system_metadata = l.system_metadata "
+                "FROM staged_aspect_latest l "
+                "WHERE metadata_aspect_v2.urn = l.urn AND metadata_aspect_v2.aspect_name = l.aspect_name "
+                "AND metadata_aspect_v2.version = 0 AND l.existed"
+            )
+            self.duckdb_client.execute(
+                "DELETE FROM metadata_search_v2 WHERE urn IN (SELECT urn FROM staged_aspect_latest) "
+                "AND (aspect_name = 'urn' OR aspect_name IN "
+                "(SELECT aspect_name FROM staged_aspect_latest l WHERE l.urn = metadata_search_v2.urn))"
+            )
+            self.duckdb_client.execute(
+                _SEARCH_INDEX_QUERY.format(
+                    filter="AND EXISTS (SELECT 1 FROM staged_aspect_latest l "
+                    "WHERE l.urn = a.urn AND l.aspect_name = a.aspect_name)"
+                )
+            )
+        except Exception:
+            self.duckdb_client.rollback()
+            raise
+        else:
+            self.duckdb_client.commit()
+        finally:
+            for table in [
+                "staged_aspect_v2",
+                "staged_aspect_changes",
+                "staged_aspect_latest",
+            ]:
+                self.duckdb_client.execute(f"DROP TABLE IF EXISTS {table}")
+
+    def _update_search_index(self, urn: str, aspect_name: str) -> None:
+        self.duckdb_client.execute(
+            "DELETE FROM metadata_search_v2 WHERE urn = ? AND aspect_name IN (?, 'urn')",
+            [urn, aspect_name],
+        )
+        self.duckdb_client.execute(
+            _SEARCH_INDEX_QUERY.format(filter="AND urn = ? AND aspect_name = ?"),
+            [urn, aspect_name],
+        )
+
+    def _rebuild_search_index(self) -> None:
+        self.duckdb_client.begin()
+        try:
+            self.duckdb_client.execute("DELETE FROM metadata_search_v2")
+            self.duckdb_client.execute(_SEARCH_INDEX_QUERY.format(filter=""))
+        except Exception:
+            self.duckdb_client.rollback()
+            raise
+        else:
+            self.duckdb_client.commit()
+
     def list_ids(self) -> Iterable[str]:
         self.duckdb_client.execute("SELECT distinct(urn) from metadata_aspect_v2")
         for row in self.duckdb_client.fetchall():
@@ -289,11 +669,7 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
     ) -> Iterable[Searchable]:
         aspects = aspects or []
         if flavor == SearchFlavor.FREE_TEXT:
-            base_query = f"SELECT distinct(urn), 'urn', NULL from metadata_aspect_v2 where urn ILIKE '%{query}%' UNION SELECT urn, aspect_name, metadata from metadata_aspect_v2 where metadata->>'$.name' ILIKE '%{query}%'"
-            for r in self.duckdb_client.execute(base_query).fetchall():
-                yield Searchable(
-                    id=r[0], aspect=r[1], snippet=r[2] if snippet else None
-                )
+            yield from self._free_text_search(query, aspects, snippet)
         elif flavor == SearchFlavor.EXACT:
             base_query = f"SELECT urn, aspect_name, metadata from metadata_aspect_v2 where version = 0 AND ({query})"
             for r in self.duckdb_client.execute(base_query).fetchall():
@@ -303,7 +679,60 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         else:
             raise Exception(f"Unhandled search flavor {flavor}")
 
+    def _free_text_search(
+        self, query: str, aspects: List[str], snippet: bool
+    ) -> Iterable[Searchable]:
+        if not self._search_index_available:
+            # read-only access to a database that predates the search index
+            yield from self._substring_search(query, snippet)
+            return
+
+        tokens = _tokenize_search_query(query)
+        if not tokens:
+            return
+
+        # Prefix ranges on the indexed token column, so only the matching part of
+        # the index is read.
+        token_filters = []
+        params: List[Any] = [tokens]
+        for token in tokens:
+            upper_bound = _prefix_upper_bound(token)
+            if upper_bound is None:
+                token_filters.append("(s.token >= ?)")
+                params.append(token)
+            else:
+                token_filters.append("(s.token >= ? AND s.token < ?)")
+                params += [token, upper_bound]
+        aspect_filter = ""
+        if aspects:
+            aspect_filter = f"AND s.aspect_name IN ({', '.join(['?'] * len(aspects))})"
+            params += aspects
+        params += [len(tokens), _SEARCH_RESULTS_LIMIT]
+
+        results = self.duckdb_client.execute(
+            _SEARCH_QUERY.format(
+                token_filter=" OR ".join(token_filters), aspect_filter=aspect_filter
+            ),
+            params,
+        ).fetchall()
+        if not results:
+            # the index only matches the start of words, fall back to matching
+            # anywhere in the urns and names
+            yield from self._substring_search(query, snippet)
+            return
+        for r in results:
+            yield Searchable(id=r[0], aspect=r[1], snippet=r[2] if snippet else None)
+
+    def _substring_search(self, query: str, snippet: bool) -> Iterable[Searchable]:
+        base_query = "SELECT distinct(urn), 'urn', NULL from metadata_aspect_v2 where urn ILIKE ? UNION SELECT urn, aspect_name, metadata from metadata_aspect_v2 where metadata->>'$.name' ILIKE ?"
+        pattern = f"%{query}%"
+        for r in self.duckdb_client.execute(base_query, [pattern, pattern]).fetchall():
+            yield Searchable(id=r[0], aspect=r[1], snippet=r[2] if snippet else None)
+
     def remove_edge(self, src: str, relnship: str) -> None:
+        if self._edge_buffer is not None:
+            self._edge_buffer.pop((str(src), relnship), None)
+            return
         try:
             self.duckdb_client.execute(
                 "DELETE FROM metadata_edge_v2 WHERE src_id = ? AND relnship = ?",
@@ -325,6 +754,12 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         src_id = str(src)
         dst_id = str(dst)
         logger.debug(f"Add edge {src_id},{dst_id},{relnship},{dst_label}")
+        if self._edge_buffer is not None:
+            if remove_existing:
+                self._edge_buffer[(src_id, relnship)] = {dst_id: dst_label}
+            else:
+                self._edge_buffer.setdefault((src_id, relnship), {})[dst_id] = dst_label
+            return
         try:
             query = "SELECT * FROM metadata_edge_v2 WHERE src_id = ? AND relnship = ?"
             params = [src_id, relnship]
@@ -477,14 +912,43 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             ]
 
     def reindex(self) -> None:
-        self.duckdb_client.execute("DELETE FROM metadata_edge_v2")
-        self.duckdb_client.commit()
-        for urn_aspect_dict in self.get_all_entities(typed=True):
-            for urn, aspect_map in urn_aspect_dict.items():
-                for aspect_name, aspect_value in aspect_map.items():
-                    assert isinstance(aspect_value, _Aspect)
-                    self.post_update_hook(urn, aspect_name, aspect_value)
-                self.global_post_update_hook(urn, aspect_map)  # type: ignore
+        self.flush()
+        self._rebuild_search_index()
+        # Rebuild the edges in memory, then replace the edge table in one transaction.
+        self._edge_buffer = {}
+        try:
+            for urn_aspect_dict in self.get_all_entities(typed=True):
+                for urn, aspect_map in urn_aspect_dict.items():
+                    for aspect_name, aspect_value in aspect_map.items():
+                        assert isinstance(aspect_value, _Aspect)
+                        self.post_update_hook(urn, aspect_name, aspect_value)
+                    self.global_post_update_hook(urn, aspect_map)  # type: ignore
+            edges = [
+                (src_id, relnship, dst_id, dst_label)
+                for (src_id, relnship), dsts in self._edge_buffer.items()
+                for dst_id, dst_label in dsts.items()
+            ]
+        finally:
+            self._edge_buffer = None
+
+        self.duckdb_client.begin()
+        try:
+            self.duckdb_client.execute("DELETE FROM metadata_edge_v2")
+            self._insert_rows(
+                "metadata_edge_v2",
+                {
+                    "src_id": "VARCHAR",
+                    "relnship": "VARCHAR",
+                    "dst_id": "VARCHAR",
+                    "dst_label": "VARCHAR",
+                },
+                edges,
+            )
+        except Exception:
+            self.duckdb_client.rollback()
+            raise
+        else:
+            self.duckdb_client.commit()
 
     def get_all_entities(
         self, typed: bool = False
@@ -5,3 +5,5 @@ class DuckDBLiteConfig(ConfigModel):
     file: str
     read_only: bool = False
     options: dict = {}
+    bulk_load: bool = False
+    bulk_load_batch_size: int = 100_000
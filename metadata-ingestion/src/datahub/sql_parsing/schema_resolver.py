@@ -80,6 +80,9 @@ class SchemaResolver(Closeable, SchemaResolverInterface):
     def get_urns(self) -> Set[str]:
         return {k for k, v in self._schema_cache.items() if v is not None}
 
+    def get_schema_infos(self) -> Dict[str, SchemaInfo]:
+        return {k: v for k, v in self._schema_cache.items() if v is not None}
+
     def schema_count(self) -> int:
         return int(
             self._schema_cache.sql_query(
@@ -264,6 +267,9 @@ class _SchemaResolverWithExtras(SchemaResolverInterface):
             return urn, self._extra_schemas[urn]
         return self._base_resolver.resolve_table(table)
 
+    def has_extra_schema(self, urn: str) -> bool:
+        return urn in self._extra_schemas
+
     def add_temp_tables(
         self, temp_tables: Dict[str, Optional[List[SchemaFieldClass]]]
     ) -> None:
@@ -283,6 +283,7 @@ class SqlAggregatorReport(Report):
     num_observed_queries_failed: int = 0
     num_observed_queries_column_timeout: int = 0
     num_observed_queries_column_failed: int = 0
+    num_observed_queries_parsed_ahead: int = 0
     observed_query_parse_failures: LossyList[str] = dataclasses.field(
         default_factory=LossyList
     )
@@ -806,6 +807,7 @@ class SqlParsingAggregator(Closeable):
         observed: ObservedQuery,
         is_known_temp_table: bool = False,
         require_out_table_schema: bool = False,
+        parse_result: Optional[SqlParsingResult] = None,
     ) -> None:
         """Add an observed query to the aggregator.
 
@@ -814,6 +816,11 @@ class SqlParsingAggregator(Closeable):
         map, which will get used in subsequent queries with the same session ID.
 
         This assumes that queries come in order of increasing timestamps.
+
+        A `parse_result` computed ahead of time, e.g. in another process, can be passed to
+        skip parsing. It must come from `sqlglot_lineage` with the same schemas as this
+        aggregator's schema resolver. Since it doesn't know about the temp tables of the
+        session, the query is parsed again if it references any of them.
         """
         self.report.num_observed_queries += 1
 
@@ -828,16 +835,22 @@ class SqlParsingAggregator(Closeable):
             session_has_temp_tables = schema_resolver.includes_temp_tables()
 
         # Run the SQL parser.
-        parsed = self._run_sql_parser(
-            observed.query,
-            default_db=observed.default_db,
-            default_schema=observed.default_schema,
-            schema_resolver=schema_resolver,
-            session_id=session_id,
-            timestamp=observed.timestamp,
-            user=observed.user,
-            override_dialect=observed.override_dialect,
-        )
+        if parse_result is not None and not self._references_temp_tables(
+            schema_resolver, parse_result
+        ):
+            self.report.num_observed_queries_parsed_ahead += 1
+            parsed = parse_result
+        else:
+            parsed = self._run_sql_parser(
+                observed.query,
+                default_db=observed.default_db,
+                default_schema=observed.default_schema,
+                schema_resolver=schema_resolver,
+                session_id=session_id,
+                timestamp=observed.timestamp,
+                user=observed.user,
+                override_dialect=observed.override_dialect,
+            )
         if parsed.debug_info.error:
             self.report.observed_query_parse_failures.append(
                 f"{parsed.debug_info.error} on query: {observed.query[:100]}"
@@ -1162,6 +1175,15 @@ class SqlParsingAggregator(Closeable):
         # Register the query's lineage.
         self._lineage_map.for_mutation(view_urn, OrderedSet()).add(query_fingerprint)
 
+    @staticmethod
+    def _references_temp_tables(
+        schema_resolver: SchemaResolverInterface, parsed: SqlParsingResult
+    ) -> bool:
+        return isinstance(schema_resolver, _SchemaResolverWithExtras) and any(
+            schema_resolver.has_extra_schema(urn)
+            for urn in [*parsed.in_tables, *parsed.out_tables]
+        )
+
     def _run_sql_parser(
         self,
         query: str,
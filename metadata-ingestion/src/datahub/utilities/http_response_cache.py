@@ -0,0 +1,320 @@
+"""
+An opt-in, on-disk cache of HTTP responses, for REST API based sources.
+
+It's meant to speed up reruns of a recipe, e.g. while iterating on it or after a sink
+failure: responses are served from a SQLite file while they're fresh, and stale
+responses are revalidated with their ETag / Last-Modified header, so that unchanged
+API pages aren't downloaded again.
+
+The cache is mounted as a transport adapter on the `requests.Session` of a source,
+in front of its existing adapters (and their retry configuration).
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import pathlib
+import re
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import requests
+from pydantic import Field, validator
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from datahub.configuration.common import ConfigModel
+from datahub.utilities.sqlite_cache import SqliteCache
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CACHE_DIR = pathlib.Path.home() / ".datahub" / "http_cache"
+_TABLE_NAME = "http_responses"
+_UNCACHED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+_KEY_HEADERS = ["Authorization", "Accept"]
+
+
+class HttpResponseCacheConfig(ConfigModel):
+    enabled: bool = Field(
+        default=False,
+        description="Whether to cache API responses on disk. Meant for development and reruns of a recipe, "
+        "since changes made in the source system within `ttl_seconds` are only picked up if the API "
+        "supports ETag or Last-Modified headers. Responses are cached per credentials, so with short-lived "
+        "access tokens they're only reused while the token is valid.",
+    )
+    path: Optional[pathlib.Path] = Field(
+        default=None,
+        description="SQLite file of the cache. Defaults to a file per source type in `~/.datahub/http_cache`.",
+    )
+    ttl_seconds: int = Field(
+        default=24 * 60 * 60,
+        ge=0,
+        description="Time for which a response is served without contacting the server. "
+        "After that, it's revalidated if it has an ETag or Last-Modified header, and downloaded again otherwise.",
+    )
+    max_size_mb: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum size of the cached responses. The least recently used ones are evicted beyond it.",
+    )
+    methods: List[str] = Field(
+        default=["GET"],
+        description="HTTP methods whose responses are cached. Requests with a body are cached by their body as well, "
+        "so POST can be added for read-only query APIs such as GraphQL.",
+    )
+
+    @validator("methods", each_item=True)
+    def _upper_case_methods(cls, v: str) -> str:
+        return v.upper()
+
+
+class HttpResponseCacheConfigMixin(ConfigModel):
+    http_response_cache: HttpResponseCacheConfig = Field(
+        default_factory=HttpResponseCacheConfig,
+        description="On-disk cache of API responses, to speed up reruns.",
+    )
+
+
+@dataclasses.dataclass
+class HttpResponseCacheStats:
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    stored: int = 0
+    evicted: int = 0
+
+
+@dataclasses.dataclass
+class _CachedResponse:
+    url: str
+    status_code: int
+    reason: Optional[str]
+    headers: Dict[str, str]
+    content: bytes
+    stored_at: float
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """The headers of a conditional request, to revalidate this response."""
+        headers = CaseInsensitiveDict(self.headers)
+        conditions = {}
+        if "ETag" in headers:
+            conditions["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            conditions["If-Modified-Since"] = headers["Last-Modified"]
+        return conditions
+
+    def to_response(self, request: requests.PreparedRequest) -> requests.Response:
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.reason = self.reason  # type: ignore[assignment]
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.content
+        response.request = request
+        return response
+
+
+class HttpResponseCache(SqliteCache):
+    """Responses stored in a SQLite file, keyed by request, with LRU eviction beyond a total size."""
+
+    def __init__(self, path: pathlib.Path, max_size_bytes: int):
+        super().__init__(path)
+        self.max_size_bytes = max_size_bytes
+        self.stats = HttpResponseCacheStats()
+
+        self._conn.execute(
+            f"""CREATE TABLE IF NOT EXISTS {_TABLE_NAME} (
+                key TEXT PRIMARY KEY,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL,
+                metadata TEXT NOT NULL,
+                content BLOB NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {_TABLE_NAME}_accessed_at ON {_TABLE_NAME} (accessed_at)"
+        )
+        self._size_bytes: int = self._conn.execute(
+            f"SELECT COALESCE(SUM(size), 0) FROM {_TABLE_NAME}"
+        ).fetchone()[0]
+
+    @classmethod
+    def for_config(
+        cls, config: HttpResponseCacheConfig, source_name: str
+    ) -> "HttpResponseCache":
+        return cls.for_path(
+            config.path or _DEFAULT_CACHE_DIR / f"{source_name}.sqlite",
+            config.max_size_mb * 1024 * 1024,
+        )
+
+    @staticmethod
+    def make_key(request: requests.PreparedRequest) -> str:
+        # Responses depend on the credentials, e.g. on the permissions of the user, and on
+        # the requested format. The credentials are only stored as part of the digest.
+        key = hashlib.sha256(f"{request.method} {request.url}".encode())
+        for header in _KEY_HEADERS:
+            key.update(f"\n{header}: {request.headers.get(header, '')}".encode())
+        body = request.body
+        if body:
+            key.update(body.encode() if isinstance(body, str) else body)
+        return key.hexdigest()
+
+    def get(self, key: str) -> Optional[_CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT stored_at, metadata, content FROM {_TABLE_NAME} WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                f"UPDATE {_TABLE_NAME} SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        return _CachedResponse(
+            **json.loads(row["metadata"]),
+            content=row["content"],
+            stored_at=row["stored_at"],
+        )
+
+    def put(self, key: str, response: requests.Response) -> None:
+        content = response.content
+        metadata = json.dumps(
+            {
+                "url": response.url,
+                "status_code": response.status_code,
+                "reason": response.reason,
+                # The content is stored decoded.
+                "headers": {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() not in _UNCACHED_HEADERS
+                },
+            }
+        )
+        size = len(content) + len(metadata)
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute(
+                f"SELECT size FROM {_TABLE_NAME} WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {_TABLE_NAME} VALUES (?, ?, ?, ?, ?, ?)",
+                (key, now, now, size, metadata, content),
+            )
+            self._size_bytes += size - (previous["size"] if previous else 0)
+            self.stats.stored += 1
+            self._evict()
+
+    def touch(self, key: str) -> None:
+        """Marks a response as fresh again, after it was revalidated."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE {_TABLE_NAME} SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+
+    def _evict(self) -> None:
+        while self._size_bytes > self.max_size_bytes:
+            rows = self._conn.execute(
+                f"SELECT key, size FROM {_TABLE_NAME} ORDER BY accessed_at LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            for row in rows:
+                self._conn.execute(
+                    f"DELETE FROM {_TABLE_NAME} WHERE key = ?", (row["key"],)
+                )
+                self._size_bytes -= row["size"]
+                self.stats.evicted += 1
+                if self._size_bytes <= self.max_size_bytes:
+                    break
+
+
+class CachingHTTPAdapter(BaseAdapter):
+    """Serves responses from an HttpResponseCache, and sends the other requests with the wrapped adapter."""
+
+    def __init__(
+        self,
+        adapter: BaseAdapter,
+        cache: HttpResponseCache,
+        config: HttpResponseCacheConfig,
+        uncached_url_patterns: Sequence[str] = (),
+    ):
+        super().__init__()
+        self.adapter = adapter
+        self.cache = cache
+        self.ttl_seconds = config.ttl_seconds
+        self.methods = set(config.methods)
+        self.uncached_url_patterns = [re.compile(p) for p in uncached_url_patterns]
+
+    def _is_cacheable(self, request: requests.PreparedRequest) -> bool:
+        return request.method in self.methods and not any(
+            pattern.search(request.url or "") for pattern in self.uncached_url_patterns
+        )
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        if kwargs.get("stream") or not self._is_cacheable(request):
+            return self.adapter.send(request, **kwargs)
+
+        key = self.cache.make_key(request)
+        cached = self.cache.get(key)
+        if cached and time.time() - cached.stored_at < self.ttl_seconds:
+            self.cache.stats.hits += 1
+            logger.debug(f"Serving {request.method} {request.url} from the cache")
+            return cached.to_response(request)
+
+        if cached and cached.validators:
+            conditional_request = request.copy()
+            conditional_request.headers.update(cached.validators)
+            response = self.adapter.send(conditional_request, **kwargs)
+            if response.status_code == 304:
+                self.cache.stats.revalidated += 1
+                self.cache.touch(key)
+                response.close()
+                return cached.to_response(request)
+        else:
+            response = self.adapter.send(request, **kwargs)
+
+        self.cache.stats.misses += 1
+        if response.status_code == 200:
+            self.cache.put(key, response)
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+def mount_http_response_cache(
+    session: requests.Session,
+    config: HttpResponseCacheConfig,
+    source_name: str,
+    uncached_url_patterns: Sequence[str] = (),
+) -> Optional[HttpResponseCache]:
+    """Mounts the response cache on the session, in front of the adapters currently mounted on it.
+
+    Does nothing unless the cache is enabled. Should be called after the session is configured,
+    e.g. after the retry adapters are mounted. Responses of URLs matching `uncached_url_patterns`,
+    e.g. the status of an asynchronous job that is polled, are never cached.
+    """
+    if not config.enabled:
+        return None
+
+    cache = HttpResponseCache.for_config(config, source_name)
+    for prefix in ["https://", "http://"]:
+        adapter = session.get_adapter(prefix)
+        if isinstance(adapter, CachingHTTPAdapter):
+            adapter = adapter.adapter
+        session.mount(
+            prefix,
+            CachingHTTPAdapter(adapter, cache, config, uncached_url_patterns),
+        )
+    return cache
@@ -1,8 +1,22 @@
 import collections
+import dataclasses
+import email.utils
+import logging
+import math
+import re
 import threading
 import time
 from contextlib import AbstractContextManager
-from typing import Any, Deque
+from http import HTTPStatus
+from typing import Any, Deque, Dict, List, Optional, Pattern, Tuple
+
+import requests
+from pydantic import Field, validator
+from requests.adapters import BaseAdapter
+
+from datahub.configuration.common import ConfigModel
+
+logger = logging.getLogger(__name__)
 
 
 # Modified version of https://github.com/RazerM/ratelimiter/blob/master/ratelimiter/_sync.py
@@ -20,9 +34,9 @@ class RateLimiter(AbstractContextManager):
         if max_calls <= 0:
             raise ValueError("Rate limiting number of calls should be > 0")
 
-        # We're using a deque to store the last execution timestamps, not for
-        # its maxlen attribute, but to allow constant time front removal.
-        self.calls: Deque = collections.deque()
+        # The start times of the last max_calls operations, including the ones
+        # that are still waiting for their slot.
+        self.calls: Deque[float] = collections.deque(maxlen=max_calls)
 
         self.period = period
         self.max_calls = max_calls
@@ -30,26 +44,320 @@ class RateLimiter(AbstractContextManager):
 
     def __enter__(self) -> "RateLimiter":
         with self._lock:
-            # We want to ensure that no more than max_calls were run in the allowed
-            # period. For this, we store the last timestamps of each call and run
-            # the rate verification upon each __enter__ call.
+            # We want to ensure that no more than max_calls are started in any
+            # period, so an operation starts a period after the max_calls-th last one.
+            now = time.monotonic()
+            start = now
             if len(self.calls) >= self.max_calls:
-                until = time.time() + self.period - self._timespan
-                sleeptime = until - time.time()
-                if sleeptime > 0:
-                    time.sleep(sleeptime)
-            return self
+                start = max(now, self.calls[0] + self.period)
+            self.calls.append(start)
+        # Wait for the reserved slot outside of the lock, so that concurrent callers
+        # can reserve the following slots meanwhile.
+        if start > now:
+            time.sleep(start - now)
+        return self
 
     def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        pass
+
+
+class RateLimitConfig(ConfigModel):
+    requests_per_second: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Maximum average number of API requests per second, shared by all the workers of the source. "
+        "Unlimited by default, except for the budgets of `endpoints`.",
+    )
+    burst: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of requests that can be sent at once after an idle period. "
+        "Defaults to one second worth of requests.",
+    )
+    endpoints: Dict[str, float] = Field(
+        default={},
+        description="Requests per second allowed for the requests whose URL matches a regex, e.g. "
+        "`{'/api/reports/': 2}`. Each entry has its own budget, used instead of `requests_per_second` "
+        "by the matching requests. The first matching regex is used.",
+    )
+    adaptive: bool = Field(
+        default=True,
+        description="Whether to halve the rate after a throttled (HTTP 429) response, and to restore it gradually "
+        "after successful requests. Throttled requests always wait for the delay of their `Retry-After` header.",
+    )
+    max_throttled_retries: int = Field(
+        default=3,
+        ge=0,
+        description="Number of times a throttled request is sent again, once the rate limit allows it.",
+    )
+
+    @validator("endpoints")
+    def _valid_endpoint_budgets(cls, v: Dict[str, float]) -> Dict[str, float]:
+        for pattern, requests_per_second in v.items():
+            re.compile(pattern)
+            if requests_per_second <= 0:
+                raise ValueError(
+                    f"Requests per second of endpoint {pattern} should be > 0"
+                )
+        return v
+
+    @property
+    def enabled(self) -> bool:
+        return self.requests_per_second is not None or bool(self.endpoints)
+
+
+class RateLimitConfigMixin(ConfigModel):
+    rate_limit: RateLimitConfig = Field(
+        default_factory=RateLimitConfig,
+        description="Client-side rate limit of the API requests.",
+    )
+
+
+@dataclasses.dataclass
+class RateLimiterStats:
+    """Meant to be embedded in a source report. Can be shared by multiple limiters."""
+
+    requests: int = 0
+    delayed_requests: int = 0
+    throttled_responses: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_wait(self, seconds: float) -> None:
         with self._lock:
-            # Store the last operation timestamp.
-            self.calls.append(time.time())
+            self.requests += 1
+            if seconds > 0:
+                self.delayed_requests += 1
+                self.total_wait_seconds += seconds
+                self.max_wait_seconds = max(self.max_wait_seconds, seconds)
 
-            # Pop the timestamp list front (ie: the older calls) until the sum goes
-            # back below the period. This is our 'sliding period' window.
-            while self._timespan >= self.period:
-                self.calls.popleft()
+    def record_throttled(self) -> None:
+        with self._lock:
+            self.throttled_responses += 1
+
+    def as_obj(self) -> dict:
+        return {
+            "requests": self.requests,
+            "delayed_requests": self.delayed_requests,
+            "throttled_responses": self.throttled_responses,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+        }
+
+
+class TokenBucketRateLimiter(AbstractContextManager):
+    """Limits operations to an average rate, with bursts of up to `burst` operations.
+
+    Like RateLimiter, callers only hold the lock to reserve their slot, and wait for
+    it outside of the lock, so concurrent callers don't queue behind a sleeping one.
+    Unlike it, the rate adapts to throttling feedback from the server, see `throttle`.
+    """
+
+    # Rate added back after each successful request, as a fraction of the configured rate.
+    _RECOVERY_STEP = 0.05
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        adaptive: bool = True,
+        stats: Optional[RateLimiterStats] = None,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("Rate limiting rate should be > 0")
+        self.max_rate = rate
+        self.burst = burst or max(1, math.ceil(rate))
+        self.adaptive = adaptive
+        self.stats = stats or RateLimiterStats()
+
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._tokens = float(self.burst)
+        # Tokens are accumulated from this time on. Set in the future while throttled.
+        self._updated_at = time.monotonic()
 
     @property
-    def _timespan(self) -> float:
-        return self.calls[-1] - self.calls[0]
+    def rate(self) -> float:
+        """The current rate, which is lower than `max_rate` after throttled responses."""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated_at:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self._rate
+            )
+            self._updated_at = now
+
+    def reserve(self) -> float:
+        """Reserves a slot for an operation, and returns the number of seconds to wait for it, without waiting."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            ready_at = self._updated_at + max(0.0, -self._tokens / self._rate)
+        wait_seconds = max(0.0, ready_at - now)
+        self.stats.record_wait(wait_seconds)
+        return wait_seconds
+
+    def acquire(self) -> float:
+        """Waits until the rate limit allows an operation, and returns the number of seconds waited."""
+        wait_seconds = self.reserve()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Reports that the server throttled an operation.
+
+        No new operation is allowed until `retry_after` seconds have passed, or one slot of
+        the current rate if it's unknown, and the rate is halved if the limiter is adaptive.
+        Operations that already reserved a slot aren't delayed.
+        """
+        self.stats.record_throttled()
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self.adaptive:
+                self._rate = max(self._rate / 2, self.max_rate / 100)
+            delay = retry_after if retry_after is not None else 1 / self._rate
+            # A single operation is allowed once the delay has passed.
+            self._tokens = min(self._tokens, 0.0) + 1
+            self._updated_at = max(self._updated_at, now + delay)
+
+    def succeeded(self) -> None:
+        """Reports that an operation wasn't throttled, to gradually restore the rate after `throttle`."""
+        if self._rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._rate = min(
+                self.max_rate, self._rate + self.max_rate * self._RECOVERY_STEP
+            )
+
+    def __enter__(self) -> "TokenBucketRateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        pass
+
+
+class EndpointRateLimiter:
+    """The token buckets of a RateLimitConfig: one per endpoint regex, and a default one."""
+
+    def __init__(
+        self, config: RateLimitConfig, stats: Optional[RateLimiterStats] = None
+    ) -> None:
+        self.stats = stats or RateLimiterStats()
+        self.max_throttled_retries = config.max_throttled_retries
+        self.default: Optional[TokenBucketRateLimiter] = (
+            TokenBucketRateLimiter(
+                config.requests_per_second,
+                burst=config.burst,
+                adaptive=config.adaptive,
+                stats=self.stats,
+            )
+            if config.requests_per_second is not None
+            else None
+        )
+        self.endpoints: List[Tuple[Pattern, TokenBucketRateLimiter]] = [
+            (
+                re.compile(pattern),
+                TokenBucketRateLimiter(
+                    requests_per_second,
+                    adaptive=config.adaptive,
+                    stats=self.stats,
+                ),
+            )
+            for pattern, requests_per_second in config.endpoints.items()
+        ]
+
+    def for_url(self, url: str) -> Optional[TokenBucketRateLimiter]:
+        for pattern, limiter in self.endpoints:
+            if pattern.search(url):
+                return limiter
+        return self.default
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a `Retry-After` header, which is either a number of seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.debug(f"Ignoring invalid Retry-After header {value!r}")
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RateLimitingHTTPAdapter(BaseAdapter):
+    """Sends requests with the wrapped adapter once the rate limit of their URL allows it.
+
+    Throttled responses (HTTP 429) slow down the limiter of their URL, and the request is
+    sent again after the delay of their `Retry-After` header.
+    """
+
+    def __init__(self, adapter: BaseAdapter, limiter: EndpointRateLimiter):
+        super().__init__()
+        self.adapter = adapter
+        self.limiter = limiter
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        limiter = self.limiter.for_url(request.url or "")
+        if limiter is None:
+            return self.adapter.send(request, **kwargs)
+
+        retries = 0
+        while True:
+            limiter.acquire()
+            response = self.adapter.send(request, **kwargs)
+            if response.status_code != HTTPStatus.TOO_MANY_REQUESTS:
+                limiter.succeeded()
+                return response
+
+            limiter.throttle(parse_retry_after(response.headers.get("Retry-After")))
+            if retries >= self.limiter.max_throttled_retries:
+                return response
+            retries += 1
+            logger.debug(
+                f"Request {request.method} {request.url} was throttled, retrying ({retries}/{self.limiter.max_throttled_retries})"
+            )
+            response.close()
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+def mount_rate_limiter(
+    session: requests.Session,
+    config: RateLimitConfig,
+    stats: Optional[RateLimiterStats] = None,
+) -> Optional[EndpointRateLimiter]:
+    """Mounts the rate limiter on the session, in front of the adapters currently mounted on it.
+
+    Does nothing unless a rate is configured. Should be called after the retry adapters are
+    mounted, and before `mount_http_response_cache`, so that cached responses don't use the
+    rate limit. Requests retried by the wrapped adapters aren't rate limited, so 429 should
+    be removed from their `status_forcelist` for the limiter to adapt to throttling.
+    """
+    if not config.enabled:
+        return None
+
+    limiter = EndpointRateLimiter(config, stats)
+    for prefix in ["https://", "http://"]:
+        adapter = session.get_adapter(prefix)
+        if isinstance(adapter, RateLimitingHTTPAdapter):
+            adapter = adapter.adapter
+        session.mount(prefix, RateLimitingHTTPAdapter(adapter, limiter))
+    return limiter
@@ -0,0 +1,170 @@
+"""
+Memoization of API responses with a memory budget, for REST API based sources.
+
+Sources memoize their API calls so that objects referenced from many places, e.g. the
+dataset of many charts, are only fetched once. With an unbounded `functools.lru_cache`,
+every response stays in memory until the end of the run. A SpillingCache keeps the most
+recently used results in memory up to a size budget, and moves the others to a
+FileBackedDict, so they are still fetched only once.
+"""
+
+import collections
+import dataclasses
+import functools
+import pickle
+import threading
+from typing import Any, Callable, Dict, Generic, Optional, Set, Tuple, TypeVar
+
+from pydantic import Field
+
+from datahub.configuration.common import ConfigModel
+from datahub.ingestion.api.closeable import Closeable
+from datahub.utilities.file_backed_collections import FileBackedDict
+
+_VT = TypeVar("_VT")
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class SpillingCacheConfigMixin(ConfigModel):
+    request_cache_memory_mb: int = Field(
+        default=256,
+        ge=0,
+        description="Memory used to keep API responses that are needed more than once during the run. "
+        "Less recently used responses are moved to a temporary file on disk beyond it.",
+    )
+
+
+@dataclasses.dataclass
+class SpillingCacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    spilled: int = 0
+    memory_bytes: int = 0
+    memory_entries: int = 0
+
+    def as_obj(self) -> dict:
+        obj = dataclasses.asdict(self)
+        lookups = self.hits + self.disk_hits + self.misses
+        obj["hit_rate"] = (
+            round((self.hits + self.disk_hits) / lookups, 3) if lookups else None
+        )
+        return obj
+
+
+class SpillingCache(Closeable, Generic[_VT]):
+    """Values computed once per key, kept in memory up to `max_memory_bytes` and on disk beyond it.
+
+    The size of a value is the size of its pickled form. Concurrent lookups of the same
+    missing key are serialized, so the value is only computed once.
+    """
+
+    def __init__(self, max_memory_bytes: int) -> None:
+        self.max_memory_bytes = max_memory_bytes
+        self.stats = SpillingCacheStats()
+
+        self._lock = threading.Lock()
+        # key -> (value, size), in least recently used order.
+        self._memory: "collections.OrderedDict[str, Tuple[_VT, int]]" = (
+            collections.OrderedDict()
+        )
+        # Created lazily, since most runs fit in memory.
+        self._disk: Optional[FileBackedDict[_VT]] = None
+        self._disk_keys: Set[str] = set()
+
+        self._key_locks_lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._key_waiters: Dict[str, int] = {}
+
+    @classmethod
+    def for_config(cls, config: SpillingCacheConfigMixin) -> "SpillingCache":
+        return cls(config.request_cache_memory_mb * 1024 * 1024)
+
+    def _lookup(self, key: str) -> Tuple[bool, Optional[_VT]]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats.hits += 1
+                return True, self._memory[key][0]
+            if key in self._disk_keys:
+                assert self._disk is not None
+                value = self._disk[key]
+                self.stats.disk_hits += 1
+                self._store(key, value, len(pickle.dumps(value)))
+                return True, value
+        return False, None
+
+    def _store(self, key: str, value: _VT, size: int) -> None:
+        self._memory[key] = value, size
+        self.stats.memory_bytes += size
+        while self.stats.memory_bytes > self.max_memory_bytes and self._memory:
+            spilled_key, (spilled_value, spilled_size) = self._memory.popitem(
+                last=False
+            )
+            self.stats.memory_bytes -= spilled_size
+            if spilled_key not in self._disk_keys:
+                if self._disk is None:
+                    self._disk = FileBackedDict[_VT](cache_max_size=0)
+                self._disk[spilled_key] = spilled_value
+                self._disk_keys.add(spilled_key)
+                self.stats.spilled += 1
+        self.stats.memory_entries = len(self._memory)
+
+    def get_or_compute(self, key: str, compute: Callable[[], _VT]) -> _VT:
+        found, value = self._lookup(key)
+        if found:
+            return value  # type: ignore[return-value]
+
+        with self._key_locks_lock:
+            if key not in self._key_locks:
+                self._key_locks[key] = threading.Lock()
+                self._key_waiters[key] = 0
+            key_lock = self._key_locks[key]
+            self._key_waiters[key] += 1
+        try:
+            with key_lock:
+                # Another thread may have computed the value in the meantime.
+                found, value = self._lookup(key)
+                if found:
+                    return value  # type: ignore[return-value]
+
+                computed = compute()
+                size = len(pickle.dumps(computed))
+                with self._lock:
+                    self.stats.misses += 1
+                    self._store(key, computed, size)
+                return computed
+        finally:
+            with self._key_locks_lock:
+                self._key_waiters[key] -= 1
+                if self._key_waiters[key] == 0:
+                    del self._key_locks[key]
+                    del self._key_waiters[key]
+
+    def close(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._disk_keys.clear()
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+            self.stats.memory_bytes = self.stats.memory_entries = 0
+
+
+def memoized_method(cache_attr: str) -> Callable[[_F], _F]:
+    """Memoizes a method in the SpillingCache stored in the `cache_attr` attribute of its instance.
+
+    Replaces `functools.lru_cache` for methods whose results may be large. The arguments
+    must have a stable `repr`, which is used as the cache key.
+    """
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            cache: SpillingCache = getattr(self, cache_attr)
+            key = f"{func.__name__}{args!r}{sorted(kwargs.items())!r}"
+            return cache.get_or_compute(key, lambda: func(self, *args, **kwargs))
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
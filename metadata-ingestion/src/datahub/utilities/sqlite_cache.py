@@ -0,0 +1,63 @@
+"""
+A base class for the opt-in, on-disk caches that speed up reruns of a recipe.
+"""
+
+import logging
+import pathlib
+import threading
+import time
+from typing import Any, ClassVar, Dict, Type, TypeVar
+
+from datahub.utilities.file_backed_collections import ConnectionWrapper
+
+logger = logging.getLogger(__name__)
+
+_CacheT = TypeVar("_CacheT", bound="SqliteCache")
+
+
+class SqliteCache:
+    """A cache stored in a SQLite file, whose subclasses create and query their own tables.
+
+    Instances are shared by all the sources that use the same file, see `for_path`.
+    Queries should hold `_lock`, since the connection is shared by their threads.
+    """
+
+    # Set for each subclass, see __init_subclass__.
+    _instances: ClassVar[Dict[pathlib.Path, "SqliteCache"]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._instances = {}
+
+    def __init__(self, path: pathlib.Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._conn = ConnectionWrapper(path)
+
+    @classmethod
+    def for_path(
+        cls: Type[_CacheT], path: pathlib.Path, *args: Any, **kwargs: Any
+    ) -> _CacheT:
+        """Returns the instance of the file, creating it with the given arguments if needed."""
+        path = path.resolve()
+        with cls._instances_lock:
+            if path not in cls._instances:
+                logger.info(f"Using the {cls.__name__} in {path}")
+                cls._instances[path] = cls(path, *args, **kwargs)
+            return cls._instances[path]  # type: ignore[return-value]
+
+    def _delete_unused(self, table: str, max_age_seconds: float) -> int:
+        """Deletes the rows of a table with an `accessed_at` column that weren't used recently."""
+        with self._lock:
+            return self._conn.execute(
+                f"DELETE FROM {table} WHERE accessed_at < ?",
+                (time.time() - max_age_seconds,),
+            ).rowcount
+
+    def close(self) -> None:
+        with self._instances_lock:
+            self._instances.pop(self.path, None)
+        self._conn.close()
@@ -1,12 +1,20 @@
+import collections
 import concurrent.futures
-import contextlib
+import dataclasses
+import itertools
 import queue
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import (
     Any,
     Callable,
+    Deque,
+    Dict,
     Iterable,
     Iterator,
     Optional,
+    Set,
     Tuple,
     TypeVar,
 )
@@ -14,6 +22,117 @@ from typing import (
 T = TypeVar("T")
 
 
+@dataclass
+class ThreadedIteratorExecutorStats:
+    """Timing stats of the jobs run by ThreadedIteratorExecutor.
+
+    A single instance can be passed to multiple `process` calls, and is meant to be
+    embedded in a source report.
+    """
+
+    jobs_completed: int = 0
+    jobs_failed: int = 0
+    jobs_cancelled: int = 0
+    items_yielded: int = 0
+    # Wall time of the jobs, including time spent blocked on a slow consumer.
+    total_job_seconds: float = 0.0
+    max_job_seconds: float = 0.0
+    # Time the consumer spent waiting for the workers to produce items.
+    consumer_wait_seconds: float = 0.0
+    busy_seconds_per_worker: Dict[str, float] = field(default_factory=dict)
+
+    def as_obj(self) -> dict:
+        obj = dataclasses.asdict(self)
+        for key in ["total_job_seconds", "max_job_seconds", "consumer_wait_seconds"]:
+            obj[key] = round(obj[key], 3)
+        obj["busy_seconds_per_worker"] = {
+            worker: round(seconds, 3)
+            for worker, seconds in sorted(self.busy_seconds_per_worker.items())
+        }
+        return obj
+
+
+class _JobDone:
+    def __init__(self, worker: str, seconds: float) -> None:
+        self.worker = worker
+        self.seconds = seconds
+
+
+class _JobFailed(_JobDone):
+    def __init__(self, worker: str, seconds: float, exc: BaseException) -> None:
+        super().__init__(worker, seconds)
+        self.exc = exc
+
+
+class _Run:
+    """The state of a single ThreadedIteratorExecutor.process call."""
+
+    def __init__(
+        self,
+        worker_func: Callable[..., Iterable[Any]],
+        max_backpressure: int,
+        stats: ThreadedIteratorExecutorStats,
+    ) -> None:
+        self.worker_func = worker_func
+        self.stats = stats
+        # (job id, produced item or _JobDone)
+        self.out_q: "queue.Queue[Tuple[int, Any]]" = queue.Queue(
+            maxsize=max_backpressure
+        )
+        self.cancelled = threading.Event()
+        self.futures: Dict[int, "concurrent.futures.Future[None]"] = {}
+
+    def run_job(self, job_id: int, args: Tuple[Any, ...]) -> None:
+        start = time.perf_counter()
+        worker = threading.current_thread().name
+        done: _JobDone
+        try:
+            for item in self.worker_func(*args):
+                if self.cancelled.is_set():
+                    break
+                self.out_q.put((job_id, item))
+        except BaseException as e:
+            done = _JobFailed(worker, time.perf_counter() - start, e)
+        else:
+            done = _JobDone(worker, time.perf_counter() - start)
+        # Every started job ends with exactly one done message, which is what
+        # allows the consumer to block on the queue without polling.
+        self.out_q.put((job_id, done))
+
+    def receive(self) -> Tuple[int, Any]:
+        wait_start = time.perf_counter()
+        job_id, message = self.out_q.get()
+        self.stats.consumer_wait_seconds += time.perf_counter() - wait_start
+
+        if isinstance(message, _JobDone):
+            del self.futures[job_id]
+            stats = self.stats
+            stats.total_job_seconds += message.seconds
+            stats.max_job_seconds = max(stats.max_job_seconds, message.seconds)
+            stats.busy_seconds_per_worker[message.worker] = (
+                stats.busy_seconds_per_worker.get(message.worker, 0.0) + message.seconds
+            )
+            if isinstance(message, _JobFailed):
+                stats.jobs_failed += 1
+                raise message.exc
+            stats.jobs_completed += 1
+        return job_id, message
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+        for job_id, future in list(self.futures.items()):
+            if future.cancel():
+                self.stats.jobs_cancelled += 1
+                del self.futures[job_id]
+        # Drain the queue so that running jobs aren't stuck on a full queue,
+        # until each of them has sent its done message.
+        while self.futures:
+            job_id, message = self.out_q.get()
+            if isinstance(message, _JobDone):
+                del self.futures[job_id]
+                self.stats.jobs_cancelled += 1
+
+
 class ThreadedIteratorExecutor:
     """
     Executes worker functions of type `Callable[..., Iterable[T]]` in parallel threads,
@@ -27,37 +146,94 @@ class ThreadedIteratorExecutor:
         args_list: Iterable[Tuple[Any, ...]],
         max_workers: int,
         max_backpressure: Optional[int] = None,
+        max_pending_jobs: Optional[int] = None,
+        ordered: bool = False,
+        stats: Optional[ThreadedIteratorExecutorStats] = None,
     ) -> Iterator[T]:
+        """Runs `worker_func(*args)` for each args tuple and yields the produced items.
+
+        Args:
+            worker_func: A function that returns an iterable of items.
+            args_list: The arguments of each job. It is consumed lazily, as jobs are
+                submitted.
+            max_workers: The maximum number of threads to use.
+            max_backpressure: The maximum number of produced items that are waiting
+                to be consumed. Workers block once it's reached. Defaults to
+                10*max_workers.
+            max_pending_jobs: The maximum number of jobs submitted to the thread pool
+                at any time, including the running ones and, in ordered mode, the
+                finished ones whose items aren't yielded yet. Defaults to
+                2*max_workers.
+            ordered: If set, items are yielded in the order of args_list, and in the
+                order produced within each job. Items of later jobs are buffered
+                while an earlier job is running.
+            stats: If provided, job timing stats are accumulated into it.
+
+        If a job raises an exception, the outstanding jobs are cancelled and the
+        exception is raised to the consumer as soon as it's received. Jobs are also
+        cancelled if the consumer stops iterating early. Running jobs are stopped at
+        their next produced item.
+        """
         if max_backpressure is None:
             max_backpressure = 10 * max_workers
         assert max_backpressure >= max_workers
+        if max_pending_jobs is None:
+            max_pending_jobs = 2 * max_workers
+        assert max_pending_jobs >= max_workers
 
-        out_q: queue.Queue[T] = queue.Queue(maxsize=max_backpressure)
-
-        def _worker_wrapper(
-            worker_func: Callable[..., Iterable[T]], *args: Any
-        ) -> None:
-            for item in worker_func(*args):
-                out_q.put(item)
+        run = _Run(
+            worker_func, max_backpressure, stats or ThreadedIteratorExecutorStats()
+        )
+        args_iter = iter(args_list)
+        next_job_id = 0
+        # Only used in ordered mode.
+        next_ordered_job_id = 0
+        buffered: Dict[int, Deque[T]] = collections.defaultdict(collections.deque)
+        finished: Set[int] = set()
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = []
-            for args in args_list:
-                future = executor.submit(_worker_wrapper, worker_func, *args)
-                futures.append(future)
-            # Read from the queue and yield the work units until all futures are done.
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=cls.__name__
+        )
+        try:
             while True:
-                if not out_q.empty():
-                    while not out_q.empty():
-                        yield out_q.get_nowait()
-                else:
-                    with contextlib.suppress(queue.Empty):
-                        yield out_q.get(timeout=0.2)
+                # In ordered mode, jobs that finished while an earlier job is still
+                # running are pending too, until their buffered items are yielded.
+                pending_jobs = (
+                    next_job_id - next_ordered_job_id if ordered else len(run.futures)
+                )
+                for args in itertools.islice(
+                    args_iter, max_pending_jobs - pending_jobs
+                ):
+                    run.futures[next_job_id] = executor.submit(
+                        run.run_job, next_job_id, args
+                    )
+                    next_job_id += 1
 
-                # Filter out the done futures.
-                futures = [f for f in futures if not f.done()]
-                if not futures:
+                if not run.futures:
                     break
-        # Yield the remaining work units. This theoretically should not happen, but adding it just in case.
-        while not out_q.empty():
-            yield out_q.get_nowait()
+
+                job_id, message = run.receive()
+                if not ordered:
+                    if not isinstance(message, _JobDone):
+                        run.stats.items_yielded += 1
+                        yield message
+                    continue
+
+                if isinstance(message, _JobDone):
+                    finished.add(job_id)
+                else:
+                    buffered[job_id].append(message)
+                # Yield everything that's now at the head of the order.
+                while next_ordered_job_id < next_job_id:
+                    items = buffered.get(next_ordered_job_id)
+                    while items:
+                        run.stats.items_yielded += 1
+                        yield items.popleft()
+                    if next_ordered_job_id not in finished:
+                        break
+                    buffered.pop(next_ordered_job_id, None)
+                    finished.remove(next_ordered_job_id)
+                    next_ordered_job_id += 1
+        finally:
+            run.cancel()
+            executor.shutdown(wait=True)
@@ -253,6 +253,34 @@ def test_azure_ad_source_default_configs(pytestconfig, mock_datahub_graph, tmp_p
     )
 
 
+@freeze_time(FROZEN_TIME)
+def test_azure_ad_source_concurrent_group_members(
+    pytestconfig, mock_datahub_graph, tmp_path
+):
+    test_resources_dir: pathlib.Path = (
+        pytestconfig.rootpath / "tests/integration/azure_ad"
+    )
+
+    output_file_name = "azure_ad_mces_concurrent_group_members.json"
+    new_recipe = default_recipe(tmp_path, output_file_name)
+
+    new_recipe["source"]["config"]["max_workers"] = 3
+
+    run_ingest(
+        pytestconfig=pytestconfig,
+        mock_datahub_graph=mock_datahub_graph,
+        recipe=new_recipe,
+        mocked_functions_reference=mocked_functions,
+    )
+
+    # The group memberships are the same as when the groups are fetched one at a time.
+    mce_helpers.check_golden_file(
+        pytestconfig,
+        output_path=f"{tmp_path}/{output_file_name}",
+        golden_path=test_resources_dir / "azure_ad_mces_golden_default_config.json",
+    )
+
+
 @freeze_time(FROZEN_TIME)
 def test_azure_ad_source_empty_group_membership(
     pytestconfig, mock_datahub_graph, tmp_path
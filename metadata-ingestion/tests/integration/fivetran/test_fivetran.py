@@ -161,9 +161,21 @@ def default_query_results(
     raise Exception(f"Unknown query {query}")
 
 
+def batched_query_results(query):
+    # The queries of a batch with a single connector return the rows of all the
+    # connectors, which the source must only use for the connectors of the batch.
+    for connector in default_connector_query_results:
+        query = query.replace(
+            f"IN ('{connector['connector_id']}')",
+            "IN ('calendar_elected', 'my_confluent_cloud_connector_id')",
+        )
+    return default_query_results(query)
+
+
 @freeze_time(FROZEN_TIME)
 @pytest.mark.integration
-def test_fivetran_with_snowflake_dest(pytestconfig, tmp_path):
+@pytest.mark.parametrize("connector_batch_size", [100, 1])
+def test_fivetran_with_snowflake_dest(pytestconfig, tmp_path, connector_batch_size):
     test_resources_dir = pytestconfig.rootpath / "tests/integration/fivetran"
 
     # Run the metadata ingestion pipeline.
@@ -174,7 +186,7 @@ def test_fivetran_with_snowflake_dest(pytestconfig, tmp_path):
         "datahub.ingestion.source.fivetran.fivetran_log_api.create_engine"
     ) as mock_create_engine:
         connection_magic_mock = MagicMock()
-        connection_magic_mock.execute.side_effect = default_query_results
+        connection_magic_mock.execute.side_effect = batched_query_results
 
         mock_create_engine.return_value = connection_magic_mock
 
@@ -205,6 +217,7 @@ def test_fivetran_with_snowflake_dest(pytestconfig, tmp_path):
                                 "my_confluent_cloud_connector_id",
                             ]
                         },
+                        "connector_batch_size": connector_batch_size,
                         "sources_to_platform_instance": {
                             "calendar_elected": {
                                 "database": "postgres_db",
@@ -1,3 +1,4 @@
+import copy
 import json
 import pathlib
 from typing import Sequence
@@ -56,18 +57,21 @@ class MockResponse:
         return self
 
     def get(self, url, timeout=40):
+        # Like a requests.Session, return a new response, since the source may
+        # send requests from multiple threads.
+        response = copy.copy(self)
         base_url = url.split("?")[0]
         next_page = "page=2" in url
-        self.url = base_url
-        self.timeout = timeout
+        response.url = base_url
+        response.timeout = timeout
 
-        if self.error_list is not None and self.url in self.error_list:
+        if self.error_list is not None and response.url in self.error_list:
             http_error_msg = "{} Client Error: {} for url: {}".format(
                 400,
                 "Simulate error",
-                self.url,
+                response.url,
             )
-            raise HTTPError(http_error_msg, response=self)
+            raise HTTPError(http_error_msg, response=response)
 
         if next_page:
             with open(f"{test_resources_dir}/setup/final_page.json") as file:
@@ -78,15 +82,15 @@ class MockResponse:
                 if last_path in EMBEDDED_KEY_LOOKUP:
                     last_path = EMBEDDED_KEY_LOOKUP[last_path]
                 data["_embedded"][last_path] = []
-                self.json_data = data
+                response.json_data = data
         else:
             response_json_path = (
                 f"{test_resources_dir}/setup/{JSON_RESPONSE_MAP.get(base_url)}"
             )
             with open(response_json_path) as file:
                 data = json.loads(file.read())
-                self.json_data = data
-        return self
+                response.json_data = data
+        return response
 
     @property
     def text(self) -> str:
@@ -121,8 +125,9 @@ class MockResponseJson(MockResponse):
 
     def get(self, url, timeout=40):
         response = super().get(url, timeout)
-        if self.url in self.json_empty_list:
-            response.status_code = 204
+        if response.url in self.json_empty_list:
+            # The following responses are empty as well.
+            self.status_code = response.status_code = 204
         return response
 
 
@@ -135,7 +140,8 @@ def mocked_requests_failure(*args, **kwargs):
 
 
 @freeze_time(FROZEN_TIME)
-def test_mode_ingest_success(pytestconfig, tmp_path):
+@pytest.mark.parametrize("max_threads", [1, 4])
+def test_mode_ingest_success(pytestconfig, tmp_path, max_threads):
     with patch(
         "datahub.ingestion.source.mode.requests.Session",
         side_effect=mocked_requests_success,
@@ -150,6 +156,7 @@ def test_mode_ingest_success(pytestconfig, tmp_path):
                         "password": "xxxx",
                         "connect_uri": "https://app.mode.com/",
                         "workspace": "acryl",
+                        "max_threads": max_threads,
                     },
                 },
                 "sink": {
@@ -1240,3 +1240,104 @@ def test_mysql_odbc_regular_case():
         data_platform_tables[0].urn
         == "urn:li:dataset:(urn:li:dataPlatform:mysql,employees.employees,PROD)"
     )
+
+
+def _get_upstream_urns(
+    expression: str,
+    reporter: PowerBiDashboardSourceReport,
+    parse_cache: parser.MQueryParseCache,
+) -> List[str]:
+    table: powerbi_data_classes.Table = powerbi_data_classes.Table(
+        columns=[],
+        measures=[],
+        expression=expression,
+        name="virtual_order_table",
+        full_name="OrderDataSet.virtual_order_table",
+    )
+
+    ctx, config, platform_instance_resolver = get_default_instances()
+
+    return [
+        upstream.urn
+        for upstream in combine_upstreams_from_lineage(
+            parser.get_upstream_tables(
+                table,
+                reporter,
+                ctx=ctx,
+                config=config,
+                platform_instance_resolver=platform_instance_resolver,
+                parse_cache=parse_cache,
+            )
+        )
+    ]
+
+
+@pytest.mark.integration
+def test_m_query_parse_cache(tmp_path):
+    cache_file = tmp_path / "m_query_parse_cache.sqlite"
+    expected_urns = [
+        "urn:li:dataset:(urn:li:dataPlatform:mssql,library.dbo.book_issue,PROD)"
+    ]
+    reporter = PowerBiDashboardSourceReport()
+
+    with patch(
+        "datahub.ingestion.source.powerbi.m_query.parser._parse_normalized_expression",
+        wraps=parser._parse_normalized_expression,
+    ) as parse:
+        parse_cache = parser.MQueryParseCache(cache_file)
+        assert _get_upstream_urns(M_QUERIES[15], reporter, parse_cache) == (
+            expected_urns
+        )
+        # Identical once normalized
+        assert (
+            _get_upstream_urns(
+                M_QUERIES[15].replace(" ", "\u00a0"), reporter, parse_cache
+            )
+            == expected_urns
+        )
+        parse_cache.close()
+        assert parse.call_count == 1
+
+        # The parse tree is reused by the next run.
+        parse_cache = parser.MQueryParseCache(cache_file)
+        assert _get_upstream_urns(M_QUERIES[15], reporter, parse_cache) == (
+            expected_urns
+        )
+        parse_cache.close()
+        assert parse.call_count == 1
+
+    assert reporter.m_query_parse_attempts == 3
+    assert reporter.m_query_parse_cache_hits == 2
+
+
+@pytest.mark.integration
+def test_m_query_parse_ahead():
+    ctx, config, platform_instance_resolver = get_default_instances(
+        {"m_query_parse_processes": 2}
+    )
+    reporter = PowerBiDashboardSourceReport()
+    parse_cache = parser.MQueryParseCache()
+    tables = [
+        powerbi_data_classes.Table(
+            name=f"table_{i}", full_name=f"dataset.table_{i}", expression=expression
+        )
+        for i, expression in enumerate(
+            [M_QUERIES[15], M_QUERIES[14], M_QUERIES[15], "LOAD_DATA(SOURCE)"]
+        )
+    ]
+
+    parser.parse_ahead(tables, parse_cache, reporter, config)
+    # Duplicates and expressions without a data access function aren't parsed.
+    assert reporter.m_query_parse_pool_expressions == 2
+
+    with patch(
+        "datahub.ingestion.source.powerbi.m_query.parser._parse_normalized_expression"
+    ) as parse:
+        assert _get_upstream_urns(M_QUERIES[15], reporter, parse_cache) == [
+            "urn:li:dataset:(urn:li:dataPlatform:mssql,library.dbo.book_issue,PROD)"
+        ]
+        assert _get_upstream_urns(M_QUERIES[14], reporter, parse_cache) == [
+            "urn:li:dataset:(urn:li:dataPlatform:oracle,salesdb.hr.employees,PROD)"
+        ]
+        assert parse.call_count == 0
+    parse_cache.close()
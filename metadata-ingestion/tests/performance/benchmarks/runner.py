@@ -0,0 +1,245 @@
+"""
+Runs the ingestion benchmarks, records their throughput and peak memory usage to JSON,
+and fails if they regressed compared to a baseline.
+
+    # Compare against the committed baseline
+    python -m tests.performance.benchmarks
+
+    # Record the results of a subset of the benchmarks
+    python -m tests.performance.benchmarks -b file_sink -b file_source --output results.json
+
+    # Update the committed baseline, e.g. after an intended change
+    python -m tests.performance.benchmarks --update-baseline
+
+Each benchmark runs in a fresh process, so that its peak memory usage isn't affected by
+the other benchmarks. Throughput varies between machines, so the baseline should be
+recorded on the machine that is used for the comparison.
+"""
+
+import json
+import logging
+import pathlib
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence
+
+import click
+
+from datahub.utilities.perf_timer import PerfTimer
+from tests.performance.benchmarks.suite import BENCHMARKS
+
+logger = logging.getLogger(__name__)
+
+BASELINE_PATH = pathlib.Path(__file__).parent / "baseline.json"
+
+# The directory that contains the `tests` package.
+_ROOT_DIR = pathlib.Path(__file__).parents[3]
+
+
+def _peak_rss_mb() -> float:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, and in kilobytes elsewhere.
+    if sys.platform == "darwin":
+        return max_rss / 1024 / 1024
+    return max_rss / 1024
+
+
+def run_benchmark(name: str, scale: float) -> Dict[str, Any]:
+    """Runs a benchmark in this process."""
+    num_items = max(1, int(BENCHMARKS[name].num_items * scale))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        run = BENCHMARKS[name].setup(num_items, pathlib.Path(tmp_dir))
+        with PerfTimer() as timer:
+            run()
+        seconds = timer.elapsed_seconds()
+
+    return {
+        "num_items": num_items,
+        "seconds": round(seconds, 3),
+        "items_per_second": round(num_items / seconds, 1),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def _run_benchmark_in_subprocess(name: str, scale: float) -> Dict[str, Any]:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "tests.performance.benchmarks",
+            "--in-process",
+            name,
+            "--scale",
+            str(scale),
+        ],
+        cwd=_ROOT_DIR,
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_benchmarks(
+    names: Sequence[str], scale: float, repeat: int
+) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for name in names:
+        runs = [_run_benchmark_in_subprocess(name, scale) for _ in range(repeat)]
+        # The noise of both metrics is mostly additive, so keep the best run of each.
+        best = min(runs, key=lambda run: run["seconds"])
+        best["peak_rss_mb"] = min(run["peak_rss_mb"] for run in runs)
+        results[name] = best
+        logger.info(f"{name}: {best}")
+    return results
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    max_slowdown: float,
+    max_memory_increase: float,
+) -> List[str]:
+    """Compares the results to the baseline, and returns a description of each regression."""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            logger.warning(f"No baseline for {name}")
+            continue
+        if expected["num_items"] != result["num_items"]:
+            regressions.append(
+                f"{name}: ran with {result['num_items']} items, "
+                f"but the baseline has {expected['num_items']}"
+            )
+            continue
+
+        min_throughput = expected["items_per_second"] * (1 - max_slowdown)
+        if result["items_per_second"] < min_throughput:
+            regressions.append(
+                f"{name}: {result['items_per_second']} items/s, "
+                f"baseline {expected['items_per_second']} items/s"
+            )
+        max_rss = expected["peak_rss_mb"] * (1 + max_memory_increase)
+        if result["peak_rss_mb"] > max_rss:
+            regressions.append(
+                f"{name}: peak RSS {result['peak_rss_mb']} MB, "
+                f"baseline {expected['peak_rss_mb']} MB"
+            )
+    return regressions
+
+
+@click.command()
+@click.option(
+    "-b",
+    "--benchmark",
+    "names",
+    multiple=True,
+    type=click.Choice(sorted(BENCHMARKS)),
+    help="Benchmarks to run. Defaults to all of them.",
+)
+@click.option(
+    "--scale",
+    type=float,
+    default=1.0,
+    show_default=True,
+    help="Multiplier of the number of items processed by each benchmark. "
+    "Results are only comparable at the same scale.",
+)
+@click.option(
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=3,
+    show_default=True,
+    help="Number of runs of each benchmark. The best one is kept.",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    help="File to write the results to.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    default=BASELINE_PATH,
+    show_default=True,
+)
+@click.option(
+    "--max-slowdown",
+    type=float,
+    default=0.25,
+    show_default=True,
+    help="Fail if the throughput of a benchmark is lower than the baseline by more than this fraction.",
+)
+@click.option(
+    "--max-memory-increase",
+    type=float,
+    default=0.25,
+    show_default=True,
+    help="Fail if the peak RSS of a benchmark is higher than the baseline by more than this fraction.",
+)
+@click.option(
+    "--update-baseline",
+    is_flag=True,
+    help="Write the results to the baseline file, instead of comparing them to it.",
+)
+@click.option(
+    "--in-process", hidden=True, help="Run a single benchmark in this process."
+)
+def main(
+    names: Sequence[str],
+    scale: float,
+    repeat: int,
+    output: Optional[pathlib.Path],
+    baseline: pathlib.Path,
+    max_slowdown: float,
+    max_memory_increase: float,
+    update_baseline: bool,
+    in_process: Optional[str],
+) -> None:
+    if in_process:
+        click.echo(json.dumps(run_benchmark(in_process, scale)))
+        return
+
+    logging.basicConfig(level=logging.INFO)
+    expected = None
+    if not update_baseline:
+        expected = json.loads(baseline.read_text())
+        if expected["scale"] != scale:
+            raise click.UsageError(
+                f"The baseline was recorded at scale {expected['scale']}, not {scale}"
+            )
+
+    results: Dict[str, Any] = {
+        "scale": scale,
+        "python_version": platform.python_version(),
+        "benchmarks": run_benchmarks(names or sorted(BENCHMARKS), scale, repeat),
+    }
+    if output:
+        output.write_text(json.dumps(results, indent=2) + "\n")
+
+    if expected is None:
+        if baseline.exists() and names:
+            # Only replace the results of the benchmarks that were run.
+            previous = json.loads(baseline.read_text())
+            results["benchmarks"] = {
+                **previous["benchmarks"],
+                **results["benchmarks"],
+            }
+        baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        logger.info(f"Wrote baseline to {baseline}")
+        return
+
+    regressions = find_regressions(
+        results["benchmarks"],
+        expected["benchmarks"],
+        max_slowdown=max_slowdown,
+        max_memory_increase=max_memory_increase,
+    )
+    if regressions:
+        click.echo("Performance regressions:\n" + "\n".join(regressions), err=True)
+        sys.exit(1)
+    click.echo("No performance regressions")
@@ -0,0 +1,90 @@
+import json
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+_SERVER_CONFIG = {
+    "noCode": "true",
+    "versions": {"acryldata/datahub": {"version": "v1.0.0"}},
+}
+
+
+@dataclass
+class StubGmsStats:
+    requests: int = 0
+    bytes_received: int = 0
+
+
+class _StubGmsHandler(BaseHTTPRequestHandler):
+    server: "_StubGmsServer"
+
+    def _respond(self, body: Any) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/config"):
+            self._respond(_SERVER_CONFIG)
+        else:
+            self.send_error(404)
+
+    def do_POST(self) -> None:
+        # The payload isn't parsed, so that the benchmark measures the client.
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        with self.server.stats_lock:
+            self.server.stats.requests += 1
+            self.server.stats.bytes_received += length
+        self._respond({"value": []})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _StubGmsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StubGmsHandler)
+        self.stats = StubGmsStats()
+        self.stats_lock = threading.Lock()
+
+
+class StubGms:
+    """A local HTTP server that accepts everything that DataHubRestEmitter sends, without storing it.
+
+    Usage:
+        with StubGms() as gms:
+            emitter = DataHubRestEmitter(gms.url)
+    """
+
+    def __init__(self) -> None:
+        self._server = _StubGmsServer()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def stats(self) -> StubGmsStats:
+        return self._server.stats
+
+    def __enter__(self) -> "StubGms":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stub-gms", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,300 @@
+"""
+Benchmarks of the hot paths of ingestion.
+
+Each benchmark has a setup function, which generates the test data for a given number of items and returns
+the function that is timed by the runner. The data is generated with a fixed seed, so that runs are comparable.
+"""
+
+import pathlib
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List
+
+from datahub.emitter.mce_builder import make_data_platform_urn, make_dataset_urn
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.rest_emitter import DataHubRestEmitter
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import NoopWriteCallback
+from datahub.ingestion.api.source import Source, SourceReport
+from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.sink.file import FileSink
+from datahub.ingestion.source.file import FileSourceConfig, GenericFileSource
+from datahub.metadata.schema_classes import (
+    DatasetPropertiesClass,
+    OtherSchemaClass,
+    SchemaFieldClass,
+    SchemaFieldDataTypeClass,
+    SchemaMetadataClass,
+    StringTypeClass,
+)
+from datahub.sql_parsing.schema_resolver import SchemaResolver
+from datahub.sql_parsing.sql_parsing_aggregator import (
+    ObservedQuery,
+    SqlParsingAggregator,
+)
+from datahub.utilities.file_backed_collections import FileBackedDict
+from tests.performance.benchmarks.stub_gms import StubGms
+from tests.performance.data_generation import NormalDistribution, generate_data
+from tests.performance.data_model import Table
+
+PLATFORM = "snowflake"
+SEED = 0
+
+# Prepares a benchmark for a number of items, given a temporary directory, and returns the function to time.
+BenchmarkSetup = Callable[[int, pathlib.Path], Callable[[], None]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    description: str
+    # Number of items processed at scale 1.0
+    num_items: int
+    setup: BenchmarkSetup
+
+
+def _generate_tables(num_tables: int) -> List[Table]:
+    random.seed(SEED)
+    return generate_data(
+        num_containers=[1, 10],
+        num_tables=num_tables,
+        num_views=0,
+        columns_per_table=NormalDistribution(20, 10),
+    ).tables
+
+
+def _table_name(table: Table) -> str:
+    return ".".join(table.name_components)
+
+
+def _generate_mcps(num_mcps: int) -> List[MetadataChangeProposalWrapper]:
+    """Dataset properties and schema metadata aspects, for distinct datasets."""
+    tables = _generate_tables(min(num_mcps // 2 + 1, 1000))
+    mcps: List[MetadataChangeProposalWrapper] = []
+    for i in range(0, num_mcps, 2):
+        table = tables[(i // 2) % len(tables)]
+        name = f"{_table_name(table)}_{i // 2}"
+        urn = make_dataset_urn(PLATFORM, name)
+        mcps.append(
+            MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=DatasetPropertiesClass(
+                    name=table.name,
+                    qualifiedName=name,
+                    customProperties={"container": table.container.name},
+                ),
+            )
+        )
+        mcps.append(
+            MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=SchemaMetadataClass(
+                    schemaName=name,
+                    platform=make_data_platform_urn(PLATFORM),
+                    version=0,
+                    hash="",
+                    platformSchema=OtherSchemaClass(rawSchema=""),
+                    fields=[
+                        SchemaFieldClass(
+                            fieldPath=column.name,
+                            type=SchemaFieldDataTypeClass(type=StringTypeClass()),
+                            nativeDataType=column.type.value,
+                            nullable=column.nullable,
+                        )
+                        for column in table.columns.values()
+                    ],
+                ),
+            )
+        )
+    return mcps[:num_mcps]
+
+
+def _generate_queries(tables: List[Table], num_queries: int) -> List[str]:
+    rng = random.Random(SEED)
+    queries = []
+    for i in range(num_queries):
+        downstream, *upstreams = rng.sample(tables, k=rng.randint(2, 4))
+        select_list = ", ".join(
+            f"u{j}.{column} AS {column}_{j}"
+            for j, upstream in enumerate(upstreams)
+            for column in rng.sample(
+                list(upstream.columns), k=min(5, len(upstream.columns))
+            )
+        )
+        joins = " ".join(
+            f"JOIN {_table_name(upstream)} AS u{j} ON u0.id = u{j}.id"
+            for j, upstream in enumerate(upstreams[1:], start=1)
+        )
+        queries.append(
+            f"INSERT INTO {_table_name(downstream)} "
+            f"SELECT {select_list} FROM {_table_name(upstreams[0])} AS u0 {joins} "
+            f"WHERE u0.id > {i}"
+        )
+    return queries
+
+
+def sql_parsing_aggregator(
+    num_items: int, tmp_path: pathlib.Path
+) -> Callable[[], None]:
+    tables = _generate_tables(500)
+    queries = _generate_queries(tables, num_items)
+
+    schema_resolver = SchemaResolver(platform=PLATFORM)
+    for table in tables:
+        schema_resolver.add_raw_schema_info(
+            make_dataset_urn(PLATFORM, _table_name(table)),
+            {column.name: column.type.value for column in table.columns.values()},
+        )
+    aggregator = SqlParsingAggregator(
+        platform=PLATFORM,
+        schema_resolver=schema_resolver,
+        generate_lineage=True,
+        generate_queries=True,
+        generate_usage_statistics=False,
+        format_queries=False,
+    )
+
+    def run() -> None:
+        for query in queries:
+            aggregator.add_observed_query(ObservedQuery(query=query))
+        for _ in aggregator.gen_metadata():
+            pass
+        aggregator.close()
+
+    return run
+
+
+def rest_emitter(num_items: int, tmp_path: pathlib.Path) -> Callable[[], None]:
+    mcps = _generate_mcps(num_items)
+    batch_size = 100
+
+    def run() -> None:
+        with StubGms() as gms:
+            emitter = DataHubRestEmitter(gms.url, openapi_ingestion=False)
+            emitter.test_connection()
+            for i in range(0, len(mcps), batch_size):
+                emitter.emit_mcps(mcps[i : i + batch_size])
+            emitter.close()
+            assert gms.stats.requests >= len(mcps) // batch_size
+
+    return run
+
+
+def _write_file(
+    path: pathlib.Path, mcps: Iterable[MetadataChangeProposalWrapper]
+) -> None:
+    sink = FileSink.create({"filename": str(path)}, PipelineContext(run_id="benchmark"))
+    callback = NoopWriteCallback()
+    for mcp in mcps:
+        sink.write_record_async(RecordEnvelope(mcp, metadata={}), callback)
+    sink.close()
+
+
+def file_sink(num_items: int, tmp_path: pathlib.Path) -> Callable[[], None]:
+    mcps = _generate_mcps(num_items)
+
+    def run() -> None:
+        _write_file(tmp_path / "mcps.json", mcps)
+
+    return run
+
+
+def file_source(num_items: int, tmp_path: pathlib.Path) -> Callable[[], None]:
+    path = tmp_path / "mcps.json"
+    _write_file(path, _generate_mcps(num_items))
+
+    def run() -> None:
+        source = GenericFileSource(
+            PipelineContext(run_id="benchmark"), FileSourceConfig(path=str(path))
+        )
+        num_workunits = sum(1 for _ in source.get_workunits_internal())
+        assert num_workunits == num_items, num_workunits
+        source.close()
+
+    return run
+
+
+class _GeneratedSource(Source):
+    def __init__(self, ctx: PipelineContext, workunits: List[MetadataWorkUnit]):
+        super().__init__(ctx)
+        self.report = SourceReport()
+        self.workunits = workunits
+
+    def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
+        return self.workunits
+
+    def get_report(self) -> SourceReport:
+        return self.report
+
+
+def workunit_processors(num_items: int, tmp_path: pathlib.Path) -> Callable[[], None]:
+    source = _GeneratedSource(
+        PipelineContext(run_id="benchmark"),
+        [mcp.as_workunit() for mcp in _generate_mcps(num_items)],
+    )
+
+    def run() -> None:
+        # Runs the default workunit processors of all sources.
+        for _ in source.get_workunits():
+            pass
+
+    return run
+
+
+def file_backed_dict(num_items: int, tmp_path: pathlib.Path) -> Callable[[], None]:
+    rng = random.Random(SEED)
+    values: Dict[str, Dict[str, Any]] = {
+        f"urn:li:dataset:(urn:li:dataPlatform:{PLATFORM},db.schema.table_{i},PROD)": {
+            "upstreams": [rng.randrange(num_items) for _ in range(rng.randint(0, 10))],
+            "count": i,
+        }
+        for i in range(num_items)
+    }
+    lookups = rng.choices(list(values), k=num_items)
+
+    def run() -> None:
+        # Larger than the in-memory cache, so that items are spilled to and read from sqlite.
+        with FileBackedDict[dict]() as cache:
+            for key, value in values.items():
+                cache[key] = value
+            for key in lookups:
+                value = cache[key]
+                value["count"] += 1
+                cache[key] = value
+            for _ in cache.items():
+                pass
+
+    return run
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "sql_parsing_aggregator": Benchmark(
+        "SqlParsingAggregator lineage and queries from INSERT statements",
+        num_items=500,
+        setup=sql_parsing_aggregator,
+    ),
+    "rest_emitter": Benchmark(
+        "DataHubRestEmitter batches sent to a local stub GMS",
+        num_items=10_000,
+        setup=rest_emitter,
+    ),
+    "file_sink": Benchmark(
+        "File sink writes",
+        num_items=10_000,
+        setup=file_sink,
+    ),
+    "file_source": Benchmark(
+        "File source reads",
+        num_items=10_000,
+        setup=file_source,
+    ),
+    "workunit_processors": Benchmark(
+        "Default workunit processors of sources",
+        num_items=10_000,
+        setup=workunit_processors,
+    ),
+    "file_backed_dict": Benchmark(
+        "FileBackedDict writes, random reads and updates, and iteration",
+        num_items=50_000,
+        setup=file_backed_dict,
+    ),
+}
@@ -17,6 +17,9 @@ from tests.performance.data_generation import (
 from tests.performance.databricks.unity_proxy_mock import UnityCatalogApiProxyMock
 from tests.performance.helpers import workunit_sink
 
+# Latency of the table lineage API, which is called for each table.
+API_LATENCY_SECONDS = 0.01
+
 
 def run_test():
     seed_metadata = generate_data(
@@ -35,15 +38,26 @@ def run_test():
         num_users=1000,
     )
     proxy_mock = UnityCatalogApiProxyMock(
-        seed_metadata, queries=queries, num_service_principals=10000
+        seed_metadata,
+        queries=queries,
+        num_service_principals=10000,
+        api_latency_seconds=API_LATENCY_SECONDS,
     )
     print("Data generated")
 
+    # Sequential, then with the default concurrency
+    run_source(proxy_mock, table_max_workers=1, schema_max_workers=1)
+    run_source(proxy_mock)
+
+
+def run_source(proxy_mock: UnityCatalogApiProxyMock, **config_overrides: int) -> None:
+    print(f"Running with {config_overrides or 'default config'}")
     config = UnityCatalogSourceConfig(
         token="",
         workspace_url="http://localhost:1234",
         include_usage_statistics=True,
         include_hive_metastore=False,
+        **config_overrides,
     )
     ctx = PipelineContext(run_id="test")
     with patch(
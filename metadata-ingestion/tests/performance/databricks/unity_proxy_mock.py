@@ -1,3 +1,4 @@
+import time
 import uuid
 from collections import defaultdict
 from datetime import datetime, timezone
@@ -6,6 +7,7 @@ from typing import Dict, Iterable, List, Optional
 from databricks.sdk.service.catalog import ColumnTypeName
 from databricks.sdk.service.sql import QueryStatementType
 
+from datahub.api.entities.external.unity_catalog_external_entites import UnityCatalogTag
 from datahub.ingestion.source.unity.proxy_types import (
     Catalog,
     CatalogType,
@@ -30,10 +32,13 @@ class UnityCatalogApiProxyMock:
         seed_metadata: SeedMetadata,
         queries: Iterable[data_model.Query] = (),
         num_service_principals: int = 0,
+        api_latency_seconds: float = 0.0,
     ) -> None:
         self.seed_metadata = seed_metadata
         self.queries = queries
         self.num_service_principals = num_service_principals
+        # Simulated latency of the table lineage API
+        self.api_latency_seconds = api_latency_seconds
         self.warehouse_id = "invalid-warehouse-id"
 
         # Cache for performance
@@ -155,10 +160,37 @@ class UnityCatalogApiProxyMock:
                 executed_as_user_name=None,
             )
 
+    def get_catalog_tags(self, catalog: str) -> Dict[str, List[UnityCatalogTag]]:
+        return {}
+
+    def get_schema_tags(self, catalog: str) -> Dict[str, List[UnityCatalogTag]]:
+        return {}
+
+    def get_table_tags(self, catalog: str) -> Dict[str, List[UnityCatalogTag]]:
+        return {}
+
+    def get_column_tags(self, catalog: str) -> Dict[str, List[UnityCatalogTag]]:
+        return {}
+
+    def get_catalog_table_lineage(
+        self, catalog: str, include_entity_lineage: bool
+    ) -> None:
+        # Not available, so that lineage is fetched per table
+        return None
+
+    def get_catalog_column_lineage(self, catalog: str) -> Dict[str, Dict[str, dict]]:
+        return {}
+
     def table_lineage(self, table: Table, include_entity_lineage: bool) -> None:
-        pass
+        time.sleep(self.api_latency_seconds)
 
-    def get_column_lineage(self, table: Table) -> None:
+    def get_column_lineage(
+        self,
+        table: Table,
+        column_names: List[str],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> None:
         pass
 
 
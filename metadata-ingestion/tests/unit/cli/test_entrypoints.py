@@ -0,0 +1,69 @@
+import json
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from datahub.entrypoints import _LAZY_COMMANDS, datahub
+
+# Modules that must not be imported just to list the available commands. They
+# make up most of the startup time, which is too noisy to be asserted on.
+HEAVY_MODULES = [
+    "datahub.metadata.schema_classes",
+    "datahub.ingestion.graph.client",
+    "datahub.ingestion.run.pipeline",
+    "pydantic",
+]
+
+_HELP_SCRIPT = f"""
+import json
+import sys
+
+from datahub.entrypoints import main
+
+try:
+    main(args=["--help"])
+except SystemExit:
+    pass
+print(
+    json.dumps(
+        {{"heavy_modules": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}
+    ),
+    file=sys.stderr,
+)
+"""
+
+
+def test_help_does_not_import_subcommands() -> None:
+    result = subprocess.run(
+        [sys.executable, "-c", _HELP_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "Commands:" in result.stdout
+    stats = json.loads(result.stderr.strip().splitlines()[-1])
+
+    assert stats["heavy_modules"] == []
+
+
+@pytest.mark.parametrize("name", sorted(_LAZY_COMMANDS))
+def test_lazy_command_help_matches(name: str) -> None:
+    command = datahub.get_command(click.Context(datahub), name)
+    assert command is not None
+    if command.help == "<disabled due to missing dependencies>":
+        pytest.skip(f"{name} command dependencies are not installed")
+
+    lazy_help = click.Command(name, help=_LAZY_COMMANDS[name].help)
+    assert command.get_short_help_str(limit=1000) == lazy_help.get_short_help_str(
+        limit=1000
+    )
+
+
+def test_lazy_command_invocation() -> None:
+    result = CliRunner().invoke(datahub, ["telemetry", "--help"])
+
+    assert result.exit_code == 0, result.output
+    assert "Toggle telemetry." in result.output
@@ -1,5 +1,7 @@
+import io
+import pickle
 import tempfile
-from typing import List, Type
+from typing import Any, Dict, List, Optional, Type
 
 import pandas as pd
 import ujson
@@ -9,9 +11,15 @@ from avro.io import DatumWriter
 
 from datahub.ingestion.source.schema_inference import csv_tsv, json, parquet
 from datahub.ingestion.source.schema_inference.avro import AvroInferrer
+from datahub.ingestion.source.schema_inference.object import (
+    PartialSchema,
+    construct_schema,
+    is_nullable_collection,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     BooleanTypeClass,
     NumberTypeClass,
+    RecordTypeClass,
     SchemaField,
     StringTypeClass,
 )
@@ -98,6 +106,54 @@ def test_infer_schema_json():
         assert_field_types_match(fields, expected_field_types)
 
 
+class _CountingBytesIO(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        n = super().readinto(buffer)
+        self.bytes_read += n
+        return n
+
+
+def test_infer_schema_json_reads_only_max_rows():
+    records = [{"integer_field": 1, "string_field": "a"}] * 2 + [
+        {"integer_field": i, "string_field": "b", "late_field": True}
+        for i in range(100_000)
+    ]
+    file = _CountingBytesIO(ujson.dumps(records).encode())
+
+    fields = json.JsonInferrer(max_rows=2).infer_schema(file)
+
+    assert_field_paths_match(fields, ["integer_field", "string_field"])
+    assert file.bytes_read < len(file.getvalue()) / 10
+
+
+def test_infer_schema_json_values():
+    single_object = b'{"integer_field": 1, "nested": {"float_field": 1.5}}'
+    fields = json.JsonInferrer().infer_schema(io.BytesIO(single_object))
+    assert_field_paths_match(fields, ["integer_field", "nested.float_field", "nested"])
+    assert_field_types_match(
+        fields, [NumberTypeClass, NumberTypeClass, RecordTypeClass]
+    )
+
+    json_lines = b'{"integer_field": 1}\n{"string_field": "a"}\n{"other_field": 1}\n'
+    fields = json.JsonInferrer(max_rows=2).infer_schema(io.BytesIO(json_lines))
+    assert_field_paths_match(fields, ["integer_field", "string_field"])
+
+
+def test_infer_schema_json_falls_back_to_jsonlines():
+    json_lines = b'{"integer_field": 1}\nnot json\n{"string_field": "a"}\n'
+    fields = json.JsonInferrer().infer_schema(io.BytesIO(json_lines))
+    assert_field_paths_match(fields, ["integer_field", "string_field"])
+
+
 def test_infer_schema_parquet():
     with tempfile.TemporaryFile(mode="w+b") as file:
         test_table.to_parquet(file)
@@ -135,3 +191,48 @@ def test_infer_schema_avro():
 
         assert_field_paths_match(fields, expected_field_paths_avro)
         assert_field_types_match(fields, expected_field_types)
+
+
+test_documents: List[Dict[str, Any]] = [
+    {"a": 1, "b": {"c": "x", "d": None}, "e": [{"f": 1, "g": 2}, {"f": 2}]},
+    {"a": 2.5, "b": {"c": "y"}, "e": [1, 2]},
+    {"a": None, "b": {"c": "z", "d": True}, "e": [{"f": 3}], "h": []},
+]
+
+
+def test_construct_schema_single_pass():
+    # A generator can only be consumed once.
+    schema = construct_schema((doc for doc in test_documents), delimiter=".")
+
+    assert list(schema.keys()) == [
+        ("a",),
+        ("b", "c"),
+        ("b",),
+        ("e", "f"),
+        ("e", "g"),
+        ("e",),
+        ("b", "d"),
+        ("h",),
+    ]
+    assert schema[("a",)]["type"] is float
+    assert schema[("b", "d")]["count"] == 1
+    assert schema[("e", "f")]["count"] == 3
+    assert schema[("e",)]["type"] is list
+    assert schema[("e", "g")]["delimited_name"] == "e.g"
+    for field_path, description in schema.items():
+        assert description["nullable"] == is_nullable_collection(
+            test_documents, field_path
+        ), field_path
+
+
+def test_partial_schemas_merge():
+    expected = construct_schema(test_documents, delimiter=".")
+
+    first = PartialSchema().add_documents(test_documents[:1])
+    second = PartialSchema().add_documents(test_documents[1:])
+    # Partial schemas can be shipped across process boundaries.
+    second = pickle.loads(pickle.dumps(second))
+
+    merged = first.merge(second)
+    assert merged.document_count == len(test_documents)
+    assert merged.to_schema(delimiter=".") == expected
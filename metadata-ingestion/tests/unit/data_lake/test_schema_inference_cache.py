@@ -0,0 +1,110 @@
+import pathlib
+import time
+from unittest.mock import patch
+
+from datahub.ingestion.source.data_lake_common.schema_inference_cache import (
+    SchemaInferenceCache,
+    SchemaInferenceCacheConfig,
+)
+from datahub.ingestion.source.schema_inference import csv_tsv, json
+from datahub.metadata.schema_classes import (
+    NumberTypeClass,
+    SchemaFieldClass,
+    SchemaFieldDataTypeClass,
+)
+
+URI = "s3://my-bucket/data/table/part-0.csv"
+
+FIELDS = [
+    SchemaFieldClass(
+        fieldPath="id",
+        type=SchemaFieldDataTypeClass(NumberTypeClass()),
+        nativeDataType="integer",
+    )
+]
+
+
+def _cache(tmp_path: pathlib.Path, **config: object) -> SchemaInferenceCache:
+    cache = SchemaInferenceCache.for_config(
+        SchemaInferenceCacheConfig.parse_obj(
+            {"enabled": True, "path": tmp_path / "cache.sqlite", **config}
+        ),
+        platform="s3",
+    )
+    assert cache is not None
+    return cache
+
+
+def test_disabled_by_default():
+    assert SchemaInferenceCache.for_config(SchemaInferenceCacheConfig(), "s3") is None
+
+
+def test_schemas_are_persisted(tmp_path):
+    cache = _cache(tmp_path)
+    key = cache.make_key(URI, '"etag-1"', csv_tsv.CsvInferrer(max_rows=100))
+    assert cache.get(key) is None
+    cache.put(key, FIELDS)
+    assert cache.get(key) == FIELDS
+    cache.close()
+
+    cache = _cache(tmp_path)
+    assert cache.get(key) == FIELDS
+    assert cache.stats.hits == 1
+    cache.close()
+
+
+def test_key_depends_on_etag_and_inferrer_settings():
+    keys = {
+        SchemaInferenceCache.make_key(URI, '"etag-1"', csv_tsv.CsvInferrer(100)),
+        SchemaInferenceCache.make_key(URI, '"etag-2"', csv_tsv.CsvInferrer(100)),
+        SchemaInferenceCache.make_key(URI, '"etag-1"', csv_tsv.CsvInferrer(1000)),
+        SchemaInferenceCache.make_key(URI, '"etag-1"', csv_tsv.TsvInferrer(100)),
+        SchemaInferenceCache.make_key(
+            f"{URI}.bak", '"etag-1"', csv_tsv.CsvInferrer(100)
+        ),
+        SchemaInferenceCache.make_key(
+            URI, '"etag-1"', json.JsonInferrer(max_rows=100, format="jsonl")
+        ),
+    }
+    assert len(keys) == 6
+    assert (
+        SchemaInferenceCache.make_key(URI, '"etag-1"', csv_tsv.CsvInferrer(100)) in keys
+    )
+
+
+def test_previous_versions_are_replaced(tmp_path):
+    cache = _cache(tmp_path)
+    inferrer = csv_tsv.CsvInferrer(max_rows=100)
+    old_key = cache.make_key(URI, '"etag-1"', inferrer)
+    new_key = cache.make_key(URI, '"etag-2"', inferrer)
+    cache.put(old_key, FIELDS)
+    cache.put(new_key, [])
+
+    assert cache.get(old_key) is None
+    assert cache.get(new_key) == []
+    cache.close()
+
+
+def test_schemas_of_other_inferrers_are_kept(tmp_path):
+    cache = _cache(tmp_path)
+    sample_key = cache.make_key(URI, '"etag-1"', csv_tsv.CsvInferrer(max_rows=100))
+    full_key = cache.make_key(URI, '"etag-1"', csv_tsv.CsvInferrer(max_rows=1000))
+    cache.put(sample_key, FIELDS)
+    cache.put(full_key, [])
+
+    assert cache.get(sample_key) == FIELDS
+    assert cache.get(full_key) == []
+    cache.close()
+
+
+def test_unused_schemas_expire(tmp_path):
+    cache = _cache(tmp_path, max_age_days=7)
+    key = cache.make_key(URI, '"etag-1"', csv_tsv.CsvInferrer(max_rows=100))
+    cache.put(key, FIELDS)
+    cache.close()
+
+    with patch("time.time", return_value=time.time() + 8 * 24 * 60 * 60):
+        cache = _cache(tmp_path, max_age_days=7)
+    assert cache.stats.expired == 1
+    assert cache.get(key) is None
+    cache.close()
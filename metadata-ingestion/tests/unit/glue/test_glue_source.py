@@ -1,7 +1,8 @@
 import json
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Type, cast
-from unittest.mock import patch
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Type, cast
+from unittest.mock import MagicMock, patch
 
 import pydantic
 import pytest
@@ -853,6 +854,35 @@ def test_glue_ingest_with_lake_formation_tag_extraction(
             ]
         }
 
+    # Mock the search of the tables by LF tag. The tags of the tables include the
+    # ones inherited from their database.
+    def mock_get_paginator(operation_name):
+        assert operation_name == "search_tables_by_lf_tags"
+        database_tags = mock_get_resource_lf_tags(Resource={"Database": {}})[
+            "LFTagOnDatabase"
+        ]
+        table_list = [
+            {
+                "Table": {
+                    "CatalogId": "123412341234",
+                    "DatabaseName": "flights-database",
+                    "Name": "avro",
+                },
+                "LFTagOnDatabase": database_tags,
+                "LFTagsOnTable": database_tags
+                + mock_get_resource_lf_tags(Resource={"Table": {"Name": "avro"}})[
+                    "LFTagsOnTable"
+                ],
+            }
+        ]
+        paginator = MagicMock()
+        paginator.paginate.side_effect = lambda CatalogId, Expression: [
+            {
+                "TableList": table_list if CatalogId == "123412341234" else [],
+            }
+        ]
+        return paginator
+
     # Mock PlatformResourceRepository.search_by_filter to return empty list
     def mock_search_by_filter(*args, **kwargs):
         return []
@@ -872,6 +902,11 @@ def test_glue_ingest_with_lake_formation_tag_extraction(
             "list_lf_tags",
             side_effect=mock_list_lf_tags,
         ),
+        patch.object(
+            glue_source_instance.lf_client,
+            "get_paginator",
+            side_effect=mock_get_paginator,
+        ),
         Stubber(glue_source_instance.glue_client) as glue_stubber,
     ):
         # Set up Glue client stubs
@@ -949,3 +984,166 @@ def test_glue_ingest_with_lake_formation_tag_extraction(
         output_path=tmp_path / mce_file,
         golden_path=test_resources_dir / mce_golden_file,
     )
+
+
+def test_search_table_lf_tags() -> None:
+    source = glue_source(extract_lakeformation_tags=True)
+    database_tag = {
+        "CatalogId": "123412341234",
+        "TagKey": "Environment",
+        "TagValues": ["Production"],
+    }
+    table_tag = {
+        "CatalogId": "123412341234",
+        "TagKey": "DataClassification",
+        "TagValues": ["Sensitive"],
+    }
+    tagged_tables: Dict[str, List[Dict[str, Any]]] = {
+        "Environment": [
+            {
+                "Table": {"DatabaseName": "flights-database", "Name": "avro"},
+                "LFTagOnDatabase": [database_tag],
+                "LFTagsOnTable": [database_tag, table_tag],
+            },
+            {
+                "Table": {"DatabaseName": "flights-database", "Name": "csv"},
+                "LFTagOnDatabase": [database_tag],
+                "LFTagsOnTable": [database_tag],
+            },
+        ],
+        "DataClassification": [
+            {
+                "Table": {"DatabaseName": "flights-database", "Name": "avro"},
+                "LFTagOnDatabase": [database_tag],
+                "LFTagsOnTable": [database_tag, table_tag],
+            },
+        ],
+    }
+    paginator = MagicMock()
+    paginator.paginate.side_effect = lambda CatalogId, Expression: [
+        {"TableList": tagged_tables[Expression[0]["TagKey"]]}
+    ]
+    list_lf_tags_response = {
+        "LFTags": [
+            {
+                "TagKey": "Environment",
+                "TagValues": [f"Value{i}" for i in range(60)],
+            },
+            {"TagKey": "DataClassification", "TagValues": ["Sensitive", "Public"]},
+        ]
+    }
+
+    with (
+        patch.object(
+            source.lf_client, "list_lf_tags", return_value=list_lf_tags_response
+        ),
+        patch.object(source.lf_client, "get_paginator", return_value=paginator),
+        patch.object(source.lf_client, "get_resource_lf_tags") as get_resource_lf_tags,
+    ):
+        table_lf_tags = source.search_table_lf_tags("123412341234")
+        for _ in range(2):
+            assert (
+                len(
+                    source._get_table_lf_tags(
+                        {
+                            "CatalogId": "123412341234",
+                            "DatabaseName": "flights-database",
+                            "Name": "avro",
+                        }
+                    )
+                )
+                == 1
+            )
+
+    # The tags inherited from the database are excluded.
+    assert {key: len(tags) for key, tags in table_lf_tags.items()} == {
+        ("flights-database", "avro"): 1,
+        ("flights-database", "csv"): 0,
+    }
+    # The values of a tag key are searched 50 at a time.
+    assert [
+        len(call.kwargs["Expression"][0]["TagValues"])
+        for call in paginator.paginate.call_args_list
+    ] == [50, 10, 2] * 2
+    get_resource_lf_tags.assert_not_called()
+    assert source.report.num_table_lf_tag_lookups == 0
+
+
+def test_search_table_lf_tags_falls_back_to_table_lookups() -> None:
+    source = glue_source(extract_lakeformation_tags=True)
+    table = {
+        "CatalogId": "123412341234",
+        "DatabaseName": "flights-database",
+        "Name": "avro",
+    }
+
+    with (
+        patch.object(
+            source.lf_client, "list_lf_tags", side_effect=Exception("AccessDenied")
+        ),
+        patch.object(
+            source.lf_client, "get_resource_lf_tags", return_value={}
+        ) as get_resource_lf_tags,
+    ):
+        assert source._get_table_lf_tags(table) == []
+        assert source._get_table_lf_tags(table) == []
+
+    assert get_resource_lf_tags.call_count == 2
+    assert source.report.num_table_lf_tag_lookups == 2
+    assert [w.title for w in source.report.warnings] == [
+        "Failed to search Lake Formation tags"
+    ]
+
+
+def test_get_all_databases_and_tables_concurrently() -> None:
+    source = GlueSource(
+        ctx=PipelineContext(run_id="glue-source-test"),
+        config=GlueSourceConfig(aws_region="us-west-2", max_workers=4),
+    )
+    databases = [
+        {"Name": f"database-{i}", "CatalogId": "123412341234"} for i in range(8)
+    ]
+
+    def get_tables_from_database(database: Mapping[str, Any]) -> Iterable[Dict]:
+        i = int(database["Name"].split("-")[1])
+        if i == 5:
+            raise Exception("AccessDenied")
+        # The first databases are the slowest to list.
+        time.sleep((8 - i) * 0.01)
+        for j in range(i % 3):
+            yield {"Name": f"table-{j}", "DatabaseName": database["Name"]}
+
+    with (
+        patch.object(source, "get_all_databases", return_value=iter(databases)),
+        patch.object(
+            source, "get_tables_from_database", side_effect=get_tables_from_database
+        ),
+    ):
+        all_databases, all_tables = source.get_all_databases_and_tables()
+
+    assert all_databases == databases
+    assert [(t["DatabaseName"], t["Name"]) for t in all_tables] == [
+        (f"database-{i}", f"table-{j}")
+        for i in range(8)
+        if i != 5
+        for j in range(i % 3)
+    ]
+    assert [w.message for w in source.report.warnings] == [
+        "Failed to get tables from database"
+    ]
+
+
+def test_concurrent_aws_clients_config() -> None:
+    # botocore's Config sets its options as attributes dynamically.
+    config: Any = GlueSourceConfig(aws_region="us-west-2")._aws_config()
+    assert config.retries == {"max_attempts": 5, "mode": "standard"}
+
+    config = GlueSourceConfig(aws_region="us-west-2", max_workers=32)._aws_config()
+    assert config.max_pool_connections == 32
+    assert config.retries == {"max_attempts": 5, "mode": "adaptive"}
+
+    config = GlueSourceConfig(
+        aws_region="us-west-2", max_workers=4, aws_retry_mode="standard"
+    )._aws_config()
+    assert config.max_pool_connections == 10
+    assert config.retries == {"max_attempts": 5, "mode": "standard"}
@@ -0,0 +1,118 @@
+from typing import Any, Dict, List, Tuple
+from unittest import mock
+
+from datahub.ingestion.source.powerbi.config import (
+    PowerBiDashboardSourceConfig,
+    PowerBiDashboardSourceReport,
+)
+from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import Workspace
+from datahub.ingestion.source.powerbi.rest_api_wrapper.data_resolver import (
+    AdminAPIResolver,
+)
+from datahub.ingestion.source.powerbi.rest_api_wrapper.powerbi_api import PowerBiAPI
+
+
+def _workspace(workspace_id: str) -> Workspace:
+    return Workspace(
+        id=workspace_id,
+        name=workspace_id,
+        type="Workspace",
+        dashboards={},
+        reports={},
+        datasets={},
+        report_endorsements={},
+        dashboard_endorsements={},
+        scan_result={},
+        independent_datasets={},
+        app=None,
+    )
+
+
+class FakeScans:
+    """Scan jobs that complete after a fixed number of status checks."""
+
+    def __init__(self, checks_to_complete: List[int]):
+        self.checks_to_complete = checks_to_complete
+        self.checks: Dict[str, int] = {}
+        self.created: List[List[str]] = []
+        self.in_flight_on_create: List[int] = []
+
+    def create_scan_job(self, workspace_ids: List[str]) -> str:
+        scan_id = f"scan-{len(self.created)}"
+        self.created.append(workspace_ids)
+        self.in_flight_on_create.append(
+            len([s for s, n in self.checks.items() if n >= 0])
+        )
+        self.checks[scan_id] = self.checks_to_complete[len(self.created) - 1]
+        return scan_id
+
+    def is_scan_complete(self, scan_id: str) -> bool:
+        self.checks[scan_id] -= 1
+        return self.checks[scan_id] < 0
+
+    def get_scan_result(self, scan_id: str) -> Any:
+        assert self.checks[scan_id] < 0
+        return {"scan_id": scan_id}
+
+
+def _scan(max_concurrent_scans: int, fake_scans: FakeScans) -> Tuple[List[Any], int]:
+    """Returns the scan results in the order they're yielded, and the number of sleeps."""
+    config = PowerBiDashboardSourceConfig(
+        tenant_id="tenant",
+        client_id="client",
+        client_secret="secret",
+        max_concurrent_scans=max_concurrent_scans,
+    )
+    report = PowerBiDashboardSourceReport()
+    with mock.patch("msal.ConfidentialClientApplication") as msal_client:
+        msal_client.return_value.acquire_token_for_client.return_value = {
+            "access_token": "dummy"
+        }
+        api = PowerBiAPI(config, report)
+
+    batches = [[_workspace(f"w{i}")] for i in range(len(fake_scans.checks_to_complete))]
+    with (
+        mock.patch.multiple(
+            AdminAPIResolver,
+            create_scan_job=mock.Mock(side_effect=fake_scans.create_scan_job),
+            is_scan_complete=mock.Mock(side_effect=fake_scans.is_scan_complete),
+            get_scan_result=mock.Mock(side_effect=fake_scans.get_scan_result),
+        ),
+        mock.patch("time.sleep") as sleep,
+    ):
+        results = [
+            ([w.id for w in workspaces], scan_result)
+            for workspaces, scan_result in api._get_scan_results(batches)
+        ]
+
+    assert report.scan_jobs_created == len(batches)
+    assert report.max_scan_jobs_in_flight == max_concurrent_scans
+    return results, sleep.call_count
+
+
+def test_scan_jobs_are_pipelined():
+    fake_scans = FakeScans(checks_to_complete=[2, 0, 0])
+    results, sleep_count = _scan(max_concurrent_scans=2, fake_scans=fake_scans)
+
+    # The second scan completes first, and the third one is created while the
+    # first one is still running.
+    assert results == [
+        (["w1"], {"scan_id": "scan-1"}),
+        (["w2"], {"scan_id": "scan-2"}),
+        (["w0"], {"scan_id": "scan-0"}),
+    ]
+    assert fake_scans.in_flight_on_create == [0, 1, 1]
+    assert sleep_count == 0
+
+
+def test_scan_jobs_are_sequential_by_default():
+    fake_scans = FakeScans(checks_to_complete=[2, 0, 1])
+    results, sleep_count = _scan(max_concurrent_scans=1, fake_scans=fake_scans)
+
+    assert results == [
+        (["w0"], {"scan_id": "scan-0"}),
+        (["w1"], {"scan_id": "scan-1"}),
+        (["w2"], {"scan_id": "scan-2"}),
+    ]
+    assert fake_scans.in_flight_on_create == [0, 0, 0]
+    assert sleep_count == 3
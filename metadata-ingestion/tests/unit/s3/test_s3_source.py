@@ -1,12 +1,16 @@
 from datetime import datetime
-from typing import List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 from unittest.mock import Mock, call, patch
 
+import boto3
 import pytest
+from freezegun import freeze_time
+from moto import mock_s3
 
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.source.aws.aws_common import AwsConnectionConfig
 from datahub.ingestion.source.data_lake_common.data_lake_utils import ContainerWUCreator
 from datahub.ingestion.source.data_lake_common.path_spec import PathSpec
 from datahub.ingestion.source.s3.source import (
@@ -14,6 +18,7 @@ from datahub.ingestion.source.s3.source import (
     S3Source,
     partitioned_folder_comparator,
 )
+from datahub.metadata.schema_classes import SchemaMetadataClass
 
 
 def _get_s3_source(path_spec_: PathSpec) -> S3Source:
@@ -374,6 +379,7 @@ def test_get_folder_info_returns_expected_folder() -> None:
                 creation_time=datetime(2025, 1, 1, 1),
                 last_modified=datetime(2025, 1, 1, 1),
                 size=100,
+                e_tag='"etag-0001"',
             ),
             Mock(
                 bucket_name="my-bucket",
@@ -381,6 +387,7 @@ def test_get_folder_info_returns_expected_folder() -> None:
                 creation_time=datetime(2025, 1, 1, 2),
                 last_modified=datetime(2025, 1, 1, 2),
                 size=50,
+                e_tag='"etag-0002"',
             ),
         ]
     )
@@ -400,6 +407,7 @@ def test_get_folder_info_returns_expected_folder() -> None:
         modification_time=datetime(2025, 1, 1, 2),
         size=150,
         sample_file="s3://my-bucket/my-folder/dir1/0002.csv",
+        sample_file_etag='"etag-0002"',
     )
 
 
@@ -621,3 +629,106 @@ class TestResolveTemplatedFolders:
         # assert
         expected = ["data/folder1/", "data/folder2/"]
         assert result == expected
+
+
+@pytest.fixture
+def s3_tables_bucket() -> Iterator[str]:
+    with mock_s3():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="my-bucket")
+        for i in range(6):
+            for year in (2023, 2024):
+                s3.put_object(
+                    Bucket="my-bucket",
+                    Key=f"data/table{i}/year={year}/part-0.csv",
+                    Body=f"id,name,col{i}\n1,a,{year}\n".encode(),
+                )
+        yield "my-bucket"
+
+
+def _ingest_s3_tables(
+    bucket_name: str, max_workers: int = 1, **config: Any
+) -> List[MetadataWorkUnit]:
+    source = S3Source.create(
+        config_dict={
+            "path_specs": [
+                {
+                    "include": f"s3://{bucket_name}/data/{{table}}/{{partition_key[0]}}={{partition[0]}}/*.csv",
+                }
+            ],
+            "aws_config": {
+                "aws_region": "us-east-1",
+                "aws_access_key_id": "test-key",
+                "aws_secret_access_key": "test-secret",
+            },
+            "max_workers": max_workers,
+            **config,
+        },
+        ctx=PipelineContext(run_id="test-s3"),
+    )
+    workunits = list(source.get_workunits_internal())
+    source.close()
+    return workunits
+
+
+@freeze_time("2025-01-01 00:00:00")
+def test_s3_tables_processed_concurrently(s3_tables_bucket: str) -> None:
+    serial_workunits = _ingest_s3_tables(s3_tables_bucket, max_workers=1)
+
+    with patch.object(
+        AwsConnectionConfig,
+        "get_s3_client",
+        autospec=True,
+        side_effect=AwsConnectionConfig.get_s3_client,
+    ) as get_s3_client:
+        concurrent_workunits = _ingest_s3_tables(s3_tables_bucket, max_workers=4)
+
+    # The tables, and their schemas, are emitted in the same order.
+    assert [wu.id for wu in concurrent_workunits] == [wu.id for wu in serial_workunits]
+    assert [wu.metadata for wu in concurrent_workunits] == [
+        wu.metadata for wu in serial_workunits
+    ]
+    schema_fields = [
+        [field.fieldPath for field in schema.fields]
+        for schema in (
+            wu.get_aspect_of_type(SchemaMetadataClass) for wu in concurrent_workunits
+        )
+        if schema is not None
+    ]
+    assert schema_fields == [["id", "name", f"col{i}"] for i in range(6)]
+
+    # A single client, with a large enough connection pool, is shared by the threads.
+    get_s3_client.assert_called_once()
+    assert get_s3_client.call_args.kwargs["max_pool_connections"] == 10
+
+
+@freeze_time("2025-01-01 00:00:00")
+def test_s3_schema_inference_cache(s3_tables_bucket: str, tmp_path: Any) -> None:
+    config: Dict[str, Any] = {
+        "schema_inference_cache": {"enabled": True, "path": str(tmp_path / "cache")}
+    }
+    uncached_workunits = _ingest_s3_tables(s3_tables_bucket, **config)
+
+    with patch(
+        "datahub.ingestion.source.s3.source.smart_open", side_effect=AssertionError
+    ):
+        cached_workunits = _ingest_s3_tables(s3_tables_bucket, **config)
+    assert [wu.metadata for wu in cached_workunits] == [
+        wu.metadata for wu in uncached_workunits
+    ]
+
+    # A new version of a sample file is downloaded again.
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.put_object(
+        Bucket=s3_tables_bucket,
+        Key="data/table0/year=2024/part-0.csv",
+        Body=b"id,name,new_col\n1,a,b\n",
+    )
+    workunits = _ingest_s3_tables(s3_tables_bucket, **config)
+    schema_fields = [
+        [field.fieldPath for field in schema.fields]
+        for schema in (wu.get_aspect_of_type(SchemaMetadataClass) for wu in workunits)
+        if schema is not None
+    ]
+    assert schema_fields[0] == ["id", "name", "new_col"]
+    assert schema_fields[1:] == [["id", "name", f"col{i}"] for i in range(1, 6)]
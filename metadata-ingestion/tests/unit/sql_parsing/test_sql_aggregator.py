@@ -26,6 +26,7 @@ from datahub.sql_parsing.sqlglot_lineage import (
     ColumnLineageInfo,
     ColumnRef,
     DownstreamColumnRef,
+    sqlglot_lineage,
 )
 from datahub.testing import mce_helpers
 from tests.test_helpers.click_helpers import run_datahub_cmd
@@ -186,6 +187,54 @@ def test_temp_table() -> None:
     )
 
 
+@freeze_time(FROZEN_TIME)
+def test_temp_table_with_parse_results() -> None:
+    aggregator = SqlParsingAggregator(
+        platform="redshift",
+        generate_lineage=True,
+        generate_usage_statistics=False,
+        generate_operations=False,
+    )
+
+    aggregator._schema_resolver.add_raw_schema_info(
+        DatasetUrn("redshift", "dev.public.bar").urn(),
+        {"a": "int", "b": "int", "c": "int"},
+    )
+
+    # Parsed ahead of time, without the temp tables of the sessions.
+    for query, session_id in [
+        ("create table foo as select a, 2*b as b from bar", "session1"),
+        ("create temp table foo as select a, b+c as c from bar", "session2"),
+        ("create table foo_session2 as select * from foo", "session2"),
+        ("create table foo_session3 as select * from foo", "session3"),
+    ]:
+        aggregator.add_observed_query(
+            ObservedQuery(
+                query=query,
+                default_db="dev",
+                default_schema="public",
+                session_id=session_id,
+            ),
+            parse_result=sqlglot_lineage(
+                query,
+                schema_resolver=aggregator._schema_resolver,
+                default_db="dev",
+                default_schema="public",
+            ),
+        )
+
+    # The query that reads the temp table is parsed again.
+    assert aggregator.report.num_observed_queries_parsed_ahead == 3
+    assert aggregator.report.num_sql_parsed == 1
+
+    mcps = list(aggregator.gen_metadata())
+
+    check_goldens_stream(
+        outputs=mcps,
+        golden_path=RESOURCE_DIR / "test_temp_table.json",
+    )
+
+
 @freeze_time(FROZEN_TIME)
 def test_multistep_temp_table() -> None:
     aggregator = SqlParsingAggregator(
@@ -1,8 +1,16 @@
+import json
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
 
 import pytest
 
-from datahub.ingestion.source.sql_queries import QueryEntry, SqlQueriesSourceConfig
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.source.sql_queries import (
+    QueryEntry,
+    SqlQueriesSource,
+    SqlQueriesSourceConfig,
+)
+from datahub.metadata.schema_classes import DatasetUsageStatisticsClass
 from datahub.metadata.urns import CorpUserUrn, DatasetUrn
 
 
@@ -426,3 +434,64 @@ class TestQueryEntry:
         assert query_entry.downstream_tables == expected_query_entry.downstream_tables
         assert query_entry.upstream_tables == expected_query_entry.upstream_tables
         assert query_entry.session_id == expected_query_entry.session_id
+
+
+@pytest.mark.parametrize("parse_processes", [0, 1])
+def test_queries_are_parsed_once_per_fingerprint(tmp_path, parse_processes):
+    query_file = tmp_path / "queries.jsonl"
+    queries = [
+        {
+            "query": f"SELECT id FROM db.sch.orders WHERE order_date = '2021-01-0{day}'",
+            "timestamp": 1609459200 + day,
+            "user": f"user{day}",
+        }
+        for day in range(1, 4)
+    ] + [
+        {
+            "query": "INSERT INTO db.sch.orders_copy SELECT id FROM db.sch.orders",
+            "timestamp": 1609459300,
+        },
+        {
+            "query": "not parsed",
+            "upstream_tables": ["db.sch.orders"],
+            "downstream_tables": ["db.sch.orders_copy"],
+        },
+    ]
+    query_file.write_text("\n".join(json.dumps(query) for query in queries))
+
+    source = SqlQueriesSource(
+        PipelineContext(run_id="sql-queries-test", graph=MagicMock()),
+        SqlQueriesSourceConfig.parse_obj(
+            {
+                "query_file": str(query_file),
+                "platform": "snowflake",
+                "use_schema_resolver": False,
+                "parse_processes": parse_processes,
+                "usage": {
+                    "start_time": "2021-01-01T00:00:00Z",
+                    "end_time": "2021-01-02T00:00:00Z",
+                    "bucket_duration": "DAY",
+                },
+            }
+        ),
+    )
+    workunits = list(source.get_workunits())
+
+    report = source.get_report()
+    assert report.num_entries_processed == 5
+    assert report.num_unique_queries_parsed == 2
+    assert report.num_queries_deduplicated == 2
+    assert report.sql_aggregator is not None
+    assert report.sql_aggregator.num_observed_queries_parsed_ahead == 4
+
+    # Every query still counts towards usage, with its own user.
+    [usage] = [
+        wu.get_aspect_of_type(DatasetUsageStatisticsClass)
+        for wu in workunits
+        if wu.get_urn()
+        == "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.sch.orders,PROD)"
+        and wu.get_aspect_of_type(DatasetUsageStatisticsClass)
+    ]
+    assert usage is not None
+    assert usage.totalSqlQueries == 4
+    assert usage.uniqueUserCount == 3
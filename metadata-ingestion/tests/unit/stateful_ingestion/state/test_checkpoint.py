@@ -5,6 +5,7 @@ import pydantic
 import pytest
 
 from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
+from datahub.ingestion.source.state.entity_removal_state import GenericCheckpointState
 from datahub.ingestion.source.state.sql_common_state import (
     BaseSQLAlchemyCheckpointState,
 )
@@ -143,7 +144,7 @@ def test_serde_idempotence(state_obj):
 
 def test_supported_encodings():
     """
-    Tests utf-8 and base85-bz2-json encodings
+    Tests utf-8, base85-bz2-json and base85-zlib-json encodings
     """
     test_state = BaseTimeWindowCheckpointState(
         version="1.0", begin_timestamp_millis=1, end_timestamp_millis=100
@@ -157,6 +158,32 @@ def test_supported_encodings():
     test_state.serde = "base85-bz2-json"
     test_serde_idempotence(test_state)
 
+    # 3. Test zlib encoding
+    test_state.serde = "base85-zlib-json"
+    test_serde_idempotence(test_state)
+
+
+def test_compact_generic_state_encoding():
+    urns = [
+        f"urn:li:dataset:(urn:li:dataPlatform:snowflake,db.schema.table_{i},PROD)"
+        for i in reversed(range(1000))
+    ]
+    plain_state = GenericCheckpointState(urns=urns)
+    compact_state = GenericCheckpointState(urns=urns, serde="base85-zlib-json")
+
+    assert len(compact_state.to_bytes()) < len(plain_state.to_bytes())
+
+    checkpoint_state = IngestionCheckpointStateClass(
+        formatVersion=compact_state.version,
+        serde=compact_state.serde,
+        payload=compact_state.to_bytes(),
+    )
+    checkpoint = _assert_checkpoint_deserialization(
+        checkpoint_state,
+        GenericCheckpointState(urns=sorted(urns), serde="base85-zlib-json"),
+    )
+    assert set(checkpoint.state.urns) == set(urns)
+
 
 def test_base85_upgrade_pickle_to_json():
     """Verify that base85 (pickle) encoding is transitioned to base85-bz2-json."""
@@ -175,7 +202,7 @@ def test_base85_upgrade_pickle_to_json():
 
 @pytest.mark.parametrize(
     "serde",
-    ["utf-8", "base85-bz2-json"],
+    ["utf-8", "base85-bz2-json", "base85-zlib-json"],
 )
 def test_state_forward_compatibility(serde: str) -> None:
     class PrevState(CheckpointStateBase):
@@ -4,6 +4,8 @@ import pytest
 
 from datahub.ingestion.source.state.entity_removal_state import (
     compute_percent_entities_changed,
+    decode_sorted_urns,
+    encode_sorted_urns,
     filter_ignored_entity_types,
 )
 
@@ -63,3 +65,19 @@ def test_filter_ignored_entity_types():
         "urn:li:dataset:(urn:li:dataPlatform:postgres,dummy_dataset2,PROD)",
         "urn:li:dataset:(urn:li:dataPlatform:postgres,dummy_dataset3,PROD)",
     ]
+
+
+def test_sorted_urns_encoding_roundtrip():
+    urns = [
+        "urn:li:dataset:(urn:li:dataPlatform:postgres,db.public.b,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:postgres,db.public.a,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:postgres,db.public.ab,PROD)",
+        "urn:li:container:1234",
+        "",
+    ]
+    encoded = encode_sorted_urns(urns)
+    assert encoded[:4] == [0, "", 0, "urn:li:container:1234"]
+    assert decode_sorted_urns(encoded) == sorted(urns)
+
+    with pytest.raises(ValueError):
+        decode_sorted_urns([0])
@@ -0,0 +1,165 @@
+import json
+import pathlib
+from typing import Iterable, List, Set, Tuple
+
+import datahub.emitter.mce_builder as builder
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.lite.duckdb_lite import DuckDBLite
+from datahub.lite.duckdb_lite_config import DuckDBLiteConfig
+from datahub.lite.lite_local import SearchFlavor
+from datahub.metadata.schema_classes import (
+    DatasetPropertiesClass,
+    StatusClass,
+    SystemMetadataClass,
+)
+
+
+def _mcps(run: int) -> Iterable[MetadataChangeProposalWrapper]:
+    for i in range(10):
+        urn = builder.make_dataset_urn("hive", f"db.table_{i}")
+        system_metadata = SystemMetadataClass(lastObserved=1000 * run + i + 1)
+        yield MetadataChangeProposalWrapper(
+            entityUrn=urn,
+            # Only some of the descriptions change from one run to the next.
+            aspect=DatasetPropertiesClass(
+                name=f"table_{i}", description=f"run {run % (i + 1)}"
+            ),
+            systemMetadata=system_metadata,
+        )
+        yield MetadataChangeProposalWrapper(
+            entityUrn=urn,
+            aspect=StatusClass(removed=False),
+            systemMetadata=system_metadata,
+        )
+
+    # Repeated writes of the same aspect within a single batch.
+    urn = builder.make_dataset_urn("hive", "db.table_0")
+    for last_observed, description in [(5, "x"), (6, "x"), (7, "y")]:
+        yield MetadataChangeProposalWrapper(
+            entityUrn=urn,
+            aspect=DatasetPropertiesClass(name="table_0", description=description),
+            systemMetadata=SystemMetadataClass(lastObserved=last_observed),
+        )
+
+
+def _load(lite: DuckDBLite) -> Tuple[List[tuple], List[tuple]]:
+    for run in range(3):
+        for mcp in _mcps(run):
+            lite.write(mcp)
+    lite.reindex()
+
+    aspects = [
+        (urn, aspect_name, version, json.loads(metadata), json.loads(system_metadata))
+        for urn, aspect_name, version, metadata, system_metadata in lite.duckdb_client.execute(
+            "SELECT urn, aspect_name, version, metadata, system_metadata "
+            "FROM metadata_aspect_v2 ORDER BY urn, aspect_name, version"
+        ).fetchall()
+    ]
+    edges = lite.duckdb_client.execute(
+        "SELECT * FROM metadata_edge_v2 ORDER BY ALL"
+    ).fetchall()
+    lite.close()
+    return aspects, edges
+
+
+def test_bulk_load_matches_per_record_write(tmp_path: pathlib.Path) -> None:
+    expected_aspects, expected_edges = _load(
+        DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "per_record.duckdb")))
+    )
+    assert expected_edges
+
+    # A small batch size so that flushes happen in the middle of a run.
+    bulk_aspects, bulk_edges = _load(
+        DuckDBLite(
+            DuckDBLiteConfig(
+                file=str(tmp_path / "bulk.duckdb"),
+                bulk_load=True,
+                bulk_load_batch_size=7,
+            )
+        )
+    )
+    assert bulk_aspects == expected_aspects
+    assert bulk_edges == expected_edges
+
+    latest = DuckDBLite(
+        DuckDBLiteConfig(file=str(tmp_path / "bulk.duckdb"), read_only=True)
+    ).get(builder.make_dataset_urn("hive", "db.table_0"), None, details=True)
+    assert latest
+    properties = latest["datasetProperties"]
+    assert isinstance(properties, dict)
+    assert properties["description"] == "y"
+    assert properties["__systemMetadata"]["lastObserved"] == 7
+
+
+def test_free_text_search_is_ranked(tmp_path: pathlib.Path) -> None:
+    lite = DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "search.duckdb")))
+    system_metadata = SystemMetadataClass(lastObserved=1)
+    for name in ["orders", "customer_orders", "customers"]:
+        lite.write(
+            MetadataChangeProposalWrapper(
+                entityUrn=builder.make_dataset_urn("hive", f"sales.{name}"),
+                aspect=DatasetPropertiesClass(
+                    name=name.replace("_", " ").title(),
+                    description="Orders by customer, o'clock",
+                ),
+                systemMetadata=system_metadata,
+            )
+        )
+
+    results = list(lite.search("customer", SearchFlavor.FREE_TEXT, snippet=False))
+    assert [r.id for r in results if r.aspect == "datasetProperties"] == [
+        builder.make_dataset_urn("hive", "sales.customer_orders"),
+        builder.make_dataset_urn("hive", "sales.customers"),
+        builder.make_dataset_urn("hive", "sales.orders"),
+    ]
+
+    # All query tokens must match, and the last one may be a prefix.
+    results = list(lite.search("customer ord", SearchFlavor.FREE_TEXT))
+    assert results[0].id == builder.make_dataset_urn("hive", "sales.customer_orders")
+    assert results[0].aspect == "datasetProperties"
+    assert results[0].snippet and "Customer Orders" in results[0].snippet
+
+    # Queries are passed as parameters, not interpolated into the SQL.
+    assert list(lite.search("o'clock", SearchFlavor.FREE_TEXT))
+
+    # The index follows updates to the aspects.
+    lite.write(
+        MetadataChangeProposalWrapper(
+            entityUrn=builder.make_dataset_urn("hive", "sales.orders"),
+            aspect=DatasetPropertiesClass(name="Purchases"),
+            systemMetadata=system_metadata,
+        )
+    )
+    assert {r.id for r in lite.search("purchases", SearchFlavor.FREE_TEXT)} == {
+        builder.make_dataset_urn("hive", "sales.orders")
+    }
+    lite.close()
+
+
+def test_free_text_search_unicode_and_substring(tmp_path: pathlib.Path) -> None:
+    lite = DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "search.duckdb")))
+    system_metadata = SystemMetadataClass(lastObserved=1)
+    clients = builder.make_dataset_urn("hive", "sales.clients")
+    tokyo = builder.make_dataset_urn("hive", "sales.tokyo")
+    for urn, name in [(clients, "Données Clients"), (tokyo, "東京 売上")]:
+        lite.write(
+            MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=DatasetPropertiesClass(name=name),
+                systemMetadata=system_metadata,
+            )
+        )
+
+    def search(query: str) -> Set[str]:
+        return {r.id for r in lite.search(query, SearchFlavor.FREE_TEXT)}
+
+    # Non-ASCII words are indexed, and matched as prefixes.
+    assert search("données") == {clients}
+    assert search("DONN") == {clients}
+    assert search("東京") == {tokyo}
+    assert search("売") == {tokyo}
+
+    # Queries that don't match the start of a word fall back to a substring search.
+    assert search("nnées") == {clients}
+    assert search("okyo") == {tokyo}
+    lite.close()
@@ -1,12 +1,14 @@
 import uuid
 from collections import defaultdict
 from decimal import Decimal
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, cast
 from unittest import TestCase
 from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
+from pyiceberg.conversions import to_bytes
 from pyiceberg.exceptions import (
     NoSuchIcebergTableError,
     NoSuchNamespaceError,
@@ -19,6 +21,7 @@ from pyiceberg.partitioning import PartitionSpec
 from pyiceberg.schema import Schema
 from pyiceberg.table import Table
 from pyiceberg.table.metadata import TableMetadataV2
+from pyiceberg.table.snapshots import Operation
 from pyiceberg.types import (
     BinaryType,
     BooleanType,
@@ -51,11 +54,16 @@ from datahub.ingestion.source.iceberg.iceberg import (
     IcebergSource,
     IcebergSourceConfig,
 )
+from datahub.ingestion.source.iceberg.iceberg_profiling_state import (
+    IcebergProfilingStateHandler,
+    IcebergTableProfileState,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.schema import ArrayType, SchemaField
 from datahub.metadata.schema_classes import (
     ArrayTypeClass,
     BooleanTypeClass,
     BytesTypeClass,
+    DatasetProfileClass,
     DateTypeClass,
     FixedTypeClass,
     NumberTypeClass,
@@ -504,6 +512,144 @@ def test_iceberg_profiler_value_render(
     )
 
 
+class InMemoryProfilingState:
+    def __init__(self) -> None:
+        self.last_tables: Dict[str, IcebergTableProfileState] = {}
+        self.current_tables: Dict[str, IcebergTableProfileState] = {}
+
+    def get_last_table_state(
+        self, dataset_name: str
+    ) -> Optional[IcebergTableProfileState]:
+        return self.last_tables.get(dataset_name)
+
+    def set_table_state(
+        self, dataset_name: str, table_state: IcebergTableProfileState
+    ) -> None:
+        self.current_tables[dataset_name] = table_state
+
+    def next_run(self) -> None:
+        self.last_tables, self.current_tables = self.current_tables, {}
+
+
+def _data_file(snapshot_id: int, ids: List[Optional[int]]) -> SimpleNamespace:
+    values = [value for value in ids if value is not None]
+    return SimpleNamespace(
+        snapshot_id=snapshot_id,
+        data_file=SimpleNamespace(
+            record_count=len(ids),
+            null_value_counts={1: len(ids) - len(values)},
+            lower_bounds={1: to_bytes(LongType(), min(values))},
+            upper_bounds={1: to_bytes(LongType(), max(values))},
+        ),
+    )
+
+
+class FakeManifest:
+    def __init__(self, added_snapshot_id: int, entries: List[SimpleNamespace]):
+        self.added_snapshot_id = added_snapshot_id
+        self.entries = entries
+        self.reads = 0
+
+    def fetch_manifest_entry(self, io: Any) -> List[SimpleNamespace]:
+        self.reads += 1
+        return self.entries
+
+
+class FakeTable:
+    def __init__(self) -> None:
+        self.io = None
+        self.metadata_location = "s3://abcdefg/namespaceA/table1"
+        self.snapshots: Dict[int, SimpleNamespace] = {}
+        self.current: Optional[SimpleNamespace] = None
+
+    def add_snapshot(
+        self, operation: Operation, total_records: int, manifests: List[FakeManifest]
+    ) -> None:
+        snapshot_id = len(self.snapshots) + 1
+        self.current = SimpleNamespace(
+            snapshot_id=snapshot_id,
+            parent_snapshot_id=self.current.snapshot_id if self.current else None,
+            summary=SimpleNamespace(
+                operation=operation,
+                additional_properties={"total-records": str(total_records)},
+            ),
+            manifests=lambda io: manifests,
+        )
+        self.snapshots[snapshot_id] = self.current
+
+    def schema(self) -> Schema:
+        return Schema(NestedField(1, "id", LongType(), required=False), schema_id=0)
+
+    def current_snapshot(self) -> Optional[SimpleNamespace]:
+        return self.current
+
+    def snapshot_by_id(self, snapshot_id: int) -> Optional[SimpleNamespace]:
+        return self.snapshots.get(snapshot_id)
+
+
+def _profile(profiler: IcebergProfiler, table: FakeTable) -> Tuple[Any, ...]:
+    [profile] = profiler.profile_table("namespaceA.table1", cast(Table, table))
+    assert isinstance(profile, DatasetProfileClass)
+    assert profile.fieldProfiles
+    [field_profile] = profile.fieldProfiles
+    return (
+        profile.rowCount,
+        field_profile.nullCount,
+        field_profile.min,
+        field_profile.max,
+    )
+
+
+def test_iceberg_profiler_snapshot_cache() -> None:
+    source = with_iceberg_source(
+        profiling={"enabled": True, "use_snapshot_cache": True}
+    )
+    state = InMemoryProfilingState()
+    profiler = IcebergProfiler(
+        source.report,
+        source.config.profiling,
+        cast(IcebergProfilingStateHandler, state),
+    )
+    uncached_profiler = IcebergProfiler(
+        source.report,
+        source.config.profiling.copy(update={"use_snapshot_cache": False}),
+    )
+
+    table = FakeTable()
+    first = FakeManifest(1, [_data_file(1, [5, None, 7])])
+    second = FakeManifest(1, [_data_file(1, [3, 4])])
+    table.add_snapshot(Operation.APPEND, 5, [first, second])
+    assert _profile(profiler, table) == (5, 1, "3", "7")
+    assert source.report.manifests_profiled == 2
+
+    # Unchanged snapshot, no manifest is read.
+    state.next_run()
+    assert _profile(profiler, table) == (5, 1, "3", "7")
+    assert source.report.profiles_from_snapshot_cache == 1
+    assert first.reads == second.reads == 1
+
+    # Append, with the first manifest merged with the new data files.
+    state.next_run()
+    merged = FakeManifest(
+        2,
+        [_data_file(1, [5, None, 7]), _data_file(2, [None, 9]), _data_file(2, [1])],
+    )
+    table.add_snapshot(Operation.APPEND, 8, [merged, second])
+    assert _profile(profiler, table) == (8, 2, "1", "9")
+    assert source.report.profiles_incrementally_updated == 1
+    assert second.reads == 1
+    assert _profile(uncached_profiler, table) == (8, 2, "1", "9")
+
+    # Overwrites can remove data files, so the table is profiled from scratch.
+    state.next_run()
+    table.add_snapshot(
+        Operation.OVERWRITE, 3, [FakeManifest(3, [_data_file(3, [2, None, 4])])]
+    )
+    assert _profile(profiler, table) == (3, 1, "2", "4")
+    assert source.report.profiles_incrementally_updated == 1
+    assert state.current_tables["namespaceA.table1"].snapshot_id == 3
+
+
 def test_avro_decimal_bytes_nullable() -> None:
     """
     The following test exposes a problem with decimal (bytes) not preserving extra attributes like _nullable.  Decimal (fixed) and Boolean for example do.
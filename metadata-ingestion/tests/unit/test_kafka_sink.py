@@ -8,7 +8,11 @@ from datahub.emitter.kafka_emitter import MCE_KEY
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
 from datahub.ingestion.api.sink import SinkReport, WriteCallback
-from datahub.ingestion.sink.datahub_kafka import DatahubKafkaSink, _KafkaCallback
+from datahub.ingestion.sink.datahub_kafka import (
+    DatahubKafkaSink,
+    KafkaSinkMode,
+    _KafkaCallback,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeEvent,
     MetadataChangeProposal,
@@ -107,6 +111,64 @@ class KafkaSinkTest(unittest.TestCase):
         kafka_sink.close()
         mock_producer_instance.flush.assert_has_calls([call(), call()])
 
+    @patch("datahub.ingestion.api.sink.PipelineContext", autospec=True)
+    @patch("datahub.emitter.kafka_emitter.SerializingProducer", autospec=True)
+    def test_kafka_sink_pipelined_mode(self, mock_producer, mock_context):
+        mock_producer_instance = mock_producer.return_value
+        mock_producer_instance.__len__.return_value = 0
+        kafka_sink = DatahubKafkaSink.create(
+            {
+                "connection": {"bootstrap": "foobar:9092"},
+                "mode": "PIPELINED",
+                "max_in_flight_messages": 2,
+            },
+            mock_context,
+        )
+        assert kafka_sink.config.mode == KafkaSinkMode.PIPELINED
+
+        delivery_callbacks = []
+        mock_producer_instance.produce.side_effect = (
+            lambda **kwargs: delivery_callbacks.append(kwargs["on_delivery"])
+        )
+
+        def deliver_all(timeout=0):
+            while delivery_callbacks:
+                delivery_callbacks.pop(0)(None, "ok")
+            return 0
+
+        write_callback = MagicMock(spec=WriteCallback)
+        mcp = MetadataChangeProposalWrapper(
+            entityUrn=builder.make_dataset_urn("bigquery", "table"),
+            aspect=models.StatusClass(removed=False),
+        )
+        # Nothing gets acknowledged until the in-flight cap is reached.
+        for _ in range(2):
+            kafka_sink.write_record_async(
+                RecordEnvelope(record=mcp, metadata={}), write_callback
+            )
+        assert kafka_sink.report.in_flight_messages == 2
+
+        # No flush at the end of a workunit in pipelined mode.
+        kafka_sink.handle_work_unit_end(MagicMock())
+        mock_producer_instance.flush.assert_not_called()
+
+        # Once the cap is reached, writes wait for deliveries.
+        mock_producer_instance.poll.side_effect = deliver_all
+        kafka_sink.write_record_async(
+            RecordEnvelope(record=mcp, metadata={}), write_callback
+        )
+        assert kafka_sink.report.in_flight_cap_waits == 1
+        assert write_callback.on_success.call_count == 2
+        deliver_all()
+        assert kafka_sink.report.in_flight_messages == 0
+        assert kafka_sink.report.total_records_written == 3
+        assert kafka_sink.report.max_in_flight_messages_seen == 2
+
+        kafka_sink.flush()
+        mock_producer_instance.flush.assert_called()
+        report = kafka_sink.report.as_obj()
+        assert report["produce_latency_ms_avg"] is not None
+
     @patch("datahub.ingestion.sink.datahub_kafka.RecordEnvelope", autospec=True)
     @patch("datahub.ingestion.sink.datahub_kafka.WriteCallback", autospec=True)
     def test_kafka_callback_class(self, mock_w_callback, mock_re):
@@ -1,8 +1,19 @@
+from types import SimpleNamespace
+from typing import Any, Dict, List
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import mssql
+from sqlalchemy.dialects.mssql import information_schema as ischema
 
-from datahub.ingestion.source.sql.mssql.source import SQLServerConfig, SQLServerSource
+from datahub.ingestion.source.sql.mssql.source import (
+    SCHEMA_COLUMNS_QUERY,
+    SCHEMA_FOREIGN_KEYS_QUERY,
+    SCHEMA_PK_CONSTRAINTS_QUERY,
+    SQLServerConfig,
+    SQLServerSchemaReflector,
+    SQLServerSource,
+)
 
 
 @pytest.fixture
@@ -299,3 +310,151 @@ def test_stored_procedure_vs_direct_query_compatibility(mssql_source):
     # Verify database_name is properly set
     assert sp_step["database_name"] == "test_db"
     assert direct_step["database_name"] == "test_db"
+
+
+# (name, data type, nullable, max length, precision, scale, default, collation)
+_COLUMNS = [
+    ("id", "int", "NO", None, 10, 0, None, None),
+    ("customer_id", "int", "YES", None, 10, 0, None, None),
+    ("note", "nvarchar", "YES", -1, None, None, None, "Latin1_General_CI_AS"),
+    ("code", "varchar", "NO", 20, None, None, "('new')", "Latin1_General_CI_AS"),
+    ("amount", "decimal", "NO", None, 10, 2, "((0))", None),
+    ("ratio", "float", "YES", None, 53, None, None, None),
+    ("created_at", "datetime2", "NO", None, None, None, "(getdate())", None),
+]
+
+# (name, ordinal, column, referred schema, referred table, referred column, update rule, delete rule)
+_FOREIGN_KEYS = [
+    ("fk_customer", 1, "customer_id", "dbo", "customers", "id", "NO ACTION", "CASCADE"),
+    (
+        "fk_product",
+        1,
+        "product_id",
+        "catalog",
+        "products",
+        "id",
+        "SET NULL",
+        "NO ACTION",
+    ),
+    (
+        "fk_product",
+        2,
+        "variant",
+        "catalog",
+        "products",
+        "variant",
+        "SET NULL",
+        "NO ACTION",
+    ),
+]
+
+_SCHEMA_ROWS: Dict[str, List[Any]] = {
+    SCHEMA_COLUMNS_QUERY: [("orders", *column) for column in _COLUMNS],
+    SCHEMA_PK_CONSTRAINTS_QUERY: [("orders", "id", "PK_orders")],
+    SCHEMA_FOREIGN_KEYS_QUERY: [
+        ("orders", *foreign_key) for foreign_key in _FOREIGN_KEYS
+    ],
+}
+
+
+def _make_schema_connection() -> MagicMock:
+    def execute(statement: Any, *args: Any, **kwargs: Any) -> MagicMock:
+        result = MagicMock()
+        result.fetchall.return_value = _SCHEMA_ROWS.get(str(statement), [])
+        return result
+
+    connection = MagicMock()
+    connection.execute.side_effect = execute
+    return connection
+
+
+def _make_table_connection(mappings: List[dict]) -> MagicMock:
+    """A connection returning the rows of the per-table queries of MSDialect."""
+    connection = MagicMock()
+    connection.execution_options.return_value = connection
+    connection.execute.return_value.mappings.return_value = mappings
+    connection.execute.return_value.fetchall.return_value = [
+        ("dbo", name, ordinal, column, *referred, "SIMPLE", update_rule, delete_rule)
+        for name, ordinal, column, *referred, update_rule, delete_rule in _FOREIGN_KEYS
+    ]
+    return connection
+
+
+def test_schema_reflector_matches_inspector():
+    dialect = mssql.dialect()
+    dialect._supports_nvarchar_max = True
+    reflector = SQLServerSchemaReflector(
+        SimpleNamespace(bind=_make_schema_connection(), dialect=dialect)  # type: ignore[arg-type]
+    )
+
+    columns = ischema.columns.c
+    table_columns = dialect.get_columns(
+        _make_table_connection(
+            [
+                {
+                    columns.column_name: name,
+                    columns.data_type: data_type,
+                    columns.is_nullable: is_nullable,
+                    columns.character_maximum_length: char_length,
+                    columns.numeric_precision: precision,
+                    columns.numeric_scale: scale,
+                    columns.column_default: default,
+                    columns.collation_name: collation,
+                    ischema.computed_columns.c.definition: None,
+                    ischema.computed_columns.c.is_persisted: None,
+                    ischema.identity_columns.c.is_identity: None,
+                    ischema.identity_columns.c.seed_value: None,
+                    ischema.identity_columns.c.increment_value: None,
+                }
+                for (
+                    name,
+                    data_type,
+                    is_nullable,
+                    char_length,
+                    precision,
+                    scale,
+                    default,
+                    collation,
+                ) in _COLUMNS
+            ]
+        ),
+        "orders",
+        schema="dbo",
+    )
+    schema_columns = reflector.get_columns("dbo")
+    assert list(schema_columns) == ["orders"]
+    # The identity of the columns isn't reflected in bulk.
+    assert [
+        {**column, "type": repr(column["type"])} for column in schema_columns["orders"]
+    ] == [
+        {
+            **{key: column[key] for key in ("name", "nullable", "default")},
+            "type": repr(column["type"]),
+        }
+        for column in table_columns
+    ]
+
+    pk_constraint = dialect.get_pk_constraint(
+        _make_table_connection(
+            [
+                {
+                    "COLUMN_NAME": "customer_id",
+                    "CONSTRAINT_TYPE": "UNIQUE",
+                    "CONSTRAINT_NAME": "UQ_orders",
+                },
+                {
+                    "COLUMN_NAME": "id",
+                    "CONSTRAINT_TYPE": "PRIMARY KEY",
+                    "CONSTRAINT_NAME": "PK_orders",
+                },
+            ]
+        ),
+        "orders",
+        schema="dbo",
+    )
+    assert reflector.get_pk_constraints("dbo") == {"orders": pk_constraint}
+
+    foreign_keys = dialect.get_foreign_keys(
+        _make_table_connection([]), "orders", schema="dbo"
+    )
+    assert reflector.get_foreign_keys("dbo") == {"orders": foreign_keys}
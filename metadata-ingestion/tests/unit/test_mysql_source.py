@@ -0,0 +1,139 @@
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest import mock
+
+from sqlalchemy.dialects import mysql
+
+from datahub.ingestion.source.sql.mysql import (
+    SCHEMA_COLUMNS_QUERY,
+    SCHEMA_FOREIGN_KEYS_QUERY,
+    SCHEMA_PK_CONSTRAINTS_QUERY,
+    SCHEMA_TABLE_COMMENTS_QUERY,
+    MySQLSchemaReflector,
+)
+
+_SHOW_CREATE_TABLE = """CREATE TABLE `orders` (
+  `id` int NOT NULL AUTO_INCREMENT,
+  `customer_id` int DEFAULT NULL,
+  `note` varchar(100) CHARACTER SET latin1 COLLATE latin1_swedish_ci DEFAULT NULL COMMENT 'free text',
+  `code` varchar(20) COLLATE utf8mb4_bin NOT NULL,
+  `status` varchar(20) NOT NULL,
+  `amount` decimal(10,2) NOT NULL,
+  PRIMARY KEY (`id`),
+  KEY `fk_customer` (`customer_id`),
+  CONSTRAINT `fk_customer` FOREIGN KEY (`customer_id`) REFERENCES `customers` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT='Orders'"""
+
+_TABLE = ("BASE TABLE", "utf8mb4_0900_ai_ci")
+
+# The information_schema rows of the table created by _SHOW_CREATE_TABLE.
+_SCHEMA_ROWS: Dict[str, List[Any]] = {
+    SCHEMA_COLUMNS_QUERY: [
+        ("orders", "id", "int", "NO", "auto_increment", None, None, "", *_TABLE),
+        ("orders", "customer_id", "int", "YES", "", None, None, "", *_TABLE),
+        (
+            "orders",
+            "note",
+            "varchar(100)",
+            "YES",
+            "",
+            "latin1",
+            "latin1_swedish_ci",
+            "free text",
+            *_TABLE,
+        ),
+        (
+            "orders",
+            "code",
+            "varchar(20)",
+            "NO",
+            "",
+            "utf8mb4",
+            "utf8mb4_bin",
+            "",
+            *_TABLE,
+        ),
+        (
+            "orders",
+            "status",
+            "varchar(20)",
+            "NO",
+            "",
+            "utf8mb4",
+            "utf8mb4_0900_ai_ci",
+            "",
+            *_TABLE,
+        ),
+        ("orders", "amount", "decimal(10,2)", "NO", "", None, None, "", *_TABLE),
+    ],
+    SCHEMA_PK_CONSTRAINTS_QUERY: [("orders", "id")],
+    SCHEMA_FOREIGN_KEYS_QUERY: [
+        (
+            "orders",
+            "fk_customer",
+            "customer_id",
+            "shop",
+            "customers",
+            "id",
+            "NO ACTION",
+            "CASCADE",
+        )
+    ],
+    SCHEMA_TABLE_COMMENTS_QUERY: [("orders", "Orders")],
+}
+
+
+def _make_dialect() -> mysql.dialect:
+    dialect = mysql.dialect()
+    # Set when connecting to the server.
+    dialect._connection_charset = "utf8mb4"
+    dialect._needs_correct_for_88718_96365 = False
+    return dialect
+
+
+def _make_schema_connection() -> mock.MagicMock:
+    def execute(statement: Any, *args: Any, **kwargs: Any) -> mock.MagicMock:
+        result = mock.MagicMock()
+        result.fetchall.return_value = _SCHEMA_ROWS.get(str(statement), [])
+        return result
+
+    connection = mock.MagicMock()
+    connection.execute.side_effect = execute
+    return connection
+
+
+def _make_table_connection() -> mock.MagicMock:
+    connection = mock.MagicMock()
+    connection.execution_options.return_value = connection
+    connection.exec_driver_sql.return_value.first.return_value = (
+        "orders",
+        _SHOW_CREATE_TABLE,
+    )
+    return connection
+
+
+def _with_type_repr(columns: List[dict]) -> List[dict]:
+    return [{**column, "type": repr(column["type"])} for column in columns]
+
+
+def test_schema_reflector_matches_inspector():
+    dialect = _make_dialect()
+    reflector = MySQLSchemaReflector(
+        SimpleNamespace(bind=_make_schema_connection(), dialect=dialect)  # type: ignore[arg-type]
+    )
+    connection = _make_table_connection()
+
+    columns = reflector.get_columns("shop")
+    assert list(columns) == ["orders"]
+    assert _with_type_repr(columns["orders"]) == _with_type_repr(
+        dialect.get_columns(connection, "orders", schema="shop")
+    )
+    assert reflector.get_pk_constraints("shop") == {
+        "orders": dialect.get_pk_constraint(connection, "orders", schema="shop")
+    }
+    assert reflector.get_foreign_keys("shop") == {
+        "orders": dialect.get_foreign_keys(connection, "orders", schema="shop")
+    }
+    assert reflector.get_table_comments("shop") == {
+        "orders": dialect.get_table_comment(connection, "orders", schema="shop")
+    }
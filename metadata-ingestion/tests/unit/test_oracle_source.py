@@ -1,9 +1,17 @@
 import unittest.mock
+from types import SimpleNamespace
+from typing import Any, List
 
 import pytest
+from sqlalchemy.dialects import oracle
 
 from datahub.ingestion.api.common import PipelineContext
-from datahub.ingestion.source.sql.oracle import OracleConfig, OracleSource
+from datahub.ingestion.source.sql.oracle import (
+    OracleConfig,
+    OracleInspectorObjectWrapper,
+    OracleSchemaReflector,
+    OracleSource,
+)
 
 
 def test_oracle_config():
@@ -43,3 +51,188 @@ def test_oracle_config():
             },
             PipelineContext("test-oracle-config"),
         ).get_workunits()
+
+
+_IDENTITY = "BY DEFAULT,START WITH: 1, INCREMENT BY: 1, MAX_VALUE: 9999999999, MIN_VALUE: 1, CYCLE_FLAG: N, CACHE_SIZE: 20, ORDER_FLAG: N"
+
+# The rows of the DBA_TAB_COLS query, ordered by table name and column id.
+_COLUMN_ROWS = [
+    ("ID", "NUMBER", None, None, 0, "N", None, None, "NO", "NO", None, "CUSTOMERS"),
+    (
+        "NAME",
+        "NVARCHAR2",
+        50,
+        None,
+        None,
+        "Y",
+        None,
+        None,
+        "NO",
+        None,
+        None,
+        "CUSTOMERS",
+    ),
+    ("ID", "NUMBER", None, None, 0, "N", None, None, "NO", "NO", _IDENTITY, "ORDERS"),
+    (
+        "CUSTOMER_ID",
+        "NUMBER",
+        None,
+        10,
+        0,
+        "Y",
+        None,
+        "The customer",
+        "NO",
+        None,
+        None,
+        "ORDERS",
+    ),
+    ("note", "VARCHAR2", 100, None, None, "Y", None, None, "NO", None, None, "ORDERS"),
+    ("AMOUNT", "NUMBER", None, 10, 2, "N", "0", None, "NO", None, None, "ORDERS"),
+    (
+        "TOTAL",
+        "NUMBER",
+        None,
+        12,
+        2,
+        "Y",
+        '"AMOUNT"*2',
+        None,
+        "YES",
+        None,
+        None,
+        "ORDERS",
+    ),
+    (
+        "CREATED_AT",
+        "TIMESTAMP(6) WITH TIME ZONE",
+        None,
+        None,
+        6,
+        "N",
+        "SYSTIMESTAMP",
+        None,
+        "NO",
+        None,
+        None,
+        "ORDERS",
+    ),
+]
+
+# The rows of the constraints query, ordered by table name, constraint name and position.
+_CONSTRAINT_ROWS = [
+    ("PK_CUSTOMERS", "P", "ID", None, None, None, 1, None, None, None, "CUSTOMERS"),
+    (
+        "FK_CUSTOMER",
+        "R",
+        "CUSTOMER_ID",
+        "CUSTOMERS",
+        "ID",
+        "SHOP",
+        1,
+        1,
+        None,
+        "CASCADE",
+        "ORDERS",
+    ),
+    (
+        "FK_PRODUCT",
+        "R",
+        "PRODUCT_ID",
+        "PRODUCTS",
+        "ID",
+        "CATALOG",
+        1,
+        1,
+        None,
+        "NO ACTION",
+        "ORDERS",
+    ),
+    (
+        "FK_PRODUCT",
+        "R",
+        "VARIANT",
+        "PRODUCTS",
+        "VARIANT",
+        "CATALOG",
+        2,
+        2,
+        None,
+        "NO ACTION",
+        "ORDERS",
+    ),
+    ("PK_ORDERS", "P", "ID", None, None, None, 1, None, None, None, "ORDERS"),
+    (
+        "SYS_C0012",
+        "C",
+        "AMOUNT",
+        None,
+        None,
+        None,
+        1,
+        None,
+        '"AMOUNT" >= 0',
+        None,
+        "ORDERS",
+    ),
+]
+
+_COMMENT_ROWS = [("CUSTOMERS", None), ("ORDERS", "The orders")]
+
+
+def _make_oracle_connection() -> unittest.mock.MagicMock:
+    def execute(statement, params=None, **kwargs):
+        query = str(statement)
+        table_name = (params or {}).get("table_name")
+        rows: List[Any]
+        if "FROM dba_tab_cols" in query:
+            rows = _COLUMN_ROWS
+        elif "FROM dba_constraints" in query:
+            rows = _CONSTRAINT_ROWS
+        elif table_name is None:
+            rows = _COMMENT_ROWS
+        else:
+            # The comment of a single table.
+            rows = [(comment, table) for table, comment in _COMMENT_ROWS]
+        if table_name is not None:
+            rows = [row for row in rows if row[-1] == table_name]
+        result = unittest.mock.MagicMock()
+        result.fetchall.return_value = rows
+        result.__iter__.side_effect = lambda: iter(rows)
+        result.scalar.return_value = rows[0][0] if rows else None
+        return result
+
+    connection = unittest.mock.MagicMock()
+    connection.execute.side_effect = execute
+    return connection
+
+
+def test_schema_reflector_matches_inspector():
+    dialect = oracle.dialect()
+    dialect.server_version_info = (19, 0)
+    wrapper = OracleInspectorObjectWrapper(
+        SimpleNamespace(bind=_make_oracle_connection(), dialect=dialect)  # type: ignore[arg-type]
+    )
+    reflector = OracleSchemaReflector(wrapper)
+
+    def with_type_repr(columns):
+        return [{**column, "type": repr(column["type"])} for column in columns]
+
+    columns = reflector.get_columns("shop")
+    assert list(columns) == ["customers", "orders"]
+    for table, table_columns in columns.items():
+        assert with_type_repr(table_columns) == with_type_repr(
+            wrapper.get_columns(table, "shop")
+        )
+    assert reflector.get_pk_constraints("shop") == {
+        table: wrapper.get_pk_constraint(table, "shop")
+        for table in ["customers", "orders"]
+    }
+    assert reflector.get_foreign_keys("shop") == {
+        table: wrapper.get_foreign_keys(table, "shop")
+        for table in ["customers", "orders"]
+    }
+    assert reflector.get_table_comments("shop") == {
+        table: wrapper.get_table_comment(table, "shop")
+        for table in ["customers", "orders"]
+    }
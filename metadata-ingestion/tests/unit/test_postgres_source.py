@@ -1,8 +1,20 @@
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
 from unittest import mock
 from unittest.mock import patch
 
+from sqlalchemy.dialects import postgresql
+
 from datahub.ingestion.api.common import PipelineContext
-from datahub.ingestion.source.sql.postgres import PostgresConfig, PostgresSource
+from datahub.ingestion.source.sql.postgres import (
+    SCHEMA_COLUMNS_QUERY,
+    SCHEMA_FOREIGN_KEYS_QUERY,
+    SCHEMA_PK_CONSTRAINTS_QUERY,
+    SCHEMA_TABLE_COMMENTS_QUERY,
+    PostgresConfig,
+    PostgresSchemaReflector,
+    PostgresSource,
+)
 
 
 def _base_config():
@@ -80,3 +92,101 @@ def test_current_sqlalchemy_database_in_identifier():
         )
         == "current_db.superset.logs"
     )
+
+
+_SCHEMA_ROWS: Dict[str, List[Any]] = {
+    SCHEMA_COLUMNS_QUERY: [
+        ("orders", "id", "integer", "nextval('orders_id_seq'::regclass)", True, None),
+        ("orders", "customer_id", "integer", None, False, "The customer"),
+        ("orders", "product_id", "integer", None, False, None),
+        ("orders", "Variant", "character varying(100)", None, False, None),
+        ("orders", "amount", "numeric(10,2)", None, True, None),
+        ("orders", "created_at", "timestamp with time zone", "now()", True, None),
+    ],
+    SCHEMA_PK_CONSTRAINTS_QUERY: [("orders", "orders_pkey", "id")],
+    SCHEMA_FOREIGN_KEYS_QUERY: [
+        (
+            "orders",
+            "orders_customer_id_fkey",
+            "FOREIGN KEY (customer_id) REFERENCES customers(id) ON DELETE CASCADE",
+            "public",
+        ),
+        (
+            "orders",
+            "orders_product_fkey",
+            'FOREIGN KEY (product_id, "Variant") REFERENCES catalog.products(id, "Variant") ON UPDATE SET NULL',
+            "catalog",
+        ),
+    ],
+    SCHEMA_TABLE_COMMENTS_QUERY: [("orders", "The orders")],
+}
+
+
+def _table_rows(query: str) -> List[Any]:
+    """The rows of the per-table queries of PGDialect for the table of _SCHEMA_ROWS."""
+    if "relname = :table_name" in query:
+        return [(1234,)]
+    # Checked first, since the primary key query filters on a.attrelid as well.
+    if "ix.indisprimary" in query:
+        return [("id",)]
+    if "a.attrelid = :table_oid" in query:
+        return [
+            (name, format_type, default, notnull, 1234, comment, "", None)
+            for _, name, format_type, default, notnull, comment in _SCHEMA_ROWS[
+                SCHEMA_COLUMNS_QUERY
+            ]
+        ]
+    if "r.contype = 'p'" in query:
+        return [("orders_pkey",)]
+    if "r.contype = 'f'" in query:
+        return [row[1:] for row in _SCHEMA_ROWS[SCHEMA_FOREIGN_KEYS_QUERY]]
+    if "pgd.objsubid = 0" in query:
+        return [("The orders",)]
+    # Enums and domains.
+    return []
+
+
+def _make_connection(rows: Callable[[str], List[Any]]) -> mock.MagicMock:
+    def execute(statement: Any, *args: Any, **kwargs: Any) -> mock.MagicMock:
+        result = mock.MagicMock()
+        result_rows = rows(str(statement))
+        result.fetchall.return_value = result_rows
+        result.__iter__.side_effect = lambda: iter(result_rows)
+        result.scalar.return_value = result_rows[0][0] if result_rows else None
+        return result
+
+    connection = mock.MagicMock()
+    connection.execute.side_effect = execute
+    return connection
+
+
+def _with_type_repr(columns: List[dict]) -> List[dict]:
+    return [{**column, "type": repr(column["type"])} for column in columns]
+
+
+def test_schema_reflector_matches_inspector():
+    dialect = postgresql.dialect()
+    dialect.server_version_info = (14, 0)
+    dialect.default_schema_name = "public"
+    reflector = PostgresSchemaReflector(
+        SimpleNamespace(  # type: ignore[arg-type]
+            bind=_make_connection(lambda query: _SCHEMA_ROWS.get(query, [])),
+            dialect=dialect,
+        )
+    )
+    connection = _make_connection(_table_rows)
+
+    columns = reflector.get_columns("public")
+    assert list(columns) == ["orders"]
+    assert _with_type_repr(columns["orders"]) == _with_type_repr(
+        dialect.get_columns(connection, "orders", "public")
+    )
+    assert reflector.get_pk_constraints("public") == {
+        "orders": dialect.get_pk_constraint(connection, "orders", "public")
+    }
+    assert reflector.get_foreign_keys("public") == {
+        "orders": dialect.get_foreign_keys(connection, "orders", "public")
+    }
+    assert reflector.get_table_comments("public") == {
+        "orders": dialect.get_table_comment(connection, "orders", "public")
+    }
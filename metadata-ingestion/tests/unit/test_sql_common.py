@@ -1,9 +1,18 @@
-from typing import Dict
+import contextlib
+import pathlib
+from typing import Dict, List
 from unittest import mock
 
 import pytest
-
-from datahub.ingestion.source.sql.sql_common import PipelineContext, SQLAlchemySource
+from freezegun import freeze_time
+from sqlalchemy import create_engine
+from sqlalchemy.engine.reflection import Inspector
+
+from datahub.ingestion.source.sql.sql_common import (
+    PipelineContext,
+    SchemaReflector,
+    SQLAlchemySource,
+)
 from datahub.ingestion.source.sql.sql_config import SQLCommonConfig
 from datahub.ingestion.source.sql.sqlalchemy_uri_mapper import (
     get_platform_from_sqlalchemy_uri,
@@ -200,3 +209,114 @@ def test_fine_grained_lineages(
 
     assert actual_downstream == expected_simplified_downstream
     assert actual_upstream == expected_simplified_upstream
+
+
+FROZEN_TIME = "2024-01-01 00:00:00"
+
+
+class _SQLiteConfig(SQLCommonConfig):
+    path: str
+
+    def get_sql_alchemy_url(self):
+        return f"sqlite:///{self.path}"
+
+
+class _SQLiteSchemaReflector(SchemaReflector):
+    """Reflects all the tables of the schema at once, with the dialect's per-table methods."""
+
+    def _reflect(self, schema: str, method: str) -> Dict:
+        return {
+            table: getattr(self.inspector.dialect, method)(
+                self.inspector.bind,
+                table,
+                schema,
+                info_cache=self.inspector.info_cache,
+            )
+            for table in [
+                *self.inspector.get_table_names(schema),
+                *self.inspector.get_view_names(schema),
+            ]
+        }
+
+    def get_columns(self, schema: str) -> Dict[str, List[dict]]:
+        return self._reflect(schema, "get_columns")
+
+    def get_pk_constraints(self, schema: str) -> Dict[str, dict]:
+        return self._reflect(schema, "get_pk_constraint")
+
+    def get_foreign_keys(self, schema: str) -> Dict[str, List[dict]]:
+        return self._reflect(schema, "get_foreign_keys")
+
+
+class _SQLiteSource(SQLAlchemySource):
+    def make_schema_reflector(self, inspector: Inspector) -> SchemaReflector:
+        return _SQLiteSchemaReflector(inspector)
+
+
+@pytest.fixture
+def sqlite_db(tmp_path: pathlib.Path) -> str:
+    path = str(tmp_path / "test.db")
+    with create_engine(f"sqlite:///{path}").begin() as conn:
+        conn.execute("CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.execute(
+            "CREATE TABLE orders (id INTEGER, customer_id INTEGER, amount NUMERIC(10, 2), "
+            "PRIMARY KEY (id), CONSTRAINT fk_customer FOREIGN KEY (customer_id) REFERENCES customers (id))"
+        )
+        conn.execute(
+            "CREATE VIEW big_orders AS SELECT * FROM orders WHERE amount > 100"
+        )
+    return path
+
+
+def _ingest_sqlite(path: str, **config: object) -> "tuple[_SQLiteSource, list, dict]":
+    source = _SQLiteSource(
+        _SQLiteConfig.parse_obj({"path": path, **config}),
+        PipelineContext(run_id="test_bulk_schema_reflection"),
+        "sqlite",
+    )
+    per_table_methods = ["get_columns", "get_pk_constraint", "get_foreign_keys"]
+    with contextlib.ExitStack() as stack:
+        mocks = {
+            method: stack.enter_context(
+                mock.patch.object(
+                    Inspector,
+                    method,
+                    autospec=True,
+                    side_effect=getattr(Inspector, method),
+                )
+            )
+            for method in per_table_methods
+        }
+        workunits = [wu.metadata.to_obj() for wu in source.get_workunits_internal()]
+    calls = {method: mocks[method].call_count for method in per_table_methods}
+    return source, workunits, calls
+
+
+@freeze_time(FROZEN_TIME)
+def test_bulk_schema_reflection(sqlite_db: str) -> None:
+    _, expected_workunits, calls = _ingest_sqlite(
+        sqlite_db, bulk_schema_reflection=False
+    )
+    assert calls == {"get_columns": 3, "get_pk_constraint": 2, "get_foreign_keys": 2}
+
+    source, workunits, calls = _ingest_sqlite(sqlite_db)
+    assert calls == {"get_columns": 0, "get_pk_constraint": 0, "get_foreign_keys": 0}
+    assert workunits == expected_workunits
+    assert source.report.num_bulk_reflections == 3
+    assert source.report.num_tables_reflected_individually == 0
+
+
+@freeze_time(FROZEN_TIME)
+def test_bulk_schema_reflection_failure(sqlite_db: str) -> None:
+    _, expected_workunits, _ = _ingest_sqlite(sqlite_db, bulk_schema_reflection=False)
+
+    with mock.patch.object(
+        _SQLiteSchemaReflector, "get_columns", side_effect=Exception("denied")
+    ):
+        source, workunits, calls = _ingest_sqlite(sqlite_db)
+    assert calls == {"get_columns": 3, "get_pk_constraint": 0, "get_foreign_keys": 0}
+    assert workunits == expected_workunits
+    assert source.report.num_tables_reflected_individually == 3
+    assert [w.title for w in source.report.warnings] == [
+        "Failed to reflect schema in bulk"
+    ]
@@ -2,6 +2,7 @@ from datahub.configuration.common import AllowDenyPattern
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.source.superset import SupersetConfig, SupersetSource
 from datahub.sql_parsing.sqlglot_lineage import create_lineage_sql_parsed_result
+from datahub.utilities.http_response_cache import HttpResponseCache
 
 
 def test_default_values():
@@ -48,6 +49,31 @@ def test_superset_login(requests_mock):
     assert source.platform == "superset"
 
 
+def test_superset_reports_http_response_cache(requests_mock, tmp_path):
+    login_url = "http://localhost:8088/api/v1/security/login"
+    requests_mock.post(login_url, json={"access_token": "dummy_token"}, status_code=200)
+
+    dashboard_url = "http://localhost:8088/api/v1/dashboard/"
+    requests_mock.get(dashboard_url, json={}, status_code=200)
+
+    for entity in ["dataset", "dashboard", "chart"]:
+        requests_mock.get(
+            f"http://localhost:8088/api/v1/{entity}/related/owners",
+            json={},
+            status_code=200,
+        )
+
+    config = SupersetConfig.parse_obj(
+        {"http_response_cache": {"enabled": True, "path": tmp_path / "cache.sqlite"}}
+    )
+    source = SupersetSource(
+        ctx=PipelineContext(run_id="superset-source-cache-test"), config=config
+    )
+    cache = HttpResponseCache.for_config(config.http_response_cache, "superset")
+    assert source.report.http_response_cache is cache.stats
+    cache.close()
+
+
 def test_superset_build_owners_info(requests_mock):
     login_url = "http://localhost:8088/api/v1/security/login"
     requests_mock.post(login_url, json={"access_token": "dummy_token"}, status_code=200)
@@ -2281,6 +2281,75 @@ def test_pattern_dataset_schema_tags_transformation(mock_time):
     )
 
 
+def test_simple_dataset_ownership_transformer_semantics_patch_with_prefetch(
+    mock_time,
+):
+    server_owner = builder.make_user_urn("server_owner")
+    added_owner = builder.make_user_urn("added_owner")
+    dataset_with_ownership = builder.make_dataset_urn("bigquery", "example1")
+    dataset_without_ownership = builder.make_dataset_urn("bigquery", "example2")
+
+    def fake_get_entities(
+        entity_name: str, urns: List[str], aspects: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        assert entity_name == "dataset"
+        assert aspects == ["ownership"]
+        return {
+            urn: {"ownership": (gen_owners([server_owner]), None)}
+            for urn in urns
+            if urn == dataset_with_ownership
+        }
+
+    mock_graph = mock.MagicMock()
+    mock_graph.get_entities.side_effect = fake_get_entities
+    pipeline_context = PipelineContext(run_id="transformer_pipe_line")
+    pipeline_context.graph = mock_graph
+
+    transformer = SimpleAddDatasetOwnership.create(
+        {
+            "semantics": TransformerSemantics.PATCH,
+            "owner_urns": [added_owner],
+            "prefetch_window_size": 10,
+        },
+        pipeline_context,
+    )
+    outputs = list(
+        transformer.transform(
+            [
+                RecordEnvelope(record, metadata={})
+                for record in [
+                    make_generic_dataset_mcp(
+                        entity_urn=dataset_with_ownership,
+                        aspect=gen_owners([builder.make_user_urn("source_owner")]),
+                    ),
+                    make_generic_dataset_mcp(entity_urn=dataset_without_ownership),
+                    EndOfStream(),
+                ]
+            ]
+        )
+    )
+
+    # One batched lookup for the records window, one for the end of stream.
+    assert mock_graph.get_entities.call_count == 2
+    mock_graph.get_ownership.assert_not_called()
+    mock_graph.get_aspect.assert_not_called()
+
+    assert len(outputs) == 4
+    first_ownership = outputs[0].record.aspect
+    assert isinstance(first_ownership, models.OwnershipClass)
+    assert {owner.owner for owner in first_ownership.owners} == {
+        builder.make_user_urn("source_owner"),
+        added_owner,
+        server_owner,
+    }
+    assert isinstance(outputs[1].record.aspect, models.StatusClass)
+    eos_ownership = outputs[2].record.aspect
+    assert outputs[2].record.entityUrn == dataset_without_ownership
+    assert isinstance(eos_ownership, models.OwnershipClass)
+    assert [owner.owner for owner in eos_ownership.owners] == [added_owner]
+    assert isinstance(outputs[3].record, EndOfStream)
+
+
 def run_dataset_transformer_pipeline(
     transformer_type: Type[Union[DatasetTransformer, TagTransformer]],
     aspect: Optional[builder.Aspect],
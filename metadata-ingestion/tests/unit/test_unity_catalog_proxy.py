@@ -0,0 +1,180 @@
+from typing import Optional
+from unittest.mock import patch
+
+from databricks.sdk.service.catalog import CatalogType, TableType
+from freezegun import freeze_time
+
+from datahub.ingestion.source.unity.proxy import UnityCatalogApiProxy
+from datahub.ingestion.source.unity.proxy_types import (
+    Catalog,
+    ExternalTableReference,
+    Schema,
+    Table,
+    TableReference,
+)
+from datahub.ingestion.source.unity.report import UnityCatalogReport
+
+
+def _table(name: str) -> Table:
+    catalog = Catalog(
+        id="main",
+        name="main",
+        comment=None,
+        metastore=None,
+        owner=None,
+        type=CatalogType.MANAGED_CATALOG,
+    )
+    schema = Schema(
+        id="main.sales", name="sales", comment=None, catalog=catalog, owner=None
+    )
+    return Table(
+        id=f"main.sales.{name}",
+        name=name,
+        comment=None,
+        schema=schema,
+        columns=[],
+        storage_location=None,
+        data_source_format=None,
+        table_type=TableType.MANAGED,
+        owner=None,
+        generation=None,
+        created_at=None,
+        created_by=None,
+        updated_at=None,
+        updated_by=None,
+        table_id=None,
+        view_definition=None,
+        properties={},
+    )
+
+
+def _lineage_row(
+    source: Optional[str] = None,
+    source_path: Optional[str] = None,
+    target: Optional[str] = None,
+    notebook_id: Optional[str] = None,
+) -> dict:
+    source_catalog, source_schema, source_table = (
+        source.split(".") if source else (None, None, None)
+    )
+    target_catalog, target_schema, target_table = (
+        target.split(".") if target else (None, None, None)
+    )
+    return {
+        "entity_type": "NOTEBOOK" if notebook_id else "JOB",
+        "entity_id": notebook_id or "123",
+        "source_table_catalog": source_catalog,
+        "source_table_schema": source_schema,
+        "source_table_name": source_table,
+        "source_path": source_path,
+        "target_table_catalog": target_catalog,
+        "target_table_schema": target_schema,
+        "target_table_name": target_table,
+    }
+
+
+def _proxy(
+    warehouse_id: Optional[str], max_api_calls_per_second: Optional[int] = None
+) -> UnityCatalogApiProxy:
+    with patch("datahub.ingestion.source.unity.proxy.WorkspaceClient"):
+        return UnityCatalogApiProxy(
+            "https://workspace_url",
+            "token",
+            warehouse_id,
+            report=UnityCatalogReport(),
+            max_api_calls_per_second=max_api_calls_per_second,
+        )
+
+
+def test_table_lineage_from_system_table():
+    proxy = _proxy(warehouse_id="warehouse")
+    rows = [
+        _lineage_row(source="main.raw.orders", target="main.sales.orders"),
+        _lineage_row(
+            source="main.raw.customers", target="main.sales.orders", notebook_id="1"
+        ),
+        _lineage_row(source_path="s3://bucket/orders", target="main.sales.orders"),
+        _lineage_row(source="main.sales.orders", notebook_id="2"),
+        _lineage_row(source="main.raw.items", target="main.sales.items"),
+    ]
+    with (
+        patch.object(
+            proxy, "_execute_sql_query_or_raise", return_value=rows
+        ) as execute_sql,
+        patch.object(proxy, "list_lineages_by_table") as list_lineages_by_table,
+    ):
+        orders = _table("orders")
+        proxy.table_lineage(orders, include_entity_lineage=True)
+        items = _table("items")
+        proxy.table_lineage(items, include_entity_lineage=True)
+        unknown = _table("unknown")
+        proxy.table_lineage(unknown, include_entity_lineage=True)
+
+    # A single query for the whole catalog
+    assert execute_sql.call_count == 1
+    list_lineages_by_table.assert_not_called()
+
+    assert set(orders.upstreams) == {
+        TableReference(None, "main", "raw", "orders"),
+        TableReference(None, "main", "raw", "customers"),
+    }
+    assert orders.external_upstreams == {
+        ExternalTableReference(
+            path="s3://bucket/orders",
+            has_permission=True,
+            name=None,
+            type=None,
+            storage_location=None,
+        )
+    }
+    assert orders.upstream_notebooks == {1}
+    assert orders.downstream_notebooks == {2}
+    assert set(items.upstreams) == {TableReference(None, "main", "raw", "items")}
+    assert not unknown.upstreams
+
+
+def test_table_lineage_falls_back_to_api():
+    proxy = _proxy(warehouse_id="warehouse")
+    with (
+        patch.object(
+            proxy,
+            "_execute_sql_query_or_raise",
+            side_effect=Exception("system schema not enabled"),
+        ),
+        patch.object(
+            proxy,
+            "list_lineages_by_table",
+            return_value={
+                "upstreams": [
+                    {
+                        "tableInfo": {
+                            "catalog_name": "main",
+                            "schema_name": "raw",
+                            "name": "orders",
+                        }
+                    }
+                ]
+            },
+        ) as list_lineages_by_table,
+    ):
+        orders = _table("orders")
+        proxy.table_lineage(orders, include_entity_lineage=False)
+
+    list_lineages_by_table.assert_called_once_with(
+        table_name="main.sales.orders", include_entity_lineage=False
+    )
+    assert set(orders.upstreams) == {TableReference(None, "main", "raw", "orders")}
+
+
+@freeze_time("2024-01-01 00:00:00")
+def test_api_calls_are_rate_limited():
+    proxy = _proxy(warehouse_id=None, max_api_calls_per_second=2)
+    with patch("datahub.utilities.ratelimiter.time.sleep") as sleep:
+        for _ in range(4):
+            proxy.list_lineages_by_table("main.sales.orders", False)
+
+    # The time is frozen, as if the calls were made by concurrent threads.
+    assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1.0]
+    assert proxy.report.rate_limit is not None
+    assert proxy.report.rate_limit.requests == 4
+    assert proxy.report.rate_limit.delayed_requests == 2
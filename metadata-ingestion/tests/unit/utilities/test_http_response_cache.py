@@ -0,0 +1,157 @@
+import pathlib
+from typing import Sequence
+
+import requests
+import requests_mock
+
+from datahub.utilities.http_response_cache import (
+    HttpResponseCache,
+    HttpResponseCacheConfig,
+    mount_http_response_cache,
+)
+
+URL = "https://bi.example.com/api/dashboards"
+
+
+def _session(
+    tmp_path: pathlib.Path, uncached_url_patterns: Sequence[str] = (), **config: object
+) -> "tuple[requests.Session, requests_mock.Adapter, HttpResponseCache]":
+    session = requests.Session()
+    adapter = requests_mock.Adapter()
+    session.mount("https://", adapter)
+    cache = mount_http_response_cache(
+        session,
+        HttpResponseCacheConfig.parse_obj(
+            {"enabled": True, "path": tmp_path / "cache.sqlite", **config}
+        ),
+        source_name="test",
+        uncached_url_patterns=uncached_url_patterns,
+    )
+    assert cache is not None
+    return session, adapter, cache
+
+
+def test_disabled_by_default():
+    session = requests.Session()
+    adapter = session.get_adapter("https://")
+    assert mount_http_response_cache(session, HttpResponseCacheConfig(), "test") is None
+    assert session.get_adapter("https://") is adapter
+
+
+def test_fresh_responses_are_served_from_cache(tmp_path):
+    session, adapter, cache = _session(tmp_path)
+    adapter.register_uri("GET", URL, json={"dashboards": [1, 2]})
+    adapter.register_uri("POST", URL, json={"created": True})
+    adapter.register_uri("GET", f"{URL}/missing", status_code=404)
+
+    for _ in range(3):
+        response = session.get(URL)
+        assert response.status_code == 200
+        assert response.json() == {"dashboards": [1, 2]}
+    # Not cached: other methods, and errors
+    for _ in range(2):
+        assert session.post(URL, json={}).json() == {"created": True}
+        assert session.get(f"{URL}/missing").status_code == 404
+
+    assert [(r.method, r.url) for r in adapter.request_history] == [
+        ("GET", URL),
+        ("POST", URL),
+        ("GET", f"{URL}/missing"),
+        ("POST", URL),
+        ("GET", f"{URL}/missing"),
+    ]
+    assert cache.stats.hits == 2
+    cache.close()
+
+    # Persisted across runs
+    session, adapter, cache = _session(tmp_path)
+    assert session.get(URL).json() == {"dashboards": [1, 2]}
+    assert not adapter.request_history
+    cache.close()
+
+
+def test_uncached_urls(tmp_path):
+    session, adapter, cache = _session(tmp_path, uncached_url_patterns=["/scanStatus/"])
+    adapter.register_uri(
+        "GET",
+        f"{URL}/scanStatus/1",
+        [{"json": {"status": "Running"}}, {"json": {"status": "Succeeded"}}],
+    )
+
+    assert session.get(f"{URL}/scanStatus/1").json() == {"status": "Running"}
+    assert session.get(f"{URL}/scanStatus/1").json() == {"status": "Succeeded"}
+    assert cache.stats.stored == 0
+    cache.close()
+
+
+def test_stale_responses_are_revalidated(tmp_path):
+    session, adapter, cache = _session(tmp_path, ttl_seconds=0)
+    adapter.register_uri(
+        "GET",
+        URL,
+        [
+            {"json": {"version": 1}, "headers": {"ETag": '"v1"'}},
+            {"status_code": 304},
+            {"json": {"version": 2}, "headers": {"ETag": '"v2"'}},
+        ],
+    )
+
+    assert session.get(URL).json() == {"version": 1}
+    # Unchanged
+    response = session.get(URL)
+    assert response.status_code == 200
+    assert response.json() == {"version": 1}
+    # Changed
+    assert session.get(URL).json() == {"version": 2}
+
+    assert [r.headers.get("If-None-Match") for r in adapter.request_history] == [
+        None,
+        '"v1"',
+        '"v1"',
+    ]
+    assert cache.stats.revalidated == 1
+    cache.close()
+
+
+def test_least_recently_used_responses_are_evicted(tmp_path):
+    session, adapter, cache = _session(tmp_path)
+    for page in range(3):
+        adapter.register_uri("GET", f"{URL}?page={page}", content=b"x" * 1000)
+    cache.max_size_bytes = 3000
+
+    session.get(f"{URL}?page=0")
+    session.get(f"{URL}?page=1")
+    session.get(f"{URL}?page=0")
+    session.get(f"{URL}?page=2")
+    assert cache.stats.evicted == 1
+
+    num_requests = len(adapter.request_history)
+    session.get(f"{URL}?page=0")
+    session.get(f"{URL}?page=2")
+    assert len(adapter.request_history) == num_requests
+    session.get(f"{URL}?page=1")
+    assert len(adapter.request_history) == num_requests + 1
+    cache.close()
+
+
+def test_responses_are_cached_per_credentials_and_format(tmp_path):
+    session, adapter, cache = _session(tmp_path)
+    adapter.register_uri("GET", URL, json={"dashboards": [1, 2]})
+
+    for _ in range(2):
+        session.get(URL, headers={"Authorization": "Bearer admin"})
+        session.get(URL, headers={"Authorization": "Bearer viewer"})
+        session.get(
+            URL, headers={"Authorization": "Bearer admin", "Accept": "text/csv"}
+        )
+
+    assert [
+        (r.headers["Authorization"], r.headers["Accept"])
+        for r in adapter.request_history
+    ] == [
+        ("Bearer admin", "*/*"),
+        ("Bearer viewer", "*/*"),
+        ("Bearer admin", "text/csv"),
+    ]
+    assert cache.stats.hits == 3
+    cache.close()
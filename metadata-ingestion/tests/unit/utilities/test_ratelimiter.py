@@ -1,8 +1,23 @@
 from collections import defaultdict
 from datetime import datetime
 from typing import Dict
+from unittest.mock import patch
 
-from datahub.utilities.ratelimiter import RateLimiter
+import pytest
+import requests
+import requests_mock
+from freezegun import freeze_time
+
+from datahub.utilities.ratelimiter import (
+    EndpointRateLimiter,
+    RateLimitConfig,
+    RateLimiter,
+    TokenBucketRateLimiter,
+    mount_rate_limiter,
+    parse_retry_after,
+)
+
+URL = "https://bi.example.com/api"
 
 
 def test_rate_is_limited():
@@ -18,3 +33,134 @@ def test_rate_is_limited():
     assert len(actual_calls) == round(TOTAL_CALLS / MAX_CALLS_PER_SEC)
     assert all(calls <= MAX_CALLS_PER_SEC for calls in actual_calls.values())
     assert sum(actual_calls.values()) == TOTAL_CALLS
+
+
+@freeze_time("2024-01-01 00:00:00")
+def test_rate_limiter_waits_outside_of_the_lock():
+    limiter = RateLimiter(max_calls=2, period=1)
+    waits = []
+
+    def sleep(seconds: float) -> None:
+        # Other callers can reserve the following slots meanwhile.
+        assert not limiter._lock.locked()
+        waits.append(seconds)
+
+    # The time is frozen, as if the callers were concurrent.
+    with patch("datahub.utilities.ratelimiter.time.sleep", side_effect=sleep):
+        for _ in range(5):
+            with limiter:
+                pass
+
+    assert waits == [1, 1, 2]
+
+
+@freeze_time("2024-01-01 00:00:00")
+def test_token_bucket_allows_bursts():
+    limiter = TokenBucketRateLimiter(rate=10, burst=2)
+
+    # Slots are reserved without waiting for the previous ones.
+    assert [limiter.reserve() for _ in range(5)] == pytest.approx([0, 0, 0.1, 0.2, 0.3])
+    assert limiter.stats.requests == 5
+    assert limiter.stats.delayed_requests == 3
+    assert limiter.stats.max_wait_seconds == pytest.approx(0.3)
+
+
+def test_token_bucket_refills_up_to_burst():
+    with freeze_time("2024-01-01 00:00:00") as frozen_time:
+        limiter = TokenBucketRateLimiter(rate=10, burst=2)
+        assert [limiter.reserve() for _ in range(2)] == [0, 0]
+        frozen_time.tick(10)
+        assert [limiter.reserve() for _ in range(3)] == pytest.approx([0, 0, 0.1])
+
+
+def test_token_bucket_adapts_to_throttling():
+    with freeze_time("2024-01-01 00:00:00") as frozen_time:
+        limiter = TokenBucketRateLimiter(rate=10, burst=1)
+        limiter.throttle(retry_after=5)
+        assert limiter.rate == 5
+        assert limiter.reserve() == pytest.approx(5)
+        assert limiter.reserve() == pytest.approx(5.2)
+
+        frozen_time.tick(10)
+        for _ in range(9):
+            limiter.succeeded()
+        assert limiter.rate == pytest.approx(9.5)
+        limiter.succeeded()
+        limiter.succeeded()
+        assert limiter.rate == 10
+        assert limiter.stats.throttled_responses == 1
+
+    non_adaptive_limiter = TokenBucketRateLimiter(rate=10, adaptive=False)
+    non_adaptive_limiter.throttle()
+    assert non_adaptive_limiter.rate == 10
+
+
+def test_endpoint_budgets():
+    limiter = EndpointRateLimiter(
+        RateLimitConfig(
+            requests_per_second=10, endpoints={"/reports/": 2, "/reports/.*/runs": 1}
+        )
+    )
+    reports_limiter = limiter.for_url(f"{URL}/reports/1/runs")
+    assert reports_limiter is not None and reports_limiter.rate == 2
+    assert limiter.for_url(f"{URL}/spaces") is limiter.default
+    assert limiter.default is not None and limiter.default.rate == 10
+    # The limiters share the stats.
+    assert reports_limiter.stats is limiter.default.stats
+
+    only_endpoints = EndpointRateLimiter(RateLimitConfig(endpoints={"/reports/": 2}))
+    assert only_endpoints.for_url(f"{URL}/spaces") is None
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after("0.5") == 0.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    with freeze_time("2024-01-01 00:00:00"):
+        assert parse_retry_after("Mon, 01 Jan 2024 00:00:30 GMT") == 30
+
+
+def test_rate_limit_disabled_by_default():
+    session = requests.Session()
+    adapter = session.get_adapter("https://")
+    assert mount_rate_limiter(session, RateLimitConfig()) is None
+    assert session.get_adapter("https://") is adapter
+
+
+def test_session_requests_are_rate_limited():
+    session = requests.Session()
+    adapter = requests_mock.Adapter()
+    session.mount("https://", adapter)
+    limiter = mount_rate_limiter(
+        session,
+        RateLimitConfig(
+            requests_per_second=10, burst=1, adaptive=False, max_throttled_retries=1
+        ),
+    )
+    assert limiter is not None
+    adapter.register_uri(
+        "GET",
+        f"{URL}/reports",
+        [
+            {"status_code": 429, "headers": {"Retry-After": "2"}},
+            {"json": {"reports": []}},
+        ],
+    )
+    adapter.register_uri(
+        "GET", f"{URL}/spaces", status_code=429, headers={"Retry-After": "1"}
+    )
+
+    with (
+        freeze_time("2024-01-01 00:00:00") as frozen_time,
+        patch("time.sleep", side_effect=frozen_time.tick) as sleep,
+    ):
+        assert session.get(f"{URL}/reports").json() == {"reports": []}
+        assert session.get(f"{URL}/spaces").status_code == 429
+
+    # Throttled requests are sent again after their Retry-After delay, and the
+    # throttled response is returned once the retries are exhausted.
+    assert [call.args[0] for call in sleep.call_args_list] == pytest.approx([2, 0.1, 1])
+    assert len(adapter.request_history) == 4
+    assert limiter.stats.requests == 4
+    assert limiter.stats.throttled_responses == 3
@@ -0,0 +1,100 @@
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List
+
+from datahub.utilities.spilling_cache import SpillingCache, memoized_method
+
+
+def _size(value: object) -> int:
+    return len(pickle.dumps(value))
+
+
+def test_values_are_computed_once():
+    cache: SpillingCache[List[int]] = SpillingCache(max_memory_bytes=1024 * 1024)
+    computed: List[str] = []
+
+    def compute(key: str) -> List[int]:
+        computed.append(key)
+        return [len(key)]
+
+    for key in ["a", "bb", "a", "a", "bb"]:
+        assert cache.get_or_compute(key, partial(compute, key)) == [len(key)]
+
+    assert computed == ["a", "bb"]
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 2
+    assert cache.stats.as_obj()["hit_rate"] == 0.6
+    cache.close()
+
+
+def test_cold_values_are_spilled_to_disk():
+    value = {"payload": "x" * 1000}
+    cache: SpillingCache[Dict[str, str]] = SpillingCache(
+        max_memory_bytes=2 * _size(value)
+    )
+    for key in ["a", "b", "c"]:
+        cache.get_or_compute(key, lambda: dict(value))
+
+    # The least recently used value was moved to disk.
+    assert cache.stats.memory_entries == 2
+    assert cache.stats.memory_bytes <= cache.max_memory_bytes
+    assert cache.stats.spilled == 1
+
+    assert cache.get_or_compute("a", lambda: {"recomputed": "a"}) == value
+    assert cache.stats.disk_hits == 1
+    assert cache.stats.misses == 3
+    # "a" is back in memory, so "b" was spilled instead.
+    assert cache.stats.spilled == 2
+    assert cache.get_or_compute("b", lambda: {"recomputed": "b"}) == value
+    cache.close()
+
+
+def test_concurrent_lookups_compute_once():
+    cache: SpillingCache[int] = SpillingCache(max_memory_bytes=1024)
+    calls = 0
+    calls_lock = threading.Lock()
+
+    def compute() -> int:
+        nonlocal calls
+        with calls_lock:
+            calls += 1
+        time.sleep(0.1)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda _: cache.get_or_compute("key", compute), range(8))
+        )
+
+    assert results == [42] * 8
+    assert calls == 1
+    cache.close()
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.request_cache: SpillingCache[dict] = SpillingCache(1024 * 1024)
+        self.requests: List[str] = []
+
+    @memoized_method("request_cache")
+    def get(self, path: str, page: int = 1) -> dict:
+        self.requests.append(f"{path}?page={page}")
+        return {"path": path, "page": page}
+
+
+def test_memoized_method():
+    client = _Client()
+    assert client.get("/reports") == {"path": "/reports", "page": 1}
+    assert client.get("/reports") == {"path": "/reports", "page": 1}
+    assert client.get("/reports", page=2) == {"path": "/reports", "page": 2}
+
+    # The cache is per instance.
+    other_client = _Client()
+    other_client.get("/reports")
+
+    assert client.requests == ["/reports?page=1", "/reports?page=2"]
+    assert other_client.requests == ["/reports?page=1"]
+    assert client.request_cache.stats.hits == 1
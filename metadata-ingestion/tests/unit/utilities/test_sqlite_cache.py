@@ -0,0 +1,43 @@
+import pathlib
+
+from datahub.utilities.sqlite_cache import SqliteCache
+
+
+class _NamesCache(SqliteCache):
+    def __init__(self, path: pathlib.Path):
+        super().__init__(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS names (name TEXT PRIMARY KEY, accessed_at REAL NOT NULL)"
+        )
+
+
+class _OtherCache(SqliteCache):
+    pass
+
+
+def test_instances_are_shared_by_path(tmp_path):
+    cache = _NamesCache.for_path(tmp_path / "cache.sqlite")
+    assert _NamesCache.for_path(tmp_path / "." / "cache.sqlite") is cache
+    names = _NamesCache.for_path(tmp_path / "names.sqlite")
+    assert names is not cache
+    names.close()
+
+    other = _OtherCache.for_path(tmp_path / "other.sqlite")
+    assert isinstance(other, _OtherCache)
+    assert list(_OtherCache._instances.values()) == [other]
+    other.close()
+
+    cache.close()
+    reopened = _NamesCache.for_path(tmp_path / "cache.sqlite")
+    assert reopened is not cache
+    reopened.close()
+
+
+def test_unused_rows_are_deleted(tmp_path):
+    cache = _NamesCache.for_path(tmp_path / "cache.sqlite")
+    cache._conn.execute("INSERT INTO names VALUES ('old', 0), ('new', 1e12)")
+    assert cache._delete_unused("names", max_age_seconds=60) == 1
+    assert [row["name"] for row in cache._conn.execute("SELECT name FROM names")] == [
+        "new"
+    ]
+    cache.close()
@@ -1,4 +1,12 @@
-from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutor
+import threading
+import time
+
+import pytest
+
+from datahub.utilities.threaded_iterator_executor import (
+    ThreadedIteratorExecutor,
+    ThreadedIteratorExecutorStats,
+)
 
 
 def test_threaded_iterator_executor():
@@ -12,3 +20,120 @@ def test_threaded_iterator_executor():
             table_of, [(i,) for i in range(1, 30)], max_workers=2
         )
     } == {x for i in range(1, 30) for x in table_of(i)}
+
+
+def test_threaded_iterator_executor_ordered():
+    def slow_range(i):
+        # Later jobs finish first.
+        time.sleep((10 - i) * 0.005)
+        for j in range(3):
+            yield (i, j)
+
+    stats = ThreadedIteratorExecutorStats()
+    results = list(
+        ThreadedIteratorExecutor.process(
+            slow_range,
+            [(i,) for i in range(10)],
+            max_workers=4,
+            ordered=True,
+            stats=stats,
+        )
+    )
+    assert results == [(i, j) for i in range(10) for j in range(3)]
+    assert stats.jobs_completed == 10
+    assert stats.items_yielded == 30
+    assert 0 < len(stats.busy_seconds_per_worker) <= 4
+    assert stats.as_obj()["jobs_completed"] == 10
+
+
+def test_threaded_iterator_executor_bounded_submission():
+    submitted = []
+
+    def args_list():
+        for i in range(20):
+            submitted.append(i)
+            yield (i,)
+
+    def job(i):
+        yield i
+
+    results = ThreadedIteratorExecutor.process(
+        job, args_list(), max_workers=2, max_pending_jobs=3
+    )
+    next(results)
+    # The args are consumed lazily, as jobs complete.
+    assert len(submitted) <= 4
+    assert sorted([0, *results]) == list(range(20))
+
+
+def test_threaded_iterator_executor_ordered_bounded_submission():
+    submitted = []
+    submitted_while_first_job_ran = []
+
+    def args_list():
+        for i in range(20):
+            submitted.append(i)
+            yield (i,)
+
+    def job(i):
+        if i == 0:
+            # The later jobs finish in the meantime, but their items can't be
+            # yielded yet.
+            time.sleep(0.2)
+            submitted_while_first_job_ran.append(len(submitted))
+        yield i
+
+    results = list(
+        ThreadedIteratorExecutor.process(
+            job, args_list(), max_workers=2, max_pending_jobs=3, ordered=True
+        )
+    )
+    assert results == list(range(20))
+    assert submitted_while_first_job_ran == [3]
+
+
+def test_threaded_iterator_executor_error_cancels_jobs():
+    started = []
+    lock = threading.Lock()
+
+    def job(i):
+        with lock:
+            started.append(i)
+        if i == 0:
+            raise ValueError("job failed")
+        time.sleep(0.01)
+        yield i
+
+    stats = ThreadedIteratorExecutorStats()
+    with pytest.raises(ValueError, match="job failed"):
+        list(
+            ThreadedIteratorExecutor.process(
+                job, [(i,) for i in range(1000)], max_workers=2, stats=stats
+            )
+        )
+    assert stats.jobs_failed == 1
+    assert len(started) < 1000
+
+
+def test_threaded_iterator_executor_early_stop():
+    produced = []
+
+    def infinite(i):
+        n = 0
+        while True:
+            produced.append(i)
+            yield n
+            n += 1
+
+    stats = ThreadedIteratorExecutorStats()
+    results = ThreadedIteratorExecutor.process(
+        infinite, [(i,) for i in range(4)], max_workers=2, stats=stats
+    )
+    for _, _ in zip(range(5), results):
+        pass
+    # Closing the generator stops the running jobs instead of hanging.
+    results.close()  # type: ignore[attr-defined]
+    assert stats.jobs_cancelled == 4
+    count = len(produced)
+    time.sleep(0.05)
+    assert len(produced) == count